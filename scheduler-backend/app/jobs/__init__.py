@@ -0,0 +1 @@
+"""Background schedule jobs backed by a shared SQLite job table."""
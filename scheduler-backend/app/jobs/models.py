@@ -0,0 +1,73 @@
+"""Data models for background schedule jobs."""
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from ..models import ScheduleRequest, ScheduleResponse
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobMode(str, Enum):
+    """Solver configuration a job runs with, matching the /schedule endpoints."""
+    STABLE = "stable"
+    DEV = "dev"
+    OPTIMIZED = "optimized"
+    ADAPTIVE = "adaptive"
+
+
+class JobRequest(BaseModel):
+    """Request to run a schedule in the background."""
+    request: ScheduleRequest
+    mode: JobMode = Field(JobMode.STABLE, description="Solver mode (stable, dev, optimized, adaptive)")
+    timeLimitSeconds: Optional[int] = Field(None, gt=0, description="Solver time limit in seconds")
+    solverProfile: Optional[str] = Field(None, description="CP-SAT parameter profile")
+
+
+class JobStatusResponse(BaseModel):
+    """Status, progress and, once finished, result of a job."""
+    id: str
+    mode: JobMode
+    status: JobStatus
+    progress: Dict[str, Any] = Field(default_factory=dict)
+    result: Optional[ScheduleResponse] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    createdAt: float
+    startedAt: Optional[float] = None
+    finishedAt: Optional[float] = None
+
+    model_config = {
+        'json_schema_extra': {
+            "example": {
+                "id": "3f2b6c0e9a7d4c1b8e5f2a6d9c0b1e4f",
+                "mode": "optimized",
+                "status": "running",
+                "progress": {
+                    "phase": "solving",
+                    "solver": "genetic",
+                    "generation": 42,
+                    "best_fitness": -1250.0
+                },
+                "result": None,
+                "error": None,
+                "attempts": 1,
+                "createdAt": 1767225600.0,
+                "startedAt": 1767225601.2,
+                "finishedAt": None
+            }
+        }
+    }
@@ -0,0 +1,129 @@
+"""API routes for background schedule jobs."""
+import logging
+
+from fastapi import APIRouter, HTTPException, status
+
+from ..models import ScheduleResponse
+from ..scheduling.solvers import config as config_module
+from .models import JobMode, JobRequest, JobStatusResponse
+from .store import Job
+from .worker import get_job_store
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(
+    prefix="/jobs",
+    tags=["Jobs"],
+    responses={
+        404: {"description": "Job not found"},
+        422: {"description": "Validation error"},
+        500: {"description": "Server error"}
+    }
+)
+
+
+def to_status_response(job: Job) -> JobStatusResponse:
+    """Build the API view of a job"""
+    return JobStatusResponse(
+        id=job.id,
+        mode=job.mode,
+        status=job.status,
+        progress=job.progress,
+        result=ScheduleResponse.model_validate_json(job.result) if job.result else None,
+        error=job.error,
+        attempts=job.attempts,
+        createdAt=job.created_at,
+        startedAt=job.started_at,
+        finishedAt=job.finished_at
+    )
+
+
+def get_job_or_404(job_id: str) -> Job:
+    """Look up a job, raising 404 if it does not exist"""
+    job = get_job_store().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"message": f"Job {job_id} not found"}
+        )
+    return job
+
+
+# Handlers are plain functions so FastAPI runs them in its thread pool:
+# SQLite calls can wait on another process's write lock.
+
+@router.post(
+    "/schedule",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit schedule job",
+    description="""
+    Queue a schedule request and return its job id immediately. Use this for
+    long runs (optimized, adaptive) that would exceed proxy timeouts, then
+    poll GET /jobs/{id} for progress and the result.
+    """
+)
+def submit_schedule_job(job_request: JobRequest) -> JobStatusResponse:
+    if not config_module.ENABLE_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Background jobs are disabled. Enable with ENABLE_JOBS=1"}
+        )
+    if job_request.mode == JobMode.OPTIMIZED and not config_module.ENABLE_WEIGHT_TUNING:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Weight tuning is disabled. Enable with ENABLE_WEIGHT_TUNING=1"}
+        )
+    if job_request.mode == JobMode.ADAPTIVE and not config_module.ENABLE_CONSTRAINT_RELAXATION:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Constraint relaxation is disabled. Enable with ENABLE_CONSTRAINT_RELAXATION=1"}
+        )
+
+    profile = job_request.solverProfile or job_request.request.solverProfile
+    try:
+        config_module.get_solver_profile(profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e)})
+
+    job = get_job_store().create(
+        job_request.mode,
+        job_request.request.model_dump_json(),
+        {"time_limit_seconds": job_request.timeLimitSeconds, "profile": profile}
+    )
+    logger.info(f"Queued job {job.id} ({job.mode.value}, {len(job_request.request.classes)} classes)")
+    return to_status_response(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Get job status",
+    description="""
+    Get the status and progress of a job. Progress reports the phase and,
+    depending on the solver, the generation and best fitness or the CP-SAT
+    objective and bound. Finished jobs include the schedule response.
+    """
+)
+def get_schedule_job(job_id: str) -> JobStatusResponse:
+    return to_status_response(get_job_or_404(job_id))
+
+
+@router.delete(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Cancel job",
+    description="""
+    Cancel a job. Queued jobs are cancelled immediately; running jobs stop
+    at their next progress report and keep status "running" until then.
+    Finished jobs are returned unchanged.
+    """
+)
+def cancel_schedule_job(job_id: str) -> JobStatusResponse:
+    get_job_or_404(job_id)
+    job = get_job_store().cancel(job_id)
+    logger.info(f"Cancellation requested for job {job_id} (status {job.status.value})")
+    return to_status_response(job)
+
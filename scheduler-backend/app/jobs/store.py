@@ -0,0 +1,292 @@
+"""SQLite job table shared by API processes and job workers."""
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+from .models import JobMode, JobStatus
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    mode TEXT NOT NULL,
+    status TEXT NOT NULL,
+    request TEXT NOT NULL,
+    options TEXT NOT NULL,
+    progress TEXT NOT NULL DEFAULT '{}',
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+
+@dataclass
+class Job:
+    """A row of the job table"""
+    id: str
+    mode: JobMode
+    status: JobStatus
+    request: str
+    options: Dict[str, Any] = field(default_factory=dict)
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[str] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    attempts: int = 0
+    worker: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    heartbeat_at: Optional[float] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Job":
+        """Build a job from a database row"""
+        return cls(
+            id=row["id"],
+            mode=JobMode(row["mode"]),
+            status=JobStatus(row["status"]),
+            request=row["request"],
+            options=json.loads(row["options"]),
+            progress=json.loads(row["progress"]),
+            result=row["result"],
+            error=row["error"],
+            cancel_requested=bool(row["cancel_requested"]),
+            attempts=row["attempts"],
+            worker=row["worker"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            heartbeat_at=row["heartbeat_at"]
+        )
+
+
+class JobStore:
+    """
+    Persistent job queue on a SQLite database.
+
+    Every operation opens its own connection, so one store can be shared by
+    threads, and any number of processes can point a store at the same file.
+    Workers claim jobs atomically and hold them under a lease that they
+    renew with heartbeats; a job whose worker stops renewing (crash or
+    restart) becomes claimable again until it runs out of attempts.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 60.0, max_attempts: int = 3):
+        """
+        Initialize the store, creating the job table if needed.
+
+        Args:
+            path: Path of the SQLite database file
+            lease_seconds: Seconds without a heartbeat after which a running job is retried
+            max_attempts: Number of times a job may be claimed before it fails
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        with self._connect() as conn:
+            # WAL lets readers poll job status while a worker is writing
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode"""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def create(self, mode: JobMode, request: str, options: Optional[Dict[str, Any]] = None) -> Job:
+        """
+        Queue a new job.
+
+        Args:
+            mode: Solver mode to run the job with
+            request: Schedule request as JSON
+            options: Extra solve options (time limit, profile)
+
+        Returns:
+            The queued job
+        """
+        job = Job(
+            id=uuid.uuid4().hex,
+            mode=JobMode(mode),
+            status=JobStatus.QUEUED,
+            request=request,
+            options=options or {},
+            created_at=time.time()
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, mode, status, request, options, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job.id, job.mode.value, job.status.value, job.request,
+                 json.dumps(job.options), job.created_at)
+            )
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id, or None if it does not exist"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row else None
+
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """
+        Claim the oldest runnable job for a worker.
+
+        Runnable jobs are queued jobs and running jobs whose lease expired.
+        Expired jobs that already used up their attempts are failed instead.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+
+        Returns:
+            The claimed job, or None if nothing is runnable
+        """
+        now = time.time()
+        expired = now - self.lease_seconds
+        with self._connect() as conn:
+            # Take the write lock up front so two workers cannot claim the same job
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ? "
+                    "WHERE status = ? AND heartbeat_at < ? AND cancel_requested = 1",
+                    (JobStatus.CANCELLED.value, now, JobStatus.RUNNING.value, expired)
+                )
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+                    "WHERE status = ? AND heartbeat_at < ? AND attempts >= ?",
+                    (JobStatus.FAILED.value, "Worker stopped responding too many times",
+                     now, JobStatus.RUNNING.value, expired, self.max_attempts)
+                )
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE status = ? OR (status = ? AND heartbeat_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (JobStatus.QUEUED.value, JobStatus.RUNNING.value, expired)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, "
+                    "started_at = ?, heartbeat_at = ? WHERE id = ?",
+                    (JobStatus.RUNNING.value, worker_id, now, now, row["id"])
+                )
+                job = Job.from_row(
+                    conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+                )
+                conn.execute("COMMIT")
+                return job
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def heartbeat(self, job_id: str, worker_id: str, progress: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Renew a worker's lease on a job, optionally recording progress.
+
+        Args:
+            job_id: Job being run
+            worker_id: Worker holding the job
+            progress: Latest progress to store
+
+        Returns:
+            True if the job should stop: cancellation was requested or the
+            job is no longer held by this worker
+        """
+        with self._connect() as conn:
+            if progress is None:
+                updated = conn.execute(
+                    "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND worker = ? AND status = ?",
+                    (time.time(), job_id, worker_id, JobStatus.RUNNING.value)
+                ).rowcount
+            else:
+                updated = conn.execute(
+                    "UPDATE jobs SET heartbeat_at = ?, progress = ? "
+                    "WHERE id = ? AND worker = ? AND status = ?",
+                    (time.time(), json.dumps(progress), job_id, worker_id, JobStatus.RUNNING.value)
+                ).rowcount
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return not updated or row is None or bool(row["cancel_requested"])
+
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: JobStatus,
+        result: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        Record the outcome of a job held by a worker.
+
+        Args:
+            job_id: Job being finished
+            worker_id: Worker holding the job
+            status: Final status
+            result: Schedule response as JSON
+            error: Error message for failed jobs
+
+        Returns:
+            False if the job was no longer held by this worker
+        """
+        with self._connect() as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (JobStatus(status).value, result, error, time.time(),
+                 job_id, worker_id, JobStatus.RUNNING.value)
+            ).rowcount
+        return bool(updated)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job.
+
+        Queued jobs are cancelled immediately. Running jobs are flagged and
+        their worker stops at its next progress report or heartbeat.
+        Finished jobs are left unchanged.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            The job after the change, or None if it does not exist
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, cancel_requested = 1, finished_at = ? "
+                "WHERE id = ? AND status = ?",
+                (JobStatus.CANCELLED.value, time.time(), job_id, JobStatus.QUEUED.value)
+            )
+            conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?",
+                (job_id, JobStatus.RUNNING.value)
+            )
+        return self.get(job_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Count jobs by status"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {status.value: 0 for status in JobStatus}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
@@ -0,0 +1,329 @@
+"""Local worker processes that run queued schedule jobs"""
+import atexit
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..models import ScheduleRequest
+from ..utils.date_utils import to_utc_isoformat
+from .models import JobMode, JobStatus
+from .store import Job, JobStore
+
+logger = logging.getLogger(__name__)
+
+
+def build_solver(mode: JobMode, request: ScheduleRequest):
+    """
+    Build the solver for a job mode, configured like the matching /schedule endpoint.
+
+    Args:
+        mode: Job mode
+        request: Schedule request of the job
+
+    Returns:
+        UnifiedSolver for the mode
+
+    Raises:
+        ValueError: If the mode needs a feature that is disabled
+    """
+    from ..scheduling.solvers import config as config_module
+    from ..scheduling.solvers.solver import UnifiedSolver
+
+    if mode == JobMode.STABLE:
+        return UnifiedSolver(use_genetic=False)
+    if mode == JobMode.DEV:
+        return UnifiedSolver(use_genetic=True)
+    if mode == JobMode.OPTIMIZED:
+        if not config_module.ENABLE_WEIGHT_TUNING:
+            raise ValueError("Weight tuning is disabled. Enable with ENABLE_WEIGHT_TUNING=1")
+        return UnifiedSolver(request=request, use_genetic=True, use_or_tools=False)
+    if mode == JobMode.ADAPTIVE:
+        if not config_module.ENABLE_CONSTRAINT_RELAXATION:
+            raise ValueError("Constraint relaxation is disabled. Enable with ENABLE_CONSTRAINT_RELAXATION=1")
+        return UnifiedSolver(request=request, use_genetic=True, use_or_tools=True, enable_relaxation=True)
+    raise ValueError(f"Unknown job mode: {mode}")
+
+
+class JobRun:
+    """
+    Progress reporting and cancellation for one job run.
+
+    Solver progress is written to the job table at most once per
+    ``progress_seconds``; a background thread renews the lease in between so
+    long stretches without new solutions do not look like a dead worker.
+    Either write picks up a cancellation request, which the progress
+    callback passes back to the solver as a stop request.
+    """
+
+    def __init__(self, store: JobStore, job: Job, worker_id: str, progress_seconds: float = 1.0):
+        self.store = store
+        self.job = job
+        self.worker_id = worker_id
+        self.progress_seconds = progress_seconds
+        self.cancelled = threading.Event()
+        self._progress: Dict[str, Any] = {"phase": "starting"}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+        self._stopped = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def set_phase(self, phase: str) -> None:
+        """Start a new phase of the job and record it immediately"""
+        with self._lock:
+            self._progress = {"phase": phase}
+        self.flush()
+
+    def on_progress(self, progress: Dict[str, Any]) -> bool:
+        """Progress callback for the solver; returns True when the job should stop"""
+        # Intermediate schedules are only streamed, not stored
+        progress = {key: value for key, value in progress.items() if key != "assignments"}
+        with self._lock:
+            self._progress = {"phase": self._progress.get("phase"), **progress}
+        if time.time() - self._last_write >= self.progress_seconds:
+            self.flush()
+        return self.cancelled.is_set()
+
+    def flush(self) -> None:
+        """Write the latest progress and check for cancellation"""
+        with self._lock:
+            progress = dict(self._progress)
+        self._last_write = time.time()
+        if self.store.heartbeat(self.job.id, self.worker_id, progress):
+            self.cancelled.set()
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(0.1, self.store.lease_seconds / 3)
+        while not self._stopped.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {self.job.id} failed: {e}")
+
+    def __enter__(self) -> "JobRun":
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name=f"job-heartbeat-{self.job.id[:8]}",
+            daemon=True
+        )
+        self._heartbeat_thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stopped.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+
+
+def run_job(store: JobStore, job: Job, worker_id: str, progress_seconds: float = 1.0) -> JobStatus:
+    """
+    Run a claimed job to completion and record its outcome.
+
+    Args:
+        store: Job store holding the job
+        job: Job claimed by this worker
+        worker_id: Identifier of this worker
+        progress_seconds: Minimum seconds between progress writes
+
+    Returns:
+        Final status of the job
+    """
+    logger.info(f"Worker {worker_id} running job {job.id} ({job.mode.value}, attempt {job.attempts})")
+    with JobRun(store, job, worker_id, progress_seconds) as run:
+        try:
+            request = ScheduleRequest.model_validate_json(job.request)
+            solver = build_solver(job.mode, request)
+            solver.set_progress_callback(run.on_progress)
+
+            if job.mode == JobMode.OPTIMIZED:
+                # Tune separately from the solve so progress shows the phase
+                # and a cancellation during tuning stops it and skips the
+                # final solve
+                run.set_phase("tuning")
+                try:
+                    solver.tune_weights(request, progress_callback=run.on_progress)
+                except Exception as e:
+                    logger.error(f"Weight tuning failed: {str(e)}")
+                    logger.warning("Continuing with default weights")
+                if run.cancelled.is_set():
+                    store.finish(job.id, worker_id, JobStatus.CANCELLED)
+                    return JobStatus.CANCELLED
+
+            run.set_phase("solving")
+            response = solver.solve(
+                request,
+                time_limit_seconds=job.options.get("time_limit_seconds"),
+                with_relaxation=job.mode == JobMode.ADAPTIVE,
+                profile=job.options.get("profile")
+            )
+            run.flush()
+            if run.cancelled.is_set():
+                store.finish(job.id, worker_id, JobStatus.CANCELLED)
+                return JobStatus.CANCELLED
+
+            # Convert assignment date strings to UTC ISO 8601 format
+            for assignment in response.assignments:
+                assignment.date = to_utc_isoformat(datetime.fromisoformat(assignment.date))
+
+            store.finish(job.id, worker_id, JobStatus.SUCCEEDED, result=response.model_dump_json())
+            logger.info(f"Job {job.id} finished with {len(response.assignments)} assignments")
+            return JobStatus.SUCCEEDED
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {str(e)}")
+            logger.error(traceback.format_exc())
+            store.finish(job.id, worker_id, JobStatus.FAILED, error=str(e))
+            return JobStatus.FAILED
+
+
+def _worker_main(
+    db_path: str,
+    index: int,
+    lease_seconds: float,
+    max_attempts: int,
+    poll_seconds: float,
+    stop_event: Any
+) -> None:
+    """Claim and run jobs until the stop event is set"""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    store = JobStore(db_path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    logger.info(f"Job worker {worker_id} started on {db_path}")
+    while not stop_event.is_set():
+        try:
+            job = store.claim(worker_id)
+        except Exception as e:
+            logger.warning(f"Job worker {worker_id} could not claim a job: {e}")
+            job = None
+        if job is None:
+            stop_event.wait(poll_seconds)
+            continue
+        run_job(store, job, worker_id)
+    logger.info(f"Job worker {worker_id} stopped")
+
+
+class JobWorkerPool:
+    """
+    Worker processes polling the job table of one database.
+
+    Solves run in separate processes so genetic runs do not contend with
+    the API event loop for the GIL. Each API process may start its own pool;
+    the job table is the only thing they share.
+
+    Workers are not daemon processes, so weight tuning, island runs and the
+    fitness worker pool can start processes of their own inside a job.
+    They are therefore stopped explicitly, by ``stop()`` or at interpreter
+    exit.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        num_workers: int,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+        poll_seconds: float = 1.0
+    ):
+        self.db_path = db_path
+        self.num_workers = max(0, num_workers)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_seconds = poll_seconds
+        # Spawn rather than fork: the API process runs threads
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._processes: List[Any] = []
+
+    def start(self) -> None:
+        """Start the worker processes"""
+        for index in range(self.num_workers):
+            process = self._context.Process(
+                target=_worker_main,
+                args=(self.db_path, index, self.lease_seconds, self.max_attempts,
+                      self.poll_seconds, self._stop_event),
+                name=f"job-worker-{index}"
+            )
+            process.start()
+            self._processes.append(process)
+        # Non-daemon workers would otherwise keep the interpreter from exiting
+        atexit.register(self.stop)
+        logger.info(f"Started {self.num_workers} job workers on {self.db_path}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker processes.
+
+        Idle workers exit at once. Workers still solving after the timeout
+        are terminated; their jobs are retried once the lease expires.
+        """
+        self._stop_event.set()
+        deadline = time.time() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.time()))
+            if process.is_alive():
+                logger.warning(f"Terminating {process.name}; its job will be retried")
+                process.terminate()
+                process.join()
+        self._processes = []
+        atexit.unregister(self.stop)
+
+    def alive(self) -> int:
+        """Number of running worker processes"""
+        return sum(1 for process in self._processes if process.is_alive())
+
+
+_store: Optional[JobStore] = None
+_pool: Optional[JobWorkerPool] = None
+_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Get the process-wide job store, creating it from config on first use"""
+    global _store
+    with _lock:
+        if _store is None:
+            from ..scheduling.solvers import config as config_module
+            _store = JobStore(
+                config_module.JOBS_DB_PATH,
+                lease_seconds=config_module.JOB_LEASE_SECONDS,
+                max_attempts=config_module.JOB_MAX_ATTEMPTS
+            )
+        return _store
+
+
+def start_job_workers() -> None:
+    """Start the local job workers configured by JOB_WORKERS"""
+    global _pool
+    from ..scheduling.solvers import config as config_module
+    if not config_module.ENABLE_JOBS or config_module.JOB_WORKERS <= 0:
+        return
+    store = get_job_store()
+    with _lock:
+        if _pool is None:
+            _pool = JobWorkerPool(
+                store.path,
+                config_module.JOB_WORKERS,
+                lease_seconds=store.lease_seconds,
+                max_attempts=store.max_attempts,
+                poll_seconds=config_module.JOB_POLL_SECONDS
+            )
+            _pool.start()
+
+
+def stop_job_workers() -> None:
+    """Stop the local job workers if they were started"""
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.stop()
+            _pool = None
+
+
+def get_job_stats() -> Dict[str, Any]:
+    """Get job counts by status and the number of local workers"""
+    stats: Dict[str, Any] = dict(get_job_store().get_stats())
+    stats["local_workers"] = _pool.alive() if _pool is not None else 0
+    return stats
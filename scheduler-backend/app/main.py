@@ -1,8 +1,9 @@
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError, BaseModel, Field
 from typing import Dict, Any, List, Optional, Union
+import asyncio
 import logging
 import traceback
 
@@ -15,7 +16,16 @@ from .scheduling.solvers.config import (
     ENABLE_CONSTRAINT_RELAXATION
 )
 from .scheduling.constraints.relaxation import RelaxationLevel
+from .scheduling.solvers.executor import (
+    SolverBusyError,
+    get_solve_executor,
+    shutdown_solve_executor
+)
+from .scheduling.solvers.cache import get_result_cache
+from .scheduling.solvers.streaming import SolutionStream, format_sse
 from .visualization.routes import router as dashboard_router
+from .jobs.routes import router as jobs_router
+from .jobs.worker import get_job_stats, start_job_workers, stop_job_workers
 
 description = """
 Scheduler API with configurable solver settings.
@@ -44,6 +54,10 @@ app = FastAPI(
         {
             "name": "Dashboard",
             "description": "Schedule analysis dashboard and visualization"
+        },
+        {
+            "name": "Jobs",
+            "description": "Run long schedule requests in the background and poll for results"
         }
     ]
 )
@@ -60,16 +74,41 @@ app.add_middleware(
 # Initialize solvers
 unified_solver = UnifiedSolver()
 
-# Create specialized solver instances for different endpoints
+# Solvers keep per-run state, so every request solves with a solver of its
+# own; these instances only record the last run for /metrics and comparisons
 stable_solver = UnifiedSolver(use_genetic=False)  # Stable uses only OR-Tools
 dev_solver = UnifiedSolver(use_genetic=True)      # Dev uses genetic algorithm
 
 # Include dashboard router
 app.include_router(dashboard_router)
 
+# Include background job router
+app.include_router(jobs_router)
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+def startup_job_workers() -> None:
+    """Start the local workers for background jobs"""
+    start_job_workers()
+
+@app.on_event("shutdown")
+def shutdown_executor() -> None:
+    """Wait for running solves and stop the solve and job worker pools"""
+    shutdown_solve_executor()
+    stop_job_workers()
+
+def solver_busy_exception(e: SolverBusyError) -> HTTPException:
+    """Build the response for a solve rejected because the queue is full"""
+    return HTTPException(
+        status_code=503,
+        detail={
+            "message": str(e),
+            "hint": "Retry later or use a lighter solverProfile."
+        }
+    )
+
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(request: Request, exc: ValidationError):
     """
@@ -164,7 +203,8 @@ async def create_schedule_stable(request: ScheduleRequest) -> ScheduleResponse:
     try:
         logger.info(f"Creating stable schedule for {len(request.classes)} classes from {request.startDate} to {request.endDate}")
         
-        response = stable_solver.solve(request)
+        response = await get_solve_executor().solve(UnifiedSolver(use_genetic=False), request)
+        stable_solver.record_response(response)
         
         # Check if we have a valid response with assignments
         if not response.assignments or len(response.assignments) == 0:
@@ -186,6 +226,23 @@ async def create_schedule_stable(request: ScheduleRequest) -> ScheduleResponse:
                         "error": response.metadata.message
                     }
                 )
+            elif hasattr(response, 'metadata') and response.metadata and response.metadata.status == "INFEASIBLE":
+                feasibility = response.metadata.feasibility or {}
+                level = feasibility.get("suggested_relaxation_level")
+                logger.warning(f"Request rejected by feasibility pre-check: {response.metadata.message}")
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        "message": "No feasible schedule exists for the given constraints.",
+                        "hint": (
+                            f"Relaxation level {level} could succeed; retry with /schedule/relaxed."
+                            if level else
+                            "Relaxing the daily and weekly limits will not help; resolve the listed issues."
+                        ),
+                        "relaxationLevel": level,
+                        "diagnosis": feasibility.get("issues", [])
+                    }
+                )
             else:
                 logger.warning("No feasible solution found")
                 raise HTTPException(
@@ -216,6 +273,14 @@ async def create_schedule_stable(request: ScheduleRequest) -> ScheduleResponse:
     except HTTPException:
         # Re-raise HTTP exceptions to be handled by http_exception_handler
         raise
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
+    except ValueError as e:
+        # Invalid solver options such as an unknown solverProfile
+        raise HTTPException(
+            status_code=400,
+            detail={"message": str(e)}
+        )
     except TimeoutError as e:
         logger.warning(f"Solver timeout: {str(e)}")
         raise HTTPException(
@@ -245,7 +310,8 @@ async def create_schedule_stable(request: ScheduleRequest) -> ScheduleResponse:
 )
 async def create_schedule_dev(request: ScheduleRequest) -> ScheduleResponse:
     try:
-        response = dev_solver.solve(request)
+        response = await get_solve_executor().solve(UnifiedSolver(use_genetic=True), request)
+        dev_solver.record_response(response)
         # Convert assignment date strings to UTC ISO 8601 format
         from datetime import datetime
         from app.utils.date_utils import to_utc_isoformat
@@ -256,6 +322,8 @@ async def create_schedule_dev(request: ScheduleRequest) -> ScheduleResponse:
             assignments=response.assignments,
             metadata=response.metadata
         )
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
     except ValidationError as e:
         raise HTTPException(
             status_code=422,
@@ -270,6 +338,66 @@ async def create_schedule_dev(request: ScheduleRequest) -> ScheduleResponse:
             detail={"message": f"Scheduling error: {str(e)}"}
         )
 
+@app.post(
+    "/schedule/stream",
+    tags=["Schedule Generation"],
+    summary="Stream schedule solutions",
+    description="""
+    Create a schedule and stream progress as Server-Sent Events while the
+    solver runs. Events:
+    - solution: an improved schedule with its objective/gap (CP-SAT) or fitness (genetic)
+    - progress: search progress without a new best schedule
+    - result: the final ScheduleResponse
+    - error: the solve failed
+
+    Closing the connection stops the solver at its next report, so clients
+    can accept an early schedule without waiting for the time limit.
+    """
+)
+async def stream_schedule(
+    request: ScheduleRequest,
+    solver: str = Query("stable", description="Solver type (stable or dev)")
+) -> StreamingResponse:
+    if solver not in ("stable", "dev"):
+        raise HTTPException(
+            status_code=400,
+            detail={"message": f"Invalid solver type: {solver}. Valid types: ['stable', 'dev']"}
+        )
+    
+    # Progress callbacks belong to one request, so use a solver of our own
+    stream = SolutionStream(UnifiedSolver(use_genetic=solver == "dev"))
+    try:
+        stream.start(get_solve_executor(), request)
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
+    
+    from datetime import datetime
+    from app.utils.date_utils import to_utc_isoformat
+    
+    async def event_source():
+        event_id = 0
+        try:
+            async for event, data in stream.events():
+                if event == "keepalive":
+                    yield ": keepalive\n\n"
+                    continue
+                if event == "result":
+                    data = data.model_dump(mode="json")
+                # Convert assignment date strings to UTC ISO 8601 format
+                for assignment in data.get("assignments", []):
+                    assignment["date"] = to_utc_isoformat(datetime.fromisoformat(assignment["date"]))
+                event_id += 1
+                yield format_sse(event, data, event_id)
+        except Exception as e:
+            logger.error(f"Streaming solve failed: {str(e)}")
+            yield format_sse("error", {"message": f"Scheduling error: {str(e)}"})
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post(
     "/schedule/compare",
     response_model=Dict[str, Any],
@@ -280,8 +408,13 @@ async def create_schedule_dev(request: ScheduleRequest) -> ScheduleResponse:
 async def compare_solvers(request: ScheduleRequest) -> Dict[str, Any]:
     try:
         # Validate and create schedules
-        stable_response = stable_solver.solve(request)
-        dev_response = dev_solver.solve(request)
+        executor = get_solve_executor()
+        stable_response, dev_response = await asyncio.gather(
+            executor.solve(UnifiedSolver(use_genetic=False), request),
+            executor.solve(UnifiedSolver(use_genetic=True), request)
+        )
+        stable_solver.record_response(stable_response)
+        dev_solver.record_response(dev_response)
         from datetime import datetime
         from app.utils.date_utils import to_utc_isoformat
         for assignment in stable_response.assignments:
@@ -299,6 +432,8 @@ async def compare_solvers(request: ScheduleRequest) -> Dict[str, Any]:
             "dev": dev_response.dict(),
             "comparison": comparison
         }
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
     except ValidationError as e:
         raise HTTPException(
             status_code=422,
@@ -360,6 +495,36 @@ async def get_relaxation_metrics() -> Dict[str, Any]:
 async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
+@app.get(
+    "/metrics/solves",
+    tags=["System"],
+    summary="Solve executor load",
+    description="Get the number of running, queued, completed and rejected solves"
+)
+async def get_solve_metrics() -> Dict[str, Any]:
+    return get_solve_executor().get_stats()
+
+@app.get(
+    "/metrics/cache",
+    tags=["System"],
+    summary="Result cache metrics",
+    description="Get hit/miss counts and sizes of the result cache for identical requests"
+)
+async def get_cache_metrics() -> Dict[str, Any]:
+    cache = get_result_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
+
+@app.get(
+    "/metrics/jobs",
+    tags=["System"],
+    summary="Background job queue",
+    description="Get the number of jobs in each state and the local job worker count"
+)
+def get_job_metrics() -> Dict[str, Any]:
+    return get_job_stats()
+
 @app.post(
     "/solver/config",
     response_model=Dict[str, Any],
@@ -522,7 +687,7 @@ async def create_optimized_schedule(request: ScheduleRequest) -> ScheduleRespons
         )
         
         # Run the solver with weight tuning enabled
-        response = optimized_solver.solve(tune_weights=True)
+        response = await get_solve_executor().solve(optimized_solver, request, tune_weights=True)
         
         # Convert assignment date strings to UTC ISO 8601 format
         from datetime import datetime
@@ -535,6 +700,8 @@ async def create_optimized_schedule(request: ScheduleRequest) -> ScheduleRespons
             assignments=response.assignments,
             metadata=response.metadata
         )
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
     except ValidationError as e:
         raise HTTPException(
             status_code=422,
@@ -604,7 +771,7 @@ async def create_relaxed_schedule(request: RelaxationRequest) -> ScheduleRespons
         relaxed_solver.relax_constraints(level)
         
         # Solve with the relaxed constraints
-        response = relaxed_solver.solve()
+        response = await get_solve_executor().solve(relaxed_solver, request.schedule_request)
         
         # Convert assignment date strings to UTC ISO 8601 format
         from datetime import datetime
@@ -622,6 +789,8 @@ async def create_relaxed_schedule(request: RelaxationRequest) -> ScheduleRespons
             assignments=response.assignments,
             metadata=response.metadata
         )
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
     except ValidationError as e:
         raise HTTPException(
             status_code=422,
@@ -666,7 +835,7 @@ async def create_adaptive_schedule(request: ScheduleRequest) -> ScheduleResponse
         )
         
         # Solve with progressive relaxation
-        response = adaptive_solver.solve(with_relaxation=True)
+        response = await get_solve_executor().solve(adaptive_solver, request, with_relaxation=True)
         
         # Convert assignment date strings to UTC ISO 8601 format
         from datetime import datetime
@@ -683,6 +852,8 @@ async def create_adaptive_schedule(request: ScheduleRequest) -> ScheduleResponse
             assignments=response.assignments,
             metadata=response.metadata
         )
+    except SolverBusyError as e:
+        raise solver_busy_exception(e)
     except ValidationError as e:
         raise HTTPException(
             status_code=422,
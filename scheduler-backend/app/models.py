@@ -157,6 +157,9 @@ class ScheduleRequest(BaseModel):
     startDate: str
     endDate: str
     constraints: ScheduleConstraints
+    solverProfile: Optional[str] = Field(
+        None, description="CP-SAT parameter profile (latency, throughput, quality)"
+    )
     
     model_config = {
         'json_schema_extra': {
@@ -197,6 +200,9 @@ class ScheduleMetadata(BaseModel):
     gap: float
     distribution: Optional[Any] = None
     solver: Optional[str] = None
+    status: Optional[str] = None
+    message: Optional[str] = None
+    feasibility: Optional[Dict[str, Any]] = None
     
     @property
     def duration(self) -> float:
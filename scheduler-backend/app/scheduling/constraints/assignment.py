@@ -18,14 +18,9 @@ class SingleAssignmentConstraint(BaseAssignmentConstraint):
         if not self.enabled:
             return
             
-        # Group variables by class
-        class_vars = defaultdict(list)
-        for var in context.variables:
-            class_vars[var["name"]].append(var["variable"])
-            
         # Add constraint for each class to be scheduled at least once
-        for class_name, vars_list in class_vars.items():
-            context.model.Add(sum(vars_list) >= 1)
+        for class_name, class_vars in context.variable_index.by_class.items():
+            context.model.Add(sum(var["variable"] for var in class_vars) >= 1)
             
     def validate(
         self,
@@ -68,15 +63,10 @@ class NoOverlapConstraint(BaseAssignmentConstraint):
         if not self.enabled:
             return
             
-        # Group variables by timeslot
-        by_time = defaultdict(list)
-        for var in context.variables:
-            key = (var["date"].date(), var["period"])
-            by_time[key].append(var["variable"])
-            
         # Add constraint to prevent overlap in each timeslot
-        for vars_list in by_time.values():
-            context.model.Add(sum(vars_list) <= 1)
+        for periods in context.variable_index.by_date_period.values():
+            for slot_vars in periods.values():
+                context.model.Add(sum(var["variable"] for var in slot_vars) <= 1)
             
     def validate(
         self,
@@ -26,11 +26,14 @@ class InstructorAvailabilityConstraint(BaseConstraint):
         
         # Add constraints for each variable that would be during an unavailable period
         unavailable_count = 0
-        for var in context.variables:
-            date_str = var["date"].date().isoformat()
-            if date_str in unavailable_slots and var["period"] in unavailable_slots[date_str]:
-                context.model.Add(var["variable"] == 0)
-                unavailable_count += 1
+        for date, periods in context.variable_index.by_date_period.items():
+            unavailable = unavailable_slots.get(date.isoformat())
+            if not unavailable:
+                continue
+            for period in unavailable:
+                for var in periods.get(period, []):
+                    context.model.Add(var["variable"] == 0)
+                    unavailable_count += 1
         
         print(f"Added {unavailable_count} instructor availability constraints")
     
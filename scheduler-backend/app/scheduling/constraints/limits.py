@@ -18,18 +18,11 @@ class DailyLimitConstraint(BaseConstraint):
         if not self.enabled:
             return
             
-        # Group variables by date
-        by_date = defaultdict(list)
-        for var in context.variables:
-            # var["date"] is already a datetime object from base solver
-            date = var["date"].date()
-            by_date[date].append(var["variable"])
-        
         # Add constraint for each date
         limit_count = 0
-        for date, vars_list in by_date.items():
+        for date, day_vars in context.variable_index.by_date.items():
             context.model.Add(
-                sum(vars_list) <= context.request.constraints.maxClassesPerDay
+                sum(var["variable"] for var in day_vars) <= context.request.constraints.maxClassesPerDay
             )
             limit_count += 1
             
@@ -77,18 +70,11 @@ class WeeklyLimitConstraint(BaseConstraint):
         if not self.enabled:
             return
             
-        # Group variables by week
-        by_week = defaultdict(list)
-        for var in context.variables:
-            # Both var["date"] and context.start_date are datetime objects
-            week_num = (var["date"] - context.start_date).days // 7
-            by_week[week_num].append(var["variable"])
-            
         # Add constraint for each week
         limit_count = 0
-        for week_num, vars_list in by_week.items():
+        for week_num, week_vars in context.variable_index.by_week.items():
             context.model.Add(
-                sum(vars_list) <= context.request.constraints.maxClassesPerWeek
+                sum(var["variable"] for var in week_vars) <= context.request.constraints.maxClassesPerWeek
             )
             limit_count += 1
             
@@ -137,28 +123,15 @@ class MinimumPeriodsConstraint(BaseConstraint):
         if not self.enabled:
             return
             
-        # Group variables by week and count weekdays per week
-        by_week = defaultdict(list)
-        by_day = defaultdict(lambda: defaultdict(list))  # week -> day -> vars
-        weekdays_by_week = defaultdict(int)
-        seen_dates = set()  # Track unique dates to avoid double-counting
+        # Prorate by the calendar weekdays of each week, so weeks or days
+        # whose variables were all pruned keep the minimum they would have
+        # without pruning
+        index = context.variable_index
         
-        for var in context.variables:
-            week_num = (var["date"] - context.start_date).days // 7
-            date = var["date"].date()
-            
-            # Count weekdays (only once per date)
-            if date not in seen_dates and var["date"].weekday() < 5:
-                weekdays_by_week[week_num] += 1
-                seen_dates.add(date)
-            
-            by_week[week_num].append(var["variable"])
-            by_day[week_num][date].append(var)
-            
         # Add constraint for each week
         limit_count = 0
-        for week_num, vars_list in by_week.items():
-            weekdays = weekdays_by_week[week_num]
+        for week_num, weekdays in context.weekdays_by_week.items():
+            vars_list = [var["variable"] for var in index.by_week.get(week_num, [])]
             # Use ceiling division and enforce a minimum threshold
             base_min = context.request.constraints.minPeriodsPerWeek
             prorated = (base_min * weekdays + 4) // 5  # Add 4 to round up
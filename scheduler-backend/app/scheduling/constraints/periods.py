@@ -24,12 +24,10 @@ class RequiredPeriodsConstraint(BaseConstraint):
             
         print(f"Applying {self.name} constraint")
             
+        by_class = context.variable_index.by_class
         for class_obj in context.request.classes:
-            # Look for variables matching this class
-            class_vars = [
-                var for var in context.variables 
-                if var["name"] == class_obj.name
-            ]
+            # Look up variables for this class
+            class_vars = by_class.get(class_obj.name, [])
 
             # Handle required periods if present
             if hasattr(class_obj, "weeklySchedule") and class_obj.weeklySchedule.requiredPeriods:
@@ -184,10 +182,7 @@ class ConflictPeriodsConstraint(BaseConstraint):
                 continue
 
             # Get all variables for this class
-            class_vars = [
-                var for var in context.variables 
-                if var["name"] == class_obj.name
-            ]
+            class_vars = context.variable_index.by_class.get(class_obj.name, [])
 
             print(f"Found {len(class_obj.weeklySchedule.conflicts)} conflicts for {class_obj.name}")
             # Prevent assignment to any conflicting periods
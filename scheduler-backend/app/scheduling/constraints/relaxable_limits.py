@@ -55,16 +55,10 @@ class RelaxableDailyLimitConstraint(RelaxableConstraint):
         extra_classes = self.relaxation_params.get("extra_classes_allowed", 0)
         effective_max = original_max + extra_classes
         
-        # Group variables by date
-        by_date = defaultdict(list)
-        for var in context.variables:
-            date = var["date"].date()
-            by_date[date].append(var["variable"])
-        
         # Add constraint for each date
         limit_count = 0
-        for date, vars_list in by_date.items():
-            context.model.Add(sum(vars_list) <= effective_max)
+        for date, day_vars in context.variable_index.by_date.items():
+            context.model.Add(sum(var["variable"] for var in day_vars) <= effective_max)
             limit_count += 1
             
         logger.info(
@@ -201,16 +195,10 @@ class RelaxableWeeklyLimitConstraint(RelaxableConstraint):
         extra_classes = self.relaxation_params.get("extra_classes_allowed", 0)
         effective_max = original_max + extra_classes
         
-        # Group variables by week
-        by_week = defaultdict(list)
-        for var in context.variables:
-            week_num = (var["date"] - context.start_date).days // 7
-            by_week[week_num].append(var["variable"])
-        
         # Add constraint for each week
         limit_count = 0
-        for week_num, vars_list in by_week.items():
-            context.model.Add(sum(vars_list) <= effective_max)
+        for week_num, week_vars in context.variable_index.by_week.items():
+            context.model.Add(sum(var["variable"] for var in week_vars) <= effective_max)
             limit_count += 1
             
         logger.info(
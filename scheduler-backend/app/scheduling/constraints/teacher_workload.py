@@ -1,5 +1,4 @@
 """Teacher workload scheduling constraints"""
-from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Tuple
 
@@ -45,42 +44,34 @@ class ConsecutiveClassesConstraint(BaseConstraint):
         if hasattr(context.request.constraints, 'allowConsecutiveClasses'):
             allow_consecutive = context.request.constraints.allowConsecutiveClasses
             
-        # Group variables by date and sort by period
-        by_date_period = {}
-        for var in context.variables:
-            date = var["date"].date()
-            period = var["period"]
-            
-            if date not in by_date_period:
-                by_date_period[date] = {}
-                
-            by_date_period[date][period] = var["variable"]
+        # Slot loads are shared across all classes scheduled in a slot
+        occupancy = context.occupancy
         
         # Add constraints for consecutive periods
         constraint_count = 0
         
-        for date, period_vars in by_date_period.items():
-            periods = sorted(period_vars.keys())
+        for date in occupancy.dates():
+            loads = {
+                period: occupancy.slot_load(date, period)
+                for period in occupancy.periods(date)
+            }
             
-            # Handle consecutive periods
-            for i in range(len(periods) - 2):  # Check sequences of 3 periods
-                p1, p2, p3 = periods[i], periods[i + 1], periods[i + 2]
+            for p1 in sorted(loads):
+                p2, p3 = p1 + 1, p1 + 2
                 
                 # Ensure three consecutive periods don't all have classes
                 # We need at least one period to be free
-                context.model.Add(
-                    period_vars[p1] + period_vars[p2] + period_vars[p3] <= 2
-                )
-                constraint_count += 1
+                if p2 in loads and p3 in loads:
+                    context.model.Add(
+                        loads[p1] + loads[p2] + loads[p3] <= 2
+                    )
+                    constraint_count += 1
                 
-            # If not allowing any consecutive classes, add additional constraints
-            if not allow_consecutive:
-                for i in range(len(periods) - 1):  # Check pairs of consecutive periods
-                    p1, p2 = periods[i], periods[i + 1]
-                    
-                    # Ensure consecutive periods don't both have classes
+                # If not allowing any consecutive classes, ensure consecutive
+                # periods don't both have classes
+                if not allow_consecutive and p2 in loads:
                     context.model.Add(
-                        period_vars[p1] + period_vars[p2] <= 1
+                        loads[p1] + loads[p2] <= 1
                     )
                     constraint_count += 1
         
@@ -226,21 +217,15 @@ class TeacherBreakConstraint(BaseConstraint):
         if not required_breaks:
             return
             
-        # Group variables by date and required break periods
-        by_date = defaultdict(list)
-        for var in context.variables:
-            date = var["date"].date()
-            period = var["period"]
-            
-            if period in required_breaks:
-                by_date[date].append(var["variable"])
-        
         # Add constraint to ensure required break periods are free
+        occupancy = context.occupancy
         constraint_count = 0
-        for date, vars_list in by_date.items():
-            for break_var in vars_list:
-                context.model.Add(break_var == 0)  # Period must be free
-                constraint_count += 1
+        for date in occupancy.dates():
+            for period in required_breaks:
+                load = occupancy.slot_load(date, period)
+                if load is not None:
+                    context.model.Add(load == 0)  # Period must be free
+                    constraint_count += 1
         
         print(f"Added {constraint_count} teacher break constraints for required periods {required_breaks}")
     
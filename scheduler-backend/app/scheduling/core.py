@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Protocol, Optional
 from ortools.sat.python import cp_model
 
@@ -10,6 +10,8 @@ from ..models import (
     ScheduleAssignment,
     ScheduleMetadata
 )
+from .utils.variable_index import VariableIndex
+from .utils.occupancy import SlotOccupancy
 
 class SchedulerContext:
     """Context object for sharing state between scheduler components"""
@@ -28,6 +30,8 @@ class SchedulerContext:
         self.end_date = end_date
         self.variables: List[Dict[str, Any]] = []
         self.debug_info: Dict[str, Any] = {}
+        self._variable_index: Optional[VariableIndex] = None
+        self._occupancy: Optional[SlotOccupancy] = None
         
         # Index classes by name for quick lookup
         self.classes_by_name = {
@@ -42,6 +46,57 @@ class SchedulerContext:
                 self.instructor_unavailable[date_str] = set()
             self.instructor_unavailable[date_str].update(avail.periods)
 
+    @property
+    def variable_index(self) -> VariableIndex:
+        """
+        Shared indexed views over the schedule variables.
+
+        The index is rebuilt only when the variable list is replaced or grows,
+        so all constraints and objectives of a request reuse the same views.
+        """
+        index = self._variable_index
+        if index is None or index.variables is not self.variables or index.size != len(self.variables):
+            index = VariableIndex(
+                self.variables,
+                self.start_date,
+                [c.name for c in self.request.classes]
+            )
+            self._variable_index = index
+        return index
+
+    @property
+    def occupancy(self) -> SlotOccupancy:
+        """
+        Shared slot and day occupancy expressions for the schedule variables.
+
+        Built on top of variable_index and replaced together with it.
+        """
+        index = self.variable_index
+        occupancy = self._occupancy
+        if occupancy is None or occupancy.index is not index or occupancy.model is not self.model:
+            occupancy = SlotOccupancy(
+                self.model,
+                index,
+                {c.name: getattr(c, "gradeGroup", None) for c in self.request.classes}
+            )
+            self._occupancy = occupancy
+        return occupancy
+
+    @property
+    def weekdays_by_week(self) -> Dict[int, int]:
+        """
+        Number of calendar weekdays (Mon-Fri) in each week of the schedule.
+
+        Weeks are counted from start_date like the variables' "week". Unlike
+        variable_index.weekdays_by_week, the count does not depend on which
+        variables were created, so domain pruning never changes it.
+        """
+        weekdays: Dict[int, int] = {}
+        for day_index in range((self.end_date - self.start_date).days + 1):
+            if (self.start_date + timedelta(days=day_index)).weekday() < 5:
+                weekdays[day_index // 7] = weekdays.get(day_index // 7, 0) + 1
+        return weekdays
+
 class Constraint(Protocol):
     """Protocol defining the interface for scheduler constraints"""
     @property
@@ -1,38 +1,45 @@
 """Objective to encourage similar number of classes across used days"""
-from collections import defaultdict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
 from ortools.sat.python import cp_model
 
 from .base import BaseObjective
 from ..core import SchedulerContext
+from ..utils.variable_index import PERIODS_PER_DAY
 from ...models import ScheduleAssignment
 
 class DailyBalanceObjective(BaseObjective):
     """Encourages similar number of classes on each used day"""
     
-    def __init__(self):
-        from ..solvers.config import WEIGHTS
+    def __init__(self, formulation: Optional[str] = None):
+        """
+        Initialize the objective.
+        
+        Args:
+            formulation: "pairwise" or "compact" day-balance terms
+                (defaults to OBJECTIVE_FORMULATION from config)
+        """
+        from ..solvers.config import WEIGHTS, OBJECTIVE_FORMULATION, OBJECTIVE_FORMULATIONS
         super().__init__(
             name="daily_balance",
             weight=WEIGHTS['daily_balance']
         )
+        self.formulation = formulation or OBJECTIVE_FORMULATION
+        if self.formulation not in OBJECTIVE_FORMULATIONS:
+            raise ValueError(f"Unknown objective formulation: {self.formulation}")
     
     def create_terms(self, context: SchedulerContext) -> List[cp_model.LinearExpr]:
         terms = []
         
-        # Group variables by week and day
-        by_week = defaultdict(lambda: defaultdict(list))
-        for var in context.variables:
-            week_num = (var["date"] - context.start_date).days // 7
-            day_num = var["date"].weekday()  # Monday = 0, Sunday = 6
-            by_week[week_num][day_num].append(var)
+        # Variables grouped by week and day (Monday = 0, Sunday = 6)
+        index = context.variable_index
+        by_week = index.by_week_day
         
         # Process each week (except final week)
-        total_weeks = max(by_week.keys()) + 1
+        total_weeks = index.total_weeks
         for week_num in range(total_weeks - 1):  # Skip final week
-            week_vars = by_week[week_num]
+            week_vars = by_week.get(week_num, {})
             
             # Create day usage indicators and class counts
             day_used = {}
@@ -41,18 +48,16 @@ class DailyBalanceObjective(BaseObjective):
             # For each weekday (Monday-Friday)
             for day_num in range(5):  # 0-4 represents Monday-Friday
                 if day_num in week_vars:
-                    # Binary variable indicating if day is used
-                    day_used[day_num] = context.model.NewBoolVar(
-                        f"balance_day_used_w{week_num}_d{day_num}"
-                    )
-                    
-                    # Sum of assignments for this day
-                    day_sum = sum(var["variable"] for var in week_vars[day_num])
-                    day_count[day_num] = day_sum
-                    
-                    # Link day_used to whether any classes are scheduled
-                    context.model.Add(day_sum > 0).OnlyEnforceIf(day_used[day_num])
-                    context.model.Add(day_sum == 0).OnlyEnforceIf(day_used[day_num].Not())
+                    # Shared day indicator and class count for this day
+                    date = week_vars[day_num][0]["date"].date()
+                    day_used[day_num] = context.occupancy.day_used(date)
+                    day_count[day_num] = context.occupancy.day_load(date)
+            
+            if self.formulation == "compact":
+                terms.extend(
+                    self._compact_balance_terms(context, week_num, day_used, day_count)
+                )
+                continue
             
             # Compare each pair of used days
             for day_i in range(5):
@@ -97,3 +102,29 @@ class DailyBalanceObjective(BaseObjective):
                     terms.append(penalty)
         
         return terms
+    
+    def _compact_balance_terms(
+        self,
+        context: SchedulerContext,
+        week_num: int,
+        day_used: Dict[int, Any],
+        day_count: Dict[int, Any]
+    ) -> List[cp_model.LinearExpr]:
+        """
+        Penalize the spread between the busiest and quietest used day of a week.
+        
+        The spread times (days - 1) is a lower bound on the sum of pairwise
+        differences, and needs two variables per week instead of two per pair.
+        """
+        if len(day_count) < 2:
+            return []
+        
+        max_count = context.model.NewIntVar(0, PERIODS_PER_DAY, f"daily_balance_max_w{week_num}")
+        min_count = context.model.NewIntVar(0, PERIODS_PER_DAY, f"daily_balance_min_w{week_num}")
+        for day_num, count in day_count.items():
+            context.model.Add(max_count >= count)
+            # Unused days do not pull the minimum down
+            context.model.Add(min_count <= count).OnlyEnforceIf(day_used[day_num])
+        context.model.Add(min_count <= max_count)
+        
+        return [-100 * (len(day_count) - 1) * (max_count - min_count)]
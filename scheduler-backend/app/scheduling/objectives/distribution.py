@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import statistics
 from datetime import datetime, timedelta
@@ -34,22 +34,29 @@ class DistributionObjective(BaseObjective):
     3. Balanced class workload
     """
     
-    def __init__(self):
-        from ..solvers.config import WEIGHTS
+    def __init__(self, formulation: Optional[str] = None):
+        """
+        Initialize the objective.
+        
+        Args:
+            formulation: "pairwise" or "compact" period-balance terms
+                (defaults to OBJECTIVE_FORMULATION from config)
+        """
+        from ..solvers.config import WEIGHTS, OBJECTIVE_FORMULATION, OBJECTIVE_FORMULATIONS
         super().__init__(
             name="distribution",
             weight=WEIGHTS['distribution']  # Use standardized weight from config
         )
+        self.formulation = formulation or OBJECTIVE_FORMULATION
+        if self.formulation not in OBJECTIVE_FORMULATIONS:
+            raise ValueError(f"Unknown objective formulation: {self.formulation}")
     
     def create_terms(self, context: SchedulerContext) -> List[cp_model.LinearExpr]:
         terms = []
         
-        # Group variables by week
-        by_week = defaultdict(list)
-        for var in context.variables:
-            # Both var["date"] and context.start_date are datetime objects from base solver
-            week_num = (var["date"] - context.start_date).days // 7
-            by_week[week_num].append(var)
+        # Shared indexed views of the variables
+        index = context.variable_index
+        by_week = index.by_week
         
         # Create weekly distribution terms
         total_classes = len(context.request.classes)
@@ -70,53 +77,15 @@ class DistributionObjective(BaseObjective):
             context.model.Add(penalty <= 750 * deviation)
             terms.append(penalty)
         
-        # Group variables by date and period
-        by_date = defaultdict(lambda: defaultdict(list))
-        for var in context.variables:
-            date = var["date"].date()
-            period = var["period"]
-            by_date[date][period].append(var)
-        
         # Create daily distribution terms
-        for date, periods in by_date.items():
-            # Track assignments per period
-            period_sums = []
-            for period in range(1, 9):
-                if period in periods:
-                    period_sum = sum(
-                        var["variable"] for var in periods[period]
-                    )
-                    period_sums.append(period_sum)
-            
-            # Penalize uneven distribution across periods
-            if period_sums:
-                for i in range(len(period_sums)):
-                    for j in range(i + 1, len(period_sums)):
-                        # Create deviation variable for each pair
-                        deviation = context.model.NewIntVar(
-                            -10, 10, 
-                            f"period_diff_{date}_{i}_{j}"
-                        )
-                        context.model.Add(
-                            deviation == period_sums[i] - period_sums[j]
-                        )
-                        # Penalize differences
-                        penalty = context.model.NewIntVar(
-                            -500, 0,
-                            f"period_penalty_{date}_{i}_{j}"
-                        )
-                        context.model.Add(penalty <= -50 * deviation)
-                        context.model.Add(penalty <= 50 * deviation)
-                        terms.append(penalty)
-        
-        # Group variables by class
-        by_class = defaultdict(lambda: defaultdict(list))
-        for var in context.variables:
-            date = var["date"].date()
-            by_class[var["name"]][date].append(var)
+        for date in index.by_date_period:
+            if self.formulation == "compact":
+                terms.extend(self._compact_period_terms(context, date))
+            else:
+                terms.extend(self._pairwise_period_terms(context, date))
         
         # Create class workload distribution terms
-        for class_vars in by_class.values():
+        for class_vars in index.by_class_date.values():
             for date, day_vars in class_vars.items():
                 # Sum of assignments for this class on this day
                 day_sum = sum(var["variable"] for var in day_vars)
@@ -140,6 +109,76 @@ class DistributionObjective(BaseObjective):
         
         return terms
     
+    def _pairwise_period_terms(
+        self,
+        context: SchedulerContext,
+        date: Any
+    ) -> List[cp_model.LinearExpr]:
+        """Penalize the load difference of every pair of periods on a date."""
+        terms = []
+        occupancy = context.occupancy
+        
+        # Track assignments per period
+        period_sums = [
+            occupancy.slot_load(date, period)
+            for period in occupancy.periods(date)
+        ]
+        
+        # Penalize uneven distribution across periods
+        for i in range(len(period_sums)):
+            for j in range(i + 1, len(period_sums)):
+                # Create deviation variable for each pair
+                deviation = context.model.NewIntVar(
+                    -10, 10, 
+                    f"period_diff_{date}_{i}_{j}"
+                )
+                context.model.Add(
+                    deviation == period_sums[i] - period_sums[j]
+                )
+                # Penalize differences
+                penalty = context.model.NewIntVar(
+                    -500, 0,
+                    f"period_penalty_{date}_{i}_{j}"
+                )
+                context.model.Add(penalty <= -50 * deviation)
+                context.model.Add(penalty <= 50 * deviation)
+                terms.append(penalty)
+        
+        return terms
+    
+    def _compact_period_terms(
+        self,
+        context: SchedulerContext,
+        date: Any
+    ) -> List[cp_model.LinearExpr]:
+        """
+        Penalize each period's deviation from the day's mean load.
+        
+        With n periods and a day total S, |n * load - S| summed over the
+        periods is twice the sum of pairwise differences when slot loads are
+        0/1, so a weight of 25 matches the pairwise penalty of 50 while adding
+        one variable per period instead of two per pair.
+        """
+        terms = []
+        occupancy = context.occupancy
+        periods = occupancy.periods(date)
+        n = len(periods)
+        if n < 2:
+            return terms
+        
+        day_sum = occupancy.day_load(date)
+        for period in periods:
+            deviation = context.model.NewIntVar(
+                0, 10 * n,
+                f"period_dev_{date}_{period}"
+            )
+            scaled_load = n * occupancy.slot_load(date, period)
+            context.model.Add(deviation >= scaled_load - day_sum)
+            context.model.Add(deviation >= day_sum - scaled_load)
+            terms.append(-25 * deviation)
+        
+        return terms
+    
     def calculate_metrics(
         self,
         assignments: List[ScheduleAssignment],
@@ -1,5 +1,4 @@
 """Objective to compress remaining classes into early days of final week"""
-from collections import defaultdict
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
@@ -22,15 +21,12 @@ class FinalWeekCompressionObjective(BaseObjective):
     def create_terms(self, context: SchedulerContext) -> List[cp_model.LinearExpr]:
         terms = []
         
-        # Group variables by week and day
-        by_week = defaultdict(lambda: defaultdict(list))
-        for var in context.variables:
-            week_num = (var["date"] - context.start_date).days // 7
-            day_num = var["date"].weekday()  # Monday = 0, Sunday = 6
-            by_week[week_num][day_num].append(var)
+        # Variables grouped by week and day (Monday = 0, Sunday = 6)
+        index = context.variable_index
+        by_week = index.by_week_day
         
         # Only focus on the final week
-        final_week = max(by_week.keys())
+        final_week = index.total_weeks - 1
         if final_week in by_week:
             final_week_vars = by_week[final_week]
             
@@ -55,29 +51,14 @@ class FinalWeekCompressionObjective(BaseObjective):
                         
                     # Additional penalty for gaps between used days
                     if day_num > 0 and day_num - 1 in final_week_vars:
-                        # Variables for previous and current day usage
-                        prev_day_used = context.model.NewBoolVar(
-                            f"final_week_prev_day_used_{day_num}"
+                        # Shared usage indicators for previous and current day
+                        prev_day_used = context.occupancy.day_used(
+                            final_week_vars[day_num - 1][0]["date"].date()
                         )
-                        curr_day_used = context.model.NewBoolVar(
-                            f"final_week_curr_day_used_{day_num}"
+                        curr_day_used = context.occupancy.day_used(
+                            final_week_vars[day_num][0]["date"].date()
                         )
                         
-                        # Link usage variables to assignments
-                        prev_sum = sum(
-                            var["variable"] 
-                            for var in final_week_vars[day_num - 1]
-                        )
-                        curr_sum = sum(
-                            var["variable"] 
-                            for var in final_week_vars[day_num]
-                        )
-                        
-                        context.model.Add(prev_sum > 0).OnlyEnforceIf(prev_day_used)
-                        context.model.Add(prev_sum == 0).OnlyEnforceIf(prev_day_used.Not())
-                        context.model.Add(curr_sum > 0).OnlyEnforceIf(curr_day_used)
-                        context.model.Add(curr_sum == 0).OnlyEnforceIf(curr_day_used.Not())
-                        
                         # Penalize gaps (prev day unused but current day used)
                         gap_penalty = context.model.NewIntVar(
                             -1000, 0,
@@ -62,87 +62,43 @@ class GradeGroupingObjective(BaseObjective):
         """
         terms = []
         
-        # Group variables by date and period to find consecutive assignments
-        by_date_period = defaultdict(dict)
-        for var in context.variables:
-            date = var["date"].date()
-            period = var["period"]
-            by_date_period[date][period] = var
+        occupancy = context.occupancy
         
         # Create reward terms for consecutive periods with similar grades
-        for date, periods in by_date_period.items():
-            period_nums = sorted(periods.keys())
-            for i in range(len(period_nums) - 1):
-                # Get current and next period
-                cur_period = period_nums[i]
-                next_period = period_nums[i + 1]
+        for date in occupancy.dates():
+            period_nums = occupancy.periods(date)
+            for cur_period in period_nums:
+                next_period = cur_period + 1
                 
                 # Skip if periods are not consecutive
-                if next_period != cur_period + 1:
+                if next_period not in period_nums:
                     continue
                 
-                cur_var = periods[cur_period]
-                next_var = periods[next_period]
-                
-                # Create variables to track if both periods are scheduled
-                cur_active = cur_var["variable"]
-                next_active = next_var["variable"]
-                
-                # Create variable for when both periods are active
-                both_active = context.model.NewBoolVar(
-                    f"both_active_{date}_{cur_period}_{next_period}"
-                )
-                context.model.AddBoolAnd([cur_active, next_active]).OnlyEnforceIf(both_active)
-                context.model.AddBoolOr([cur_active.Not(), next_active.Not()]).OnlyEnforceIf(both_active.Not())
-                
-                # Get class objects for both variables
-                # Handle different field names (id vs name vs classId)
-                cur_class = next((c for c in context.request.classes if 
-                                  (hasattr(c, "id") and c.id == cur_var["name"]) or 
-                                  (hasattr(c, "name") and c.name == cur_var["name"])), None)
-                next_class = next((c for c in context.request.classes if 
-                                  (hasattr(c, "id") and c.id == next_var["name"]) or 
-                                  (hasattr(c, "name") and c.name == next_var["name"])), None)
+                # Load of each grade group in both periods (0/1 per slot)
+                cur_loads = occupancy.grade_loads(date, cur_period)
+                next_loads = occupancy.grade_loads(date, next_period)
                 
-                if cur_class and next_class:
-                    # Calculate similarity score between the grades using gradeGroup
-                    cur_grade_group = getattr(cur_class, 'gradeGroup', None)
-                    next_grade_group = getattr(next_class, 'gradeGroup', None)
-                    
-                    # If gradeGroup is not available, use the mapping from the model
-                    if cur_grade_group is None or next_grade_group is None:
-                        # Default grade mapping
-                        grade_map = {
-                            "Pre-K": 0,
-                            "K": 1,
-                            "1": 2,
-                            "2": 3,
-                            "3": 4,
-                            "4": 5,
-                            "5": 6
-                        }
-                        cur_grade_group = grade_map.get(cur_class.grade, 0)
-                        next_grade_group = grade_map.get(next_class.grade, 0)
-                    
-                    # Calculate similarity
-                    similarity = grade_similarity(cur_grade_group, next_grade_group)
-                    
-                    # Convert to integer score (multiply by 100 for CP-SAT)
-                    int_score = int(similarity * 100)
-                    
-                    # Only add bonus if similarity is meaningful
-                    if int_score > 0:
-                        # Create reward term when both are active
-                        reward = context.model.NewIntVar(
-                            0, int_score, 
-                            f"grade_grouping_reward_{date}_{cur_period}_{next_period}"
-                        )
+                for cur_group, cur_load in cur_loads.items():
+                    for next_group, next_load in next_loads.items():
+                        # Calculate similarity between the grade groups
+                        similarity = grade_similarity(cur_group or 0, next_group or 0)
+                        
+                        # Convert to integer score (multiply by 100 for CP-SAT)
+                        int_score = int(similarity * 100)
                         
-                        # Set reward to similarity score if both active, otherwise 0
-                        context.model.Add(reward == int_score).OnlyEnforceIf(both_active)
-                        context.model.Add(reward == 0).OnlyEnforceIf(both_active.Not())
+                        # Only add bonus if similarity is meaningful
+                        if int_score <= 0:
+                            continue
+                        
+                        # True only if both grade groups occupy their periods.
+                        # The objective is maximized, so upper bounds suffice.
+                        both_active = context.model.NewBoolVar(
+                            f"grade_grouping_{date}_{cur_period}_g{cur_group}_g{next_group}"
+                        )
+                        context.model.Add(both_active <= cur_load)
+                        context.model.Add(both_active <= next_load)
                         
-                        terms.append(reward)
+                        terms.append(int_score * both_active)
         
         return terms
     
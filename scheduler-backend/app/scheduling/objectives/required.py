@@ -33,10 +33,7 @@ class RequiredPeriodsObjective(BaseObjective):
         
         for var in context.variables:
             # Get class object for this variable
-            class_obj = next(
-                c for c in context.request.classes 
-                if c.name == var["name"]
-            )
+            class_obj = context.classes_by_name[var["name"]]
             
             # Convert variable's date to date string
             date_str = var["date"].date().isoformat()
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional
 import traceback
 import time
 from datetime import datetime, timedelta
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from ortools.sat.python import cp_model
 
 from ..core import SchedulerContext
+from ..utils.domain_pruning import DomainPruner
 from ...models import (
     ScheduleRequest, 
     ScheduleResponse, 
@@ -25,6 +26,7 @@ class BaseSolver:
         self.name = name
         self.constraints = []
         self.objectives = []
+        self._progress_callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
         
     def add_constraint(self, constraint: Any) -> None:
         """Add a constraint to the solver"""
@@ -33,13 +35,50 @@ class BaseSolver:
     def add_objective(self, objective: Any) -> None:
         """Add an objective to the solver"""
         self.objectives.append(objective)
+    
+    def get_active_constraints(self) -> List[Any]:
+        """Get the constraints that will be applied to the model"""
+        return self.constraints
+        
+    def set_progress_callback(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]]
+    ) -> None:
+        """
+        Set a callback function to receive progress during solving.
+        
+        The callback receives a dict describing the latest progress (for
+        CP-SAT: solutions, objective, bound, gap and elapsed seconds, plus
+        the assignments as dicts when the solution improved). Returning
+        True asks the solver to stop and return the best solution so far.
+        
+        Args:
+            callback: Function to call with progress, or None to remove it
+        """
+        self._progress_callback = callback
+        
+    def create_schedule(
+        self,
+        request: ScheduleRequest,
+        time_limit_seconds: Optional[float] = None,
+        profile: Optional[str] = None
+    ) -> ScheduleResponse:
+        """
+        Create a schedule using the solver configuration.
+        
+        Args:
+            request: The schedule request to solve
+            time_limit_seconds: Solver time limit (defaults to the profile's limit)
+            profile: Name of the CP-SAT parameter profile (defaults to SOLVER_PROFILE)
+        """
+        from .config import get_solver_profile
+        solver_profile = get_solver_profile(profile)
+        time_limit = solver_profile.get_time_limit(time_limit_seconds)
         
-    def create_schedule(self, request: ScheduleRequest) -> ScheduleResponse:
-        """Create a schedule using the solver configuration"""
         print(f"\nStarting {self.name} solver for {len(request.classes)} classes...")
         print("\nSolver configuration:")
         print("Constraints:")
-        for constraint in self.constraints:
+        for constraint in self.get_active_constraints():
             print(f"- {constraint.name}")
         print("\nObjectives:")
         for objective in self.objectives:
@@ -50,10 +89,18 @@ class BaseSolver:
             model = cp_model.CpModel()
             solver = cp_model.CpSolver()
             
-            # Configure solver parameters for timeout and performance
-            solver.parameters.max_time_in_seconds = 120.0  # 2 minute timeout
-            solver.parameters.log_search_progress = True
-            solver.parameters.num_search_workers = 8
+            # Configure solver parameters from the profile
+            solver.parameters.max_time_in_seconds = time_limit
+            solver.parameters.log_search_progress = solver_profile.LOG_SEARCH_PROGRESS
+            solver.parameters.num_search_workers = solver_profile.get_num_workers()
+            if solver_profile.RELATIVE_GAP > 0:
+                solver.parameters.relative_gap_limit = solver_profile.RELATIVE_GAP
+            print(
+                f"\nSolver profile: {solver_profile.NAME} "
+                f"(time limit: {time_limit:.0f}s, "
+                f"workers: {solver.parameters.num_search_workers}, "
+                f"relative gap: {solver_profile.RELATIVE_GAP})"
+            )
             
             # Parse dates
             start_date = datetime.fromisoformat(request.startDate)
@@ -78,18 +125,11 @@ class BaseSolver:
             
             # Log available slots per class
             print("\nAvailable slots per class:")
-            by_class = {}
-            for var in context.variables:
-                class_name = var["name"]
-                if class_name not in by_class:
-                    by_class[class_name] = []
-                by_class[class_name].append(var)
-            
-            for class_name, vars_list in by_class.items():
+            for class_name, vars_list in context.variable_index.by_class.items():
                 print(f"\nClass {class_name}:")
                 print(f"- Total available slots: {len(vars_list)}")
                 # Get class's conflicts
-                class_obj = next(c for c in request.classes if c.name == class_name)
+                class_obj = context.classes_by_name[class_name]
                 # Class object may have conflicts directly or in weeklySchedule
                 if hasattr(class_obj, "conflicts") and class_obj.conflicts:
                     print(f"- Conflict periods: {len(class_obj.conflicts)}")
@@ -106,7 +146,7 @@ class BaseSolver:
                     print(f"  {day}: periods {sorted(periods)}")
             
             # Apply constraints
-            for constraint in self.constraints:
+            for constraint in self.get_active_constraints():
                 print(f"\nApplying constraint: {constraint.name}")
                 constraint.apply(context)
             
@@ -121,6 +161,10 @@ class BaseSolver:
             if objective_terms:
                 context.model.Maximize(sum(objective_terms))
             
+            # Report how much of the slot/day occupancy was shared
+            context.debug_info["occupancy"] = dict(context.occupancy.stats)
+            print(f"\nShared occupancy: {context.debug_info['occupancy']}")
+            
             # Add search heuristics
             print("\nAdding search heuristics...")
             
@@ -157,10 +201,10 @@ class BaseSolver:
             )
             
             # Create solution callback to track best solution
-            callback = SolutionCallback(context)
+            callback = SolutionCallback(context, self._progress_callback)
             
             # Solve with timeout
-            print("\nStarting solver with 2 minute timeout...")
+            print(f"\nStarting solver with {time_limit:.0f} second timeout...")
             start_time = time.time()
             status = solver.Solve(context.model, callback)
             duration_ms = int((time.time() - start_time) * 1000)
@@ -182,7 +226,7 @@ class BaseSolver:
             else:
                 # Check if this was a timeout or no solution exists
                 elapsed_time = time.time() - start_time
-                if elapsed_time >= 119.0:  # Close to our 120s limit
+                if elapsed_time >= time_limit - 1.0:  # Close to the time limit
                     raise TimeoutError("Solver timed out without finding any solution")
                 else:
                     raise ValueError("No solution found. The problem may be infeasible with current constraints.")
@@ -283,12 +327,24 @@ class BaseSolver:
         print(f"Periods per day: 8")
         print(f"Maximum possible slots: {weekdays * 8}")
         
+        # Determine statically-zero slots so their variables are never created
+        from .config import ENABLE_DOMAIN_PRUNING
+        pruner = None
+        if ENABLE_DOMAIN_PRUNING:
+            pruner = DomainPruner(context, self.get_active_constraints())
+        
         # Create variables
         for class_obj in context.request.classes:
             print(f"\nCreating variables for class {class_obj.name}:")
             print(f"- Conflicts: {len(class_obj.weeklySchedule.conflicts)}")
             
+            # Index conflicts by weekday once per class
+            conflicts_by_weekday = {}
+            for conflict in class_obj.weeklySchedule.conflicts:
+                conflicts_by_weekday.setdefault(conflict.dayOfWeek, set()).add(conflict.period)
+            
             current_date = context.start_date
+            day_index = 0
             class_vars = 0
             while current_date <= context.end_date:
                 # Only create variables for weekdays and non-conflicting periods
@@ -296,37 +352,51 @@ class BaseSolver:
                     weekday = current_date.weekday() + 1  # Convert to 1-5 for Monday-Friday
                     
                     # Get conflicts for this day
-                    conflicts = {
-                        conflict.period
-                        for conflict in class_obj.weeklySchedule.conflicts
-                        if conflict.dayOfWeek == weekday
-                    }
+                    conflicts = conflicts_by_weekday.get(weekday, set())
                     
-                    # Create variables only for non-conflicting periods
+                    # Create variables only for non-conflicting, non-pruned periods
                     for period in range(1, 9):  # periods 1-8
-                        if period not in conflicts:
-                            var_name = f"class_{class_obj.name}_{current_date.date()}_{period}"
-                            var = context.model.NewBoolVar(var_name)
-                            variable_data = {
-                                "variable": var,
-                                "name": class_obj.name,
-                                "date": current_date,
-                                "period": period
-                            }
+                        if period in conflicts:
+                            continue
+                        if pruner and pruner.is_pruned(class_obj.name, current_date.date(), period):
+                            continue
+                        
+                        var_name = f"class_{class_obj.name}_{current_date.date()}_{period}"
+                        var = context.model.NewBoolVar(var_name)
+                        variable_data = {
+                            "variable": var,
+                            "name": class_obj.name,
+                            "date": current_date,
+                            "period": period,
+                            # Precomputed offsets used by the variable index
+                            "day_index": day_index,
+                            "week": day_index // 7
+                        }
+                        
+                        # Add grade information if available
+                        if hasattr(class_obj, "grade"):
+                            variable_data["grade"] = class_obj.grade
                             
-                            # Add grade information if available
-                            if hasattr(class_obj, "grade"):
-                                variable_data["grade"] = class_obj.grade
-                                
-                            context.variables.append(variable_data)
-                            class_vars += 1
+                        context.variables.append(variable_data)
+                        class_vars += 1
                 current_date = current_date + timedelta(days=1)
+                day_index += 1
             print(f"- Created {class_vars} variables")
+        
+        if pruner:
+            stats = pruner.finish()
+            context.debug_info["domain_pruning"] = stats.to_dict()
+            print(f"\nDomain pruning eliminated {stats.variables_eliminated} variables "
+                  f"and {stats.constraints_eliminated} constraints: {stats.by_reason}")
 
 class SolutionCallback(cp_model.CpSolverSolutionCallback):
     """Callback to track solver progress and store intermediate solutions"""
     
-    def __init__(self, context: SchedulerContext):
+    def __init__(
+        self,
+        context: SchedulerContext,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+    ):
         cp_model.CpSolverSolutionCallback.__init__(self)
         self._solutions = 0
         self._start_time = time.time()
@@ -335,6 +405,7 @@ class SolutionCallback(cp_model.CpSolverSolutionCallback):
         self._best_solution: Optional[List[ScheduleAssignment]] = None
         self._best_objective = float('-inf')
         self._context = context
+        self._progress_callback = progress_callback
         
     def on_solution_callback(self):
         """Called when solver finds a new solution"""
@@ -343,7 +414,8 @@ class SolutionCallback(cp_model.CpSolverSolutionCallback):
         
         # Track best solution
         objective_value = self.ObjectiveValue()
-        if objective_value > self._best_objective:
+        improved = objective_value > self._best_objective
+        if improved:
             self._best_objective = objective_value
             self._best_solution = self._convert_solution()
             
@@ -386,6 +458,29 @@ class SolutionCallback(cp_model.CpSolverSolutionCallback):
             
             self._last_log_time = current_time
             self._last_log_count = self._solutions
+        
+        # Report progress, with the schedule when it improved, and stop
+        # early if the caller asks for it
+        if self._progress_callback is not None:
+            bound = self.BestObjectiveBound()
+            progress = {
+                "solver": "cp-sat",
+                "solutions": self._solutions,
+                "objective": self._best_objective,
+                "bound": bound,
+                "gap": (
+                    abs(bound - self._best_objective) / abs(self._best_objective)
+                    if self._best_objective != 0 else None
+                ),
+                "elapsed_seconds": current_time - self._start_time,
+                "improved": improved
+            }
+            if improved:
+                progress["assignments"] = [a.model_dump() for a in self._best_solution]
+            stop = self._progress_callback(progress)
+            if stop:
+                print(f"\nStopping search at caller's request after {self._solutions} solutions")
+                self.StopSearch()
             
     def _convert_solution(self) -> List[ScheduleAssignment]:
         """Convert current solution to schedule assignments"""
@@ -0,0 +1,252 @@
+"""Content-addressed cache of schedule responses"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ...models import ScheduleRequest, ScheduleResponse
+
+logger = logging.getLogger(__name__)
+
+# Request fields holding dates, normalized so equivalent spellings hash alike
+DATE_FIELDS = ("date", "startDate", "endDate")
+
+
+def _normalize_date(value: Any) -> Any:
+    """Normalize an ISO date or datetime string to UTC ISO 8601"""
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Put a JSON value in canonical form.
+
+    Every list in a schedule request is an unordered collection (classes,
+    availability, conflicts, periods), so lists are sorted by the canonical
+    JSON of their items; dict keys are sorted when dumped.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _normalize_date(item) if key in DATE_FIELDS else _canonical(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        items = [_canonical(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    return value
+
+
+def request_hash(request: ScheduleRequest, solver_signature: Dict[str, Any]) -> str:
+    """
+    Hash a schedule request together with the solver settings that shape its result.
+
+    Args:
+        request: Schedule request
+        solver_signature: Solver type, weights, relaxation level and solve options
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "request": _canonical(request.model_dump(mode="json")),
+        "solver": _canonical(solver_signature),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of schedule responses keyed by request hash.
+
+    The memory tier is an LRU of at most ``max_entries`` responses. The
+    optional disk tier is a SQLite table that survives restarts and is
+    shared by every process pointing at the same file; disk hits are
+    promoted to memory. Entries expire ``ttl_seconds`` after they were
+    stored (0 keeps them until evicted).
+
+    Responses are stored as JSON and a fresh copy is returned on every hit,
+    so callers may modify what they get back.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 3600, db_path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Responses kept in memory
+            ttl_seconds: Seconds an entry stays valid (0 = no expiry)
+            db_path: SQLite file for the disk tier, or None for memory only
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path or None
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, expires_at REAL)"
+                )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the disk tier in autocommit mode"""
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _expires_at(self) -> float:
+        return time.time() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+
+    def _remember(self, key: str, expires_at: float, response_json: str) -> None:
+        """Add an entry to the memory tier, evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = (expires_at, response_json)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[ScheduleResponse]:
+        """
+        Look up a response.
+
+        Args:
+            key: Request hash
+            count_miss: Whether a miss counts in the metrics (False when the
+                caller will look up the same key again before solving)
+
+        Returns:
+            A copy of the cached response, or None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return ScheduleResponse.model_validate_json(entry[1])
+                del self._entries[key]
+                self._stats["expired"] += 1
+
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    row = conn.execute(
+                        "SELECT response, expires_at FROM results WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and row[1] is not None and row[1] <= now:
+                        conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                        with self._lock:
+                            self._stats["expired"] += 1
+                        row = None
+            except sqlite3.Error as e:
+                logger.warning(f"Result cache disk lookup failed: {e}")
+                row = None
+            if row is not None:
+                expires_at = row[1] if row[1] is not None else float("inf")
+                self._remember(key, expires_at, row[0])
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                return ScheduleResponse.model_validate_json(row[0])
+
+        if count_miss:
+            with self._lock:
+                self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, response: ScheduleResponse) -> None:
+        """
+        Store a response under a request hash.
+
+        Args:
+            key: Request hash
+            response: Response to cache
+        """
+        response_json = response.model_dump_json()
+        expires_at = self._expires_at()
+        self._remember(key, expires_at, response_json)
+        with self._lock:
+            self._stats["stores"] += 1
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (key, response, created_at, expires_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, response_json, time.time(),
+                         None if expires_at == float("inf") else expires_at)
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Result cache disk store failed: {e}")
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and the size of each tier"""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["memory_entries"] = len(self._entries)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hits"] = hits
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["disk"] = bool(self.db_path)
+        return stats
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Get the process-wide result cache, or None if ENABLE_RESULT_CACHE is off"""
+    global _cache
+    from . import config as config_module
+    if not config_module.ENABLE_RESULT_CACHE:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(
+                max_entries=config_module.RESULT_CACHE_SIZE,
+                ttl_seconds=config_module.RESULT_CACHE_TTL_SECONDS,
+                db_path=config_module.RESULT_CACHE_DB_PATH
+            )
+        return _cache
@@ -4,6 +4,7 @@ from typing import List, Optional, Dict
 import os
 
 from ..core import Constraint, Objective
+from ..utils.resources import available_cpu_count
 
 @dataclass
 class GeneticConfig:
@@ -19,7 +20,30 @@ class GeneticConfig:
     DIVERSITY_THRESHOLD: float = 0.15
     ADAPTATION_STRENGTH: float = 0.5
     PARALLEL_FITNESS: bool = True
+    VECTORIZED_FITNESS: bool = True
+    INCREMENTAL_FITNESS: bool = False
+    VERIFY_FITNESS: bool = False
+    FITNESS_CACHE_SIZE: int = 0
+    SHARED_MEMORY_FITNESS: bool = False
+    NUM_ISLANDS: int = 1
+    MIGRATION_INTERVAL: int = 10
+    MIGRATION_SIZE: int = 2
+    MIGRATION_TOPOLOGY: str = "ring"
+    DIVERSITY_METRIC: str = "frequency"
+    DIVERSITY_SAMPLES: int = 1000
+    GREEDY_INIT_FRACTION: float = 0.5
+    CP_SAT_SEEDS: int = 0
+    SEED_TIME_LIMIT: float = 5.0
+    REPAIR_MOVES: int = 50
+    OFFSPRING_ATTEMPTS: int = 10
     CROSSOVER_METHODS: List[str] = field(default_factory=lambda: ["single_point", "two_point", "uniform", "order"])
+    LOCAL_SEARCH_INTERVAL: int = 0
+    LOCAL_SEARCH_TOP_K: int = 2
+    LOCAL_SEARCH_EVALUATIONS: int = 200
+    MUTATION_METHODS: List[str] = field(default_factory=lambda: ["random", "free_slot", "swap", "shift"])
+    CHECKPOINT_DIR: Optional[str] = None
+    CHECKPOINT_INTERVAL: int = 10
+    RESUME: bool = False
     
     @classmethod
     def from_env(cls) -> 'GeneticConfig':
@@ -31,6 +55,12 @@ class GeneticConfig:
             if crossover_methods_str else 
             ["single_point", "two_point", "uniform", "order"]
         )
+        mutation_methods_str = os.getenv('GA_MUTATION_METHODS', '')
+        mutation_methods = (
+            mutation_methods_str.split(',')
+            if mutation_methods_str else
+            ["random", "free_slot", "swap", "shift"]
+        )
         
         return cls(
             POPULATION_SIZE=int(os.getenv('GA_POPULATION_SIZE', '100')),
@@ -44,7 +74,30 @@ class GeneticConfig:
             DIVERSITY_THRESHOLD=float(os.getenv('GA_DIVERSITY_THRESHOLD', '0.15')),
             ADAPTATION_STRENGTH=float(os.getenv('GA_ADAPTATION_STRENGTH', '0.5')),
             PARALLEL_FITNESS=bool(int(os.getenv('GA_PARALLEL_FITNESS', '1'))),
-            CROSSOVER_METHODS=crossover_methods
+            VECTORIZED_FITNESS=bool(int(os.getenv('GA_VECTORIZED_FITNESS', '1'))),
+            INCREMENTAL_FITNESS=bool(int(os.getenv('GA_INCREMENTAL_FITNESS', '0'))),
+            VERIFY_FITNESS=bool(int(os.getenv('GA_VERIFY_FITNESS', '0'))),
+            FITNESS_CACHE_SIZE=int(os.getenv('GA_FITNESS_CACHE_SIZE', '0')),
+            SHARED_MEMORY_FITNESS=bool(int(os.getenv('GA_SHARED_MEMORY_FITNESS', '0'))),
+            NUM_ISLANDS=int(os.getenv('GA_NUM_ISLANDS', '1')),
+            MIGRATION_INTERVAL=int(os.getenv('GA_MIGRATION_INTERVAL', '10')),
+            MIGRATION_SIZE=int(os.getenv('GA_MIGRATION_SIZE', '2')),
+            MIGRATION_TOPOLOGY=os.getenv('GA_MIGRATION_TOPOLOGY', 'ring'),
+            DIVERSITY_METRIC=os.getenv('GA_DIVERSITY_METRIC', 'frequency'),
+            DIVERSITY_SAMPLES=int(os.getenv('GA_DIVERSITY_SAMPLES', '1000')),
+            GREEDY_INIT_FRACTION=float(os.getenv('GA_GREEDY_INIT_FRACTION', '0.5')),
+            CP_SAT_SEEDS=int(os.getenv('GA_CP_SAT_SEEDS', '0')),
+            SEED_TIME_LIMIT=float(os.getenv('GA_SEED_TIME_LIMIT', '5')),
+            REPAIR_MOVES=int(os.getenv('GA_REPAIR_MOVES', '50')),
+            OFFSPRING_ATTEMPTS=int(os.getenv('GA_OFFSPRING_ATTEMPTS', '10')),
+            LOCAL_SEARCH_INTERVAL=int(os.getenv('GA_LOCAL_SEARCH_INTERVAL', '0')),
+            LOCAL_SEARCH_TOP_K=int(os.getenv('GA_LOCAL_SEARCH_TOP_K', '2')),
+            LOCAL_SEARCH_EVALUATIONS=int(os.getenv('GA_LOCAL_SEARCH_EVALUATIONS', '200')),
+            CHECKPOINT_DIR=os.getenv('GA_CHECKPOINT_DIR') or None,
+            CHECKPOINT_INTERVAL=int(os.getenv('GA_CHECKPOINT_INTERVAL', '10')),
+            RESUME=bool(int(os.getenv('GA_RESUME', '0'))),
+            CROSSOVER_METHODS=crossover_methods,
+            MUTATION_METHODS=mutation_methods
         )
 
 @dataclass
@@ -69,6 +122,48 @@ class MetaOptimizationConfig:
             PARALLEL_EVALUATION=bool(int(os.getenv('META_PARALLEL_EVALUATION', '1')))
         )
 
+@dataclass
+class SolverProfile:
+    """CP-SAT search parameters applied to a single solve"""
+    NAME: str
+    TIME_LIMIT_SECONDS: Optional[float] = None  # None uses the caller's or global limit
+    NUM_WORKERS: Optional[int] = None  # None uses the CPUs available to the process
+    MAX_WORKERS: Optional[int] = None  # Cap for the detected worker count
+    RELATIVE_GAP: float = 0.0  # Stop once within this gap of the best bound
+    LOG_SEARCH_PROGRESS: bool = False
+    
+    @classmethod
+    def from_env(cls, name: str, **defaults) -> 'SolverProfile':
+        """Create a profile from its defaults and SOLVER_<NAME>_* environment variables"""
+        profile = cls(NAME=name, **defaults)
+        prefix = f"SOLVER_{name.upper()}_"
+        if os.getenv(prefix + 'TIME_LIMIT'):
+            profile.TIME_LIMIT_SECONDS = float(os.getenv(prefix + 'TIME_LIMIT'))
+        if os.getenv(prefix + 'WORKERS'):
+            profile.NUM_WORKERS = int(os.getenv(prefix + 'WORKERS')) or None
+        if os.getenv(prefix + 'RELATIVE_GAP'):
+            profile.RELATIVE_GAP = float(os.getenv(prefix + 'RELATIVE_GAP'))
+        if os.getenv(prefix + 'LOG'):
+            profile.LOG_SEARCH_PROGRESS = bool(int(os.getenv(prefix + 'LOG')))
+        return profile
+    
+    def get_num_workers(self) -> int:
+        """Get the number of CP-SAT search workers to use"""
+        if self.NUM_WORKERS:
+            return self.NUM_WORKERS
+        workers = available_cpu_count()
+        if self.MAX_WORKERS:
+            workers = min(workers, self.MAX_WORKERS)
+        return workers
+    
+    def get_time_limit(self, time_limit_seconds: Optional[float] = None) -> float:
+        """Get the time limit, preferring the caller's over the profile's and the global one"""
+        if time_limit_seconds is not None:
+            return float(time_limit_seconds)
+        if self.TIME_LIMIT_SECONDS is not None:
+            return float(self.TIME_LIMIT_SECONDS)
+        return float(SOLVER_TIME_LIMIT_SECONDS)
+
 # Detect if we're in a test environment
 IS_TEST_ENV = 'PYTEST_CURRENT_TEST' in os.environ
 
@@ -84,6 +179,10 @@ ENABLE_WEIGHT_TUNING = bool(int(os.getenv('ENABLE_WEIGHT_TUNING', '0')))
 # Disable grade grouping in test environment by default 
 ENABLE_GRADE_GROUPING = bool(int(os.getenv('ENABLE_GRADE_GROUPING', '0')))
 ENABLE_CONSTRAINT_RELAXATION = bool(int(os.getenv('ENABLE_CONSTRAINT_RELAXATION', '1')))
+# Skip creating variables for slots that hard constraints force to zero
+ENABLE_DOMAIN_PRUNING = bool(int(os.getenv('ENABLE_DOMAIN_PRUNING', '1')))
+# Reject requests that fail the counting pre-check before building a model
+ENABLE_FEASIBILITY_CHECK = bool(int(os.getenv('ENABLE_FEASIBILITY_CHECK', '1')))
 
 # Load configurations
 GENETIC_CONFIG = GeneticConfig.from_env()
@@ -92,6 +191,55 @@ META_CONFIG = MetaOptimizationConfig.from_env()
 # Time limits
 SOLVER_TIME_LIMIT_SECONDS = int(os.getenv('SOLVER_TIME_LIMIT', '300'))
 
+# CP-SAT parameter profiles: "latency" answers quickly within a small gap,
+# "throughput" uses few workers so many solves can share a node, and
+# "quality" searches for the optimum with all available CPUs
+SOLVER_PROFILES = {
+    profile.NAME: profile
+    for profile in [
+        SolverProfile.from_env(
+            "latency", TIME_LIMIT_SECONDS=30, MAX_WORKERS=8, RELATIVE_GAP=0.05
+        ),
+        SolverProfile.from_env(
+            "throughput", TIME_LIMIT_SECONDS=60, MAX_WORKERS=2, RELATIVE_GAP=0.02
+        ),
+        SolverProfile.from_env(
+            "quality", MAX_WORKERS=8, LOG_SEARCH_PROGRESS=True
+        ),
+    ]
+}
+SOLVER_PROFILE = os.getenv('SOLVER_PROFILE', 'quality')
+
+# API solve execution: solves running at once (0 = CPUs / workers per solve),
+# solves allowed to wait for a slot, and whether GA runs use worker processes
+SOLVE_MAX_CONCURRENT = int(os.getenv('SOLVE_MAX_CONCURRENT', '0'))
+SOLVE_MAX_QUEUED = int(os.getenv('SOLVE_MAX_QUEUED', '16'))
+SOLVE_GENETIC_IN_PROCESS = bool(int(os.getenv('SOLVE_GENETIC_IN_PROCESS', '1')))
+
+# Background jobs: SQLite job table shared by every API process, worker
+# processes started per API process, seconds without a heartbeat before a
+# job is handed to another worker, and claims allowed before a job fails
+ENABLE_JOBS = bool(int(os.getenv('ENABLE_JOBS', '1')))
+JOBS_DB_PATH = os.getenv('JOBS_DB_PATH', 'jobs.sqlite3')
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '0' if IS_TEST_ENV else '1'))
+JOB_LEASE_SECONDS = float(os.getenv('JOB_LEASE_SECONDS', '60'))
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+JOB_POLL_SECONDS = float(os.getenv('JOB_POLL_SECONDS', '1'))
+
+# Result cache for repeated identical requests: responses kept in memory,
+# seconds before an entry expires (0 = never), and an optional SQLite file
+# for a disk tier shared by every process (empty = memory only)
+ENABLE_RESULT_CACHE = bool(int(os.getenv('ENABLE_RESULT_CACHE', '0' if IS_TEST_ENV else '1')))
+RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', '128'))
+RESULT_CACHE_TTL_SECONDS = float(os.getenv('RESULT_CACHE_TTL_SECONDS', '3600'))
+RESULT_CACHE_DB_PATH = os.getenv('RESULT_CACHE_DB_PATH', '')
+
+# Formulation of the distribution and daily balance objectives:
+# "pairwise" compares every pair of periods/days, "compact" uses
+# deviation-from-mean and max/min variables that grow linearly
+OBJECTIVE_FORMULATIONS = ("pairwise", "compact")
+OBJECTIVE_FORMULATION = os.getenv('OBJECTIVE_FORMULATION', 'pairwise')
+
 # Objective weights
 WEIGHTS = {
     'required_periods': 10000,
@@ -213,3 +361,21 @@ def get_base_objectives() -> List[Objective]:
         objectives.append(GradeGroupingObjective())  # weight=1200
     
     return objectives
+
+def get_solver_profile(name: Optional[str] = None) -> SolverProfile:
+    """
+    Get a CP-SAT parameter profile by name.
+    
+    Args:
+        name: Profile name (defaults to SOLVER_PROFILE)
+        
+    Returns:
+        The matching solver profile
+    """
+    name = name or SOLVER_PROFILE
+    if name not in SOLVER_PROFILES:
+        raise ValueError(
+            f"Unknown solver profile: {name}. "
+            f"Valid profiles: {', '.join(SOLVER_PROFILES)}"
+        )
+    return SOLVER_PROFILES[name]
@@ -0,0 +1,251 @@
+"""Bounded execution of solver runs off the API event loop"""
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from ...models import ScheduleRequest, ScheduleResponse
+from ..utils.resources import available_cpu_count
+
+logger = logging.getLogger(__name__)
+
+
+class SolverBusyError(RuntimeError):
+    """Raised when a solve is submitted while the executor queue is full"""
+    pass
+
+
+# Solvers built inside worker processes, keyed by their options
+_worker_solvers: Dict[Tuple, Any] = {}
+
+
+def _solve_in_worker(
+    options: Dict[str, Any],
+    request: ScheduleRequest,
+    solve_kwargs: Dict[str, Any]
+) -> ScheduleResponse:
+    """Run a solve in a worker process with a solver built from the given options"""
+    from .solver import UnifiedSolver
+
+    weights = options.get("custom_weights") or {}
+    key = (
+        options["use_genetic"],
+        options["use_or_tools"],
+        options["enable_relaxation"],
+        tuple(sorted(weights.items()))
+    )
+    solver = _worker_solvers.get(key)
+    if solver is None:
+        solver = UnifiedSolver(**options)
+        _worker_solvers[key] = solver
+    return solver.solve(request, **solve_kwargs)
+
+
+class SolveExecutor:
+    """
+    Runs solver calls outside the event loop with a cap on concurrent solves.
+
+    Every solve occupies one slot of a thread pool sized to the concurrency
+    cap. CP-SAT releases the GIL while searching, so it runs directly in that
+    thread; genetic runs are pure Python and are handed to a process pool of
+    the same size so they do not contend for the GIL. Up to ``max_queued``
+    further solves wait for a free slot; beyond that, submissions are
+    rejected with SolverBusyError.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queued: int,
+        genetic_in_process: bool = True
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrent: Number of solves that may run at the same time
+            max_queued: Number of solves that may wait for a free slot
+            genetic_in_process: Whether genetic runs use worker processes
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.genetic_in_process = genetic_in_process
+        self._threads = ThreadPoolExecutor(
+            max_workers=self.max_concurrent,
+            thread_name_prefix="solve"
+        )
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it on first use"""
+        with self._lock:
+            if self._processes is None:
+                # Spawn rather than fork: the API process runs threads
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self.max_concurrent,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._processes
+
+    def _uses_process(self, solver: Any, solve_kwargs: Dict[str, Any]) -> bool:
+        """Check whether a solver's runs should go to a worker process"""
+        if not self.genetic_in_process:
+            return False
+        # Progress callbacks can only be called in this process
+        if getattr(solver, "_progress_callback", None) is not None:
+            return False
+        # Relaxation and weight tuning read or change solver state that a
+        # worker's copy of the solver would not have or would keep
+        if solve_kwargs.get("tune_weights") or solve_kwargs.get("with_relaxation"):
+            return False
+        level = getattr(solver, "current_relaxation_level", None)
+        if level is not None and level.value > 0:
+            return False
+        from . import config as config_module
+        return (
+            config_module.ENABLE_GENETIC_OPTIMIZATION
+            and getattr(solver, "use_genetic", False)
+            and getattr(solver, "genetic_optimizer", None) is not None
+        )
+
+    def _run(self, solver: Any, request: ScheduleRequest, solve_kwargs: Dict[str, Any]) -> ScheduleResponse:
+        """Run one solve in a pool thread"""
+        with self._lock:
+            self._running += 1
+        try:
+            if self._uses_process(solver, solve_kwargs):
+                # Worker processes have their own memory cache, so check ours first
+                cached = solver.get_cached_response(request, **solve_kwargs)
+                if cached is not None:
+                    return cached
+                options = {
+                    "use_genetic": solver.use_genetic,
+                    "use_or_tools": solver.use_or_tools,
+                    "enable_relaxation": solver.enable_relaxation,
+                    "custom_weights": solver.get_weights(),
+                }
+                future = self._get_process_pool().submit(
+                    _solve_in_worker, options, request, solve_kwargs
+                )
+                response = future.result()
+                solver.record_response(response)
+                solver.cache_response(request, response, **solve_kwargs)
+                return response
+            return solver.solve(request, **solve_kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _on_done(self, future: Any) -> None:
+        """Count a finished solve, including ones cancelled while queued"""
+        with self._lock:
+            self._completed += 1
+
+    def submit(self, solver: Any, request: ScheduleRequest, **solve_kwargs) -> Future:
+        """
+        Queue ``solver.solve(request, **solve_kwargs)`` on the pool.
+
+        Solvers keep the state of their current run, so a solver must not be
+        submitted again while an earlier submission is still running; build
+        one per request instead.
+
+        Args:
+            solver: UnifiedSolver to run
+            request: Schedule request to solve
+            **solve_kwargs: Extra arguments for UnifiedSolver.solve
+
+        Returns:
+            Future resolving to the solver's response
+
+        Raises:
+            SolverBusyError: If the concurrency cap and queue are both full
+        """
+        with self._lock:
+            if self._submitted - self._completed >= self.max_concurrent + self.max_queued:
+                self._rejected += 1
+                raise SolverBusyError(
+                    f"Solver is busy: {self.max_concurrent} solves running "
+                    f"and {self.max_queued} queued"
+                )
+            self._submitted += 1
+
+        future = self._threads.submit(self._run, solver, request, solve_kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    async def solve(self, solver: Any, request: ScheduleRequest, **solve_kwargs) -> ScheduleResponse:
+        """
+        Run ``solver.solve(request, **solve_kwargs)`` without blocking the event loop.
+
+        Args:
+            solver: UnifiedSolver to run
+            request: Schedule request to solve
+            **solve_kwargs: Extra arguments for UnifiedSolver.solve
+
+        Returns:
+            The solver's response
+
+        Raises:
+            SolverBusyError: If the concurrency cap and queue are both full
+        """
+        return await asyncio.wrap_future(self.submit(solver, request, **solve_kwargs))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current load of the executor"""
+        with self._lock:
+            pending = self._submitted - self._completed
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+                "running": self._running,
+                "queued": max(0, pending - self._running),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "genetic_in_process": self.genetic_in_process,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pools, waiting for running solves to finish"""
+        self._threads.shutdown(wait=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=True)
+
+
+_executor: Optional[SolveExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_solve_executor() -> SolveExecutor:
+    """Get the process-wide solve executor, creating it from config on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from . import config as config_module
+            max_concurrent = config_module.SOLVE_MAX_CONCURRENT
+            if max_concurrent <= 0:
+                # Enough concurrent solves to keep every CPU busy
+                workers = config_module.get_solver_profile().get_num_workers()
+                max_concurrent = max(1, available_cpu_count() // workers)
+            _executor = SolveExecutor(
+                max_concurrent=max_concurrent,
+                max_queued=config_module.SOLVE_MAX_QUEUED,
+                genetic_in_process=config_module.SOLVE_GENETIC_IN_PROCESS
+            )
+            logger.info(f"Solve executor started: {_executor.get_stats()}")
+        return _executor
+
+
+def shutdown_solve_executor() -> None:
+    """Shut down the process-wide solve executor if it was started"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
@@ -0,0 +1,199 @@
+"""Checkpoints that let a genetic optimization run resume where it stopped."""
+import hashlib
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from ....models import ScheduleRequest, WeightConfig
+from .adaptation import AdaptiveController
+from .chromosome import CLASS, ScheduleChromosome
+from .compiled import GENE_DTYPE
+from .population import PopulationManager
+
+# Attributes restored on resume, beyond the population itself
+POPULATION_FIELDS = (
+    "mutation_rate", "crossover_rate", "generation",
+    "crossover_method_weights", "crossover_stats",
+    "mutation_method_weights", "mutation_stats", "repair_stats"
+)
+CONTROLLER_FIELDS = (
+    "current_mutation_rate", "current_crossover_rate",
+    "diversity_history", "fitness_history", "last_adaptation_generation"
+)
+
+
+def request_key(request: ScheduleRequest, weights: WeightConfig) -> str:
+    """
+    Identify a request and its weights, whose fitness scores a checkpoint holds.
+
+    Returns:
+        Hex SHA-256 digest of both, as JSON
+    """
+    digest = hashlib.sha256(request.model_dump_json().encode())
+    digest.update(weights.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def checkpoint_path(location: Union[str, Path], key: str) -> Path:
+    """
+    Get the checkpoint file of a request.
+
+    Args:
+        location: A checkpoint file, or a directory holding one file per
+            request key
+        key: Key of the request (see request_key)
+    """
+    path = Path(location)
+    return path if path.suffix == ".npz" else path / f"{key}.npz"
+
+
+@dataclass
+class Checkpoint:
+    """State of a single-population optimization run after a generation."""
+    key: str
+    # Generations completed, and so the index of the next one
+    generation: int
+    gene_arrays: List[np.ndarray]
+    fitness: np.ndarray
+    # Class ID of each class index in the gene arrays
+    class_ids: List[str]
+    best_fitness_history: List[float] = field(default_factory=list)
+    avg_fitness_history: List[float] = field(default_factory=list)
+    diversity_history: List[float] = field(default_factory=list)
+    # JSON-compatible counters, operator weights, controller and RNG state
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def capture(
+        cls,
+        key: str,
+        generation: int,
+        manager: PopulationManager,
+        controller: Optional[AdaptiveController],
+        histories: Dict[str, List[float]],
+        counters: Dict[str, Any]
+    ) -> 'Checkpoint':
+        """
+        Take a checkpoint of a run.
+
+        Args:
+            key: Key of the run's request (see request_key)
+            generation: Generations completed
+            manager: Population manager of the run
+            controller: Adaptive parameter controller, if the run has one
+            histories: Best, average and diversity histories by field name
+            counters: Other JSON-compatible optimizer state
+        """
+        # Mutants await credit by population index, as chromosomes are rebuilt on resume
+        positions = {id(chromosome): index for index, chromosome in enumerate(manager.population)}
+        mutants = [[method, positions[id(child)]] for method, child in manager._mutants if id(child) in positions]
+        return cls(
+            key=key,
+            generation=generation,
+            gene_arrays=[chromosome.gene_array for chromosome in manager.population],
+            fitness=np.array([chromosome.fitness for chromosome in manager.population], dtype=np.float64),
+            class_ids=list(manager.compiled.classes.ids),
+            best_fitness_history=list(histories.get("best_fitness_history", [])),
+            avg_fitness_history=list(histories.get("avg_fitness_history", [])),
+            diversity_history=list(histories.get("diversity_history", [])),
+            state={
+                "population": {name: getattr(manager, name) for name in POPULATION_FIELDS},
+                "mutants": mutants,
+                "mutant_baseline": manager._mutant_baseline,
+                "controller": {name: getattr(controller, name) for name in CONTROLLER_FIELDS} if controller else None,
+                "optimizer": counters,
+                "random": random.getstate()
+            }
+        )
+
+    def restore(self, manager: PopulationManager, controller: Optional[AdaptiveController]) -> None:
+        """
+        Replace a run's population, operator and controller state with the checkpoint's.
+
+        Class indices are translated to the manager's class table, and the
+        random module continues from the checkpoint's state.
+        """
+        classes = manager.compiled.classes
+        mapping = np.array([classes.intern(class_id) for class_id in self.class_ids], dtype=GENE_DTYPE)
+        population = []
+        for gene_array, fitness in zip(self.gene_arrays, self.fitness.tolist()):
+            gene_array = gene_array.copy()
+            if len(gene_array):
+                gene_array[:, CLASS] = mapping[gene_array[:, CLASS]]
+            chromosome = ScheduleChromosome(manager.request, compiled=manager.compiled)
+            chromosome.gene_array = gene_array
+            chromosome.fitness = fitness
+            population.append(chromosome)
+        manager.population = population
+        manager.size = len(population)
+        for name, value in self.state.get("population", {}).items():
+            setattr(manager, name, value)
+        manager._mutants = [(method, population[index]) for method, index in self.state.get("mutants", [])]
+        manager._mutant_baseline = self.state.get("mutant_baseline", float('-inf'))
+        if controller is not None and self.state.get("controller"):
+            for name, value in self.state["controller"].items():
+                setattr(controller, name, value)
+        version, internal, gauss = self.state["random"]
+        random.setstate((version, tuple(internal), gauss))
+
+
+def save_checkpoint(path: Union[str, Path], checkpoint: Checkpoint) -> None:
+    """
+    Write a checkpoint as one compressed NumPy archive.
+
+    The file is written next to its destination and then renamed over
+    it, so a crash mid-write leaves the previous checkpoint intact.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lengths = np.array([len(gene_array) for gene_array in checkpoint.gene_arrays], dtype=np.int64)
+    genes = (np.concatenate(checkpoint.gene_arrays) if checkpoint.gene_arrays
+             else np.empty((0, 4), dtype=GENE_DTYPE))
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as file:
+        np.savez_compressed(
+            file,
+            key=np.array(checkpoint.key),
+            generation=np.array(checkpoint.generation, dtype=np.int64),
+            genes=genes.astype(GENE_DTYPE),
+            lengths=lengths,
+            fitness=checkpoint.fitness,
+            class_ids=np.array(checkpoint.class_ids, dtype=str),
+            best_fitness_history=np.array(checkpoint.best_fitness_history, dtype=np.float64),
+            avg_fitness_history=np.array(checkpoint.avg_fitness_history, dtype=np.float64),
+            diversity_history=np.array(checkpoint.diversity_history, dtype=np.float64),
+            state=np.array(json.dumps(checkpoint.state))
+        )
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path: Union[str, Path]) -> Checkpoint:
+    """
+    Read a checkpoint written by save_checkpoint.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not a checkpoint
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        try:
+            lengths = archive["lengths"]
+            gene_arrays = np.split(archive["genes"], np.cumsum(lengths)[:-1]) if len(lengths) else []
+            return Checkpoint(
+                key=str(archive["key"]),
+                generation=int(archive["generation"]),
+                gene_arrays=gene_arrays,
+                fitness=archive["fitness"],
+                class_ids=archive["class_ids"].tolist(),
+                best_fitness_history=archive["best_fitness_history"].tolist(),
+                avg_fitness_history=archive["avg_fitness_history"].tolist(),
+                diversity_history=archive["diversity_history"].tolist(),
+                state=json.loads(str(archive["state"]))
+            )
+        except KeyError as e:
+            raise ValueError(f"Not a genetic algorithm checkpoint: {path}") from e
@@ -1,9 +1,11 @@
 """Chromosome representation for genetic algorithm scheduling."""
-from typing import List, Dict, Optional
+from typing import Any, List, Optional, Sequence, Iterable, Tuple
 from dataclasses import dataclass
 import random
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from ....models import (
     ScheduleRequest,
     ScheduleResponse,
@@ -12,6 +14,21 @@ from ....models import (
     TimeSlot,
     Class
 )
+from .compiled import (
+    GENE_DTYPE,
+    ClassTable,
+    CompiledRequest,
+    ConstraintLimits,
+    get_class_table
+)
+from .initialization import greedy_gene_array
+from .repair import repair_gene_array
+
+# Columns of ScheduleChromosome.gene_array
+CLASS, WEEK, DAY, PERIOD = range(4)
+
+# Operators of ScheduleChromosome.mutate
+MUTATION_METHODS = ("random", "free_slot", "swap", "shift")
 
 @dataclass
 class Gene:
@@ -20,84 +37,505 @@ class Gene:
     day_of_week: int  # 1-5 (Monday-Friday)
     period: int       # 1-8
     week: int        # Week number relative to start date
-    
+
     def to_time_slot(self) -> TimeSlot:
         """Convert gene to TimeSlot model."""
         return TimeSlot(dayOfWeek=self.day_of_week, period=self.period)
 
+
+def gene_keys(gene_arrays: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the week, day and slot keys of every gene.
+
+    Days 1-7 and periods 1-15 pack without collisions, so equal day keys
+    mean the same week and day, and slot keys sort by week, day and period.
+
+    Args:
+        gene_arrays: Gene array, or a stack of equal-length gene arrays
+
+    Returns:
+        Tuple of (weeks, day_keys, slot_keys) int64 arrays
+    """
+    weeks = gene_arrays[..., WEEK].astype(np.int64)
+    day_keys = weeks * 8 + gene_arrays[..., DAY]
+    slot_keys = day_keys * 16 + gene_arrays[..., PERIOD]
+    return weeks, day_keys, slot_keys
+
+
+def row_counts(keys: np.ndarray) -> np.ndarray:
+    """Count the occurrences of each non-negative key in each row of a 2-D array."""
+    size = int(keys.max()) + 1
+    offsets = np.arange(len(keys))[:, np.newaxis] * size
+    return np.bincount((keys + offsets).ravel(), minlength=len(keys) * size).reshape(len(keys), size)
+
+
+def consecutive_periods(sorted_slot_keys: np.ndarray) -> np.ndarray:
+    """
+    Mark genes whose period directly follows the previous gene's on the same day.
+
+    Args:
+        sorted_slot_keys: Slot keys sorted along the last axis
+
+    Returns:
+        Boolean array one shorter than the keys along the last axis
+    """
+    return (
+        (np.diff(sorted_slot_keys, axis=-1) == 1) &
+        (sorted_slot_keys[..., 1:] // 16 == sorted_slot_keys[..., :-1] // 16)
+    )
+
+
+def _joins_long_run(occupied: np.ndarray, allow_pairs: bool) -> np.ndarray:
+    """
+    Mark the slots of a week where a class would make an invalid run.
+
+    Args:
+        occupied: Boolean (days, periods) occupancy of the week
+        allow_pairs: Whether two consecutive classes are allowed
+
+    Returns:
+        Boolean (days, periods) array, True where taking the slot makes a
+        run of three, or of two if pairs are not allowed
+    """
+    before = np.zeros_like(occupied)
+    after = np.zeros_like(occupied)
+    before[:, 1:] = occupied[:, :-1]
+    after[:, :-1] = occupied[:, 1:]
+    if not allow_pairs:
+        return before | after
+    two_before = np.zeros_like(occupied)
+    two_after = np.zeros_like(occupied)
+    two_before[:, 2:] = occupied[:, :-2]
+    two_after[:, :-2] = occupied[:, 2:]
+    return (before & two_before) | (after & two_after) | (before & after)
+
+
+def validate_gene_arrays(gene_arrays: np.ndarray, limits: ConstraintLimits) -> np.ndarray:
+    """
+    Check a stack of equal-length gene arrays against the schedule constraints.
+
+    Args:
+        gene_arrays: Array of shape (chromosomes, genes, 4)
+        limits: Constraint limits of the request
+
+    Returns:
+        Boolean array, True for each valid chromosome
+    """
+    valid = np.ones(len(gene_arrays), dtype=bool)
+    if not gene_arrays.shape[1]:
+        return valid
+
+    weeks, day_keys, slot_keys = gene_keys(gene_arrays)
+
+    # 1. Check classes per day constraint
+    valid &= row_counts(day_keys).max(axis=1) <= limits.max_classes_per_day
+
+    # 2. Check classes per week constraint
+    valid &= row_counts(weeks).max(axis=1) <= limits.max_classes_per_week
+
+    # 3. Check consecutive classes constraint
+    follows = consecutive_periods(np.sort(slot_keys, axis=1))
+
+    # Three consecutive classes are always disallowed
+    valid &= ~np.any(follows[:, :-1] & follows[:, 1:], axis=1)
+
+    # If we don't allow consecutive pairs, check for them
+    if not limits.allow_consecutive_pairs:
+        valid &= ~np.any(follows, axis=1)
+
+    return valid
+
+
+class GeneList(list):
+    """
+    List of Gene objects viewing a chromosome's gene array.
+
+    Changing the list through its methods (append, item assignment, ...)
+    writes the change back to the array. Changing the attributes of a
+    Gene in it does not; assign a new Gene instead.
+    """
+
+    def __init__(self, owner: 'ScheduleChromosome', genes: Iterable[Gene] = ()):
+        super().__init__(genes)
+        self._owner = owner
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _writes_back(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._owner._load_genes(self)
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__"
+):
+    setattr(GeneList, _name, _writes_back(_name))
+
+
 class ScheduleChromosome:
     """
     Genetic representation of a complete schedule.
-    
-    Each chromosome contains a list of genes, where each gene represents
-    a class assignment (what class is scheduled for what time slot).
+
+    Each chromosome holds one row per gene in ``gene_array``, an integer
+    array with the class index (see ClassTable), week, day of week and
+    period of a class assignment. ``genes`` presents the same assignments
+    as a list of Gene objects for code that works gene by gene.
+
+    Chromosomes created with a CompiledRequest take their dates, class
+    table and constraint limits from it instead of reading the request.
+
+    Operators draw from ``rng``, a random.Random that children inherit, or
+    from the random module when it is None.
+
+    ``fitness_bases`` holds fitness states (see FitnessCalculator) of this
+    chromosome or of its parents, so a child can be scored from the genes
+    it changed. Gene arrays are never modified in place once created;
+    operators write new arrays, which keeps those states accurate.
     """
-    
-    def __init__(self, request: Optional[ScheduleRequest] = None):
-        self.genes: List[Gene] = []
+
+    def __init__(
+        self,
+        request: Optional[ScheduleRequest] = None,
+        compiled: Optional[CompiledRequest] = None,
+        rng: Optional[random.Random] = None
+    ):
         self.fitness: float = 0.0
-        self.request = request
+        self.request = request if request is not None or compiled is None else compiled.request
+        self.compiled = compiled
         self.start_date: Optional[datetime] = None
         self.end_date: Optional[datetime] = None
-        
-        if request:
-            self.start_date = datetime.strptime(request.startDate, "%Y-%m-%d")
-            self.end_date = datetime.strptime(request.endDate, "%Y-%m-%d")
-    
+        self.total_weeks = 1
+        self._gene_array = np.empty((0, 4), dtype=GENE_DTYPE)
+        self._genes: Optional[GeneList] = None
+        self.fitness_bases: Tuple[Any, ...] = ()
+        # Random stream of the operators; None draws from the random module
+        self.rng = rng
+
+        if compiled:
+            self.classes = compiled.classes
+            self.start_date = compiled.start_date
+            self.end_date = compiled.end_date
+            self.total_weeks = compiled.total_weeks
+        else:
+            self.classes = get_class_table(self.request)
+            if self.request:
+                self.start_date = datetime.strptime(self.request.startDate, "%Y-%m-%d")
+                self.end_date = datetime.strptime(self.request.endDate, "%Y-%m-%d")
+                self.total_weeks = (self.end_date - self.start_date).days // 7 + 1
+
+    @property
+    def gene_array(self) -> np.ndarray:
+        """Genes as an (n, 4) array of class index, week, day and period."""
+        return self._gene_array
+
+    @gene_array.setter
+    def gene_array(self, gene_array: np.ndarray) -> None:
+        self._gene_array = np.asarray(gene_array, dtype=GENE_DTYPE).reshape(-1, 4)
+        self._genes = None
+
+    @property
+    def genes(self) -> List[Gene]:
+        """Genes as a list of Gene objects, built from the gene array on first use."""
+        if self._genes is None:
+            ids = self.classes.ids
+            self._genes = GeneList(self, [
+                Gene(class_id=ids[class_idx], day_of_week=day, period=period, week=week)
+                for class_idx, week, day, period in self._gene_array.tolist()
+            ])
+        return self._genes
+
+    @genes.setter
+    def genes(self, genes: Sequence[Gene]) -> None:
+        genes = GeneList(self, genes)
+        self._load_genes(genes)
+        self._genes = genes
+
+    def _load_genes(self, genes: Sequence[Gene]) -> None:
+        """Rebuild the gene array from Gene objects."""
+        intern = self.classes.intern
+        self._gene_array = np.array(
+            [(intern(gene.class_id), gene.week, gene.day_of_week, gene.period) for gene in genes],
+            dtype=GENE_DTYPE
+        ).reshape(-1, 4)
+
+    def __getstate__(self) -> dict:
+        # The gene list is rebuilt on demand and fitness states stay local
+        state = self.__dict__.copy()
+        state["_genes"] = None
+        state["fitness_bases"] = ()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state.setdefault("fitness_bases", ())
+        state.setdefault("rng", None)
+        self.__dict__.update(state)
+
+    def _spawn(
+        self,
+        gene_array: np.ndarray,
+        other: Optional['ScheduleChromosome'] = None
+    ) -> 'ScheduleChromosome':
+        """
+        Create a chromosome of the same request holding the given genes.
+
+        The child keeps the latest fitness state of this chromosome and of
+        the other parent, if any, as bases for incremental scoring.
+        """
+        child = ScheduleChromosome.__new__(ScheduleChromosome)
+        child.fitness = 0.0
+        child.request = self.request
+        child.compiled = self.compiled
+        child.start_date = self.start_date
+        child.end_date = self.end_date
+        child.total_weeks = self.total_weeks
+        child.classes = self.classes
+        child._gene_array = gene_array
+        child._genes = None
+        child.fitness_bases = self.fitness_bases[:1]
+        child.rng = self.rng
+        if other is not None and other.classes is self.classes:
+            child.fitness_bases += other.fitness_bases[:1]
+        return child
+
+    def copy(self) -> 'ScheduleChromosome':
+        """Create a copy with its own genes and the same fitness."""
+        child = self._spawn(self._gene_array.copy())
+        child.fitness = self.fitness
+        return child
+
+    def _aligned(self, other: 'ScheduleChromosome') -> np.ndarray:
+        """Get the gene array of another chromosome with class indices from this one's table."""
+        if other.classes is self.classes:
+            return other._gene_array
+        mapping = np.array([self.classes.intern(class_id) for class_id in other.classes.ids], dtype=GENE_DTYPE)
+        gene_array = other._gene_array.copy()
+        if len(gene_array):
+            gene_array[:, CLASS] = mapping[gene_array[:, CLASS]]
+        return gene_array
+
+    def hamming_distance(self, other: 'ScheduleChromosome') -> int:
+        """
+        Count the positions at which two chromosomes of equal length differ.
+
+        Raises:
+            ValueError: If the chromosomes have different numbers of genes
+        """
+        other_array = self._aligned(other)
+        if len(self._gene_array) != len(other_array):
+            raise ValueError("Chromosomes must have same number of genes")
+        return int(np.count_nonzero((self._gene_array != other_array).any(axis=1)))
+
+    @property
+    def _random(self):
+        """The chromosome's random stream, or the random module if it has none."""
+        return random if self.rng is None else self.rng
+
+    def _rng(self) -> np.random.Generator:
+        # Seeded from the random stream so seeding it keeps runs reproducible
+        return np.random.default_rng(self._random.getrandbits(64))
+
+    def _random_slots(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw random (week, day, period) rows respecting basic time constraints."""
+        slots = np.empty((count, 3), dtype=GENE_DTYPE)
+        slots[:, 0] = rng.integers(0, self.total_weeks, count)
+        slots[:, 1] = rng.integers(1, 6, count)   # Monday-Friday
+        slots[:, 2] = rng.integers(1, 9, count)   # Periods 1-8
+        return slots
+
     def initialize_random(self) -> None:
         """Create a random initial schedule."""
         if not self.request:
             raise ValueError("Cannot initialize without a ScheduleRequest")
-            
-        self.genes = []
-        total_weeks = (self.end_date - self.start_date).days // 7 + 1
-        
-        for class_obj in self.request.classes:
-            # Calculate how many sessions this class needs based on constraints
-            sessions_needed = self.request.constraints.minPeriodsPerWeek * total_weeks
-            
-            for _ in range(sessions_needed):
-                gene = self._create_random_gene(class_obj.id)
-                self.genes.append(gene)
-    
+
+        # Calculate how many sessions each class needs based on constraints
+        if self.compiled:
+            sessions_needed = self.compiled.limits.min_periods_per_week * self.total_weeks
+            class_indices = self.compiled.class_indices
+        else:
+            sessions_needed = self.request.constraints.minPeriodsPerWeek * self.total_weeks
+            class_indices = np.array(
+                [self.classes.intern(class_obj.id) for class_obj in self.request.classes], dtype=GENE_DTYPE
+            )
+
+        gene_array = np.empty((len(class_indices) * sessions_needed, 4), dtype=GENE_DTYPE)
+        gene_array[:, CLASS] = np.repeat(class_indices, sessions_needed)
+        gene_array[:, WEEK:] = self._random_slots(self._rng(), len(gene_array))
+        self.gene_array = gene_array
+
+    def initialize_greedy(self, fixed: Optional[np.ndarray] = None) -> None:
+        """
+        Create an initial schedule that keeps to the request's constraints.
+
+        Sessions are placed one at a time in free slots their class may
+        take, within the daily, weekly and consecutive limits (see
+        greedy_gene_array).
+
+        Args:
+            fixed: Genes to keep, such as a CP-SAT schedule, completed greedily
+        """
+        if not self.request:
+            raise ValueError("Cannot initialize without a ScheduleRequest")
+        compiled = self.compiled or CompiledRequest(self.request)
+        self.gene_array = greedy_gene_array(compiled, self._rng(), fixed)
+
     def _create_random_gene(self, class_id: str) -> Gene:
         """Create a random gene (class assignment) respecting basic time constraints."""
         if not self.request:
             raise ValueError("Cannot create genes without a ScheduleRequest")
-            
+
         # Random day (1-5, Monday-Friday)
-        day = random.randint(1, 5)
-        
+        day = self._random.randint(1, 5)
+
         # Random period (1-8)
-        period = random.randint(1, 8)
-        
+        period = self._random.randint(1, 8)
+
         # Random week within the schedule range
-        total_weeks = (self.end_date - self.start_date).days // 7 + 1
-        week = random.randint(0, total_weeks - 1)
-        
+        week = self._random.randint(0, self.total_weeks - 1)
+
         return Gene(
             class_id=class_id,
             day_of_week=day,
             period=period,
             week=week
         )
-    
-    def mutate(self, mutation_rate: float = 0.1) -> None:
+
+    def mutate(self, mutation_rate: float = 0.1, method: str = "random") -> None:
         """
-        Apply random mutations to genes.
-        
+        Apply mutations to genes.
+
         Args:
             mutation_rate: Probability (0-1) of each gene being mutated
+            method: Mutation operator applied to each mutated gene:
+                - "random": Move it to a random slot
+                - "free_slot": Move it to a random free slot of its week
+                  that its class may take, within the daily and consecutive limits
+                - "swap": Swap its slot with that of a gene of another class
+                - "shift": Move it one period or one day, if that slot is
+                  free, its class may take it and the limits allow it
         """
-        for i in range(len(self.genes)):
-            if random.random() < mutation_rate:
-                # Replace with a new random gene for the same class
-                self.genes[i] = self._create_random_gene(self.genes[i].class_id)
-    
+        if method not in MUTATION_METHODS:
+            raise ValueError(f"Unknown mutation method: {method}")
+        if not len(self._gene_array):
+            return
+
+        rng = self._rng()
+        mutated = rng.random(len(self._gene_array)) < mutation_rate
+        count = int(np.count_nonzero(mutated))
+        if not count:
+            return
+        if not self.request:
+            raise ValueError("Cannot create genes without a ScheduleRequest")
+
+        gene_array = self._gene_array.copy()
+        if method == "random":
+            # Move each mutated gene to a new random slot for the same class
+            gene_array[mutated, WEEK:] = self._random_slots(rng, count)
+        elif method == "swap":
+            self._swap_slots(gene_array, np.flatnonzero(mutated), rng)
+        else:
+            self._move_to_free_slots(gene_array, np.flatnonzero(mutated), rng, shift=method == "shift")
+        self._gene_array = gene_array
+        self._genes = None
+
+    @staticmethod
+    def _swap_slots(gene_array: np.ndarray, indices: np.ndarray, rng: np.random.Generator) -> None:
+        """Swap the slot of each indexed gene with that of a random gene of another class."""
+        classes = gene_array[:, CLASS]
+        for index in indices.tolist():
+            others = np.flatnonzero(classes != classes[index])
+            if not len(others):
+                continue
+            other = int(others[rng.integers(len(others))])
+            gene_array[[index, other], WEEK:] = gene_array[[other, index], WEEK:]
+
+    def _move_to_free_slots(
+        self,
+        gene_array: np.ndarray,
+        indices: np.ndarray,
+        rng: np.random.Generator,
+        shift: bool
+    ) -> None:
+        """
+        Move each indexed gene to a free slot of its week that keeps the limits.
+
+        Slot occupancy is counted once per (week, day, period), so checking
+        a slot is a lookup. Genes without such a slot stay where they are.
+
+        Args:
+            gene_array: Genes to change in place
+            indices: Genes to move
+            rng: Random generator
+            shift: Whether to move only one period or one day, not anywhere in the week
+        """
+        compiled = self.compiled or CompiledRequest(self.request)
+        limits = compiled.limits
+        shape = compiled.allowed.shape[1:]
+        in_range = (gene_array[:, WEEK] >= 0) & (gene_array[:, WEEK] < shape[0])
+        occupancy = np.bincount(
+            np.ravel_multi_index(tuple(gene_array[in_range, WEEK:].T.astype(np.int64)), shape, mode='clip'),
+            minlength=int(np.prod(shape))
+        ).reshape(shape)
+        rows = compiled.class_rows(gene_array[:, CLASS])
+
+        for index in indices.tolist():
+            week, day, period = gene_array[index, WEEK:].tolist()
+            if not 0 <= week < shape[0]:
+                continue
+            occupancy[week, day, period] -= 1
+            occupied = occupancy[week] > 0
+            candidates = (
+                compiled.allowed[rows[index], week] & ~occupied &
+                (occupancy[week].sum(axis=1) < limits.max_classes_per_day)[:, np.newaxis] &
+                ~_joins_long_run(occupied, limits.allow_consecutive_pairs)
+            )
+            if shift:
+                neighbours = np.zeros(shape[1:], dtype=bool)
+                for day_step, period_step in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+                    if 0 <= day + day_step < shape[1] and 0 <= period + period_step < shape[2]:
+                        neighbours[day + day_step, period + period_step] = True
+                candidates &= neighbours
+            slots = np.flatnonzero(candidates)
+            if len(slots):
+                day, period = divmod(int(slots[rng.integers(len(slots))]), shape[2])
+                gene_array[index, DAY:] = (day, period)
+            occupancy[week, day, period] += 1
+
+    def repair(self, max_moves: int = 50) -> int:
+        """
+        Move the genes that make the schedule invalid to the nearest slots that fit.
+
+        See repair_gene_array; at most ``max_moves`` genes move, so the
+        schedule may still be invalid afterwards.
+
+        Args:
+            max_moves: Most genes moved
+
+        Returns:
+            Number of genes moved
+        """
+        if not self.request:
+            raise ValueError("Cannot repair without a ScheduleRequest")
+        compiled = self.compiled or CompiledRequest(self.request)
+        gene_array, moves = repair_gene_array(compiled, self._gene_array, self._rng(), max_moves)
+        if moves:
+            self.gene_array = gene_array
+        return moves
+
     def crossover(self, other: 'ScheduleChromosome', method: str = "auto") -> tuple['ScheduleChromosome', 'ScheduleChromosome']:
         """
         Perform crossover with another chromosome.
-        
+
         Args:
             other: The other parent chromosome
             method: Crossover method to use:
@@ -106,23 +544,24 @@ class ScheduleChromosome:
                 - "uniform": Uniform crossover with 0.5 probability for each gene
                 - "order": Order-based crossover that preserves relative ordering
                 - "auto": Automatically select the best method based on chromosome
-                
+
         Returns:
             A tuple of two child chromosomes
         """
-        if len(self.genes) != len(other.genes):
+        length = len(self._gene_array)
+        if length != len(other._gene_array):
             raise ValueError("Chromosomes must have same number of genes for crossover")
-            
+
         # Choose method if auto
         if method == "auto":
             # Use different methods based on problem characteristics
-            if len(self.genes) <= 10:
+            if length <= 10:
                 method = "uniform"  # Good for small chromosomes
             elif self.request and self.request.constraints.maxClassesPerDay > 0:
                 method = "order"    # Good for preserving scheduling patterns
             else:
-                method = random.choice(["single_point", "two_point", "uniform"])
-                
+                method = self._random.choice(["single_point", "two_point", "uniform"])
+
         # Execute the selected crossover method
         if method == "single_point":
             return self._single_point_crossover(other)
@@ -134,205 +573,184 @@ class ScheduleChromosome:
             return self._order_crossover(other)
         else:
             raise ValueError(f"Unknown crossover method: {method}")
-    
+
     def _single_point_crossover(self, other: 'ScheduleChromosome') -> tuple['ScheduleChromosome', 'ScheduleChromosome']:
         """
         Perform single-point crossover with another chromosome.
-        
+
         This is the classic crossover that splits the chromosome at a random point.
         """
-        # Create new chromosomes
-        child1 = ScheduleChromosome(self.request)
-        child2 = ScheduleChromosome(self.request)
-        
+        genes1 = self._gene_array
+        genes2 = self._aligned(other)
+
         # Select crossover point
-        crossover_point = random.randint(0, len(self.genes))
-        
+        crossover_point = self._random.randint(0, len(genes1))
+
         # Create children by combining genes from parents
-        child1.genes = self.genes[:crossover_point] + other.genes[crossover_point:]
-        child2.genes = other.genes[:crossover_point] + self.genes[crossover_point:]
-        
+        child1 = self._spawn(np.concatenate((genes1[:crossover_point], genes2[crossover_point:])), other)
+        child2 = self._spawn(np.concatenate((genes2[:crossover_point], genes1[crossover_point:])), other)
+
         return child1, child2
-    
+
     def _two_point_crossover(self, other: 'ScheduleChromosome') -> tuple['ScheduleChromosome', 'ScheduleChromosome']:
         """
         Perform two-point crossover with another chromosome.
-        
+
         Takes a section from the middle of one parent and combines with
         the beginning and end of the other parent.
         """
-        # Create new chromosomes
-        child1 = ScheduleChromosome(self.request)
-        child2 = ScheduleChromosome(self.request)
-        
+        genes1 = self._gene_array
+        genes2 = self._aligned(other)
+
         # Select two crossover points
-        length = len(self.genes)
-        point1 = random.randint(0, length - 1)
-        point2 = random.randint(point1 + 1, length)
-        
-        # Create children by combining genes from parents
-        child1.genes = (
-            self.genes[:point1] +
-            other.genes[point1:point2] + 
-            self.genes[point2:]
-        )
-        
-        child2.genes = (
-            other.genes[:point1] +
-            self.genes[point1:point2] + 
-            other.genes[point2:]
-        )
-        
-        return child1, child2
-    
+        length = len(genes1)
+        point1 = self._random.randint(0, length - 1)
+        point2 = self._random.randint(point1 + 1, length)
+
+        # Create children by swapping the middle sections
+        child1_genes = genes1.copy()
+        child1_genes[point1:point2] = genes2[point1:point2]
+        child2_genes = genes2.copy()
+        child2_genes[point1:point2] = genes1[point1:point2]
+
+        return self._spawn(child1_genes, other), self._spawn(child2_genes, other)
+
     def _uniform_crossover(self, other: 'ScheduleChromosome') -> tuple['ScheduleChromosome', 'ScheduleChromosome']:
         """
         Perform uniform crossover with another chromosome.
-        
+
         Each gene has a 50% chance of coming from either parent.
         This provides more mixing and is better for some problems.
         """
-        # Create new chromosomes
-        child1 = ScheduleChromosome(self.request)
-        child2 = ScheduleChromosome(self.request)
-        
-        child1.genes = []
-        child2.genes = []
-        
-        # For each gene position, randomly select from either parent
-        for i in range(len(self.genes)):
-            # Flip a coin for each gene
-            if random.random() < 0.5:
-                child1.genes.append(self.genes[i])
-                child2.genes.append(other.genes[i])
-            else:
-                child1.genes.append(other.genes[i])
-                child2.genes.append(self.genes[i])
-        
+        genes1 = self._gene_array
+        genes2 = self._aligned(other)
+
+        # Flip a coin for each gene position
+        from_self = (self._rng().random(len(genes1)) < 0.5)[:, np.newaxis]
+
+        child1 = self._spawn(np.where(from_self, genes1, genes2), other)
+        child2 = self._spawn(np.where(from_self, genes2, genes1), other)
+
         return child1, child2
-    
+
     def _order_crossover(self, other: 'ScheduleChromosome') -> tuple['ScheduleChromosome', 'ScheduleChromosome']:
         """
         Perform order-based crossover with another chromosome.
-        
-        This preserves the relative ordering of genes, which is important
-        for scheduling problems where the order of classes matters.
+
+        Each child keeps a random segment of one parent and takes the rest
+        of its sessions from the other parent, in that parent's order. This
+        preserves the relative ordering of genes, which is important for
+        scheduling problems where the order of classes matters.
         """
-        # Create new chromosomes
-        child1 = ScheduleChromosome(self.request)
-        child2 = ScheduleChromosome(self.request)
-        
-        length = len(self.genes)
-        
+        genes1 = self._gene_array
+        genes2 = self._aligned(other)
+
+        length = len(genes1)
+        if length < 2:
+            return self._spawn(genes1.copy(), other), self._spawn(genes2.copy(), other)
+
         # Select a random segment
-        start = random.randint(0, length - 2)
-        end = random.randint(start + 1, length - 1)
-        
-        # Create a map of class IDs to genes for quick lookup
-        self_class_map = {gene.class_id: gene for gene in self.genes}
-        other_class_map = {gene.class_id: gene for gene in other.genes}
-        
-        # Get class IDs from the segments we'll preserve
-        segment1 = [gene.class_id for gene in self.genes[start:end]]
-        segment2 = [gene.class_id for gene in other.genes[start:end]]
-        
-        # Initialize child genes
-        child1.genes = [None] * length
-        child2.genes = [None] * length
-        
+        start = self._random.randint(0, length - 2)
+        end = self._random.randint(start + 1, length - 1)
+
         # Copy the selected segments
-        for i in range(start, end):
-            child1.genes[i] = self.genes[i]
-            child2.genes[i] = other.genes[i]
-        
+        child1_genes = genes1.copy()
+        child2_genes = genes2.copy()
+
         # Fill remaining positions while preserving order
-        self._fill_remaining_order_based(child1, other, segment1, start, end)
-        self._fill_remaining_order_based(child2, self, segment2, start, end)
-        
-        return child1, child2
-    
+        self._fill_remaining_order_based(child1_genes, genes2, genes1[start:end, CLASS], start, end)
+        self._fill_remaining_order_based(child2_genes, genes1, genes2[start:end, CLASS], start, end)
+
+        return self._spawn(child1_genes, other), self._spawn(child2_genes, other)
+
     def _fill_remaining_order_based(
-        self, 
-        child: 'ScheduleChromosome', 
-        donor: 'ScheduleChromosome',
-        used_classes: List[str],
+        self,
+        child_genes: np.ndarray,
+        donor_genes: np.ndarray,
+        used_classes: np.ndarray,
         start: int,
         end: int
     ) -> None:
         """
         Helper method for order crossover to fill remaining positions.
-        
+
+        The donor's genes of each class form a queue in donor order; the
+        fixed segment takes as many sessions from the front of each queue
+        as it holds of that class, and the rest fill the child in donor
+        order. Children of parents with the same sessions thus keep every
+        class's number of sessions. Ranks within each class come from a
+        stable sort of the class column, which NumPy does by radix sort for
+        16-bit integers such as GENE_DTYPE, so the fill is O(n).
+
         Args:
-            child: The child chromosome to fill
-            donor: The chromosome providing the genes for remaining positions
-            used_classes: List of class IDs already used in the fixed segment
+            child_genes: Gene array of the child, filled in place; positions
+                the donor has no genes left for keep their genes
+            donor_genes: Gene array providing the genes for remaining positions
+            used_classes: Class indices already used in the fixed segment
             start: Start index of the fixed segment
             end: End index of the fixed segment
         """
-        length = len(child.genes)
-        donor_classes = [gene.class_id for gene in donor.genes]
-        
-        # Rearrange the donor classes to put the used ones at the end
-        donor_order = []
-        for class_id in donor_classes:
-            if class_id not in used_classes:
-                donor_order.append(class_id)
-        
-        # Fill positions before the fixed segment
-        idx = 0
-        for i in range(0, start):
-            child.genes[i] = next(
-                gene for gene in donor.genes 
-                if gene.class_id == donor_order[idx]
-            )
-            idx += 1
-            
-        # Fill positions after the fixed segment
-        for i in range(end, length):
-            child.genes[i] = next(
-                gene for gene in donor.genes 
-                if gene.class_id == donor_order[idx]
-            )
-            idx += 1
-    
+        # Kept in GENE_DTYPE: wider integers are sorted by timsort instead
+        donor_classes = donor_genes[:, CLASS]
+        if not len(donor_classes):
+            return
+
+        # Position of each donor gene in its class's queue
+        order = np.argsort(donor_classes, kind='stable')
+        sorted_classes = donor_classes[order]
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order)) - np.searchsorted(sorted_classes, sorted_classes)
+
+        # Skip the sessions the fixed segment already holds
+        used_counts = np.bincount(
+            used_classes, minlength=int(sorted_classes[-1]) + 1
+        )[:int(sorted_classes[-1]) + 1]
+        fill = donor_genes[ranks >= used_counts[donor_classes]]
+
+        # Fill positions before and after the fixed segment
+        head = fill[:start]
+        tail = fill[start:start + len(child_genes) - end]
+        child_genes[:len(head)] = head
+        child_genes[end:end + len(tail)] = tail
+
     def encode(self, schedule: ScheduleResponse) -> None:
         """Convert a ScheduleResponse into chromosome representation."""
-        self.genes = []
-        current_date = self.start_date
-        
+        rows = []
         for assignment in schedule.assignments:
             # Calculate week number
             assignment_date = datetime.strptime(assignment.date, "%Y-%m-%d")
             week = (assignment_date - self.start_date).days // 7
-            
-            # Create gene from assignment
-            gene = Gene(
-                class_id=assignment.name,
-                day_of_week=assignment.timeSlot.dayOfWeek,
-                period=assignment.timeSlot.period,
-                week=week
-            )
-            self.genes.append(gene)
-    
+
+            rows.append((
+                self.classes.intern(assignment.name),
+                week,
+                assignment.timeSlot.dayOfWeek,
+                assignment.timeSlot.period
+            ))
+        self.gene_array = np.array(rows, dtype=GENE_DTYPE)
+
     def decode(self) -> ScheduleResponse:
         """Convert chromosome representation into a ScheduleResponse."""
         assignments: List[ScheduleAssignment] = []
-        
-        for gene in self.genes:
+        ids = self.classes.ids
+
+        for class_idx, week, day, period in self._gene_array.tolist():
+            class_id = ids[class_idx]
+
             # Calculate actual date from week and day
-            days_to_add = gene.week * 7 + (gene.day_of_week - 1)
+            days_to_add = week * 7 + (day - 1)
             assignment_date = self.start_date + timedelta(days=days_to_add)
-            
+
             # Make name unique by adding a hash based on date and time slot
-            unique_suffix = f"{assignment_date.strftime('%Y%m%d')}-p{gene.period}"
+            unique_suffix = f"{assignment_date.strftime('%Y%m%d')}-p{period}"
             assignment = ScheduleAssignment(
-                name=f"{gene.class_id}-{unique_suffix}",  # Make name unique to avoid overlap errors
-                classId=gene.class_id,  # Keep original class ID for reference
+                name=f"{class_id}-{unique_suffix}",  # Make name unique to avoid overlap errors
+                classId=class_id,  # Keep original class ID for reference
                 date=assignment_date.strftime("%Y-%m-%d"),
-                timeSlot=gene.to_time_slot()
+                timeSlot=TimeSlot(dayOfWeek=day, period=period)
             )
             assignments.append(assignment)
-        
+
         # Create basic metadata (will be updated with actual values later)
         metadata = ScheduleMetadata(
             duration_ms=0,
@@ -341,67 +759,21 @@ class ScheduleChromosome:
             gap=0.0,
             distribution=None  # Will be populated later if needed
         )
-        
+
         return ScheduleResponse(assignments=assignments, metadata=metadata)
-    
+
     def validate(self) -> bool:
         """
         Check if the chromosome represents a valid schedule.
-        
+
         Returns:
             bool: True if schedule is valid, False otherwise
         """
         if not self.request:
             raise ValueError("Cannot validate without a ScheduleRequest")
-            
-        # Check basic constraints
-        constraints = self.request.constraints
-        
-        # 1. Check classes per day constraint
-        classes_per_day: Dict[tuple[int, int], int] = {}  # (week, day) -> count
-        for gene in self.genes:
-            key = (gene.week, gene.day_of_week)
-            classes_per_day[key] = classes_per_day.get(key, 0) + 1
-            if classes_per_day[key] > constraints.maxClassesPerDay:
-                return False
-        
-        # 2. Check classes per week constraint
-        classes_per_week: Dict[int, int] = {}
-        for gene in self.genes:
-            classes_per_week[gene.week] = classes_per_week.get(gene.week, 0) + 1
-            if classes_per_week[gene.week] > constraints.maxClassesPerWeek:
-                return False
-        
-        # 3. Check consecutive classes constraint
-        # Group by week and day
-        daily_schedule: Dict[tuple[int, int], List[int]] = {}
-        for gene in self.genes:
-            key = (gene.week, gene.day_of_week)
-            if key not in daily_schedule:
-                daily_schedule[key] = []
-            daily_schedule[key].append(gene.period)
-        
-        # Check for three consecutive classes (always disallowed)
-        for periods in daily_schedule.values():
-            periods.sort()
-            
-            # Check sequences of three consecutive periods
-            for i in range(len(periods) - 2):
-                if (periods[i+1] == periods[i] + 1 and 
-                    periods[i+2] == periods[i+1] + 1):
-                    # Three consecutive periods found - not allowed
-                    return False
-            
-            # Check if pairs are allowed
-            allow_consecutive_pairs = True
-            if hasattr(constraints, 'allowConsecutiveClasses'):
-                allow_consecutive_pairs = constraints.allowConsecutiveClasses
-            
-            # If we don't allow consecutive pairs, check for them
-            if not allow_consecutive_pairs:
-                for i in range(len(periods) - 1):
-                    if periods[i+1] == periods[i] + 1:
-                        # Consecutive pair found when not allowed
-                        return False
-        
-        return True
+
+        if self.compiled:
+            limits = self.compiled.limits
+        else:
+            limits = ConstraintLimits.from_constraints(self.request.constraints)
+        return bool(validate_gene_arrays(self._gene_array[np.newaxis], limits)[0])
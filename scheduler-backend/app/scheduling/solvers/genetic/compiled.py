@@ -0,0 +1,182 @@
+"""Lookup tables compiled once from a schedule request for the genetic algorithm."""
+from typing import Dict, Iterable, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ....models import ScheduleRequest, ScheduleConstraints
+
+# Integer type of the gene arrays
+GENE_DTYPE = np.int16
+
+# Mask dimensions; days 1-7 and periods 1-15 index directly
+MASK_DAYS = 8
+MASK_PERIODS = 16
+
+
+class ClassTable:
+    """
+    Maps class IDs to the small integers stored in gene arrays.
+
+    Chromosomes of the same request share one table, so their class
+    columns can be compared and recombined without translation.
+    """
+
+    def __init__(self, class_ids: Iterable[str] = ()):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for class_id in class_ids:
+            self.intern(class_id)
+
+    def intern(self, class_id: str) -> int:
+        """Get the index of a class ID, adding it if it is new."""
+        index = self.index.get(class_id)
+        if index is None:
+            with self._lock:
+                index = self.index.get(class_id)
+                if index is None:
+                    index = len(self.ids)
+                    if index > np.iinfo(GENE_DTYPE).max:
+                        raise ValueError("Too many classes for the gene array")
+                    self.ids.append(class_id)
+                    self.index[class_id] = index
+        return index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getstate__(self) -> dict:
+        return {"ids": list(self.ids)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["ids"])
+
+
+_class_tables: "OrderedDict[tuple, ClassTable]" = OrderedDict()
+_class_tables_lock = threading.Lock()
+_MAX_CLASS_TABLES = 64
+
+
+def get_class_table(request: Optional[ScheduleRequest]) -> ClassTable:
+    """
+    Get the class table shared by chromosomes with the same classes.
+
+    The request's classes get indices 0..n-1 in request order; IDs met
+    later (e.g. when encoding a response) are appended after them.
+    """
+    key = tuple(class_obj.id for class_obj in request.classes) if request else ()
+    with _class_tables_lock:
+        table = _class_tables.get(key)
+        if table is None:
+            table = ClassTable(key)
+            _class_tables[key] = table
+            while len(_class_tables) > _MAX_CLASS_TABLES:
+                _class_tables.popitem(last=False)
+        else:
+            _class_tables.move_to_end(key)
+        return table
+
+
+@dataclass(frozen=True)
+class ConstraintLimits:
+    """Scheduling limits read once from ScheduleConstraints."""
+    max_classes_per_day: int
+    max_classes_per_week: int
+    min_periods_per_week: int
+    max_consecutive_classes: int
+    allow_consecutive_pairs: bool = True
+
+    @classmethod
+    def from_constraints(cls, constraints: ScheduleConstraints) -> 'ConstraintLimits':
+        """Create limits from request constraints."""
+        return cls(
+            max_classes_per_day=constraints.maxClassesPerDay,
+            max_classes_per_week=constraints.maxClassesPerWeek,
+            min_periods_per_week=constraints.minPeriodsPerWeek,
+            max_consecutive_classes=constraints.maxConsecutiveClasses,
+            allow_consecutive_pairs=getattr(constraints, 'allowConsecutiveClasses', True)
+        )
+
+
+class CompiledRequest:
+    """
+    Facts about a schedule request in the form the genetic algorithm uses.
+
+    Built once per optimization and shared by the population, its
+    chromosomes and the fitness calculator, so the inner loops index
+    arrays instead of walking pydantic models. Later changes to the
+    request are not picked up; compile it again instead.
+
+    Slot masks are indexed by [class, day, period] or
+    [class, week, day, period], where class is the index in ``classes``;
+    the extra last class row stands for classes the request does not have.
+    """
+
+    def __init__(self, request: ScheduleRequest):
+        """
+        Compile a request.
+
+        Args:
+            request: Schedule request containing classes and constraints
+        """
+        self.request = request
+        self.classes = get_class_table(request)
+        self.num_classes = len(request.classes)
+        # Indices of the request's classes, in request order
+        self.class_indices = np.array(
+            [self.classes.intern(class_obj.id) for class_obj in request.classes], dtype=GENE_DTYPE
+        )
+        self.limits = ConstraintLimits.from_constraints(request.constraints)
+
+        self.start_date = datetime.strptime(request.startDate, "%Y-%m-%d")
+        self.end_date = datetime.strptime(request.endDate, "%Y-%m-%d")
+        self.total_weeks = (self.end_date - self.start_date).days // 7 + 1
+
+        # (week, day) pairs whose date falls inside the schedule range
+        self.calendar = np.zeros((self.total_weeks, MASK_DAYS), dtype=bool)
+        for week in range(self.total_weeks):
+            for day in range(1, 6):
+                if self.start_date + timedelta(days=week * 7 + day - 1) <= self.end_date:
+                    self.calendar[week, day] = True
+
+        # Slots the instructor is unavailable, by [week, day, period]
+        self.unavailable = np.zeros((self.total_weeks, MASK_DAYS, MASK_PERIODS), dtype=bool)
+        for avail in request.instructorAvailability:
+            offset = (avail.date.date() - self.start_date.date()).days
+            week, day = divmod(offset, 7)
+            if offset < 0 or week >= self.total_weeks or day >= 5:
+                continue
+            for period in avail.periods:
+                if 1 <= period < MASK_PERIODS:
+                    self.unavailable[week, day + 1, period] = True
+
+        # Weekly conflict, preferred and avoided slots of each class
+        shape = (self.num_classes + 1, MASK_DAYS, MASK_PERIODS)
+        self.conflicts = np.zeros(shape, dtype=bool)
+        self.preferred = np.zeros(shape, dtype=bool)
+        self.avoided = np.zeros(shape, dtype=bool)
+        for class_obj in request.classes:
+            index = self.classes.index[class_obj.id]
+            schedule = class_obj.weeklySchedule
+            for mask, slots in (
+                (self.conflicts, schedule.conflicts),
+                (self.preferred, schedule.preferredPeriods),
+                (self.avoided, schedule.avoidPeriods)
+            ):
+                for slot in slots:
+                    mask[index, slot.dayOfWeek, slot.period] = True
+
+        # Slots each class may take: inside the calendar, Monday-Friday
+        # periods 1-8, free of class conflicts and instructor unavailability
+        school_slots = np.zeros((MASK_DAYS, MASK_PERIODS), dtype=bool)
+        school_slots[1:6, 1:9] = True
+        open_slots = self.calendar[:, :, np.newaxis] & school_slots & ~self.unavailable
+        self.allowed = open_slots[np.newaxis] & ~self.conflicts[:, np.newaxis]
+
+    def class_rows(self, class_indices: np.ndarray) -> np.ndarray:
+        """Map class indices to mask rows, sending unknown classes to the last row."""
+        return np.minimum(class_indices, self.num_classes)
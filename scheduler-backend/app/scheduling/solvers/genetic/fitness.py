@@ -1,6 +1,10 @@
 """Fitness calculation for genetic algorithm scheduling."""
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Dict, List
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ....models import (
     ScheduleRequest,
@@ -8,21 +12,81 @@ from ....models import (
     TimeSlot,
     WeightConfig
 )
-from .chromosome import ScheduleChromosome, Gene
+from .chromosome import (
+    ScheduleChromosome,
+    Gene,
+    ClassTable,
+    CompiledRequest,
+    CLASS,
+    WEEK,
+    DAY,
+    PERIOD,
+    gene_keys,
+    row_counts,
+    consecutive_periods,
+    validate_gene_arrays
+)
+from .compiled import MASK_DAYS, MASK_PERIODS
+
+
+def _sequential_sum(terms: np.ndarray) -> np.ndarray:
+    """
+    Sum each row left to right, one addition at a time.
+
+    np.sum adds pairwise, which can round differently from a Python loop;
+    accumulating keeps batch scores identical to the per-chromosome ones.
+    """
+    if not terms.shape[1]:
+        return np.zeros(len(terms))
+    return np.cumsum(terms, axis=1)[:, -1]
+
+
+@dataclass
+class FitnessState:
+    """
+    Weight-independent fitness contributions of one gene array.
+
+    Holds the slot histogram and the per-component counts a fitness score
+    is computed from, so a child differing from its parent in a few genes
+    can be scored by updating the parent's state for just those genes.
+    """
+    compiled: CompiledRequest
+    gene_array: np.ndarray
+    slot_counts: np.ndarray     # Genes per [week, day, period]
+    day_excess: np.ndarray      # Classes beyond the consecutive limit per [week, day]
+    day_violations: np.ndarray  # Days breaking the consecutive class rules
+    conflict_count: int
+    preferred_count: int
+    avoided_count: int
+
 
 class FitnessCalculator:
     """Calculates fitness scores for schedule chromosomes."""
     
-    def __init__(self, request: ScheduleRequest, weights: WeightConfig):
+    def __init__(
+        self,
+        request: ScheduleRequest,
+        weights: WeightConfig,
+        compiled: Optional[CompiledRequest] = None,
+        verify_incremental: bool = False
+    ):
         """
         Initialize fitness calculator.
         
         Args:
             request: Schedule request containing classes and constraints
             weights: Configuration of weights for different objectives
+            compiled: Lookup tables of the request, compiled on first use if not given
+            verify_incremental: Whether to check every incremental score
+                against a full evaluation
         """
         self.request = request
         self.weights = weights
+        self.compiled = compiled
+        self.verify_incremental = verify_incremental
+        self.incremental_stats = {"reused": 0, "incremental": 0, "full": 0}
+        self._preference_weights: Optional[Tuple[Tuple[int, int], np.ndarray, np.ndarray]] = None
+        self._class_ranks: Dict[int, Tuple[ClassTable, int, np.ndarray]] = {}
         
     def calculate_fitness(self, chromosome: ScheduleChromosome) -> float:
         """
@@ -44,6 +108,563 @@ class FitnessCalculator:
         score += self._evaluate_early_scheduling(chromosome)
         
         return score
+    
+    def calculate_population_fitness(self, population: Sequence[ScheduleChromosome]) -> List[float]:
+        """
+        Calculate fitness scores for a whole population at once.
+        
+        Scores every chromosome with NumPy operations over the stacked gene
+        arrays instead of per-gene Python loops. The scores are identical to
+        calculate_fitness, including the order of floating point additions.
+        
+        Args:
+            population: Chromosomes to score
+            
+        Returns:
+            Fitness score of each chromosome, in order
+        """
+        class_ids = [class_obj.id for class_obj in self.request.classes]
+        if len(set(class_ids)) != len(class_ids):
+            # The per-chromosome path counts genes of a repeated class once per repeat
+            return [self.calculate_fitness(chromosome) for chromosome in population]
+        
+        # Chromosomes of the same length and schedule range are scored together
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for i, chromosome in enumerate(population):
+            total_weeks = (chromosome.end_date - chromosome.start_date).days // 7 + 1
+            key = (len(chromosome.gene_array), total_weeks)
+            groups.setdefault(key, []).append(i)
+        
+        scores = [0.0] * len(population)
+        for (length, total_weeks), indices in groups.items():
+            if not length:
+                continue
+            members = [population[i] for i in indices]
+            gene_arrays = np.stack([chromosome.gene_array for chromosome in members])
+            ranks = np.stack([self._get_class_ranks(chromosome.classes)[chromosome.gene_array[:, CLASS]]
+                              for chromosome in members])
+            group_scores = self._score_gene_arrays(gene_arrays, ranks, total_weeks)
+            for i, score in zip(indices, group_scores.tolist()):
+                scores[i] = score
+        return scores
+    
+    def _get_compiled(self) -> CompiledRequest:
+        """Get the compiled request, compiling it on first use."""
+        if self.compiled is None:
+            self.compiled = CompiledRequest(self.request)
+        return self.compiled
+    
+    def _get_preference_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the preferred bonus and avoided penalty of each class slot.
+        
+        Both matrices are indexed by [class rank, day, period] and rebuilt
+        when the weights change.
+        """
+        key = (self.weights.preferred_periods, self.weights.avoid_periods)
+        if self._preference_weights is None or self._preference_weights[0] != key:
+            compiled = self._get_compiled()
+            self._preference_weights = (
+                key,
+                np.where(compiled.preferred, float(key[0]), 0.0),
+                np.where(compiled.avoided, float(key[1]), 0.0)
+            )
+        return self._preference_weights[1], self._preference_weights[2]
+    
+    def _get_class_ranks(self, classes: ClassTable) -> np.ndarray:
+        """Map a class table's indices to positions in the request's class list."""
+        cached = self._class_ranks.get(id(classes))
+        if cached is None or cached[0] is not classes or cached[1] != len(classes):
+            positions = {class_obj.id: rank for rank, class_obj in enumerate(self.request.classes)}
+            missing = len(self.request.classes)
+            ranks = np.array([positions.get(class_id, missing) for class_id in classes.ids], dtype=np.int64)
+            cached = (classes, len(classes), ranks)
+            self._class_ranks[id(classes)] = cached
+        return cached[2]
+    
+    def _score_gene_arrays(self, gene_arrays: np.ndarray, ranks: np.ndarray, total_weeks: int) -> np.ndarray:
+        """
+        Score a stack of equal-length gene arrays.
+        
+        Args:
+            gene_arrays: Array of shape (chromosomes, genes, 4)
+            ranks: Request class position of each gene
+            total_weeks: Number of weeks in the schedule range
+            
+        Returns:
+            Fitness score of each chromosome
+        """
+        compiled = self._get_compiled()
+        
+        # Only valid chromosomes are scored
+        valid = validate_gene_arrays(gene_arrays, compiled.limits)
+        scores = np.full(len(gene_arrays), float('-inf'))
+        if not valid.any():
+            return scores
+        gene_arrays = gene_arrays[valid]
+        ranks = ranks[valid]
+        
+        count, length = gene_arrays.shape[:2]
+        preferred_weights, avoided_weights = self._get_preference_weights()
+        days = gene_arrays[:, :, DAY]
+        periods = gene_arrays[:, :, PERIOD]
+        weeks, day_keys, slot_keys = gene_keys(gene_arrays)
+        
+        # Conflicts: -10000 per gene in one of its class's conflict slots
+        conflict_count = np.count_nonzero(compiled.conflicts[ranks, days, periods], axis=1)
+        conflict_score = 0.0 - 10000.0 * conflict_count
+        
+        # Preferences: per class in request order, then per gene, the
+        # preferred bonus followed by the avoided penalty
+        order = np.argsort(ranks, axis=1, kind='stable')
+        sorted_ranks = np.take_along_axis(ranks, order, axis=1)
+        sorted_days = np.take_along_axis(days, order, axis=1)
+        sorted_periods = np.take_along_axis(periods, order, axis=1)
+        preference_terms = np.zeros((count, 2 * length))
+        preference_terms[:, 0::2] = preferred_weights[sorted_ranks, sorted_days, sorted_periods]
+        preference_terms[:, 1::2] = avoided_weights[sorted_ranks, sorted_days, sorted_periods]
+        preference_score = _sequential_sum(preference_terms)
+        
+        # Distribution: variance of classes per week, over the weeks in
+        # order of their first gene
+        week_counts = row_counts(weeks)
+        first_gene = np.full(week_counts.shape, length)
+        np.minimum.at(first_gene, (np.arange(count)[:, np.newaxis], weeks), np.arange(length))
+        week_order = np.argsort(first_gene, axis=1, kind='stable')
+        ordered_counts = np.take_along_axis(week_counts, week_order, axis=1)
+        used_weeks = np.count_nonzero(week_counts, axis=1)
+        avg_classes = length / used_weeks
+        deviations = ordered_counts - avg_classes[:, np.newaxis]
+        # float_power calls C pow() like Python's ** does; x * x can round differently
+        squared = np.where(ordered_counts > 0, np.float_power(deviations, 2), 0.0)
+        variance = _sequential_sum(squared) / used_weeks
+        distribution_score = 0.0 - variance * self.weights.distribution
+        
+        # Consecutive classes: -500 per class beyond the limit in each run
+        follows = consecutive_periods(np.sort(slot_keys, axis=1))
+        positions = np.arange(1, length)
+        run_starts = np.maximum.accumulate(np.where(follows, 0, positions), axis=1)
+        run_lengths = positions - run_starts + 1
+        excess = np.where(follows, run_lengths - compiled.limits.max_consecutive_classes, 0)
+        consecutive_score = 0.0 - 500.0 * np.clip(excess, 0, None).sum(axis=1)
+        
+        # Early scheduling: bonus shrinking with the week number
+        early_terms = self.weights.earlier_dates * (total_weeks - weeks).astype(np.float64) / total_weeks
+        early_score = _sequential_sum(early_terms)
+        
+        score = 0.0 + conflict_score
+        score = score + preference_score
+        score = score + distribution_score
+        score = score + consecutive_score
+        score = score + early_score
+        
+        scores[valid] = score
+        return scores
+        
+    def calculate_incremental_fitness(self, population: Sequence[ScheduleChromosome]) -> List[float]:
+        """
+        Calculate fitness scores for a population, reusing parent fitness states.
+        
+        A chromosome whose genes match a state in its ``fitness_bases`` keeps
+        that state without evaluation, one that changed at most half of its
+        genes updates the closest state for the changed genes, and the rest
+        are evaluated from scratch. Every chromosome keeps its new state as
+        the base for its own children. Updates and evaluations are each
+        done for the whole population in one NumPy pass.
+        
+        Scores equal calculate_fitness up to floating point rounding; with
+        ``verify_incremental`` set each one is checked against it.
+        
+        Args:
+            population: Chromosomes to score
+            
+        Returns:
+            Fitness score of each chromosome, in order
+        """
+        class_ids = [class_obj.id for class_obj in self.request.classes]
+        if len(set(class_ids)) != len(class_ids):
+            return self.calculate_population_fitness(population)
+        
+        compiled = self._get_compiled()
+        states: List[Optional[FitnessState]] = [None] * len(population)
+        scores = [0.0] * len(population)
+        groups: Dict[int, List[int]] = {}
+        for i, chromosome in enumerate(population):
+            if chromosome.start_date == compiled.start_date:
+                groups.setdefault(len(chromosome.gene_array), []).append(i)
+        
+        for length, indices in groups.items():
+            members = [population[i] for i in indices]
+            gene_arrays = np.stack([chromosome.gene_array for chromosome in members])
+            in_bounds = self._in_bounds(gene_arrays)
+            bases, changed = self._closest_bases(members, gene_arrays)
+            reused = in_bounds & (changed == 0)
+            updated = in_bounds & (changed > 0) & (2 * changed <= length)
+            built = in_bounds & ~reused & ~updated
+            
+            if reused.any():
+                selected = np.flatnonzero(reused).tolist()
+                new_states = [replace(bases[j], gene_array=members[j].gene_array) for j in selected]
+                new_scores = self._score_states(new_states)
+                for j, state, score in zip(selected, new_states, new_scores.tolist()):
+                    states[indices[j]], scores[indices[j]] = state, score
+            if updated.any():
+                selected = np.flatnonzero(updated).tolist()
+                new_states, new_scores = self._update_states(
+                    [members[j] for j in selected], [bases[j] for j in selected], gene_arrays[selected]
+                )
+                for j, state, score in zip(selected, new_states, new_scores.tolist()):
+                    states[indices[j]], scores[indices[j]] = state, score
+            if built.any():
+                selected = np.flatnonzero(built).tolist()
+                new_states, new_scores = self._build_states([members[j] for j in selected], gene_arrays[selected])
+                for j, state, score in zip(selected, new_states, new_scores.tolist()):
+                    states[indices[j]], scores[indices[j]] = state, score
+            self.incremental_stats["reused"] += int(np.count_nonzero(reused))
+            self.incremental_stats["incremental"] += int(np.count_nonzero(updated))
+            self.incremental_stats["full"] += int(np.count_nonzero(built))
+        
+        # Chromosomes outside the compiled calendar take the regular path
+        others = [i for i, state in enumerate(states) if state is None]
+        if others:
+            other_scores = self.calculate_population_fitness([population[i] for i in others])
+            for i, score in zip(others, other_scores):
+                scores[i] = score
+            self.incremental_stats["full"] += len(others)
+        
+        for chromosome, state, score in zip(population, states, scores):
+            if state is None:
+                continue
+            chromosome.fitness_bases = (state,)
+            if self.verify_incremental:
+                self._verify_score(chromosome, score)
+        return scores
+    
+    def score_neighbours(
+        self,
+        chromosome: ScheduleChromosome,
+        gene_arrays: np.ndarray
+    ) -> Tuple[List[FitnessState], np.ndarray]:
+        """
+        Score gene arrays that differ from a chromosome in a few genes.
+        
+        Each gene array updates the chromosome's fitness state for just the
+        genes that differ, as calculate_incremental_fitness does for children.
+        
+        Args:
+            chromosome: Chromosome scored by calculate_incremental_fitness,
+                whose first fitness base is the state to update
+            gene_arrays: Stacked gene arrays, each as long as the chromosome's
+            
+        Returns:
+            Tuple of (fitness states, fitness scores) of the gene arrays
+            
+        Raises:
+            ValueError: If the chromosome has no fitness state of this calculator
+        """
+        base = chromosome.fitness_bases[0] if chromosome.fitness_bases else None
+        if (not isinstance(base, FitnessState) or base.compiled is not self._get_compiled()
+                or base.gene_array.shape != gene_arrays.shape[1:]):
+            raise ValueError("Chromosome has no fitness state to update")
+        if not len(gene_arrays):
+            return [], np.zeros(0)
+        count = len(gene_arrays)
+        states, scores = self._update_states([chromosome] * count, [base] * count, gene_arrays)
+        states = [replace(state, gene_array=gene_array) for state, gene_array in zip(states, gene_arrays)]
+        return states, scores
+    
+    def _in_bounds(self, gene_arrays: np.ndarray) -> np.ndarray:
+        """Check which of a stack of gene arrays fit inside the compiled slot histogram."""
+        if not gene_arrays.shape[1]:
+            return np.ones(len(gene_arrays), dtype=bool)
+        high = gene_arrays.max(axis=1)
+        return (
+            (gene_arrays.min(axis=(1, 2)) >= 0) &
+            (high[:, WEEK] < self._get_compiled().total_weeks) &
+            (high[:, DAY] < MASK_DAYS) &
+            (high[:, PERIOD] < MASK_PERIODS)
+        )
+    
+    def _closest_bases(
+        self,
+        members: Sequence[ScheduleChromosome],
+        gene_arrays: np.ndarray
+    ) -> Tuple[List[Optional[FitnessState]], np.ndarray]:
+        """
+        Find the fitness base of each chromosome that differs least from it.
+        
+        Args:
+            members: Chromosomes of equal length
+            gene_arrays: Their stacked gene arrays
+            
+        Returns:
+            Tuple of (base states, number of changed genes); chromosomes
+            without a usable base get None and one more than their length
+        """
+        count, length = gene_arrays.shape[:2]
+        bases: List[Optional[FitnessState]] = [None] * count
+        changed = np.full(count, length + 1)
+        for slot in range(max(len(chromosome.fitness_bases) for chromosome in members)):
+            candidates = [
+                base if isinstance(base, FitnessState) and base.compiled is self.compiled and
+                base.gene_array.shape == gene_arrays.shape[1:] else None
+                for base in (
+                    chromosome.fitness_bases[slot] if slot < len(chromosome.fitness_bases) else None
+                    for chromosome in members
+                )
+            ]
+            usable = np.array([base is not None for base in candidates])
+            if not usable.any():
+                continue
+            base_arrays = np.stack([
+                base.gene_array if base is not None else gene_arrays[j]
+                for j, base in enumerate(candidates)
+            ])
+            counts = np.count_nonzero((base_arrays != gene_arrays).any(axis=2), axis=1)
+            better = usable & (counts < changed)
+            for j in np.flatnonzero(better).tolist():
+                bases[j] = candidates[j]
+            changed = np.where(better, counts, changed)
+        return bases, changed
+    
+    def _build_states(
+        self,
+        members: Sequence[ScheduleChromosome],
+        gene_arrays: np.ndarray
+    ) -> Tuple[List[FitnessState], np.ndarray]:
+        """
+        Build the fitness states of equal-length chromosomes from scratch.
+        
+        Args:
+            members: Chromosomes of equal length
+            gene_arrays: Their stacked gene arrays
+            
+        Returns:
+            Tuple of (fitness states, fitness scores)
+        """
+        compiled = self._get_compiled()
+        total_weeks = compiled.total_weeks
+        ranks = self._gene_ranks(members, gene_arrays[:, :, CLASS])
+        count = len(members)
+        days = gene_arrays[:, :, DAY]
+        periods = gene_arrays[:, :, PERIOD]
+        slot_keys = gene_keys(gene_arrays)[2]
+        
+        size = total_weeks * MASK_DAYS * MASK_PERIODS
+        offsets = np.arange(count)[:, np.newaxis] * size
+        slot_counts = np.bincount(
+            (slot_keys + offsets).ravel(), minlength=count * size
+        ).astype(np.int32).reshape(count, total_weeks, MASK_DAYS, MASK_PERIODS)
+        day_excess, day_violations = self._day_penalties(slot_counts.reshape(-1, MASK_PERIODS))
+        day_excess = day_excess.reshape(count, total_weeks, MASK_DAYS)
+        day_violations = day_violations.reshape(count, total_weeks, MASK_DAYS)
+        conflict_counts = np.count_nonzero(compiled.conflicts[ranks, days, periods], axis=1)
+        preferred_counts = np.count_nonzero(compiled.preferred[ranks, days, periods], axis=1)
+        avoided_counts = np.count_nonzero(compiled.avoided[ranks, days, periods], axis=1)
+        
+        states = [
+            FitnessState(compiled, chromosome.gene_array, slot_counts[i], day_excess[i],
+                         day_violations[i], conflict, preferred, avoided)
+            for i, (chromosome, conflict, preferred, avoided) in enumerate(zip(
+                members, conflict_counts.tolist(), preferred_counts.tolist(), avoided_counts.tolist()
+            ))
+        ]
+        scores = self._score_arrays(
+            slot_counts, day_excess, day_violations, conflict_counts, preferred_counts, avoided_counts
+        )
+        return states, scores
+    
+    def _gene_ranks(self, members: Sequence[ScheduleChromosome], class_indices: np.ndarray) -> np.ndarray:
+        """
+        Map class indices to request class positions.
+        
+        Args:
+            members: Chromosomes owning the class indices
+            class_indices: Class index of each gene, one row per chromosome
+        """
+        tables = {id(chromosome.classes): chromosome.classes for chromosome in members}
+        if len(tables) == 1:
+            return self._get_class_ranks(members[0].classes)[class_indices]
+        return np.stack([self._get_class_ranks(chromosome.classes)[row]
+                         for chromosome, row in zip(members, class_indices)])
+    
+    def _update_states(
+        self,
+        members: Sequence[ScheduleChromosome],
+        bases: Sequence[FitnessState],
+        gene_arrays: np.ndarray
+    ) -> Tuple[List[FitnessState], np.ndarray]:
+        """
+        Derive fitness states from base states and the genes that differ.
+        
+        Args:
+            members: Chromosomes of equal length
+            bases: Base state of each chromosome
+            gene_arrays: Stacked gene arrays of the chromosomes
+            
+        Returns:
+            Tuple of (fitness states, fitness scores)
+        """
+        compiled = self._get_compiled()
+        total_weeks = compiled.total_weeks
+        count = len(members)
+        
+        base_arrays = np.stack([base.gene_array for base in bases])
+        owners, positions = np.nonzero((base_arrays != gene_arrays).any(axis=2))
+        old = base_arrays[owners, positions].astype(np.intp)
+        new = gene_arrays[owners, positions].astype(np.intp)
+        ranks = self._gene_ranks(members, np.stack((base_arrays[:, :, CLASS], gene_arrays[:, :, CLASS]), axis=1))
+        old_ranks = ranks[owners, 0, positions]
+        new_ranks = ranks[owners, 1, positions]
+        
+        # Move the changed genes in the stacked slot histograms
+        slot_counts = np.stack([base.slot_counts for base in bases])
+        np.subtract.at(slot_counts, (owners, old[:, WEEK], old[:, DAY], old[:, PERIOD]), 1)
+        np.add.at(slot_counts, (owners, new[:, WEEK], new[:, DAY], new[:, PERIOD]), 1)
+        
+        # Only days that lost or gained a gene need their runs recounted
+        day_excess = np.stack([base.day_excess for base in bases]).reshape(-1)
+        day_violations = np.stack([base.day_violations for base in bases]).reshape(-1)
+        touched = np.unique(np.concatenate((
+            (owners * total_weeks + old[:, WEEK]) * MASK_DAYS + old[:, DAY],
+            (owners * total_weeks + new[:, WEEK]) * MASK_DAYS + new[:, DAY]
+        )))
+        day_excess[touched], day_violations[touched] = self._day_penalties(
+            slot_counts.reshape(-1, MASK_PERIODS)[touched]
+        )
+        day_excess = day_excess.reshape(count, total_weeks, MASK_DAYS)
+        day_violations = day_violations.reshape(count, total_weeks, MASK_DAYS)
+        
+        def count_change(mask: np.ndarray) -> np.ndarray:
+            gained = mask[new_ranks, new[:, DAY], new[:, PERIOD]]
+            lost = mask[old_ranks, old[:, DAY], old[:, PERIOD]]
+            return (np.bincount(owners[gained], minlength=count) -
+                    np.bincount(owners[lost], minlength=count))
+        
+        conflict_counts = np.array([base.conflict_count for base in bases]) + count_change(compiled.conflicts)
+        preferred_counts = np.array([base.preferred_count for base in bases]) + count_change(compiled.preferred)
+        avoided_counts = np.array([base.avoided_count for base in bases]) + count_change(compiled.avoided)
+        
+        states = [
+            FitnessState(compiled, chromosome.gene_array, slot_counts[i], day_excess[i],
+                         day_violations[i], conflict, preferred, avoided)
+            for i, (chromosome, conflict, preferred, avoided) in enumerate(zip(
+                members, conflict_counts.tolist(), preferred_counts.tolist(), avoided_counts.tolist()
+            ))
+        ]
+        scores = self._score_arrays(
+            slot_counts, day_excess, day_violations, conflict_counts, preferred_counts, avoided_counts
+        )
+        return states, scores
+    
+    def _day_penalties(self, period_counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count the classes beyond the consecutive limit on each day.
+        
+        Follows the per-chromosome rules on the sorted periods of a day:
+        a run grows when a period directly follows the previous one, and a
+        repeated period starts a new run.
+        
+        Args:
+            period_counts: Genes per period, one row per day
+            
+        Returns:
+            Tuple of (excess classes, whether the day breaks the consecutive rules)
+        """
+        limits = self._get_compiled().limits
+        excess = np.zeros(len(period_counts), dtype=np.int64)
+        violations = np.zeros(len(period_counts), dtype=bool)
+        # Run length at the last gene of the previous period, 0 if it has none
+        run = np.zeros(len(period_counts), dtype=np.int64)
+        used_periods = np.flatnonzero(period_counts.any(axis=0))
+        if not len(used_periods):
+            return excess, violations
+        for period in range(used_periods[0], used_periods[-1] + 1):
+            counts = period_counts[:, period]
+            present = counts > 0
+            follows = present & (run > 0)
+            first_run = np.where(present, run + 1, 0)
+            excess += np.where(follows, np.maximum(first_run - limits.max_consecutive_classes, 0), 0)
+            if limits.allow_consecutive_pairs:
+                violations |= follows & (first_run > 2)
+            else:
+                violations |= follows
+            run = np.where(counts == 1, first_run, present.astype(np.int64))
+        return excess, violations
+    
+    def _score_states(self, states: Sequence[FitnessState]) -> np.ndarray:
+        """Calculate the fitness scores of fitness states with the current weights."""
+        return self._score_arrays(
+            np.stack([state.slot_counts for state in states]),
+            np.stack([state.day_excess for state in states]),
+            np.stack([state.day_violations for state in states]),
+            np.array([state.conflict_count for state in states]),
+            np.array([state.preferred_count for state in states]),
+            np.array([state.avoided_count for state in states])
+        )
+    
+    def _score_arrays(
+        self,
+        slot_counts: np.ndarray,
+        day_excess: np.ndarray,
+        day_violations: np.ndarray,
+        conflict_counts: np.ndarray,
+        preferred_counts: np.ndarray,
+        avoided_counts: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate fitness scores from stacked fitness state fields.
+        
+        Returns:
+            Fitness score of each state, -inf for invalid ones
+        """
+        compiled = self._get_compiled()
+        limits = compiled.limits
+        weights = self.weights
+        total_weeks = compiled.total_weeks
+        
+        day_counts = slot_counts.sum(axis=3)
+        week_counts = day_counts.sum(axis=2)
+        valid = (
+            (day_counts.max(axis=(1, 2)) <= limits.max_classes_per_day) &
+            (week_counts.max(axis=1) <= limits.max_classes_per_week) &
+            ~day_violations.any(axis=(1, 2))
+        )
+        
+        conflict_score = 0.0 - 10000.0 * conflict_counts
+        # Integer weights, so the sum is exact in any order
+        preference_score = (
+            preferred_counts * weights.preferred_periods +
+            avoided_counts * weights.avoid_periods
+        ).astype(np.float64)
+        
+        # Distribution: variance of classes over the weeks in use
+        used_weeks = np.maximum(np.count_nonzero(week_counts, axis=1), 1)
+        avg_classes = week_counts.sum(axis=1) / used_weeks
+        deviations = week_counts - avg_classes[:, np.newaxis]
+        squared = np.where(week_counts > 0, np.float_power(deviations, 2), 0.0)
+        distribution_score = 0.0 - squared.sum(axis=1) / used_weeks * weights.distribution
+        
+        consecutive_score = 0.0 - 500.0 * day_excess.sum(axis=(1, 2))
+        
+        week_bonus = weights.earlier_dates * (total_weeks - np.arange(total_weeks)) / total_weeks
+        early_score = (week_counts * week_bonus).sum(axis=1)
+        
+        score = conflict_score + preference_score + distribution_score + consecutive_score + early_score
+        return np.where(valid, score, float('-inf'))
+    
+    def _verify_score(self, chromosome: ScheduleChromosome, score: float) -> None:
+        """
+        Check an incremental score against a full evaluation.
+        
+        Raises:
+            RuntimeError: If the scores differ beyond floating point rounding
+        """
+        expected = self.calculate_fitness(chromosome)
+        if not math.isclose(score, expected, rel_tol=1e-9, abs_tol=1e-6):
+            raise RuntimeError(
+                f"Incremental fitness {score} differs from full evaluation {expected}"
+            )
         
     def _evaluate_conflicts(self, chromosome: ScheduleChromosome) -> float:
         """Evaluate conflict-related constraints."""
@@ -0,0 +1,111 @@
+"""Bounded cache of chromosome fitness scores keyed by gene content."""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .chromosome import ScheduleChromosome
+
+
+def gene_hash(gene_array: np.ndarray) -> bytes:
+    """Hash the shape and contents of a gene array."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(gene_array.shape, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(gene_array).tobytes())
+    return digest.digest()
+
+
+class FitnessCache:
+    """
+    LRU cache of fitness scores keyed by gene array hash.
+
+    Elites, unmutated clones and individuals that reappear are looked up
+    instead of being scored again. Scores depend on the request and the
+    weights, so one cache serves one optimization run.
+
+    Lookups happen in the optimizer's process before chromosomes are sent
+    to the fitness worker pool, so workers never consult the cache. A
+    pickled cache is an independent copy; entries are not shared between
+    processes.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Scores kept before the least recently used is evicted
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def lookup(self, chromosomes: Sequence[ScheduleChromosome]) -> Tuple[List[bytes], List[Optional[float]]]:
+        """
+        Look up the fitness of several chromosomes.
+
+        Args:
+            chromosomes: Chromosomes to look up
+
+        Returns:
+            Tuple of (cache keys, cached fitness or None), one per chromosome
+        """
+        keys = [gene_hash(chromosome.gene_array) for chromosome in chromosomes]
+        found: List[Optional[float]] = []
+        with self._lock:
+            for key in keys:
+                fitness = self._entries.get(key)
+                if fitness is None:
+                    self._stats["misses"] += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                found.append(fitness)
+        return keys, found
+
+    def store(self, keys: Sequence[bytes], scores: Sequence[float]) -> None:
+        """
+        Store fitness scores under their cache keys.
+
+        Args:
+            keys: Keys returned by lookup
+            scores: Fitness score for each key
+        """
+        with self._lock:
+            for key, fitness in zip(keys, scores):
+                self._entries[key] = fitness
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and the number of entries"""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        return stats
+
+    def __getstate__(self) -> dict:
+        with self._lock:
+            return {
+                "max_entries": self.max_entries,
+                "entries": list(self._entries.items()),
+                "stats": dict(self._stats),
+            }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["max_entries"])
+        self._entries.update(state["entries"])
+        self._stats.update(state["stats"])
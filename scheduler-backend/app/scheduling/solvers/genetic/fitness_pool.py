@@ -0,0 +1,301 @@
+"""Persistent worker processes that score gene arrays for one optimization run."""
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # Platforms without POSIX or Windows shared memory
+    SharedMemory = None
+
+from ....models import ScheduleRequest, WeightConfig
+from .chromosome import ScheduleChromosome
+from .compiled import GENE_DTYPE, CompiledRequest
+from .fitness import FitnessCalculator
+from .local_search import local_search
+from .parallel import parallel_process_batched
+
+# State installed in each worker process by _init_worker
+_worker_compiled: Optional[CompiledRequest] = None
+_worker_calculator: Optional[FitnessCalculator] = None
+_worker_vectorized = True
+# Shared population blocks a worker has attached, by block name
+_worker_blocks: Dict[str, Tuple['SharedMemory', np.ndarray, np.ndarray]] = {}
+
+
+class SharedBlock(NamedTuple):
+    """Name and shape of a shared population block, as sent to workers."""
+    name: str
+    capacity: int
+    genes: int
+
+
+def _block_arrays(buffer, block: SharedBlock) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    View a block's buffer as its gene and fitness arrays.
+
+    The block holds a float64 fitness array of ``capacity`` entries followed
+    by a (capacity, genes, 4) gene array.
+    """
+    fitness = np.ndarray((block.capacity,), dtype=np.float64, buffer=buffer)
+    gene_arrays = np.ndarray(
+        (block.capacity, block.genes, 4), dtype=GENE_DTYPE, buffer=buffer, offset=fitness.nbytes
+    )
+    return gene_arrays, fitness
+
+
+class SharedPopulation:
+    """
+    Population gene arrays and fitness scores in one shared memory block.
+
+    The parent copies each generation's gene arrays into the block; workers
+    attach to it by name, score slices in place and write the scores into
+    the shared fitness array.
+    """
+
+    def __init__(self, capacity: int, genes: int):
+        """
+        Allocate the block.
+
+        Args:
+            capacity: Most chromosomes the block holds
+            genes: Genes per chromosome
+
+        Raises:
+            OSError: If shared memory cannot be allocated
+        """
+        size = capacity * 8 + capacity * genes * 4 * np.dtype(GENE_DTYPE).itemsize
+        self._memory = SharedMemory(create=True, size=max(1, size))
+        self.block = SharedBlock(self._memory.name, capacity, genes)
+        self.gene_arrays, self.fitness = _block_arrays(self._memory.buf, self.block)
+
+    def fits(self, count: int, genes: int) -> bool:
+        """Whether ``count`` chromosomes of ``genes`` genes fit the block."""
+        return count <= self.block.capacity and genes == self.block.genes
+
+    def close(self) -> None:
+        """Release and remove the block"""
+        # Drop the views first; the buffer cannot close while they exist
+        self.gene_arrays = self.fitness = None
+        self._memory.close()
+        self._memory.unlink()
+
+
+def _init_worker(
+    request: ScheduleRequest,
+    weights: WeightConfig,
+    class_ids: List[str],
+    vectorized: bool
+) -> None:
+    """Compile the request and build the fitness calculator once per worker."""
+    global _worker_compiled, _worker_calculator, _worker_vectorized
+    _worker_compiled = CompiledRequest(request)
+    # Intern IDs the parent met after compiling, so class indices agree
+    for class_id in class_ids:
+        _worker_compiled.classes.intern(class_id)
+    _worker_calculator = FitnessCalculator(request, weights, compiled=_worker_compiled)
+    _worker_vectorized = vectorized
+
+
+def _attach_block(block: SharedBlock) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the gene and fitness arrays of a shared block, attaching on first use."""
+    attached = _worker_blocks.get(block.name)
+    if attached is None:
+        # The parent replaces blocks that no longer fit; let go of old ones
+        for memory, _, _ in _worker_blocks.values():
+            memory.close()
+        _worker_blocks.clear()
+        # Workers share the parent's resource tracker, so attaching does
+        # not hand them ownership; the parent unlinks the block
+        memory = SharedMemory(name=block.name)
+        attached = (memory, *_block_arrays(memory.buf, block))
+        _worker_blocks[block.name] = attached
+    return attached[1], attached[2]
+
+
+def _score_shared(block: SharedBlock, indices: List[int]) -> List[int]:
+    """
+    Score a contiguous slice of a shared population in place.
+
+    Returns:
+        The indices written, so the parent can check every slice was scored
+    """
+    gene_arrays, fitness = _attach_block(block)
+    start, stop = indices[0], indices[-1] + 1
+    fitness[start:stop] = _score_batch(gene_arrays[start:stop])
+    return indices
+
+
+def _score_batch(gene_arrays: Sequence[np.ndarray]) -> List[float]:
+    """Score a batch of gene arrays, or one stacked array, with the worker's calculator."""
+    chromosomes = []
+    for gene_array in gene_arrays:
+        chromosome = ScheduleChromosome(compiled=_worker_compiled)
+        chromosome.gene_array = gene_array
+        chromosomes.append(chromosome)
+    if _worker_vectorized:
+        return _worker_calculator.calculate_population_fitness(chromosomes)
+    return [_worker_calculator.calculate_fitness(chromosome) for chromosome in chromosomes]
+
+
+def _local_search(gene_array: np.ndarray, max_evaluations: int, seed: int) -> Tuple[np.ndarray, float, int]:
+    """
+    Hill-climb one gene array with the worker's calculator.
+
+    Returns:
+        Tuple of (improved gene array, its fitness, moves kept)
+    """
+    chromosome = ScheduleChromosome(compiled=_worker_compiled)
+    chromosome.gene_array = gene_array
+    moves = local_search(_worker_calculator, chromosome, np.random.default_rng(seed), max_evaluations)
+    return chromosome.gene_array, chromosome.fitness, moves
+
+
+class FitnessWorkerPool:
+    """
+    Process pool that scores gene arrays against one request and weights.
+
+    The request and weights reach each worker once, through the pool
+    initializer; afterwards only gene arrays and scores cross process
+    boundaries. The population is split into one batch per worker, and
+    batches smaller than ``min_batch_size`` are merged so that the
+    per-batch overhead does not outweigh the scoring.
+
+    With ``shared_memory`` set, gene arrays are copied into a
+    SharedPopulation instead of being pickled, and only index ranges are
+    sent. Populations of mixed chromosome lengths, and platforms where
+    shared memory cannot be allocated, use pickled batches instead.
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledRequest,
+        weights: WeightConfig,
+        max_workers: int,
+        vectorized: bool = True,
+        min_batch_size: int = 1,
+        shared_memory: bool = False
+    ):
+        """
+        Start the worker processes.
+
+        Args:
+            compiled: Compiled request the chromosomes belong to
+            weights: Configuration of weights for different objectives
+            max_workers: Number of worker processes
+            vectorized: Whether workers score each batch in one NumPy pass
+            min_batch_size: Fewest gene arrays sent to a worker at once
+            shared_memory: Whether to pass gene arrays and scores through shared memory
+        """
+        self.max_workers = max(1, max_workers)
+        self.min_batch_size = max(1, min_batch_size)
+        self.shared_memory = shared_memory and SharedMemory is not None
+        self._shared: Optional[SharedPopulation] = None
+        # Spawn rather than fork: the API process runs threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(compiled.request, weights, list(compiled.classes.ids), vectorized)
+        )
+
+    def batches(self, count: int) -> List[slice]:
+        """Split ``count`` gene arrays into contiguous batches, one per worker at most."""
+        batch_count = max(1, min(self.max_workers, count // self.min_batch_size))
+        batch_size = math.ceil(count / batch_count) if count else 0
+        return [slice(start, start + batch_size) for start in range(0, count, batch_size or 1)]
+
+    def score(self, chromosomes: Sequence[ScheduleChromosome]) -> List[float]:
+        """
+        Score chromosomes in the worker processes.
+
+        Args:
+            chromosomes: Chromosomes of the compiled request
+
+        Returns:
+            Fitness scores in the order of the chromosomes
+        """
+        gene_arrays = [chromosome.gene_array for chromosome in chromosomes]
+        lengths = {len(gene_array) for gene_array in gene_arrays}
+        if len(lengths) == 1:
+            shared = self._shared_population(len(gene_arrays), lengths.pop())
+            if shared is not None:
+                return self._score_shared(shared, gene_arrays)
+            # One stacked array pickles several times faster than many small ones
+            gene_arrays = np.stack(gene_arrays)
+        futures = [
+            self._executor.submit(_score_batch, gene_arrays[batch])
+            for batch in self.batches(len(gene_arrays))
+        ]
+        return [score for future in futures for score in future.result()]
+
+    def local_search(
+        self,
+        gene_arrays: Sequence[np.ndarray],
+        max_evaluations: int,
+        seed: int
+    ) -> List[Tuple[np.ndarray, float, int]]:
+        """
+        Hill-climb gene arrays in the worker processes, one task each.
+
+        Args:
+            gene_arrays: Gene arrays to improve
+            max_evaluations: Most neighbours scored per gene array
+            seed: Seed of the first gene array's random generator; the
+                others take the following seeds
+
+        Returns:
+            (improved gene array, fitness, moves kept) of each gene array, in order
+        """
+        futures = [
+            self._executor.submit(_local_search, gene_array, max_evaluations, seed + index)
+            for index, gene_array in enumerate(gene_arrays)
+        ]
+        return [future.result() for future in futures]
+
+    def _shared_population(self, count: int, genes: int) -> Optional[SharedPopulation]:
+        """Get a shared block that fits the population, or None to pickle it."""
+        if not self.shared_memory:
+            return None
+        if self._shared is not None and not self._shared.fits(count, genes):
+            self._shared.close()
+            self._shared = None
+        if self._shared is None:
+            try:
+                self._shared = SharedPopulation(count, genes)
+            except OSError as e:
+                print(f"Shared memory unavailable, pickling gene arrays instead: {e}")
+                self.shared_memory = False
+        return self._shared
+
+    def _score_shared(self, shared: SharedPopulation, gene_arrays: List[np.ndarray]) -> List[float]:
+        """Score gene arrays through the shared block, sending only index ranges."""
+        count = len(gene_arrays)
+        np.stack(gene_arrays, out=shared.gene_arrays[:count])
+        batch = self.batches(count)[0]
+        written = parallel_process_batched(
+            partial(_score_shared, shared.block),
+            list(range(count)),
+            batch_size=batch.stop - batch.start,
+            executor=self._executor
+        )
+        if written != list(range(count)):
+            raise RuntimeError("Shared memory fitness evaluation did not score every chromosome")
+        return shared.fitness[:count].tolist()
+
+    def close(self) -> None:
+        """Shut the worker processes down and release the shared block"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def __enter__(self) -> 'FitnessWorkerPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
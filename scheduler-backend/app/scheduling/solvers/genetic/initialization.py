@@ -0,0 +1,275 @@
+"""Initial gene arrays that respect the constraints of a compiled request."""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ....models import ScheduleResponse
+from .compiled import GENE_DTYPE, MASK_DAYS, MASK_PERIODS, CompiledRequest
+
+
+def _run_lengths(occupied: List[bool]) -> List[int]:
+    """
+    Get the length of the run of consecutive classes each period would join.
+
+    Args:
+        occupied: Whether each period of one day is taken
+
+    Returns:
+        The taken periods directly before and after each period, plus itself
+    """
+    before = [0] * len(occupied)
+    after = [0] * len(occupied)
+    for period in range(1, len(occupied)):
+        before[period] = before[period - 1] + 1 if occupied[period - 1] else 0
+    for period in range(len(occupied) - 2, -1, -1):
+        after[period] = after[period + 1] + 1 if occupied[period + 1] else 0
+    return [b + a + 1 for b, a in zip(before, after)]
+
+
+class _Occupancy:
+    """
+    Slots taken so far by a schedule under construction.
+
+    ``open`` marks the slots a session may still take without breaking the
+    daily and consecutive limits, ``preferred`` those that also keep runs
+    within max_consecutive_classes. Both are updated one day at a time as
+    slots are taken, so choosing a slot is a couple of mask lookups.
+    """
+
+    def __init__(self, compiled: CompiledRequest):
+        limits = compiled.limits
+        self.compiled = compiled
+        self.occupied = np.zeros(compiled.allowed.shape[1:], dtype=bool)
+        self.open = np.ones(self.occupied.shape, dtype=bool)
+        self.preferred = np.ones(self.occupied.shape, dtype=bool)
+        self.day_counts = np.zeros(self.occupied.shape[:2], dtype=np.int64)
+        self.week_counts = np.zeros(compiled.total_weeks, dtype=np.int64)
+        # Three consecutive classes are never valid, pairs only if allowed
+        self.max_run = 2 if limits.allow_consecutive_pairs else 1
+        # Runs beyond max_consecutive_classes are penalized, not invalid
+        self.preferred_run = min(self.max_run, max(1, limits.max_consecutive_classes))
+
+    def place(self, week: int, day: int, period: int) -> None:
+        """Mark a slot taken and update which slots of its day stay open."""
+        self.occupied[week, day, period] = True
+        self.day_counts[week, day] += 1
+        self.week_counts[week] += 1
+        if self.day_counts[week, day] >= self.compiled.limits.max_classes_per_day:
+            self.open[week, day] = False
+            self.preferred[week, day] = False
+            return
+        occupied = self.occupied[week, day].tolist()
+        runs = _run_lengths(occupied)
+        self.open[week, day] = [
+            not taken and run <= self.max_run for taken, run in zip(occupied, runs)
+        ]
+        self.preferred[week, day] = [
+            not taken and run <= self.preferred_run for taken, run in zip(occupied, runs)
+        ]
+
+    def fits(self, week: int, day: int, period: int) -> bool:
+        """Whether a slot is free and taking it keeps the schedule valid."""
+        return (
+            0 <= week < len(self.week_counts) and 0 <= day < MASK_DAYS and 0 <= period < MASK_PERIODS and
+            self.week_counts[week] < self.compiled.limits.max_classes_per_week and
+            bool(self.open[week, day, period])
+        )
+
+    def nearest(self, row: int, week: int, day: int, period: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Find the free slot nearest another that keeps the schedule valid.
+
+        Weeks are searched from the given one outwards; within a week, slots
+        are ranked by days away, then periods away. Slots the class may take
+        come before other school slots.
+
+        Args:
+            row: Mask row of the class
+            week: Week of the slot to move from
+            day: Day of the slot to move from
+            period: Period of the slot to move from
+
+        Returns:
+            (week, day, period) of the slot, or None if there is none
+        """
+        distance = (
+            np.abs(np.arange(MASK_DAYS) - day)[:, np.newaxis] * MASK_PERIODS +
+            np.abs(np.arange(MASK_PERIODS) - period)
+        )
+        weeks = sorted(range(len(self.week_counts)), key=lambda candidate: abs(candidate - week))
+        weeks = [
+            candidate for candidate in weeks
+            if self.week_counts[candidate] < self.compiled.limits.max_classes_per_week
+        ]
+        # The mask row past the request's classes has no class conflicts
+        for mask in (self.compiled.allowed[row], self.compiled.allowed[-1]):
+            for candidate in weeks:
+                candidates = mask[candidate] & self.open[candidate]
+                if candidates.any():
+                    slot = int(np.where(candidates, distance, np.iinfo(np.int64).max).argmin())
+                    return (candidate, *divmod(slot, MASK_PERIODS))
+        return None
+
+    def choose(self, row: int, week: int, rng: np.random.Generator) -> Optional[Tuple[int, int]]:
+        """
+        Pick a random slot of a week that keeps the schedule valid.
+
+        Slots within max_consecutive_classes and outside the class's
+        avoided periods are picked first.
+
+        Args:
+            row: Mask row of the class
+            week: Week to search
+            rng: Random generator
+
+        Returns:
+            (day, period) of the slot, or None if the week has none
+        """
+        if self.week_counts[week] >= self.compiled.limits.max_classes_per_week:
+            return None
+        free = self.compiled.allowed[row, week] & self.open[week]
+        preferred = free & self.preferred[week] & ~self.compiled.avoided[row]
+        for candidates in (preferred, free):
+            slots = np.flatnonzero(candidates)
+            if len(slots):
+                return divmod(int(slots[rng.integers(len(slots))]), MASK_PERIODS)
+        return None
+
+
+def greedy_gene_array(
+    compiled: CompiledRequest,
+    rng: np.random.Generator,
+    fixed: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Build a gene array by placing one session at a time in a slot that fits.
+
+    Every class gets min_periods_per_week sessions per week, as in
+    ScheduleChromosome.initialize_random; weeks the calendar cuts too
+    short for them get none, and their sessions go to the emptiest full
+    weeks. Classes with the fewest allowed slots are placed first. Each
+    session takes a random slot its class may take (see
+    CompiledRequest.allowed) that is still free, keeps the day and week
+    under their limits and starts no disallowed run of consecutive classes.
+    If its week has no such slot, the other weeks are tried in the same
+    order; as a last resort the session takes any allowed slot.
+
+    Args:
+        compiled: Compiled schedule request
+        rng: Random generator picking the slots
+        fixed: Genes placed before all others, such as a CP-SAT schedule;
+            genes beyond a class's number of sessions are dropped
+
+    Returns:
+        Gene array holding each class's sessions in request order, by week
+    """
+    per_week = compiled.limits.min_periods_per_week
+    weeks = compiled.total_weeks
+    sessions = per_week * weeks
+    class_indices = compiled.class_indices.tolist()
+    positions = {class_idx: position for position, class_idx in enumerate(class_indices)}
+    occupancy = _Occupancy(compiled)
+    placed: List[List[Tuple[int, int, int, int]]] = [[] for _ in class_indices]
+    needed = np.full((len(class_indices), weeks), per_week, dtype=np.int64)
+
+    if fixed is not None:
+        for class_idx, week, day, period in np.asarray(fixed).tolist():
+            position = positions.get(class_idx)
+            if (position is None or len(placed[position]) >= sessions or not 0 <= week < weeks
+                    or not 0 < day < MASK_DAYS or not 0 < period < MASK_PERIODS):
+                continue
+            placed[position].append((class_idx, week, day, period))
+            needed[position, week] = max(0, needed[position, week] - 1)
+            occupancy.place(week, day, period)
+
+    # Most constrained classes first, ties in random order
+    rows = compiled.class_rows(compiled.class_indices)
+    slot_counts = compiled.allowed[rows].reshape(len(rows), -1).sum(axis=1)
+    order = np.lexsort((rng.random(len(rows)), slot_counts)).tolist()
+
+    # Weeks cut short by the calendar cannot take a full week's sessions;
+    # those go to the full weeks instead, keeping the weekly counts even
+    limits = compiled.limits
+    capacity = np.minimum(
+        compiled.calendar.sum(axis=1) * limits.max_classes_per_day, limits.max_classes_per_week
+    )
+    short = capacity < per_week * len(class_indices)
+    needed[:, short] = 0
+
+    # Sessions still to place, by week, then in any week
+    queue: List[Tuple[int, Optional[int]]] = []
+    remaining = [sessions - len(genes) for genes in placed]
+    for week in range(weeks):
+        for position in order:
+            count = min(int(needed[position, week]), remaining[position])
+            queue.extend([(position, week)] * count)
+            remaining[position] -= count
+    for position in order:
+        queue.extend([(position, None)] * remaining[position])
+
+    for position, week in queue:
+        class_idx = class_indices[position]
+        row = int(rows[position])
+        slot = occupancy.choose(row, week, rng) if week is not None else None
+        candidate_week = week
+        if slot is None:
+            # Spill into the emptiest full weeks, then the short ones
+            spill_order = np.lexsort((rng.random(weeks), occupancy.week_counts, short))
+            for candidate_week in spill_order.tolist():
+                slot = occupancy.choose(row, candidate_week, rng)
+                if slot is not None:
+                    break
+        if slot is not None:
+            day, period = slot
+        else:
+            candidate_week, day, period = _fallback_slot(compiled, row, rng)
+        placed[position].append((class_idx, candidate_week, day, period))
+        occupancy.place(candidate_week, day, period)
+
+    genes = [sorted(class_genes, key=lambda gene: gene[1]) for class_genes in placed]
+    return np.array([gene for class_genes in genes for gene in class_genes], dtype=GENE_DTYPE).reshape(-1, 4)
+
+
+def _fallback_slot(compiled: CompiledRequest, row: int, rng: np.random.Generator) -> Tuple[int, int, int]:
+    """Pick any slot the class may take, or any school slot if it may take none."""
+    slots = np.flatnonzero(compiled.allowed[row])
+    if len(slots):
+        week, rest = divmod(int(rng.choice(slots)), compiled.allowed[row, 0].size)
+        day, period = divmod(rest, MASK_PERIODS)
+        return week, day, period
+    return int(rng.integers(0, compiled.total_weeks)), int(rng.integers(1, 6)), int(rng.integers(1, 9))
+
+
+def response_gene_array(compiled: CompiledRequest, response: ScheduleResponse) -> np.ndarray:
+    """
+    Convert the assignments of a schedule, such as a CP-SAT solution, to genes.
+
+    Assignments may name their class by ID or by name. Assignments of
+    classes the request does not have, or outside its weeks, are dropped.
+
+    Args:
+        compiled: Compiled request the schedule was made for
+        response: Schedule to convert
+
+    Returns:
+        Gene array with one gene per kept assignment
+    """
+    class_ids: Dict[str, str] = {class_obj.name: class_obj.id for class_obj in compiled.request.classes}
+    class_ids.update((class_obj.id, class_obj.id) for class_obj in compiled.request.classes)
+    start = compiled.start_date.date()
+    rows = []
+    for assignment in response.assignments:
+        class_id = class_ids.get(assignment.classId) or class_ids.get(assignment.name)
+        if class_id is None:
+            continue
+        week = (datetime.fromisoformat(assignment.date).date() - start).days // 7
+        if not 0 <= week < compiled.total_weeks:
+            continue
+        rows.append((
+            compiled.classes.index[class_id],
+            week,
+            assignment.timeSlot.dayOfWeek,
+            assignment.timeSlot.period
+        ))
+    return np.array(rows, dtype=GENE_DTYPE).reshape(-1, 4)
@@ -0,0 +1,344 @@
+"""Island model: populations that evolve apart and exchange elites."""
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ....models import ScheduleRequest, WeightConfig
+from .chromosome import ScheduleChromosome
+from .compiled import CompiledRequest
+from .fitness import FitnessCalculator
+from .local_search import local_search
+from .population import PopulationManager
+
+MIGRATION_TOPOLOGIES = ("ring", "random")
+
+# Genes and fitness of a chromosome sent to another island
+Migrant = Tuple[np.ndarray, float]
+
+
+@dataclass
+class IslandSettings:
+    """How one island evolves its population."""
+    population_size: int = 100
+    elite_size: int = 2
+    mutation_rate: float = 0.1
+    crossover_rate: float = 0.8
+    crossover_methods: Optional[List[str]] = None
+    # Fixed crossover method weights; None adapts them as PopulationManager does
+    crossover_weights: Optional[Dict[str, float]] = None
+    # Elites sent to another island at each migration
+    migration_size: int = 2
+    vectorized_fitness: bool = True
+    diversity_metric: str = "frequency"
+    diversity_samples: int = 1000
+    greedy_fraction: float = 0.0
+    # Genes completed greedily into initial chromosomes, e.g. CP-SAT schedules
+    seed_gene_arrays: List[np.ndarray] = field(default_factory=list)
+    repair_moves: int = 50
+    offspring_attempts: int = 10
+    mutation_methods: Optional[List[str]] = None
+    # Generations between hill climbs of the best chromosomes (0 disables them)
+    local_search_interval: int = 0
+    local_search_top_k: int = 2
+    local_search_evaluations: int = 200
+    seed: Optional[int] = None
+
+
+@dataclass
+class EpochReport:
+    """What an island reports after evolving for one migration interval."""
+    island: int
+    generation: int
+    # (best, average, diversity) after each generation of the epoch
+    history: List[Tuple[float, float, float]]
+    best_genes: np.ndarray
+    best_fitness: float
+    emigrants: List[Migrant] = field(default_factory=list)
+
+
+class Island:
+    """One population with its own fitness calculator and random stream."""
+
+    def __init__(
+        self,
+        index: int,
+        compiled: CompiledRequest,
+        weights: WeightConfig,
+        settings: IslandSettings
+    ):
+        """
+        Create the island's population and score it.
+
+        Args:
+            index: Position of the island in the model
+            compiled: Compiled schedule request
+            weights: Configuration of weights for different objectives
+            settings: How the island evolves
+        """
+        self.index = index
+        self.compiled = compiled
+        self.settings = settings
+        # Each island draws from its own stream, leaving the random module alone
+        self.rng = random.Random(settings.seed)
+        self.manager = PopulationManager(
+            size=settings.population_size,
+            request=compiled.request,
+            elite_size=settings.elite_size,
+            mutation_rate=settings.mutation_rate,
+            crossover_rate=settings.crossover_rate,
+            crossover_methods=settings.crossover_methods,
+            compiled=compiled,
+            crossover_weights=settings.crossover_weights,
+            diversity_metric=settings.diversity_metric,
+            diversity_samples=settings.diversity_samples,
+            greedy_fraction=settings.greedy_fraction,
+            seed_gene_arrays=settings.seed_gene_arrays,
+            repair_moves=settings.repair_moves,
+            offspring_attempts=settings.offspring_attempts,
+            mutation_methods=settings.mutation_methods,
+            rng=self.rng
+        )
+        self.calculator = FitnessCalculator(compiled.request, weights, compiled=compiled)
+        self._score(self.manager.population)
+
+    def _score(self, chromosomes: Sequence[ScheduleChromosome]) -> None:
+        """Score chromosomes with the island's calculator."""
+        if self.settings.vectorized_fitness:
+            scores = self.calculator.calculate_population_fitness(chromosomes)
+        else:
+            scores = [self.calculator.calculate_fitness(chromosome) for chromosome in chromosomes]
+        for chromosome, fitness in zip(chromosomes, scores):
+            chromosome.fitness = fitness
+
+    def _local_search(self) -> None:
+        """Hill-climb the island's best valid chromosomes."""
+        ranked = sorted(self.manager.population, key=lambda c: c.fitness, reverse=True)
+        for chromosome in ranked[:self.settings.local_search_top_k]:
+            if chromosome.fitness > float('-inf'):
+                rng = np.random.default_rng(self.rng.getrandbits(64))
+                local_search(self.calculator, chromosome, rng, self.settings.local_search_evaluations)
+
+    def receive(self, immigrants: Sequence[Migrant]) -> None:
+        """Replace the island's worst chromosomes, never its elites, with immigrants."""
+        room = max(0, len(self.manager.population) - self.manager.elite_size)
+        immigrants = list(immigrants)[:room]
+        if not immigrants:
+            return
+        self.manager.population.sort(key=lambda c: c.fitness, reverse=True)
+        arrivals = []
+        for gene_array, fitness in immigrants:
+            chromosome = ScheduleChromosome(compiled=self.compiled, rng=self.rng)
+            chromosome.gene_array = gene_array
+            chromosome.fitness = fitness
+            arrivals.append(chromosome)
+        self.manager.population[-len(arrivals):] = arrivals
+
+    def run_epoch(
+        self,
+        generations: int,
+        immigrants: Sequence[Migrant] = (),
+        deadline: Optional[float] = None
+    ) -> EpochReport:
+        """
+        Take in immigrants, then evolve for a number of generations.
+
+        Args:
+            generations: Generations to evolve; 0 only reports the population
+            immigrants: Chromosomes arriving from other islands
+            deadline: time.time() after which no new generation starts
+
+        Returns:
+            The island's statistics, best chromosome and emigrants
+        """
+        self.receive(immigrants)
+        history = []
+        for _ in range(generations):
+            if deadline is not None and time.time() > deadline:
+                break
+            self.manager.evolve()
+            self._score(self.manager.population)
+            interval = self.settings.local_search_interval
+            if interval and self.manager.generation % interval == 0:
+                self._local_search()
+            history.append(self.manager.get_population_stats())
+        if not generations:
+            history.append(self.manager.get_population_stats())
+
+        ranked = sorted(self.manager.population, key=lambda c: c.fitness, reverse=True)
+        return EpochReport(
+            island=self.index,
+            generation=self.manager.generation,
+            history=history,
+            best_genes=ranked[0].gene_array,
+            best_fitness=ranked[0].fitness,
+            emigrants=[(c.gene_array, c.fitness) for c in ranked[:self.settings.migration_size]]
+        )
+
+
+def _island_process(connection, index: int, request: ScheduleRequest, weights: WeightConfig,
+                    settings: IslandSettings) -> None:
+    """Run an island in its own process, one epoch per message, until sent None."""
+    try:
+        island = Island(index, CompiledRequest(request), weights, settings)
+    except Exception as e:
+        connection.send(e)
+        return
+    connection.send(None)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        try:
+            connection.send(island.run_epoch(*message))
+        except Exception as e:
+            connection.send(e)
+    connection.close()
+
+
+class IslandModel:
+    """
+    Several islands evolving apart, exchanging elites between epochs.
+
+    Each island runs in its own process, so selection, crossover and
+    mutation scale with the number of islands, not only fitness scoring.
+    The request and weights reach each process once; afterwards only
+    migrants and reports are exchanged. Without processes the islands take
+    turns in this one.
+
+    After every epoch each island sends its best ``migration_size``
+    chromosomes to the next island in a ring, or to a random other island;
+    they replace the receiver's worst chromosomes at the start of the next
+    epoch.
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledRequest,
+        weights: WeightConfig,
+        settings: Sequence[IslandSettings],
+        topology: str = "ring",
+        use_processes: bool = True
+    ):
+        """
+        Create the islands.
+
+        Args:
+            compiled: Compiled schedule request
+            weights: Configuration of weights for different objectives
+            settings: Settings of each island
+            topology: "ring" or "random" migration
+            use_processes: Whether to run each island in its own process
+
+        Raises:
+            ValueError: If the topology is unknown
+        """
+        if topology not in MIGRATION_TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+        self.topology = topology
+        self.size = len(settings)
+        self._immigrants: List[List[Migrant]] = [[] for _ in range(self.size)]
+        self._islands: List[Island] = []
+        self._processes = []
+        self._connections = []
+        if use_processes:
+            self._start_processes(compiled.request, weights, settings)
+        if not self._processes:
+            self._islands = [
+                Island(index, compiled, weights, island_settings)
+                for index, island_settings in enumerate(settings)
+            ]
+
+    def _start_processes(self, request: ScheduleRequest, weights: WeightConfig,
+                         settings: Sequence[IslandSettings]) -> None:
+        """Start one process per island, falling back to this process on failure."""
+        # Spawn rather than fork: the API process runs threads
+        context = multiprocessing.get_context("spawn")
+        try:
+            for index, island_settings in enumerate(settings):
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=_island_process,
+                    args=(child, index, request, weights, island_settings),
+                    daemon=True
+                )
+                process.start()
+                child.close()
+                self._processes.append(process)
+                self._connections.append(parent)
+            for connection in self._connections:
+                self._receive(connection)
+        except Exception as e:
+            print(f"Island processes failed, running islands in this process: {e}")
+            self.close()
+
+    @staticmethod
+    def _receive(connection):
+        """Receive a reply from an island process, raising its errors here."""
+        try:
+            reply = connection.recv()
+        except EOFError:
+            raise RuntimeError("Island process exited unexpectedly")
+        if isinstance(reply, Exception):
+            raise RuntimeError(f"Island failed: {reply}") from reply
+        return reply
+
+    def run_epoch(self, generations: int, deadline: Optional[float] = None) -> List[EpochReport]:
+        """
+        Evolve every island for an epoch, then pick the next migrants.
+
+        Args:
+            generations: Generations each island evolves
+            deadline: time.time() after which islands start no new generation
+
+        Returns:
+            One report per island, in island order
+        """
+        immigrants, self._immigrants = self._immigrants, [[] for _ in range(self.size)]
+        if self._processes:
+            for connection, arrivals in zip(self._connections, immigrants):
+                connection.send((generations, arrivals, deadline))
+            reports = [self._receive(connection) for connection in self._connections]
+        else:
+            reports = [
+                island.run_epoch(generations, arrivals, deadline)
+                for island, arrivals in zip(self._islands, immigrants)
+            ]
+        self._migrate(reports)
+        return reports
+
+    def _migrate(self, reports: Sequence[EpochReport]) -> None:
+        """Queue each island's emigrants for their destination."""
+        if self.size < 2:
+            return
+        for report in reports:
+            if self.topology == "ring":
+                destination = (report.island + 1) % self.size
+            else:
+                destination = random.choice([i for i in range(self.size) if i != report.island])
+            self._immigrants[destination].extend(report.emigrants)
+
+    def close(self) -> None:
+        """Stop the island processes"""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._processes = []
+        self._connections = []
+
+    def __enter__(self) -> 'IslandModel':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
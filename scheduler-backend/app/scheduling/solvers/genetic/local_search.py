@@ -0,0 +1,104 @@
+"""Hill climbing that refines chromosomes one gene move or swap at a time."""
+from dataclasses import replace
+
+import numpy as np
+
+from .chromosome import CLASS, WEEK, ScheduleChromosome
+from .compiled import CompiledRequest
+from .fitness import FitnessCalculator
+
+
+def _neighbours(
+    compiled: CompiledRequest,
+    chromosome: ScheduleChromosome,
+    rows: np.ndarray,
+    rng: np.random.Generator,
+    count: int
+) -> np.ndarray:
+    """
+    Draw gene arrays one step away from a chromosome.
+
+    Half of the steps move a random gene to a random free slot its class
+    may take, in any week; the others swap the slots of a random gene and a
+    gene of another class.
+
+    Args:
+        compiled: Compiled request of the chromosome
+        chromosome: Chromosome with a fitness state as its first fitness base
+        rows: Mask row of each gene's class
+        rng: Random generator
+        count: Gene arrays to draw
+
+    Returns:
+        Stacked gene arrays of shape (count, genes, 4)
+    """
+    gene_array = chromosome.gene_array
+    classes = gene_array[:, CLASS]
+    occupied = chromosome.fitness_bases[0].slot_counts > 0
+    neighbours = np.repeat(gene_array[np.newaxis], count, axis=0)
+    indices = rng.integers(len(gene_array), size=count).tolist()
+    swaps = (rng.random(count) < 0.5).tolist()
+    for neighbour, index, swap in zip(neighbours, indices, swaps):
+        if swap:
+            others = np.flatnonzero(classes != classes[index])
+            if len(others):
+                other = int(others[rng.integers(len(others))])
+                neighbour[[index, other], WEEK:] = gene_array[[other, index], WEEK:]
+                continue
+        slots = np.flatnonzero(compiled.allowed[rows[index]] & ~occupied)
+        if len(slots):
+            neighbour[index, WEEK:] = np.unravel_index(int(slots[rng.integers(len(slots))]), occupied.shape)
+    return neighbours
+
+
+def local_search(
+    calculator: FitnessCalculator,
+    chromosome: ScheduleChromosome,
+    rng: np.random.Generator,
+    max_evaluations: int,
+    batch_size: int = 16
+) -> int:
+    """
+    Improve a chromosome by first-improvement hill climbing.
+
+    Neighbours one gene move or swap away (see _neighbours) are drawn in
+    batches and scored by updating the chromosome's fitness state for the
+    genes that differ (see FitnessCalculator.score_neighbours). The first
+    neighbour of a batch that beats the chromosome replaces it, and the
+    search goes on from there until ``max_evaluations`` neighbours have
+    been scored. Invalid chromosomes are left as they are.
+
+    Args:
+        calculator: Calculator scoring the chromosome, with its compiled request
+        chromosome: Chromosome to improve in place; its fitness, gene array
+            and fitness bases are updated
+        rng: Random generator drawing the neighbours
+        max_evaluations: Most neighbours scored
+        batch_size: Neighbours scored in one NumPy pass
+
+    Returns:
+        Moves and swaps kept
+    """
+    chromosome.fitness = calculator.calculate_incremental_fitness([chromosome])[0]
+    if not chromosome.fitness_bases or chromosome.fitness == float('-inf') or not len(chromosome.gene_array):
+        return 0
+
+    compiled = calculator.compiled
+    rows = compiled.class_rows(chromosome.gene_array[:, CLASS])
+    evaluations = 0
+    moves = 0
+    while evaluations < max_evaluations:
+        count = min(batch_size, max_evaluations - evaluations)
+        neighbours = _neighbours(compiled, chromosome, rows, rng, count)
+        states, scores = calculator.score_neighbours(chromosome, neighbours)
+        evaluations += count
+        # Rounding aside, an equal score is no improvement
+        better = np.flatnonzero(scores > chromosome.fitness + 1e-9)
+        if not len(better):
+            continue
+        first = int(better[0])
+        chromosome.gene_array = neighbours[first].copy()
+        chromosome.fitness_bases = (replace(states[first], gene_array=chromosome.gene_array),)
+        chromosome.fitness = float(scores[first])
+        moves += 1
+    return moves
@@ -1,6 +1,6 @@
 """Meta-optimization system for tuning weights in the scheduling system."""
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import random
 import numpy as np
 import time
@@ -59,13 +59,17 @@ class MetaObjectiveCalculator:
         self.base_config = base_config
         
     def evaluate_weight_config(self, weight_chromosome: WeightChromosome, 
-                              time_limit_seconds: int = 60) -> Tuple[float, Optional[List[ScheduleAssignment]]]:
+                              time_limit_seconds: int = 60,
+                              progress_callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+                              ) -> Tuple[float, Optional[List[ScheduleAssignment]]]:
         """
         Evaluate a weight configuration by running the scheduler with it.
         
         Args:
             weight_chromosome: Weight configuration to evaluate
             time_limit_seconds: Time limit for each optimization run
+            progress_callback: Optional progress callback for the run;
+                returning True stops it early
             
         Returns:
             Tuple of (meta score, schedule assignments if successful)
@@ -84,6 +88,8 @@ class MetaObjectiveCalculator:
             use_genetic=True,
             custom_weights=weight_config.weights_dict
         )
+        if progress_callback is not None:
+            solver.set_progress_callback(progress_callback)
         
         # Run solver with time limit
         try:
@@ -181,6 +187,42 @@ class MetaOptimizer:
         self.best_chromosome: Optional[WeightChromosome] = None
         self.best_assignments: Optional[List[ScheduleAssignment]] = None
         
+        # Progress reporting and early stopping of the current run
+        self._progress_callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+        self._generation = 0
+        self._evaluated = 0
+        self.stopped = False
+        
+    def _report(self, evaluation: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Report progress to the callback of the current run.
+        
+        Args:
+            evaluation: Progress of the running evaluation, if any
+            
+        Returns:
+            True if the run should stop
+        """
+        if self._progress_callback is None or self.stopped:
+            return self.stopped
+        progress: Dict[str, Any] = {
+            "solver": "meta",
+            "generation": self._generation,
+            "generations": self.generations,
+            "evaluated": self._evaluated,
+            "population_size": len(self.current_population),
+            "best_fitness": self.best_chromosome.fitness if self.best_chromosome else None
+        }
+        if evaluation is not None:
+            # Intermediate schedules of the inner runs are not reported
+            progress["evaluation"] = {
+                key: value for key, value in evaluation.items() if key != "assignments"
+            }
+        if self._progress_callback(progress):
+            logger.info("Meta-optimization stop requested")
+            self.stopped = True
+        return self.stopped
+    
     def initialize_population(self):
         """Initialize population of weight configurations."""
         self.current_population = []
@@ -215,6 +257,7 @@ class MetaOptimizer:
         Args:
             parallel: Whether to use parallel evaluation
         """
+        self._evaluated = 0
         if parallel and len(self.current_population) > 1:
             # Parallel evaluation using process pool
             with ProcessPoolExecutor() as executor:
@@ -229,6 +272,10 @@ class MetaOptimizer:
                 
                 # Collect results
                 for chromosome, future in futures:
+                    if self.stopped:
+                        # Runs already started in a worker finish on their own
+                        future.cancel()
+                        continue
                     try:
                         fitness, assignments = future.result()
                         chromosome.fitness = fitness
@@ -240,18 +287,30 @@ class MetaOptimizer:
                     except Exception as e:
                         logger.error(f"Error in parallel evaluation: {e}")
                         chromosome.fitness = -10000.0
+                    self._evaluated += 1
+                    self._report()
         else:
             # Sequential evaluation
             for chromosome in self.current_population:
-                fitness, assignments = self.objective_calculator.evaluate_weight_config(
-                    chromosome, self.eval_time_limit
-                )
+                if self.stopped:
+                    break
+                if self._progress_callback is not None:
+                    # Let a stop request end the running evaluation too
+                    fitness, assignments = self.objective_calculator.evaluate_weight_config(
+                        chromosome, self.eval_time_limit, progress_callback=self._report
+                    )
+                else:
+                    fitness, assignments = self.objective_calculator.evaluate_weight_config(
+                        chromosome, self.eval_time_limit
+                    )
                 chromosome.fitness = fitness
                 
                 # Update best if better
                 if self.best_chromosome is None or fitness > self.best_chromosome.fitness:
                     self.best_chromosome = chromosome
                     self.best_assignments = assignments
+                self._evaluated += 1
+                self._report()
     
     def select_parents(self) -> List[WeightChromosome]:
         """
@@ -380,17 +439,30 @@ class MetaOptimizer:
         
         self.current_population = new_population
     
-    def optimize(self, parallel: bool = True) -> Tuple[WeightConfig, float]:
+    def optimize(
+        self,
+        parallel: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+    ) -> Tuple[WeightConfig, float]:
         """
         Run meta-optimization to find optimal weights.
         
+        The progress callback is called after every evaluated weight
+        configuration, and with the progress of the running evaluation when
+        evaluating sequentially. Returning True from it stops the run; the
+        best configuration found so far is returned and ``stopped`` is set.
+        
         Args:
             parallel: Whether to use parallel evaluation
+            progress_callback: Optional function called with a progress dict
             
         Returns:
             Tuple of (best weight config, best fitness score)
         """
         logger.info(f"Starting meta-optimization with {self.population_size} weight configurations...")
+        self._progress_callback = progress_callback
+        self._generation = 0
+        self.stopped = False
         
         try:
             # Initialize population
@@ -402,6 +474,10 @@ class MetaOptimizer:
             
             # Run generations
             for generation in range(self.generations):
+                if self.stopped:
+                    logger.info(f"Meta-optimization stopped before generation {generation+1}")
+                    break
+                self._generation = generation + 1
                 logger.info(f"Meta-optimization generation {generation+1}/{self.generations}")
                 
                 # Create next generation
@@ -1,8 +1,13 @@
 """Genetic algorithm optimizer for schedule generation."""
+import os
+import random
 import time
-from typing import List, Optional, Tuple, Dict, Any, Callable
+from functools import partial
+from typing import List, Optional, Sequence, Tuple, Dict, Any, Callable
 import multiprocessing
 
+import numpy as np
+
 from ....models import (
     ScheduleRequest,
     ScheduleResponse,
@@ -12,12 +17,32 @@ from ....models import (
 from .chromosome import ScheduleChromosome
 from .population import PopulationManager
 from .fitness import FitnessCalculator
+from .compiled import CompiledRequest
+from .fitness_cache import FitnessCache
+from .fitness_pool import FitnessWorkerPool
+from .initialization import response_gene_array
+from .islands import IslandModel, IslandSettings
+from .local_search import local_search
 from .adaptation import AdaptiveController
-from .parallel import parallel_map, determine_worker_count
+from .checkpoint import Checkpoint, checkpoint_path, load_checkpoint, request_key, save_checkpoint
+from . import parallel
+from .parallel import parallel_map, determine_worker_count, _print_fallback_message
+
+
+def _calculate_fitness(fitness_calculator: FitnessCalculator, chromosome: ScheduleChromosome) -> float:
+    """Score one chromosome; module level so parallel_map can pickle it."""
+    return fitness_calculator.calculate_fitness(chromosome)
+
 
 class GeneticOptimizer:
     """Main genetic algorithm optimizer class."""
     
+    # Fewest chromosomes sent to a worker at once; vectorized scoring costs
+    # little per chromosome, so its batches must be larger to pay for the
+    # round trip to the worker
+    MIN_WORKER_BATCH_VECTORIZED = 128
+    MIN_WORKER_BATCH_SERIAL = 4
+    
     def __init__(
         self,
         population_size: int = 100,
@@ -31,7 +56,32 @@ class GeneticOptimizer:
         diversity_threshold: float = 0.15,
         adaptation_strength: float = 0.5,
         parallel_fitness: bool = True,
-        max_workers: int = None
+        max_workers: int = None,
+        vectorized_fitness: bool = False,
+        incremental_fitness: bool = False,
+        verify_fitness: bool = False,
+        fitness_cache_size: int = 0,
+        shared_memory_fitness: bool = False,
+        num_islands: int = 1,
+        migration_interval: int = 10,
+        migration_size: int = 2,
+        migration_topology: str = "ring",
+        island_crossover_weights: Optional[List[Dict[str, float]]] = None,
+        diversity_metric: str = "frequency",
+        diversity_samples: int = 1000,
+        greedy_init_fraction: float = 0.0,
+        cp_sat_seeds: int = 0,
+        seed_time_limit: float = 5.0,
+        seed_solver: Optional[Callable[[ScheduleRequest, float], ScheduleResponse]] = None,
+        repair_moves: int = 50,
+        offspring_attempts: int = 10,
+        mutation_methods: Optional[List[str]] = None,
+        local_search_interval: int = 0,
+        local_search_top_k: int = 2,
+        local_search_evaluations: int = 200,
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_interval: int = 10,
+        resume_from: Optional[str] = None
     ):
         """
         Initialize genetic optimizer.
@@ -49,6 +99,46 @@ class GeneticOptimizer:
             adaptation_strength: How strongly to adapt parameters (0.0-1.0)
             parallel_fitness: Whether to use parallel fitness evaluation
             max_workers: Maximum number of worker processes (None for auto)
+            vectorized_fitness: Whether to score each generation in one NumPy batch
+            incremental_fitness: Whether to score children from their parents'
+                fitness states, evaluating only the genes that changed
+            verify_fitness: Whether to check incremental scores against a full evaluation
+            fitness_cache_size: Fitness scores to memoize by gene content (0 disables the cache)
+            shared_memory_fitness: Whether worker processes read gene arrays from and
+                write scores to shared memory instead of pickled batches
+            num_islands: Populations evolving apart, each in its own process
+                when parallel_fitness is set (1 for a single population)
+            migration_interval: Generations between migrations of island elites
+            migration_size: Elites each island sends at a migration
+            migration_topology: "ring" to send elites to the next island,
+                "random" to send them to a random other island
+            island_crossover_weights: Fixed crossover method weights of each
+                island, cycled if shorter than num_islands (None to adapt them)
+            diversity_metric: "frequency" (exact, O(N*G)), "sampled" or
+                "pairwise" (exact, O(N^2*G)) population diversity
+            diversity_samples: Chromosome pairs compared by the "sampled" metric
+            greedy_init_fraction: Share of the initial population placed greedily
+                within the constraints instead of at random
+            cp_sat_seeds: Initial chromosomes completed from a short CP-SAT
+                schedule (0 to skip the CP-SAT run)
+            seed_time_limit: Most seconds the CP-SAT run may take
+            seed_solver: Function solving a request with CP-SAT in a time
+                limit, used for the seed schedule
+            repair_moves: Most genes moved to make an invalid child valid
+                (0 discards invalid children without repair)
+            offspring_attempts: Children tried per place in the population each
+                generation before invalid children are kept
+            mutation_methods: Mutation operators weighted adaptively by
+                their success (None for all of them)
+            local_search_interval: Generations between hill climbs of the
+                best chromosomes (0 disables local search)
+            local_search_top_k: Best chromosomes hill-climbed each time
+            local_search_evaluations: Most neighbours scored per hill climb
+            checkpoint_dir: Directory to checkpoint single-population runs to,
+                one file per request (None disables checkpoints)
+            checkpoint_interval: Generations between checkpoints
+            resume_from: Checkpoint file, or directory of them, to continue a
+                run of the same request from (None starts afresh)
         """
         self.population_size = population_size
         self.elite_size = elite_size
@@ -57,7 +147,40 @@ class GeneticOptimizer:
         self.max_generations = max_generations
         self.convergence_threshold = convergence_threshold
         self.use_adaptive_control = use_adaptive_control
+        self.diversity_threshold = diversity_threshold
+        self.adaptation_strength = adaptation_strength
+        self.adaptation_interval = adaptation_interval
         self.parallel_fitness = parallel_fitness
+        self.vectorized_fitness = vectorized_fitness
+        self.incremental_fitness = incremental_fitness
+        self.verify_fitness = verify_fitness
+        self.fitness_cache_size = fitness_cache_size
+        self.shared_memory_fitness = shared_memory_fitness
+        self.num_islands = max(1, num_islands)
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = migration_size
+        self.migration_topology = migration_topology
+        self.island_crossover_weights = island_crossover_weights
+        self.diversity_metric = diversity_metric
+        self.diversity_samples = diversity_samples
+        self.greedy_init_fraction = greedy_init_fraction
+        self.cp_sat_seeds = cp_sat_seeds
+        self.seed_time_limit = seed_time_limit
+        self.seed_solver = seed_solver
+        self.repair_moves = repair_moves
+        self.offspring_attempts = offspring_attempts
+        self.mutation_methods = mutation_methods
+        self.local_search_interval = max(0, local_search_interval)
+        self.local_search_top_k = max(1, local_search_top_k)
+        self.local_search_evaluations = max(0, local_search_evaluations)
+        self.local_search_stats = {"runs": 0, "improved": 0, "moves": 0, "fitness_gain": 0.0}
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.resume_from = resume_from
+        self.resumed_generation: Optional[int] = None
+        self.best_solution: Optional[ScheduleChromosome] = None
+        self.fitness_cache: Optional[FitnessCache] = None
+        self.worker_pool: Optional[FitnessWorkerPool] = None
         
         # Determine worker count if using parallel processing
         self.max_workers = max_workers
@@ -65,15 +188,7 @@ class GeneticOptimizer:
             self.max_workers = determine_worker_count()
         
         # Initialize adaptive controller if enabled
-        self.adaptive_controller = None
-        if use_adaptive_control:
-            self.adaptive_controller = AdaptiveController(
-                base_mutation_rate=mutation_rate,
-                base_crossover_rate=crossover_rate,
-                diversity_threshold=diversity_threshold,
-                adaptation_strength=adaptation_strength,
-                adaptation_interval=adaptation_interval
-            )
+        self.adaptive_controller = self._create_adaptive_controller()
         
         # These will be set when optimize is called
         self.population_manager: Optional[PopulationManager] = None
@@ -88,16 +203,71 @@ class GeneticOptimizer:
         self.diversity_history = []
         self._start_time = 0
         self._stats_callback = None
+        self._stop_requested = False
         
     def _evaluate_fitness_parallel(self, chromosomes: List[ScheduleChromosome]) -> None:
         """
         Evaluate fitness for a list of chromosomes in parallel.
         
+        Chromosomes found in the fitness cache, if enabled, take the cached
+        score; only the rest are evaluated.
+        
+        Args:
+            chromosomes: List of chromosomes to evaluate
+        """
+        if not chromosomes or self.fitness_cache is None:
+            self._score_chromosomes(chromosomes)
+            return
+        
+        keys, cached = self.fitness_cache.lookup(chromosomes)
+        missed = []
+        missed_keys = []
+        for chromosome, key, fitness in zip(chromosomes, keys, cached):
+            if fitness is None:
+                missed.append(chromosome)
+                missed_keys.append(key)
+            else:
+                chromosome.fitness = fitness
+        
+        self._score_chromosomes(missed)
+        self.fitness_cache.store(missed_keys, [chromosome.fitness for chromosome in missed])
+    
+    def _score_chromosomes(self, chromosomes: List[ScheduleChromosome]) -> None:
+        """
+        Score chromosomes with the configured evaluation strategy.
+        
         Args:
             chromosomes: List of chromosomes to evaluate
         """
         if not chromosomes:
             return
+        
+        # Reuse the fitness states of parents, so unchanged chromosomes are
+        # not scored again and children only evaluate the genes they changed
+        if self.incremental_fitness:
+            fitness_values = self.fitness_calculator.calculate_incremental_fitness(chromosomes)
+            for chromosome, fitness in zip(chromosomes, fitness_values):
+                chromosome.fitness = fitness
+            return
+        
+        # Spread large batches over the worker pool started for this run
+        if self.worker_pool is not None and len(self.worker_pool.batches(len(chromosomes))) > 1:
+            try:
+                fitness_values = self.worker_pool.score(chromosomes)
+            except Exception as e:
+                _print_fallback_message(f"Fitness worker pool failed, falling back to this process: {e}")
+                self.close_worker_pool()
+            else:
+                for chromosome, fitness in zip(chromosomes, fitness_values):
+                    chromosome.fitness = fitness
+                return
+        
+        # Score the whole batch in one vectorized pass
+        if self.vectorized_fitness:
+            fitness_values = self.fitness_calculator.calculate_population_fitness(chromosomes)
+            for chromosome, fitness in zip(chromosomes, fitness_values):
+                chromosome.fitness = fitness
+            return
             
         # Use serial processing for small batches or if parallel is disabled
         if len(chromosomes) <= 4 or not self.parallel_fitness:
@@ -105,13 +275,9 @@ class GeneticOptimizer:
                 chromosome.fitness = self.fitness_calculator.calculate_fitness(chromosome)
             return
         
-        # Create a worker function that can be pickled for multiprocessing
-        def evaluate_fitness(chromosome):
-            return self.fitness_calculator.calculate_fitness(chromosome)
-        
         # Run fitness evaluation in parallel
         fitness_values = parallel_map(
-            evaluate_fitness, 
+            partial(_calculate_fitness, self.fitness_calculator),
             chromosomes,
             max_workers=self.max_workers
         )
@@ -120,6 +286,50 @@ class GeneticOptimizer:
         for chromosome, fitness in zip(chromosomes, fitness_values):
             chromosome.fitness = fitness
     
+    def _local_search_elites(self) -> None:
+        """
+        Hill-climb the best valid chromosomes of the population (see local_search).
+        
+        Runs in the worker pool when one is started, one chromosome per
+        task, and in this process otherwise.
+        """
+        population = self.population_manager.population
+        elites = sorted(population, key=lambda c: c.fitness, reverse=True)[:self.local_search_top_k]
+        elites = [chromosome for chromosome in elites if chromosome.fitness > float('-inf')]
+        if not elites or not self.local_search_evaluations:
+            return
+        
+        seed = random.getrandbits(32)
+        before = [chromosome.fitness for chromosome in elites]
+        moves = None
+        if self.worker_pool is not None:
+            try:
+                results = self.worker_pool.local_search(
+                    [chromosome.gene_array for chromosome in elites], self.local_search_evaluations, seed
+                )
+            except Exception as e:
+                _print_fallback_message(f"Local search in the worker pool failed, running it in this process: {e}")
+                self.close_worker_pool()
+            else:
+                moves = []
+                for chromosome, (gene_array, fitness, moved) in zip(elites, results):
+                    if moved:
+                        chromosome.gene_array = gene_array
+                        chromosome.fitness = fitness
+                    moves.append(moved)
+        if moves is None:
+            moves = [
+                local_search(self.fitness_calculator, chromosome, np.random.default_rng(seed + index),
+                             self.local_search_evaluations)
+                for index, chromosome in enumerate(elites)
+            ]
+        
+        stats = self.local_search_stats
+        stats["runs"] += len(elites)
+        stats["improved"] += sum(1 for moved in moves if moved)
+        stats["moves"] += sum(moves)
+        stats["fitness_gain"] += sum(chromosome.fitness - fitness for chromosome, fitness in zip(elites, before))
+    
     def set_stats_callback(self, callback: Callable[[int, float, float, float, float, float], None]) -> None:
         """
         Set a callback function to receive statistics during optimization.
@@ -132,6 +342,15 @@ class GeneticOptimizer:
         """
         self._stats_callback = callback
     
+    def request_stop(self) -> None:
+        """
+        Ask a running optimization to stop after the current generation.
+        
+        The optimizer returns the best solution found so far. Safe to call
+        from the stats callback or from another thread.
+        """
+        self._stop_requested = True
+    
     def _check_convergence(self, generations_without_improvement: int = 20) -> bool:
         """
         Check if the algorithm has converged based on improvement history.
@@ -181,142 +400,484 @@ class GeneticOptimizer:
             ScheduleResponse containing the best schedule found
         """
         self._start_time = time.time()
+        self._stop_requested = False
         self.generations_run = 0
         self.solutions_found = 0
         self.convergence_generation = None
         self.best_fitness_history = []
         self.avg_fitness_history = []
         self.diversity_history = []
+        self.local_search_stats = {"runs": 0, "improved": 0, "moves": 0, "fitness_gain": 0.0}
+        self.resumed_generation = None
         
-        # Initialize components
-        self.fitness_calculator = self.fitness_calculator or self._create_fitness_calculator(request, weights)
-        self.population_manager = self.population_manager or self._create_population_manager(request)
+        self.best_solution = None
         
-        # Calculate initial fitness for population (in parallel if enabled)
-        print(f"Evaluating initial population fitness (parallel={self.parallel_fitness}, workers={self.max_workers})")
-        self._evaluate_fitness_parallel(self.population_manager.population)
+        if self.num_islands > 1:
+            if self.checkpoint_dir or self.resume_from:
+                print("Checkpoints apply to single-population runs; the islands start afresh unsaved")
+            return self._optimize_islands(request, weights, time_limit_seconds)
         
-        # Track best solution and its fitness
-        best_solution = None
-        best_fitness = float('-inf')
-        generations_without_improvement = 0
+        # Cached scores belong to one request and set of weights
+        self.fitness_cache = FitnessCache(self.fitness_cache_size) if self.fitness_cache_size > 0 else None
         
-        # Get initial population statistics
-        best, avg, diversity = self.population_manager.get_population_stats()
-        self.best_fitness_history.append(best)
-        self.avg_fitness_history.append(avg)
-        self.diversity_history.append(diversity)
-        
-        # Call stats callback if registered
-        if self._stats_callback:
-            self._stats_callback(
-                0, best, avg, diversity, 
-                self.population_manager.mutation_rate,
-                self.population_manager.crossover_rate
-            )
+        key = request_key(request, weights) if self.checkpoint_dir or self.resume_from else None
+        checkpoint = self._load_checkpoint(key) if self.resume_from else None
+        
+        # Initialize components for this request and these weights, sharing
+        # one compiled copy with the worker pool. They are built before any
+        # checkpoint is restored or written, so checkpoints only ever hold
+        # this run's population and controller state. A resumed run takes
+        # its population from the checkpoint, so none is seeded or built.
+        compiled = CompiledRequest(request)
+        self.fitness_calculator = self._create_fitness_calculator(request, weights, compiled)
+        if checkpoint is None:
+            seed_gene_arrays = self._solve_seed_genes(compiled, time_limit_seconds)
+            self.population_manager = self._create_population_manager(request, compiled, seed_gene_arrays)
+        else:
+            self.population_manager = self._create_population_manager(request, compiled, initialize=False)
+        self.adaptive_controller = self._create_adaptive_controller()
+        
+        # Workers install the request and weights once and live for the whole run
+        self.worker_pool = self._create_worker_pool(compiled, weights)
+        try:
+            # Track best solution and its fitness
+            best_solution = None
+            best_fitness = float('-inf')
+            generations_without_improvement = 0
+            start_generation = 0
         
-        # Evolution loop
-        for generation in range(self.max_generations):
-            self.generations_run = generation + 1
+            if checkpoint is not None:
+                # Continue from the checkpoint's population, scores and histories
+                checkpoint.restore(self.population_manager, self.adaptive_controller)
+                self.best_fitness_history = checkpoint.best_fitness_history
+                self.avg_fitness_history = checkpoint.avg_fitness_history
+                self.diversity_history = checkpoint.diversity_history
+                counters = checkpoint.state["optimizer"]
+                self.solutions_found = counters["solutions_found"]
+                self.convergence_generation = counters["convergence_generation"]
+                self.local_search_stats = counters["local_search_stats"]
+                generations_without_improvement = counters["generations_without_improvement"]
+                best_fitness = counters["best_fitness"]
+                if best_fitness > float('-inf'):
+                    best_solution = self.population_manager.get_best_solution()
+                start_generation = self.resumed_generation = self.generations_run = checkpoint.generation
+                print(f"Resuming from generation {start_generation} of {self.resume_from}")
+            else:
+                # Calculate initial fitness for population (in parallel if enabled)
+                print(f"Evaluating initial population fitness (parallel={self.parallel_fitness}, workers={self.max_workers})")
+                self._evaluate_fitness_parallel(self.population_manager.population)
+        
+                # Get initial population statistics
+                best, avg, diversity = self.population_manager.get_population_stats()
+                self.best_fitness_history.append(best)
+                self.avg_fitness_history.append(avg)
+                self.diversity_history.append(diversity)
+        
+                # Call stats callback if registered
+                if self._stats_callback:
+                    self._stats_callback(
+                        0, best, avg, diversity, 
+                        self.population_manager.mutation_rate,
+                        self.population_manager.crossover_rate
+                    )
+        
+            # Evolution loop
+            for generation in range(start_generation, self.max_generations):
+                self.generations_run = generation + 1
             
-            # Check time limit
-            if time.time() - self._start_time > time_limit_seconds:
-                print(f"Time limit reached after {generation} generations")
-                break
+                # Check time limit
+                if time.time() - self._start_time > time_limit_seconds:
+                    print(f"Time limit reached after {generation} generations")
+                    break
+            
+                # Check for a stop request
+                if self._stop_requested:
+                    print(f"Stop requested after {generation} generations")
+                    break
                 
-            # Evolve population
-            self.population_manager.evolve()
+                # Evolve population
+                self.population_manager.evolve()
             
-            # Update fitness for new population (in parallel if enabled)
-            self._evaluate_fitness_parallel(self.population_manager.population)
+                # Update fitness for new population (in parallel if enabled)
+                self._evaluate_fitness_parallel(self.population_manager.population)
+                
+                # Refine the best chromosomes by local search
+                if self.local_search_interval and (generation + 1) % self.local_search_interval == 0:
+                    self._local_search_elites()
             
-            # Get current best solution
-            current_best = self.population_manager.get_best_solution()
-            if current_best and current_best.fitness > best_fitness:
-                best_solution = current_best
+                # Get current best solution
+                current_best = self.population_manager.get_best_solution()
+                if current_best and current_best.fitness > best_fitness:
+                    best_solution = current_best
                 
-                # Calculate improvement
-                improvement = (current_best.fitness - best_fitness) / abs(best_fitness) if best_fitness != 0 else float('inf')
-                best_fitness = current_best.fitness
-                generations_without_improvement = 0
-                self.solutions_found += 1
+                    # Calculate improvement
+                    improvement = (current_best.fitness - best_fitness) / abs(best_fitness) if best_fitness != 0 else float('inf')
+                    best_fitness = current_best.fitness
+                    generations_without_improvement = 0
+                    self.solutions_found += 1
                 
-                print(f"Generation {generation}: New best solution found with fitness {best_fitness}")
-            else:
-                generations_without_improvement += 1
+                    print(f"Generation {generation}: New best solution found with fitness {best_fitness}")
+                else:
+                    generations_without_improvement += 1
             
-            # Get population statistics
-            best, avg, diversity = self.population_manager.get_population_stats()
-            self.best_fitness_history.append(best)
-            self.avg_fitness_history.append(avg)
-            self.diversity_history.append(diversity)
+                # Get population statistics
+                best, avg, diversity = self.population_manager.get_population_stats()
+                self.best_fitness_history.append(best)
+                self.avg_fitness_history.append(avg)
+                self.diversity_history.append(diversity)
             
-            # Call stats callback if registered
-            if self._stats_callback:
-                self._stats_callback(
-                    generation + 1, best, avg, diversity,
-                    self.population_manager.mutation_rate,
-                    self.population_manager.crossover_rate
-                )
+                # Call stats callback if registered
+                if self._stats_callback:
+                    self._stats_callback(
+                        generation + 1, best, avg, diversity,
+                        self.population_manager.mutation_rate,
+                        self.population_manager.crossover_rate
+                    )
             
-            # Output generation statistics
-            print(f"Generation {generation}: Best = {best:.2f}, Avg = {avg:.2f}, Diversity = {diversity:.2f}")
+                # Output generation statistics
+                print(f"Generation {generation}: Best = {best:.2f}, Avg = {avg:.2f}, Diversity = {diversity:.2f}")
             
-            # Every 10 generations, print method statistics
-            if generation > 0 and generation % 10 == 0:
-                method_weights = self.population_manager.crossover_method_weights
-                print(f"  Crossover method weights: " + 
-                      ", ".join([f"{m}={w:.2f}" for m, w in method_weights.items()]))
+                # Every 10 generations, print method statistics
+                if generation > 0 and generation % 10 == 0:
+                    method_weights = self.population_manager.crossover_method_weights
+                    print(f"  Crossover method weights: " + 
+                          ", ".join([f"{m}={w:.2f}" for m, w in method_weights.items()]))
+                    method_weights = self.population_manager.mutation_method_weights
+                    print(f"  Mutation method weights: " +
+                          ", ".join([f"{m}={w:.2f}" for m, w in method_weights.items()]))
             
-            # Apply adaptive parameter control if enabled
-            if self.use_adaptive_control and self.adaptive_controller:
-                # Update parameters based on population metrics
-                new_mutation_rate, new_crossover_rate = self.adaptive_controller.adapt_parameters(
-                    generation, best, avg, diversity
-                )
+                # Apply adaptive parameter control if enabled
+                if self.use_adaptive_control and self.adaptive_controller:
+                    # Update parameters based on population metrics
+                    new_mutation_rate, new_crossover_rate = self.adaptive_controller.adapt_parameters(
+                        generation, best, avg, diversity
+                    )
                 
-                # Apply new parameters to population manager
-                if self.population_manager.mutation_rate != new_mutation_rate or \
-                   self.population_manager.crossover_rate != new_crossover_rate:
-                    self.population_manager.mutation_rate = new_mutation_rate
-                    self.population_manager.crossover_rate = new_crossover_rate
+                    # Apply new parameters to population manager
+                    if self.population_manager.mutation_rate != new_mutation_rate or \
+                       self.population_manager.crossover_rate != new_crossover_rate:
+                        self.population_manager.mutation_rate = new_mutation_rate
+                        self.population_manager.crossover_rate = new_crossover_rate
+            
+                # Save the run so far every checkpoint interval
+                if self.checkpoint_dir and (generation + 1) % self.checkpoint_interval == 0:
+                    self._save_checkpoint(key, generation + 1, best_fitness, generations_without_improvement)
             
-            # Check convergence
-            if self._check_convergence(generations_without_improvement):
-                print(f"Converged after {generation} generations")
-                break
+                # Check convergence
+                if self._check_convergence(generations_without_improvement):
+                    print(f"Converged after {generation} generations")
+                    break
         
-        if not best_solution:
-            raise ValueError("No valid solution found")
+            if self.checkpoint_dir:
+                # A generation cut short by the time limit or a stop request is not saved
+                completed = len(self.best_fitness_history) - 1
+                self._save_checkpoint(key, completed, best_fitness, generations_without_improvement)
+        
+            if not best_solution:
+                raise ValueError("No valid solution found")
+            
+            # Convert best solution to schedule response
+            schedule = best_solution.decode()
+        
+            # Update metadata
+            duration = int((time.time() - self._start_time) * 1000)  # Convert to milliseconds
+            schedule.metadata = ScheduleMetadata(
+                duration_ms=duration,
+                solutions_found=self.solutions_found,
+                score=best_fitness,
+                gap=0.0,  # Not applicable for genetic algorithm
+                distribution=None  # Will be populated by dashboard code if needed
+            )
+        
+            return schedule
+        finally:
+            self.close_worker_pool()
+    
+    def _load_checkpoint(self, key: str) -> Optional[Checkpoint]:
+        """
+        Read the checkpoint to resume from, if there is one for this request.
+        
+        A missing, unreadable or mismatched checkpoint starts the run afresh.
+        """
+        path = checkpoint_path(self.resume_from, key)
+        if not path.exists():
+            print(f"No checkpoint at {path}, starting afresh")
+            return None
+        try:
+            checkpoint = load_checkpoint(path)
+        except (OSError, ValueError) as e:
+            print(f"Could not read checkpoint {path}, starting afresh: {e}")
+            return None
+        if checkpoint.key != key:
+            print(f"Checkpoint {path} belongs to another request or weights, starting afresh")
+            return None
+        if len(checkpoint.gene_arrays) != self.population_size:
+            print(f"Checkpoint {path} holds {len(checkpoint.gene_arrays)} chromosomes, "
+                  f"not {self.population_size}, starting afresh")
+            return None
+        return checkpoint
+    
+    def _save_checkpoint(
+        self,
+        key: str,
+        generation: int,
+        best_fitness: float,
+        generations_without_improvement: int
+    ) -> None:
+        """Checkpoint the run after a generation; a failed write is reported and the run goes on."""
+        checkpoint = Checkpoint.capture(
+            key,
+            generation,
+            self.population_manager,
+            self.adaptive_controller,
+            {
+                "best_fitness_history": self.best_fitness_history,
+                "avg_fitness_history": self.avg_fitness_history,
+                "diversity_history": self.diversity_history
+            },
+            {
+                "best_fitness": best_fitness,
+                "generations_without_improvement": generations_without_improvement,
+                "solutions_found": self.solutions_found,
+                "convergence_generation": self.convergence_generation,
+                "local_search_stats": self.local_search_stats
+            }
+        )
+        try:
+            save_checkpoint(checkpoint_path(self.checkpoint_dir, key), checkpoint)
+        except OSError as e:
+            print(f"Could not save checkpoint at generation {generation}: {e}")
+    
+    def _create_worker_pool(self, compiled: CompiledRequest, weights: WeightConfig) -> Optional[FitnessWorkerPool]:
+        """
+        Start the fitness worker pool for one run, if parallel evaluation applies.
+        
+        Incremental scoring needs the parents' fitness states in this
+        process, and test environments run sequentially, so neither gets
+        a pool.
+        """
+        if (not self.parallel_fitness or self.incremental_fitness or self._in_test_env()
+                or not self.max_workers or self.max_workers <= 1):
+            return None
+        try:
+            return FitnessWorkerPool(
+                compiled,
+                weights,
+                max_workers=self.max_workers,
+                vectorized=self.vectorized_fitness,
+                min_batch_size=(self.MIN_WORKER_BATCH_VECTORIZED if self.vectorized_fitness
+                                else self.MIN_WORKER_BATCH_SERIAL),
+                shared_memory=self.shared_memory_fitness
+            )
+        except Exception as e:
+            _print_fallback_message(f"Could not start fitness worker pool, evaluating in this process: {e}")
+            return None
+    
+    @staticmethod
+    def _in_test_env() -> bool:
+        """Whether to keep all work in this process, as parallel_map does under tests."""
+        return 'PYTEST_CURRENT_TEST' in os.environ or parallel._TEST_MODE
+    
+    def close_worker_pool(self) -> None:
+        """Shut down the fitness worker pool, if one is running."""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
+    
+    def _optimize_islands(
+        self,
+        request: ScheduleRequest,
+        weights: WeightConfig,
+        time_limit_seconds: int
+    ) -> ScheduleResponse:
+        """
+        Generate a schedule with several island populations.
+        
+        Islands evolve for migration_interval generations at a time, then
+        exchange elites. Statistics are combined per generation across the
+        islands: the best fitness, and the average fitness and diversity.
+        Islands keep their rates for the whole run; adaptive control does
+        not apply.
+        
+        Args:
+            request: Schedule request containing classes and constraints
+            weights: Configuration of weights for different objectives
+            time_limit_seconds: Maximum time to spend optimizing
             
-        # Convert best solution to schedule response
-        schedule = best_solution.decode()
+        Returns:
+            ScheduleResponse containing the best schedule found on any island
+        """
+        compiled = CompiledRequest(request)
+        seed_gene_arrays = self._solve_seed_genes(compiled, time_limit_seconds)
+        seed = random.getrandbits(32)
+        crossover_weights = self.island_crossover_weights or [None]
+        settings = [
+            IslandSettings(
+                population_size=self.population_size,
+                elite_size=self.elite_size,
+                mutation_rate=self.mutation_rate,
+                crossover_rate=self.crossover_rate,
+                crossover_methods=["single_point", "two_point", "uniform", "order"],
+                crossover_weights=crossover_weights[index % len(crossover_weights)],
+                migration_size=self.migration_size,
+                vectorized_fitness=self.vectorized_fitness,
+                diversity_metric=self.diversity_metric,
+                diversity_samples=self.diversity_samples,
+                greedy_fraction=self.greedy_init_fraction,
+                # Seeds start on the first island and spread by migration
+                seed_gene_arrays=seed_gene_arrays if index == 0 else [],
+                repair_moves=self.repair_moves,
+                offspring_attempts=self.offspring_attempts,
+                mutation_methods=self.mutation_methods,
+                local_search_interval=self.local_search_interval,
+                local_search_top_k=self.local_search_top_k,
+                local_search_evaluations=self.local_search_evaluations,
+                seed=seed + index
+            )
+            for index in range(self.num_islands)
+        ]
+        use_processes = self.parallel_fitness and not self._in_test_env()
+        print(f"Evolving {self.num_islands} islands (processes={use_processes}, "
+              f"migration every {self.migration_interval} generations, {self.migration_topology})")
+        
+        best_fitness = float('-inf')
+        generations_without_improvement = 0
+        deadline = self._start_time + time_limit_seconds
+        with IslandModel(compiled, weights, settings, self.migration_topology, use_processes) as islands:
+            epoch_length = 0
+            while True:
+                reports = islands.run_epoch(epoch_length, deadline)
+                
+                # The best chromosome on any island is the global best
+                best_report = max(reports, key=lambda report: report.best_fitness)
+                if best_report.best_fitness > best_fitness:
+                    best_fitness = best_report.best_fitness
+                    self.best_solution = ScheduleChromosome(request, compiled=compiled)
+                    self.best_solution.gene_array = best_report.best_genes
+                    self.best_solution.fitness = best_fitness
+                    generations_without_improvement = 0
+                    self.solutions_found += 1
+                    print(f"Generation {best_report.generation}: New best solution found with fitness {best_fitness}")
+                else:
+                    generations_without_improvement += epoch_length
+                
+                # Combine the islands' statistics generation by generation
+                for step in range(max(len(report.history) for report in reports)):
+                    stats = [report.history[step] for report in reports if step < len(report.history)]
+                    best = max(stat[0] for stat in stats)
+                    avg = sum(stat[1] for stat in stats) / len(stats)
+                    diversity = sum(stat[2] for stat in stats) / len(stats)
+                    self.best_fitness_history.append(best)
+                    self.avg_fitness_history.append(avg)
+                    self.diversity_history.append(diversity)
+                    if self._stats_callback:
+                        self._stats_callback(
+                            len(self.best_fitness_history) - 1, best, avg, diversity,
+                            self.mutation_rate, self.crossover_rate
+                        )
+                self.generations_run = len(self.best_fitness_history) - 1
+                
+                if self.generations_run >= self.max_generations:
+                    break
+                if time.time() > deadline:
+                    print(f"Time limit reached after {self.generations_run} generations")
+                    break
+                if self._stop_requested:
+                    print(f"Stop requested after {self.generations_run} generations")
+                    break
+                if epoch_length and self._check_convergence(generations_without_improvement):
+                    print(f"Converged after {self.generations_run} generations")
+                    break
+                epoch_length = min(self.migration_interval, self.max_generations - self.generations_run)
         
-        # Update metadata
-        duration = int((time.time() - self._start_time) * 1000)  # Convert to milliseconds
+        if self.best_solution is None:
+            raise ValueError("No valid solution found")
+        
+        schedule = self.best_solution.decode()
         schedule.metadata = ScheduleMetadata(
-            duration_ms=duration,
+            duration_ms=int((time.time() - self._start_time) * 1000),
             solutions_found=self.solutions_found,
             score=best_fitness,
             gap=0.0,  # Not applicable for genetic algorithm
             distribution=None  # Will be populated by dashboard code if needed
         )
-        
         return schedule
     
-    def _create_fitness_calculator(self, request: ScheduleRequest, weights: WeightConfig) -> FitnessCalculator:
+    def get_best_solution(self) -> Optional[ScheduleChromosome]:
+        """Get the best chromosome of the current run, across all islands in island mode."""
+        if self.num_islands > 1:
+            return self.best_solution
+        return self.population_manager.get_best_solution() if self.population_manager else None
+    
+    def _create_adaptive_controller(self) -> Optional[AdaptiveController]:
+        """Create the adaptive parameter controller for one run, if enabled."""
+        if not self.use_adaptive_control:
+            return None
+        return AdaptiveController(
+            base_mutation_rate=self.mutation_rate,
+            base_crossover_rate=self.crossover_rate,
+            diversity_threshold=self.diversity_threshold,
+            adaptation_strength=self.adaptation_strength,
+            adaptation_interval=self.adaptation_interval
+        )
+    
+    def _create_fitness_calculator(
+        self,
+        request: ScheduleRequest,
+        weights: WeightConfig,
+        compiled: Optional[CompiledRequest] = None
+    ) -> FitnessCalculator:
         """Create a fitness calculator for the given request and weights."""
-        return FitnessCalculator(request, weights)
+        return FitnessCalculator(request, weights, compiled=compiled, verify_incremental=self.verify_fitness)
     
-    def _create_population_manager(self, request: ScheduleRequest) -> PopulationManager:
-        """Create a population manager for the given request."""
+    def _solve_seed_genes(self, compiled: CompiledRequest, time_limit_seconds: float) -> List[np.ndarray]:
+        """
+        Run CP-SAT briefly for genes to seed the population with.
+        
+        The run takes at most a quarter of the time limit, which it counts
+        against. A failed or empty run seeds nothing.
+        
+        Returns:
+            The schedule's genes once per seeded chromosome, or an empty list
+        """
+        if self.cp_sat_seeds <= 0 or self.seed_solver is None:
+            return []
+        time_limit = min(self.seed_time_limit, time_limit_seconds / 4)
+        print(f"Seeding {self.cp_sat_seeds} chromosomes from a {time_limit:.1f}s CP-SAT run")
+        try:
+            response = self.seed_solver(compiled.request, time_limit)
+        except Exception as e:
+            print(f"CP-SAT seeding failed, starting without seeds: {e}")
+            return []
+        gene_array = response_gene_array(compiled, response)
+        if not len(gene_array):
+            return []
+        return [gene_array] * self.cp_sat_seeds
+    
+    def _create_population_manager(
+        self,
+        request: ScheduleRequest,
+        compiled: Optional[CompiledRequest] = None,
+        seed_gene_arrays: Sequence[np.ndarray] = (),
+        initialize: bool = True
+    ) -> PopulationManager:
+        """Create a population manager for the given request, empty unless initialized."""
         return PopulationManager(
             size=self.population_size,
             request=request,
             elite_size=self.elite_size,
             mutation_rate=self.mutation_rate,
             crossover_rate=self.crossover_rate,
-            crossover_methods=["single_point", "two_point", "uniform", "order"]
+            crossover_methods=["single_point", "two_point", "uniform", "order"],
+            compiled=compiled,
+            diversity_metric=self.diversity_metric,
+            diversity_samples=self.diversity_samples,
+            greedy_fraction=self.greedy_init_fraction,
+            seed_gene_arrays=seed_gene_arrays,
+            repair_moves=self.repair_moves,
+            offspring_attempts=self.offspring_attempts,
+            mutation_methods=self.mutation_methods,
+            initialize=initialize
         )
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -334,5 +895,11 @@ class GeneticOptimizer:
             "avg_fitness_history": self.avg_fitness_history,
             "diversity_history": self.diversity_history,
             "final_mutation_rate": self.population_manager.mutation_rate if self.population_manager else self.mutation_rate,
-            "final_crossover_rate": self.population_manager.crossover_rate if self.population_manager else self.crossover_rate
+            "final_crossover_rate": self.population_manager.crossover_rate if self.population_manager else self.crossover_rate,
+            "fitness_evaluations": dict(self.fitness_calculator.incremental_stats) if self.fitness_calculator else {},
+            "fitness_cache": self.fitness_cache.get_stats() if self.fitness_cache else {},
+            "repair": self.population_manager.get_repair_stats() if self.population_manager else {},
+            "mutation_weights": dict(self.population_manager.mutation_method_weights) if self.population_manager else {},
+            "local_search": dict(self.local_search_stats),
+            "resumed_generation": self.resumed_generation
         }
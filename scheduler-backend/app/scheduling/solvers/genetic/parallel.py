@@ -1,9 +1,9 @@
 """Parallel processing utilities for genetic algorithm optimization."""
 import multiprocessing
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from functools import partial
-from typing import Callable, List, TypeVar, Generic, Any
+from typing import Callable, List, TypeVar, Generic, Any, Optional
 
 # Type variables for generic functions
 T = TypeVar('T')
@@ -66,7 +66,43 @@ def determine_worker_count() -> int:
     else:
         return max(1, cpu_count - 2)  # Leave 2 cores free on larger systems
 
-def parallel_map(func: Callable[[T], R], items: List[T], max_workers: int = None) -> List[R]:
+def _map_with_executor(executor: Executor, func: Callable[[T], R], items: List[T]) -> List[R]:
+    """
+    Apply a function to each item on an executor.
+    
+    Args:
+        executor: Executor to submit the tasks to
+        func: Function to apply to each item
+        items: List of items to process
+        
+    Returns:
+        List of results in input order, with None for items that raised exceptions
+    """
+    results = [None] * len(items)
+    # Submit all tasks
+    future_to_index = {
+        executor.submit(func, item): i 
+        for i, item in enumerate(items)
+    }
+    
+    # Collect results as they complete
+    for future in as_completed(future_to_index):
+        index = future_to_index[future]
+        try:
+            results[index] = future.result()
+        except Exception as e:
+            # Log error but continue processing
+            print(f"Error in parallel task: {e}")
+            results[index] = None
+    
+    return results
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: List[T],
+    max_workers: int = None,
+    executor: Optional[Executor] = None
+) -> List[R]:
     """
     Apply a function to each item in a list in parallel.
     
@@ -74,6 +110,8 @@ def parallel_map(func: Callable[[T], R], items: List[T], max_workers: int = None
         func: Function to apply to each item
         items: List of items to process
         max_workers: Maximum number of worker processes (None for auto)
+        executor: Running executor to submit to instead of starting a new
+            process pool; every item is submitted to it
         
     Returns:
         List of results in the same order as input items
@@ -81,6 +119,9 @@ def parallel_map(func: Callable[[T], R], items: List[T], max_workers: int = None
     if not items:
         return []
     
+    if executor is not None:
+        return _map_with_executor(executor, func, items)
+    
     # Check if we're in a test environment or testing mode is explicitly set
     is_test_env = 'PYTEST_CURRENT_TEST' in os.environ or _TEST_MODE
     
@@ -113,25 +154,8 @@ def parallel_map(func: Callable[[T], R], items: List[T], max_workers: int = None
             raise Exception("Test pool error")
             
         # Run in parallel with process pool
-        results = [None] * len(items)
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_index = {
-                executor.submit(func, item): i 
-                for i, item in enumerate(items)
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    results[index] = future.result()
-                except Exception as e:
-                    # Log error but continue processing
-                    print(f"Error in parallel task: {e}")
-                    results[index] = None
-        
-        return results
+            return _map_with_executor(executor, func, items)
     except Exception as e:
         # Fall back to sequential processing if parallel fails
         _print_fallback_message(f"Parallel processing failed, falling back to sequential: {e}")
@@ -142,7 +166,8 @@ def parallel_process_batched(
     func: Callable[[List[T]], List[R]],
     items: List[T], 
     batch_size: int = 10,
-    max_workers: int = None
+    max_workers: int = None,
+    executor: Optional[Executor] = None
 ) -> List[R]:
     """
     Process items in batches across multiple workers.
@@ -155,6 +180,7 @@ def parallel_process_batched(
         items: List of items to process
         batch_size: Number of items per batch
         max_workers: Maximum number of workers (None for auto)
+        executor: Running executor to submit the batches to (None to start a pool)
         
     Returns:
         Combined list of results from all batches
@@ -169,7 +195,7 @@ def parallel_process_batched(
     ]
     
     # Process batches in parallel
-    batch_results = parallel_map(func, batches, max_workers)
+    batch_results = parallel_map(func, batches, max_workers, executor=executor)
     
     # Flatten batch results
     return [
@@ -1,11 +1,14 @@
 """Population management for genetic algorithm scheduling."""
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Sequence, Tuple, Dict, Any
 import random
 import numpy as np
 from collections import Counter
 
 from ....models import ScheduleRequest
-from .chromosome import ScheduleChromosome
+from .chromosome import MUTATION_METHODS, ScheduleChromosome
+from .compiled import CompiledRequest
+
+DIVERSITY_METRICS = ("frequency", "sampled", "pairwise")
 
 class PopulationManager:
     """Manages a population of schedule chromosomes."""
@@ -17,7 +20,18 @@ class PopulationManager:
         elite_size: int = 2,
         mutation_rate: float = 0.1,
         crossover_rate: float = 0.8,
-        crossover_methods: List[str] = None
+        crossover_methods: List[str] = None,
+        compiled: Optional[CompiledRequest] = None,
+        crossover_weights: Optional[Dict[str, float]] = None,
+        diversity_metric: str = "frequency",
+        diversity_samples: int = 1000,
+        greedy_fraction: float = 0.0,
+        seed_gene_arrays: Sequence[np.ndarray] = (),
+        repair_moves: int = 50,
+        offspring_attempts: int = 10,
+        mutation_methods: Optional[List[str]] = None,
+        rng: Optional[random.Random] = None,
+        initialize: bool = True
     ):
         """
         Initialize population manager.
@@ -29,31 +43,98 @@ class PopulationManager:
             mutation_rate: Probability of mutation for each gene
             crossover_rate: Probability of crossover between pairs
             crossover_methods: List of crossover methods to use (or None for auto)
+            compiled: Lookup tables of the request, compiled here if not given
+            crossover_weights: Fixed selection weight of each crossover method
+                (None to adapt the weights from each method's success rate)
+            diversity_metric: How diversity is computed: "frequency" counts
+                matching genes per position in O(N*G), "sampled" averages
+                diversity_samples random pairs, "pairwise" compares every pair
+            diversity_samples: Pairs compared by the "sampled" metric
+            greedy_fraction: Share of the initial population built greedily
+                within the constraints instead of at random
+            seed_gene_arrays: Genes, such as CP-SAT schedules, each completed
+                greedily into one initial chromosome
+            repair_moves: Most genes an invalid child may have moved to make
+                it valid (0 discards invalid children without repair)
+            offspring_attempts: Children tried per place in the population each
+                generation; once they are used up, invalid children are kept
+            mutation_methods: Mutation operators to use (see
+                ScheduleChromosome.mutate), weighted adaptively like the
+                crossover methods (or None for all of them)
+            rng: Random stream of selection and of the chromosomes' operators
+                (or None for the random module)
+            initialize: Whether to create the initial population (False when
+                it is restored from a checkpoint)
+            
+        Raises:
+            ValueError: If the diversity metric or a mutation method is unknown
         """
+        if diversity_metric not in DIVERSITY_METRICS:
+            raise ValueError(f"Unknown diversity metric: {diversity_metric}")
+        for method in mutation_methods or ():
+            if method not in MUTATION_METHODS:
+                raise ValueError(f"Unknown mutation method: {method}")
         self.size = size
         self.request = request
+        self.compiled = compiled or CompiledRequest(request)
         self.elite_size = elite_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
+        self.diversity_metric = diversity_metric
+        self.diversity_samples = max(1, diversity_samples)
+        self.greedy_fraction = min(1.0, max(0.0, greedy_fraction))
+        self.seed_gene_arrays = list(seed_gene_arrays)
+        self.repair_moves = max(0, repair_moves)
+        self.offspring_attempts = max(1, offspring_attempts)
+        self.rng = rng
+        self.repair_stats = {
+            "invalid": 0, "repaired": 0, "failed": 0, "genes_moved": 0, "admitted_invalid": 0
+        }
         self.population: List[ScheduleChromosome] = []
         self.generation = 0
         
         # Set up crossover methods
         self.crossover_methods = crossover_methods or ["single_point", "two_point", "uniform", "order"]
         self.crossover_method_weights = {method: 1.0 for method in self.crossover_methods}
+        self.fixed_crossover_weights = crossover_weights is not None
+        if crossover_weights:
+            self.crossover_method_weights.update(
+                (method, weight) for method, weight in crossover_weights.items()
+                if method in self.crossover_method_weights
+            )
         self.crossover_stats = {method: {"uses": 0, "improvements": 0} for method in self.crossover_methods}
         
+        # Set up mutation methods; mutants are credited once they are scored
+        self.mutation_methods = list(mutation_methods or MUTATION_METHODS)
+        self.mutation_method_weights = {method: 1.0 for method in self.mutation_methods}
+        self.mutation_stats = {method: {"uses": 0, "improvements": 0} for method in self.mutation_methods}
+        self._mutants: List[Tuple[str, ScheduleChromosome]] = []
+        self._mutant_baseline = float('-inf')
+        
         # Initialize population
-        self._initialize_population()
+        if initialize:
+            self._initialize_population()
     
     def _initialize_population(self) -> None:
-        """Create initial random population."""
+        """Create the initial population: seeded, then greedy, then random chromosomes."""
         self.population = []
-        for _ in range(self.size):
-            chromosome = ScheduleChromosome(self.request)
-            chromosome.initialize_random()
+        seeds = self.seed_gene_arrays[:self.size]
+        greedy_count = min(self.size - len(seeds), round(self.size * self.greedy_fraction))
+        for index in range(self.size):
+            chromosome = ScheduleChromosome(self.request, compiled=self.compiled, rng=self.rng)
+            if index < len(seeds):
+                chromosome.initialize_greedy(seeds[index])
+            elif index < len(seeds) + greedy_count:
+                chromosome.initialize_greedy()
+            else:
+                chromosome.initialize_random()
             self.population.append(chromosome)
     
+    @property
+    def _random(self):
+        """The manager's random stream, or the random module if it has none."""
+        return random if self.rng is None else self.rng
+    
     def select_parent(self) -> ScheduleChromosome:
         """
         Select a parent chromosome using tournament selection.
@@ -63,7 +144,7 @@ class PopulationManager:
         """
         # Select random candidates for tournament
         tournament_size = 3
-        candidates = random.sample(self.population, tournament_size)
+        candidates = self._random.sample(self.population, tournament_size)
         
         # Return the one with best fitness
         return max(candidates, key=lambda x: x.fitness)
@@ -75,26 +156,47 @@ class PopulationManager:
         Returns:
             Selected crossover method
         """
-        # Use weighted selection based on historical performance
-        if self.generation > 10:  # Only start adapting after 10 generations
-            # Normalize weights to sum to 1.0
-            total_weight = sum(self.crossover_method_weights.values())
-            if total_weight > 0:
-                # Select method using roulette wheel selection
-                r = random.random() * total_weight
-                cumulative = 0
-                for method, weight in self.crossover_method_weights.items():
-                    cumulative += weight
-                    if r <= cumulative:
-                        return method
+        # Use weighted selection based on historical performance, or on
+        # fixed weights from the start
+        if self.generation > 10 or self.fixed_crossover_weights:
+            method = self._roulette(self.crossover_method_weights)
+            if method is not None:
+                return method
         
         # Fallback to random selection
-        return random.choice(self.crossover_methods)
+        return self._random.choice(self.crossover_methods)
+    
+    def _select_mutation_method(self) -> str:
+        """
+        Select a mutation method using adaptive weighting.
+        
+        Returns:
+            Selected mutation method
+        """
+        if self.generation > 10:
+            method = self._roulette(self.mutation_method_weights)
+            if method is not None:
+                return method
+        return self._random.choice(self.mutation_methods)
+    
+    def _roulette(self, weights: Dict[str, float]) -> Optional[str]:
+        """Pick a key with probability proportional to its weight (None if all are zero)."""
+        # Normalize weights to sum to 1.0
+        total_weight = sum(weights.values())
+        if total_weight > 0:
+            # Select method using roulette wheel selection
+            r = self._random.random() * total_weight
+            cumulative = 0
+            for method, weight in weights.items():
+                cumulative += weight
+                if r <= cumulative:
+                    return method
+        return None
         
     def _update_crossover_weights(self) -> None:
         """Update crossover method weights based on performance."""
-        # Skip during early generations
-        if self.generation < 10:
+        # Skip during early generations, or when the weights are fixed
+        if self.generation < 10 or self.fixed_crossover_weights:
             return
             
         # Calculate success rate for each method
@@ -114,6 +216,34 @@ class PopulationManager:
             # Increase weight for successful methods
             self.crossover_method_weights[method] = max(0.1, min(5.0, rate * 2.5))
     
+    def _update_mutation_weights(self) -> None:
+        """Update mutation method weights based on performance, as for crossover."""
+        if self.generation < 10:
+            return
+        for method, stats in self.mutation_stats.items():
+            rate = stats["improvements"] / stats["uses"] if stats["uses"] else 0.5
+            self.mutation_method_weights[method] = max(0.1, min(5.0, rate * 2.5))
+            self.mutation_stats[method] = {"uses": 0, "improvements": 0}
+    
+    def _credit_mutations(self) -> None:
+        """
+        Count the last generation's mutants that beat their parents' average fitness.
+        
+        Children are scored only after evolve returns, so mutants are
+        credited at the start of the next generation.
+        """
+        for method, child in self._mutants:
+            if child.fitness > self._mutant_baseline:
+                self.mutation_stats[method]["improvements"] += 1
+        self._mutants = []
+    
+    def _mutate(self, child: ScheduleChromosome) -> str:
+        """Mutate a child with an adaptively selected method, returning the method."""
+        method = self._select_mutation_method()
+        self.mutation_stats[method]["uses"] += 1
+        child.mutate(self.mutation_rate, method)
+        return method
+    
     def evolve(self) -> None:
         """
         Evolve the population one generation.
@@ -126,6 +256,9 @@ class PopulationManager:
         
         # Keep track of previous best fitness for method evaluation
         previous_best = self.population[0].fitness if self.population else float('-inf')
+        self._credit_mutations()
+        scored = [c.fitness for c in self.population if c.fitness > float('-inf')]
+        self._mutant_baseline = sum(scored) / len(scored) if scored else float('-inf')
         
         # Keep elite solutions
         new_population = self.population[:self.elite_size]
@@ -133,15 +266,18 @@ class PopulationManager:
         # Update crossover weights every 5 generations
         if self.generation % 5 == 0:
             self._update_crossover_weights()
+            self._update_mutation_weights()
         
         # Track improvements by method
         method_children: Dict[str, List[ScheduleChromosome]] = {
             method: [] for method in self.crossover_methods
         }
         
-        # Fill rest of population with offspring
+        # Fill rest of population with offspring; after the attempt budget,
+        # children are kept whether valid or not, so a generation always ends
+        attempts_left = self.size * self.offspring_attempts
         while len(new_population) < self.size:
-            if random.random() < self.crossover_rate:
+            if self._random.random() < self.crossover_rate:
                 # Crossover with selected method
                 parent1 = self.select_parent()
                 parent2 = self.select_parent()
@@ -154,25 +290,29 @@ class PopulationManager:
                 child1, child2 = parent1.crossover(parent2, method=method)
                 
                 # Mutate children
-                child1.mutate(self.mutation_rate)
-                child2.mutate(self.mutation_rate)
+                mutation1 = self._mutate(child1)
+                mutation2 = self._mutate(child2)
                 
-                # Add valid children to population and track method
-                if child1.validate():
+                # Add valid children to population and track methods
+                attempts_left -= 2
+                if self._admit(child1, attempts_left < 0):
                     new_population.append(child1)
                     method_children[method].append(child1)
+                    self._mutants.append((mutation1, child1))
                     
-                if len(new_population) < self.size and child2.validate():
+                if len(new_population) < self.size and self._admit(child2, attempts_left < 0):
                     new_population.append(child2)
                     method_children[method].append(child2)
+                    self._mutants.append((mutation2, child2))
             else:
                 # Just clone a parent with mutation
                 parent = self.select_parent()
-                child = ScheduleChromosome(self.request)
-                child.genes = parent.genes.copy()
-                child.mutate(self.mutation_rate)
-                if child.validate():
+                child = parent.copy()
+                mutation = self._mutate(child)
+                attempts_left -= 1
+                if self._admit(child, attempts_left < 0):
                     new_population.append(child)
+                    self._mutants.append((mutation, child))
         
         # Ensure population size remains constant
         self.population = new_population[:self.size]
@@ -190,6 +330,36 @@ class PopulationManager:
                             self.crossover_stats[method]["improvements"] += 1
                             break
     
+    def _admit(self, child: ScheduleChromosome, budget_spent: bool) -> bool:
+        """
+        Decide whether a child joins the next generation, repairing it if invalid.
+        
+        Args:
+            child: Child to check
+            budget_spent: Whether the generation's offspring attempts are used up
+            
+        Returns:
+            Whether the child is valid, or may join anyway
+        """
+        if child.validate():
+            return True
+        self.repair_stats["invalid"] += 1
+        if self.repair_moves:
+            self.repair_stats["genes_moved"] += child.repair(self.repair_moves)
+            if child.validate():
+                self.repair_stats["repaired"] += 1
+                return True
+            self.repair_stats["failed"] += 1
+        if budget_spent:
+            self.repair_stats["admitted_invalid"] += 1
+        return budget_spent
+    
+    def get_repair_stats(self) -> Dict[str, Any]:
+        """Get counts of invalid, repaired and admitted invalid children so far"""
+        stats: Dict[str, Any] = dict(self.repair_stats)
+        stats["repair_rate"] = stats["repaired"] / stats["invalid"] if stats["invalid"] else 0.0
+        return stats
+    
     def get_best_solution(self) -> Optional[ScheduleChromosome]:
         """Return the chromosome with highest fitness."""
         if not self.population:
@@ -210,7 +380,28 @@ class PopulationManager:
         best_fitness = max(fitnesses)
         avg_fitness = sum(fitnesses) / len(fitnesses)
         
-        # Calculate diversity as average distance between chromosomes
+        return (best_fitness, avg_fitness, self.get_diversity())
+    
+    def get_diversity(self) -> float:
+        """
+        Calculate diversity as the average distance between chromosomes.
+        
+        The "frequency" and "pairwise" metrics give the same value up to
+        rounding; "sampled" estimates it.
+        
+        Returns:
+            Average normalized Hamming distance over pairs of chromosomes
+        """
+        if len(self.population) < 2:
+            return 0.0
+        if self.diversity_metric == "frequency":
+            return self._frequency_diversity()
+        if self.diversity_metric == "sampled":
+            return self._sampled_diversity()
+        return self._pairwise_diversity()
+    
+    def _pairwise_diversity(self) -> float:
+        """Average the distance of every pair of chromosomes."""
         distances = []
         for i in range(len(self.population)):
             for j in range(i + 1, len(self.population)):
@@ -219,9 +410,71 @@ class PopulationManager:
                     self.population[j]
                 )
                 distances.append(distance)
-        diversity = sum(distances) / len(distances) if distances else 0.0
+        return sum(distances) / len(distances) if distances else 0.0
+    
+    def _aligned_gene_arrays(self) -> List[np.ndarray]:
+        """Gene arrays of the population, with class indices of the first chromosome's table."""
+        first = self.population[0]
+        return [first._aligned(chromosome) for chromosome in self.population]
+    
+    def _frequency_diversity(self) -> float:
+        """
+        Average pairwise distance from how often each gene occurs per position.
         
-        return (best_fitness, avg_fitness, diversity)
+        At a position where gene value a occurs c_a times among n
+        chromosomes, n(n-1)/2 - sum(c_a(c_a-1)/2) pairs differ, so the sum
+        of all pairwise distances needs one sort per position instead of
+        comparing every pair. Pairs of different lengths count as distance 1.
+        """
+        groups: Dict[int, List[np.ndarray]] = {}
+        for gene_array in self._aligned_gene_arrays():
+            groups.setdefault(len(gene_array), []).append(gene_array)
+        
+        n = len(self.population)
+        total_pairs = n * (n - 1) // 2
+        same_length_pairs = 0
+        distance_sum = 0.0
+        for length, arrays in groups.items():
+            count = len(arrays)
+            pairs = count * (count - 1) // 2
+            same_length_pairs += pairs
+            if pairs == 0 or length == 0:
+                continue
+            # One int64 key per gene, columns sorted so equal genes are adjacent
+            genes = np.stack(arrays).astype(np.int64) & 0xFFFF
+            keys = (genes[..., 0] << 48) | (genes[..., 1] << 32) | (genes[..., 2] << 16) | genes[..., 3]
+            keys = np.sort(keys, axis=0).T.ravel()
+            # Start index of every run of equal genes; columns always start a run
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]] | (np.arange(keys.size) % count == 0))
+            runs = np.diff(np.r_[starts, keys.size])
+            equal_pairs = int((runs * (runs - 1) // 2).sum())
+            distance_sum += (pairs * length - equal_pairs) / length
+        
+        distance_sum += total_pairs - same_length_pairs
+        return distance_sum / total_pairs
+    
+    def _sampled_diversity(self) -> float:
+        """Estimate the average pairwise distance from random pairs."""
+        n = len(self.population)
+        if n * (n - 1) // 2 <= self.diversity_samples:
+            return self._frequency_diversity()
+        
+        gene_arrays = self._aligned_gene_arrays()
+        # Seeded from the random stream so seeding it keeps runs reproducible
+        rng = np.random.default_rng(self._random.getrandbits(64))
+        first = rng.integers(0, n, self.diversity_samples)
+        # A random offset of 1..n-1 pairs each chromosome with a different one
+        second = (first + rng.integers(1, n, self.diversity_samples)) % n
+        lengths = np.array([len(gene_array) for gene_array in gene_arrays])
+        if (lengths == lengths[0]).all() and lengths[0]:
+            genes = np.stack(gene_arrays)
+            differing = (genes[first] != genes[second]).any(axis=2).sum(axis=1)
+            return float((differing / lengths[0]).mean())
+        distances = [
+            self._chromosome_distance(self.population[i], self.population[j])
+            for i, j in zip(first.tolist(), second.tolist())
+        ]
+        return sum(distances) / len(distances)
     
     def _chromosome_distance(
         self,
@@ -233,15 +486,7 @@ class PopulationManager:
         
         Uses Hamming distance normalized by chromosome length.
         """
-        if len(chromosome1.genes) != len(chromosome2.genes):
+        if len(chromosome1.gene_array) != len(chromosome2.gene_array):
             return 1.0  # Maximum distance for different lengths
             
-        differences = 0
-        for gene1, gene2 in zip(chromosome1.genes, chromosome2.genes):
-            if (gene1.class_id != gene2.class_id or
-                gene1.day_of_week != gene2.day_of_week or
-                gene1.period != gene2.period or
-                gene1.week != gene2.week):
-                differences += 1
-                
-        return differences / len(chromosome1.genes)
+        return chromosome1.hamming_distance(chromosome2) / len(chromosome1.gene_array)
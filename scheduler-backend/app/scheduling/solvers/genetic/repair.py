@@ -0,0 +1,57 @@
+"""Repair of gene arrays that break the daily, weekly or consecutive limits."""
+from typing import Tuple
+
+import numpy as np
+
+from .compiled import CompiledRequest
+from .initialization import _Occupancy
+
+
+def repair_gene_array(
+    compiled: CompiledRequest,
+    gene_array: np.ndarray,
+    rng: np.random.Generator,
+    max_moves: int
+) -> Tuple[np.ndarray, int]:
+    """
+    Move the genes that make a gene array invalid to the nearest slots that fit.
+
+    Genes are taken in random order and kept where they are while their
+    slot is free and keeps the day, the week and the runs of consecutive
+    classes within the limits. Each remaining gene then moves to the
+    nearest free slot that fits (see _Occupancy.nearest), up to
+    ``max_moves`` genes; genes beyond the budget, or with no slot left,
+    stay where they are.
+
+    Args:
+        compiled: Compiled request of the gene array
+        gene_array: Genes to repair; not modified
+        rng: Random generator ordering the genes
+        max_moves: Most genes moved
+
+    Returns:
+        Tuple of (repaired gene array, genes moved); the gene array is the
+        one given if no gene moved
+    """
+    occupancy = _Occupancy(compiled)
+    offenders = []
+    for index in rng.permutation(len(gene_array)).tolist():
+        _, week, day, period = gene_array[index].tolist()
+        if occupancy.fits(week, day, period):
+            occupancy.place(week, day, period)
+        else:
+            offenders.append(index)
+    if not offenders:
+        return gene_array, 0
+
+    repaired = gene_array.copy()
+    moves = 0
+    for index in offenders[:max_moves]:
+        class_idx, week, day, period = gene_array[index].tolist()
+        slot = occupancy.nearest(int(compiled.class_rows(class_idx)), week, day, period)
+        if slot is None:
+            continue
+        repaired[index, 1:] = slot
+        occupancy.place(*slot)
+        moves += 1
+    return (repaired, moves) if moves else (gene_array, 0)
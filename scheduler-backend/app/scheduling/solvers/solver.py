@@ -1,5 +1,5 @@
 """Unified solver implementation with configurable features"""
-from typing import Dict, Any, List, Optional, Union, Type
+from typing import Dict, Any, Callable, List, Optional, Union, Type
 import traceback
 import os
 from dateutil import parser
@@ -23,13 +23,15 @@ from ..objectives.grade_grouping import GradeGroupingObjective
 from .base import BaseSolver
 from ...models import ScheduleRequest, ScheduleResponse, WeightConfig, ScheduleMetadata
 from .genetic.optimizer import GeneticOptimizer
-from .genetic.meta_optimizer import MetaOptimizer
+from .genetic.meta_optimizer import MetaOptimizer, WeightChromosome
 from ..constraints.relaxation import (
     RelaxationController, 
     RelaxationLevel, 
     RelaxableConstraint,
     RelaxationResult
 )
+from ..utils.feasibility import FeasibilityReport, check_feasibility
+from .cache import get_result_cache, request_hash
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +113,33 @@ class UnifiedSolver(BaseSolver):
                 adaptation_strength=config_module.GENETIC_CONFIG.ADAPTATION_STRENGTH,
                 # Disable parallel fitness in test environment
                 parallel_fitness=False if is_test_env else config_module.GENETIC_CONFIG.PARALLEL_FITNESS,
-                max_workers=1 if is_test_env else None  # Single worker in test environment
+                max_workers=1 if is_test_env else None,  # Single worker in test environment
+                vectorized_fitness=config_module.GENETIC_CONFIG.VECTORIZED_FITNESS,
+                incremental_fitness=config_module.GENETIC_CONFIG.INCREMENTAL_FITNESS,
+                verify_fitness=config_module.GENETIC_CONFIG.VERIFY_FITNESS,
+                fitness_cache_size=config_module.GENETIC_CONFIG.FITNESS_CACHE_SIZE,
+                shared_memory_fitness=config_module.GENETIC_CONFIG.SHARED_MEMORY_FITNESS,
+                num_islands=config_module.GENETIC_CONFIG.NUM_ISLANDS,
+                migration_interval=config_module.GENETIC_CONFIG.MIGRATION_INTERVAL,
+                migration_size=config_module.GENETIC_CONFIG.MIGRATION_SIZE,
+                migration_topology=config_module.GENETIC_CONFIG.MIGRATION_TOPOLOGY,
+                diversity_metric=config_module.GENETIC_CONFIG.DIVERSITY_METRIC,
+                diversity_samples=config_module.GENETIC_CONFIG.DIVERSITY_SAMPLES,
+                greedy_init_fraction=config_module.GENETIC_CONFIG.GREEDY_INIT_FRACTION,
+                cp_sat_seeds=config_module.GENETIC_CONFIG.CP_SAT_SEEDS,
+                seed_time_limit=config_module.GENETIC_CONFIG.SEED_TIME_LIMIT,
+                repair_moves=config_module.GENETIC_CONFIG.REPAIR_MOVES,
+                offspring_attempts=config_module.GENETIC_CONFIG.OFFSPRING_ATTEMPTS,
+                mutation_methods=config_module.GENETIC_CONFIG.MUTATION_METHODS,
+                local_search_interval=config_module.GENETIC_CONFIG.LOCAL_SEARCH_INTERVAL,
+                local_search_top_k=config_module.GENETIC_CONFIG.LOCAL_SEARCH_TOP_K,
+                local_search_evaluations=config_module.GENETIC_CONFIG.LOCAL_SEARCH_EVALUATIONS,
+                checkpoint_dir=config_module.GENETIC_CONFIG.CHECKPOINT_DIR,
+                checkpoint_interval=config_module.GENETIC_CONFIG.CHECKPOINT_INTERVAL,
+                # Checkpoints are kept per request, so a rerun picks up its own
+                resume_from=(config_module.GENETIC_CONFIG.CHECKPOINT_DIR
+                             if config_module.GENETIC_CONFIG.RESUME else None),
+                seed_solver=self._solve_seed_schedule
             )
         
         # Initialize meta-optimizer if enabled
@@ -138,6 +166,68 @@ class UnifiedSolver(BaseSolver):
         if config_module.ENABLE_GRADE_GROUPING:
             self.add_objective(GradeGroupingObjective())
 
+    def get_active_constraints(self) -> List[Any]:
+        """Get the enabled constraints registered with the constraint manager"""
+        return self.constraints + self._constraint_manager.get_enabled_constraints()
+    
+    def set_progress_callback(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]]
+    ) -> None:
+        """
+        Set a callback function to receive progress during solving.
+        
+        CP-SAT runs report solutions, objective, bound and gap; genetic runs
+        report the generation, best and average fitness and diversity. When
+        the best solution improved, the progress also carries its
+        assignments. Returning True from the callback stops the run early.
+        
+        Args:
+            callback: Function to call with a progress dict, or None to remove it
+        """
+        super().set_progress_callback(callback)
+        if not self.genetic_optimizer:
+            return
+        if callback is None:
+            self.genetic_optimizer.set_stats_callback(None)
+            return
+        
+        best_reported = [float('-inf')]
+        
+        def report_generation(generation, best, avg, diversity, mutation_rate, crossover_rate):
+            optimizer = self.genetic_optimizer
+            if generation == 0:
+                best_reported[0] = float('-inf')
+            improved = best > best_reported[0]
+            progress = {
+                "solver": "genetic",
+                "generation": generation,
+                "best_fitness": best,
+                "avg_fitness": avg,
+                "diversity": diversity,
+                "elapsed_seconds": time.time() - optimizer._start_time,
+                "improved": improved
+            }
+            if improved:
+                best_reported[0] = best
+                best_solution = optimizer.get_best_solution()
+                if best_solution is not None:
+                    progress["assignments"] = [
+                        a.model_dump() for a in best_solution.decode().assignments
+                    ]
+            if callback(progress):
+                optimizer.request_stop()
+        
+        self.genetic_optimizer.set_stats_callback(report_generation)
+    
+    def _solve_seed_schedule(self, request: ScheduleRequest, time_limit: float) -> ScheduleResponse:
+        """Solve with CP-SAT alone, without reporting progress, to seed the genetic population"""
+        callback, self._progress_callback = self._progress_callback, None
+        try:
+            return BaseSolver.create_schedule(self, request, time_limit)
+        finally:
+            self._progress_callback = callback
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get metrics from last solver run if enabled"""
         from . import config as config_module
@@ -161,6 +251,116 @@ class UnifiedSolver(BaseSolver):
             }
         }
 
+    def record_response(self, response: ScheduleResponse) -> None:
+        """
+        Store a response for metrics and solution comparison.
+        
+        Also used for responses produced by a copy of this solver running in
+        a worker process, so /metrics reflects runs made off the API process.
+        """
+        from . import config as config_module
+        if config_module.ENABLE_METRICS:
+            self._last_run_metadata = response.metadata
+        if config_module.ENABLE_SOLUTION_COMPARISON:
+            self._last_stable_response = response
+
+    def cache_key(
+        self,
+        request: ScheduleRequest,
+        time_limit_seconds: Optional[float] = None,
+        tune_weights: bool = False,
+        with_relaxation: bool = False,
+        profile: Optional[str] = None
+    ) -> str:
+        """
+        Get the result cache key of a solve.
+        
+        The key covers the canonical request and everything about this
+        solver that shapes the result: solver type, active constraints,
+        objective weights, relaxation level and the solve options.
+        
+        Args:
+            request: Schedule request
+            time_limit_seconds: Solver time limit
+            tune_weights: Whether weights are tuned before solving
+            with_relaxation: Whether progressive relaxation is used
+            profile: CP-SAT parameter profile
+            
+        Returns:
+            Hex digest identifying the solve
+        """
+        from . import config as config_module
+        solver_profile = config_module.get_solver_profile(
+            profile or getattr(request, "solverProfile", None)
+        )
+        return request_hash(request, {
+            "solver": self.name,
+            "genetic": bool(config_module.ENABLE_GENETIC_OPTIMIZATION and self.use_genetic and self.genetic_optimizer),
+            "or_tools": self.use_or_tools,
+            "constraints": [constraint.name for constraint in self.get_active_constraints()],
+            "objectives": [[objective.name, objective.weight] for objective in self.objectives],
+            "weights": self.get_weights(),
+            "formulation": config_module.OBJECTIVE_FORMULATION,
+            "relaxation_level": self.current_relaxation_level.name,
+            "with_relaxation": bool(with_relaxation and self.enable_relaxation),
+            "tune_weights": bool(tune_weights and config_module.ENABLE_WEIGHT_TUNING),
+            "profile": solver_profile.NAME,
+            "time_limit": solver_profile.get_time_limit(time_limit_seconds)
+        })
+    
+    def get_cached_response(
+        self,
+        request: ScheduleRequest,
+        count_miss: bool = True,
+        **solve_kwargs
+    ) -> Optional[ScheduleResponse]:
+        """
+        Look up the result of an identical earlier solve.
+        
+        Args:
+            request: Schedule request
+            count_miss: Whether a miss counts in the cache metrics
+            **solve_kwargs: Options the solve would be called with
+            
+        Returns:
+            A copy of the cached response, or None on a miss or when the
+            cache is disabled
+        """
+        cache = get_result_cache()
+        if cache is None:
+            return None
+        response = cache.get(self.cache_key(request, **solve_kwargs), count_miss=count_miss)
+        if response is not None:
+            logger.info("Returning cached schedule for identical request")
+            self.record_response(response)
+        return response
+    
+    def cache_response(self, request: ScheduleRequest, response: ScheduleResponse, **solve_kwargs) -> None:
+        """
+        Store the result of a solve for identical later requests.
+        
+        Only responses with assignments are cached, so failures are retried,
+        and runs with a progress callback are skipped since their caller may
+        have stopped them early.
+        
+        Args:
+            request: Schedule request that was solved
+            response: Its response
+            **solve_kwargs: Options the solve was called with
+        """
+        if get_result_cache() is not None:
+            self._store_result(self.cache_key(request, **solve_kwargs), response)
+    
+    def _store_result(self, key: Optional[str], response: ScheduleResponse) -> None:
+        """Cache a response under a key if it has assignments"""
+        cache = get_result_cache()
+        if cache is None or key is None or not response.assignments:
+            return
+        # Runs reporting progress may have been stopped early by their caller
+        if self._progress_callback is not None:
+            return
+        cache.put(key, response)
+    
     def get_weights(self) -> Dict[str, int]:
         """
         Get the current weights.
@@ -173,13 +373,29 @@ class UnifiedSolver(BaseSolver):
             return self.custom_weights
         else:
             return config_module.WEIGHTS
+    
+    def get_weight_config(self) -> WeightConfig:
+        """
+        Get the current weights as the WeightConfig the genetic optimizer scores with.
+        
+        Returns:
+            WeightConfig of the current weights
+        """
+        return WeightChromosome(weights=dict(self.get_weights())).to_weight_config()
             
-    def tune_weights(self, request: ScheduleRequest = None) -> WeightConfig:
+    def tune_weights(
+        self,
+        request: ScheduleRequest = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+    ) -> WeightConfig:
         """
         Tune weights using the meta-optimizer.
         
         Args:
             request: Schedule request to tune weights for (uses self.request if None)
+            progress_callback: Optional function called with the tuning
+                progress; returning True stops tuning with the best weights
+                found so far
             
         Returns:
             Optimized weight configuration
@@ -213,7 +429,8 @@ class UnifiedSolver(BaseSolver):
             
         # Run meta-optimization
         best_config, best_fitness = self.meta_optimizer.optimize(
-            parallel=META_CONFIG.PARALLEL_EVALUATION
+            parallel=META_CONFIG.PARALLEL_EVALUATION,
+            progress_callback=progress_callback
         )
         
         logger.info(f"Weight tuning complete. Best fitness: {best_fitness}")
@@ -283,19 +500,24 @@ class UnifiedSolver(BaseSolver):
     def solve(self, request: ScheduleRequest = None, 
               time_limit_seconds: int = None, 
               tune_weights: bool = False,
-              with_relaxation: bool = False) -> ScheduleResponse:
+              with_relaxation: bool = False,
+              profile: Optional[str] = None) -> ScheduleResponse:
         """
         Main solve method to generate a schedule.
         
         Args:
             request: The schedule request containing classes and constraints
-            time_limit_seconds: Time limit for solver
+            time_limit_seconds: Time limit for solver (defaults to the profile's limit)
             tune_weights: Whether to tune weights automatically
             with_relaxation: Whether to attempt constraint relaxation if initial solve fails
+            profile: CP-SAT parameter profile (defaults to the request's
+                solverProfile, then SOLVER_PROFILE)
         
         Returns:
             ScheduleResponse with assignments and metadata
         """
+        from . import config as config_module
+        
         # Use provided request or stored request
         req = request if request is not None else self.request
         if req is None:
@@ -316,12 +538,23 @@ class UnifiedSolver(BaseSolver):
                 )
             )
         
-        # Set time limit
-        time_limit = time_limit_seconds if time_limit_seconds is not None else config_module.SOLVER_TIME_LIMIT_SECONDS
+        # Resolve the parameter profile and time limit
+        profile = profile or getattr(req, "solverProfile", None)
+        time_limit = config_module.get_solver_profile(profile).get_time_limit(time_limit_seconds)
         
         # Store request for future use
         self.request = req
         
+        # Reuse the result of an identical earlier solve
+        cache_key = None
+        if get_result_cache() is not None:
+            cache_key = self.cache_key(req, time_limit, tune_weights, with_relaxation, profile)
+            cached = get_result_cache().get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached schedule for identical request")
+                self.record_response(cached)
+                return cached
+        
         # Tune weights if requested
         if tune_weights and config_module.ENABLE_WEIGHT_TUNING:
             try:
@@ -331,56 +564,74 @@ class UnifiedSolver(BaseSolver):
                 logger.warning("Continuing with default weights")
                 # Continue with default weights rather than failing
         
-        # Create schedule
-        try:
-            start_time = time.time()
-            response = self.create_schedule(req, time_limit)
-            duration = time.time() - start_time
-            
-            # Log success details
-            assignment_count = len(response.assignments) if hasattr(response, 'assignments') and response.assignments else 0
-            logger.info(f"Schedule created successfully with {assignment_count} assignments in {duration:.2f} seconds")
-            
-            # If response has no metadata, add basic metadata
-            if not hasattr(response, 'metadata') or response.metadata is None:
-                response.metadata = ScheduleMetadata(
-                    success=True,
-                    message="Schedule created successfully",
-                    duration=duration,
-                    score=0,
-                    status="SUCCESS"
+        # Reject hopeless requests before building a model, and skip the
+        # relaxation levels that cannot resolve the diagnosed issues
+        start_level = None
+        if config_module.ENABLE_FEASIBILITY_CHECK:
+            report = check_feasibility(req, self.get_active_constraints())
+            if not report.feasible:
+                logger.warning(
+                    f"Feasibility pre-check failed in {report.duration_ms:.1f} ms: "
+                    + "; ".join(issue.message for issue in report.issues)
                 )
+                if not (with_relaxation and self.enable_relaxation) or report.suggested_level is None:
+                    return self._infeasible_response(report)
+                start_level = report.suggested_level
+                logger.info(f"Skipping relaxation levels below {start_level.name}")
+        
+        # Create schedule
+        if start_level is not None:
+            response = self._infeasible_response(report)
+        else:
+            try:
+                start_time = time.time()
+                response = self.create_schedule(req, time_limit, profile)
+                duration = time.time() - start_time
+            
+                # Log success details
+                assignment_count = len(response.assignments) if hasattr(response, 'assignments') and response.assignments else 0
+                logger.info(f"Schedule created successfully with {assignment_count} assignments in {duration:.2f} seconds")
+            
+                # If response has no metadata, add basic metadata
+                if not hasattr(response, 'metadata') or response.metadata is None:
+                    response.metadata = ScheduleMetadata(
+                        success=True,
+                        message="Schedule created successfully",
+                        duration=duration,
+                        score=0,
+                        status="SUCCESS"
+                    )
             
-        except TimeoutError as e:
-            # Handle timeout specifically
-            logger.warning(f"Solver timeout after {time_limit} seconds: {str(e)}")
-            return ScheduleResponse(
-                assignments=[],
-                metadata=ScheduleMetadata(
-                    success=False,
-                    message=f"Solver timeout after {time_limit} seconds. Try simplifying the problem or increasing the time limit.",
-                    duration=time_limit,
-                    score=0,
-                    status="TIMEOUT"
+            except TimeoutError as e:
+                # Handle timeout specifically
+                logger.warning(f"Solver timeout after {time_limit} seconds: {str(e)}")
+                return ScheduleResponse(
+                    assignments=[],
+                    metadata=ScheduleMetadata(
+                        success=False,
+                        message=f"Solver timeout after {time_limit} seconds. Try simplifying the problem or increasing the time limit.",
+                        duration=time_limit,
+                        score=0,
+                        status="TIMEOUT"
+                    )
                 )
-            )
-        except Exception as e:
-            logger.error(f"Error creating schedule: {str(e)}")
-            logger.error(f"Request details: Classes={len(req.classes)}, Date range={req.startDate} to {req.endDate}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            
-            # Return a proper error response instead of raising
-            return ScheduleResponse(
-                assignments=[],
-                metadata=ScheduleMetadata(
-                    success=False,
-                    message=f"Schedule creation failed: {str(e)}",
-                    duration=0,
-                    score=0,
-                    status="ERROR"
+            except Exception as e:
+                logger.error(f"Error creating schedule: {str(e)}")
+                logger.error(f"Request details: Classes={len(req.classes)}, Date range={req.startDate} to {req.endDate}")
+                import traceback
+                logger.error(f"Traceback: {traceback.format_exc()}")
+            
+                # Return a proper error response instead of raising
+                return ScheduleResponse(
+                    assignments=[],
+                    metadata=ScheduleMetadata(
+                        success=False,
+                        message=f"Schedule creation failed: {str(e)}",
+                        duration=0,
+                        score=0,
+                        status="ERROR"
+                    )
                 )
-            )
         
         # If no solution found and relaxation is enabled, try with relaxation
         if with_relaxation and self.enable_relaxation and (
@@ -392,12 +643,14 @@ class UnifiedSolver(BaseSolver):
             for level in RelaxationLevel:
                 if level == RelaxationLevel.NONE:
                     continue
+                if start_level is not None and level.value < start_level.value:
+                    continue
                     
                 logger.info(f"Trying relaxation level: {level.name}")
                 try:
                     # Apply relaxation and resolve
                     relaxed = self.relax_constraints(level)
-                    relaxed_response = self.create_schedule(req, time_limit)
+                    relaxed_response = self.create_schedule(req, time_limit, profile)
                     
                     # If we have assignments, use this solution
                     if relaxed_response.assignments and len(relaxed_response.assignments) > 0:
@@ -408,6 +661,7 @@ class UnifiedSolver(BaseSolver):
                         # Update metadata to include relaxation information
                         relaxed_response.metadata.relaxation_level = level.name
                         relaxed_response.metadata.relaxation_count = len(relaxed)
+                        self._store_result(cache_key, relaxed_response)
                         return relaxed_response
                 except Exception as e:
                     logger.error(f"Error during constraint relaxation (level {level.name}): {str(e)}")
@@ -426,9 +680,31 @@ class UnifiedSolver(BaseSolver):
                 )
             )
         
+        self._store_result(cache_key, response)
         return response
     
-    def create_schedule(self, request: ScheduleRequest, time_limit_seconds: int = None) -> ScheduleResponse:
+    def _infeasible_response(self, report: FeasibilityReport) -> ScheduleResponse:
+        """Build the response for a request rejected by the feasibility pre-check"""
+        return ScheduleResponse(
+            assignments=[],
+            metadata=ScheduleMetadata(
+                duration_ms=int(report.duration_ms),
+                solutions_found=0,
+                score=0,
+                gap=0,
+                solver=self.name,
+                status="INFEASIBLE",
+                message="; ".join(issue.message for issue in report.issues),
+                feasibility=report.to_dict()
+            )
+        )
+    
+    def create_schedule(
+        self,
+        request: ScheduleRequest,
+        time_limit_seconds: int = None,
+        profile: Optional[str] = None
+    ) -> ScheduleResponse:
         """Create a schedule using the unified solver configuration"""
         # Import config at method level
         from . import config as config_module
@@ -458,6 +734,10 @@ class UnifiedSolver(BaseSolver):
                 logger.info(f"- Diversity threshold: {config_module.GENETIC_CONFIG.DIVERSITY_THRESHOLD}")
                 logger.info(f"- Adaptation strength: {config_module.GENETIC_CONFIG.ADAPTATION_STRENGTH}")
             logger.info(f"- Available crossover methods: {', '.join(config_module.GENETIC_CONFIG.CROSSOVER_METHODS)}")
+            logger.info(f"- Available mutation methods: {', '.join(config_module.GENETIC_CONFIG.MUTATION_METHODS)}")
+            if config_module.GENETIC_CONFIG.CHECKPOINT_DIR:
+                logger.info(f"- Checkpoints: every {config_module.GENETIC_CONFIG.CHECKPOINT_INTERVAL} generations "
+                            f"to {config_module.GENETIC_CONFIG.CHECKPOINT_DIR} (resume: {config_module.GENETIC_CONFIG.RESUME})")
         
         if config_module.ENABLE_WEIGHT_TUNING:
             logger.info("\nWeight tuning configuration:")
@@ -467,7 +747,7 @@ class UnifiedSolver(BaseSolver):
             logger.info(f"- Parallel evaluation: {config_module.META_CONFIG.PARALLEL_EVALUATION}")
             
         logger.info("\nConstraints:")
-        for constraint in self.constraints:
+        for constraint in self.get_active_constraints():
             logger.info(f"- {constraint.name}")
         logger.info("\nObjectives:")
         for objective in self.objectives:
@@ -483,29 +763,21 @@ class UnifiedSolver(BaseSolver):
             if config_module.ENABLE_SOLUTION_COMPARISON and self._last_stable_response:
                 current_stable = self._last_stable_response
             
-            time_limit = time_limit_seconds if time_limit_seconds is not None else config_module.SOLVER_TIME_LIMIT_SECONDS
+            profile = profile or getattr(request, "solverProfile", None)
+            time_limit = config_module.get_solver_profile(profile).get_time_limit(time_limit_seconds)
             
             if config_module.ENABLE_GENETIC_OPTIMIZATION and self.use_genetic and self.genetic_optimizer:
                 logger.info("Using genetic algorithm optimizer")
                 response = self.genetic_optimizer.optimize(
                     request=request,
-                    weights=self.get_weights(),
+                    weights=self.get_weight_config(),
                     time_limit_seconds=time_limit
                 )
             elif self.use_or_tools:
                 logger.info("Using OR-Tools CP-SAT solver")
-                # Create context and apply constraints
-                context = SchedulerContext(
-                    model=self.model,
-                    solver=self.solver,
-                    request=request,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                
-                # Apply constraints through manager
-                self._constraint_manager.apply_all(context)
-                response = super().create_schedule(request)
+                # Constraints from the manager are applied to the model built
+                # by the base solver (see get_active_constraints)
+                response = super().create_schedule(request, time_limit, profile)
             else:
                 raise ValueError("Neither genetic algorithm nor OR-Tools solver is enabled")
             
@@ -535,14 +807,9 @@ class UnifiedSolver(BaseSolver):
             else:
                 logger.info("All constraints satisfied!")
             
-            # Store metadata for metrics if enabled
-            if config_module.ENABLE_METRICS:
-                self._last_run_metadata = response.metadata
-                
-            # Store response for future comparison if enabled
+            # Store metadata and response for metrics and comparison
+            self.record_response(response)
             if config_module.ENABLE_SOLUTION_COMPARISON:
-                self._last_stable_response = response
-                
                 # Compare with previous stable solution if available
                 if current_stable:
                     comparison = self._compare_solutions(current_stable, response)
@@ -0,0 +1,117 @@
+"""Streaming of intermediate solutions while a solve runs"""
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from ...models import ScheduleRequest
+from .executor import SolveExecutor
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """
+    Format one Server-Sent Events message.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+        event_id: Optional event id
+
+    Returns:
+        The message, terminated by a blank line
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class SolutionStream:
+    """
+    Relays a solver's progress callbacks from its pool thread to an async consumer.
+
+    ``events()`` yields ``(event, data)`` pairs:
+
+    - ``("solution", progress)`` when the best solution improved; the progress
+      carries its ``assignments``
+    - ``("progress", progress)`` for other progress reports
+    - ``("keepalive", None)`` when nothing happened for ``keepalive_seconds``
+    - ``("result", response)`` once, with the final ScheduleResponse
+
+    Reports that arrive faster than the consumer reads them are coalesced
+    to the latest solution and the latest progress. Closing the iterator
+    early (e.g. the client disconnected) asks the solver to stop at its
+    next report, so an accepted early answer frees the solver.
+    """
+
+    def __init__(self, solver: Any):
+        """
+        Initialize the stream.
+
+        Args:
+            solver: Solver with set_progress_callback, used for this stream only
+        """
+        self.solver = solver
+        self._stop = threading.Event()
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._future: Optional[asyncio.Future] = None
+
+    def _on_progress(self, progress: Dict[str, Any]) -> bool:
+        """Progress callback, called from the solver's thread"""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, progress)
+        return self._stop.is_set()
+
+    def start(self, executor: SolveExecutor, request: ScheduleRequest, **solve_kwargs) -> None:
+        """
+        Submit the solve. Must be called from the event loop.
+
+        Raises:
+            SolverBusyError: If the executor cannot take another solve
+        """
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self.solver.set_progress_callback(self._on_progress)
+        self._future = asyncio.wrap_future(executor.submit(self.solver, request, **solve_kwargs))
+        # The result is read by events(); avoid a warning if it never is
+        self._future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def stop(self) -> None:
+        """Ask the solver to stop at its next progress report"""
+        self._stop.set()
+
+    async def events(self, keepalive_seconds: float = 15.0) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield progress events until the solve finishes.
+
+        Raises:
+            Exception: Whatever the solve raised, after the events before it
+        """
+        try:
+            while not (self._future.done() and self._queue.empty()):
+                getter = asyncio.ensure_future(self._queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, self._future},
+                    timeout=keepalive_seconds,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter not in done:
+                    getter.cancel()
+                    if not done:
+                        yield "keepalive", None
+                    continue
+
+                reports = [getter.result()]
+                while not self._queue.empty():
+                    reports.append(self._queue.get_nowait())
+                solution = next((r for r in reversed(reports) if "assignments" in r), None)
+                if solution is not None:
+                    yield "solution", solution
+                if reports[-1] is not solution:
+                    yield "progress", reports[-1]
+
+            yield "result", self._future.result()
+        finally:
+            self.stop()
@@ -0,0 +1,158 @@
+"""Domain pruning of statically-zero schedule slots before variable creation."""
+from dataclasses import dataclass, field
+from datetime import date as date_type
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..constraints.assignment import NoOverlapConstraint
+from ..constraints.instructor import InstructorAvailabilityConstraint
+from ..constraints.periods import RequiredPeriodsConstraint
+from ..constraints.teacher_workload import TeacherBreakConstraint
+
+
+@dataclass
+class PruningStats:
+    """Summary of the slots removed by the pruning pass"""
+    variables_eliminated: int = 0
+    constraints_eliminated: int = 0
+    by_reason: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for debug info and logging"""
+        return {
+            "variables_eliminated": self.variables_eliminated,
+            "constraints_eliminated": self.constraints_eliminated,
+            "by_reason": dict(self.by_reason)
+        }
+
+
+class DomainPruner:
+    """
+    Decides which (class, date, period) slots can never be assigned, so that
+    no variable is created for them.
+
+    Only slots that an enabled hard constraint would force to zero anyway are
+    pruned:
+    - periods the instructor is unavailable (InstructorAvailabilityConstraint)
+    - required break periods (TeacherBreakConstraint)
+    - slots required by exactly one other class (RequiredPeriodsConstraint
+      together with NoOverlapConstraint)
+
+    A class's own required slots are never pruned, so a required period that
+    collides with one of the above still makes the model infeasible instead of
+    silently dropping the requirement.
+    """
+
+    def __init__(self, context: 'SchedulerContext', constraints: List[Any]):  # type: ignore # noqa: F821
+        """
+        Initialize the pruner.
+
+        Args:
+            context: Scheduler context of the request (variables not yet created)
+            constraints: Constraints that will be applied to the model
+        """
+        enabled = [c for c in constraints if getattr(c, "enabled", True)]
+        request = context.request
+
+        # Instructor unavailability, using the context's date index
+        self._unavailable: Dict[str, Set[int]] = {}
+        if any(isinstance(c, InstructorAvailabilityConstraint) for c in enabled):
+            self._unavailable = context.instructor_unavailable
+
+        # Required breaks, resolved the same way TeacherBreakConstraint does
+        self._breaks: Set[int] = set()
+        for constraint in enabled:
+            if isinstance(constraint, TeacherBreakConstraint):
+                breaks = constraint.required_breaks
+                if hasattr(request.constraints, "requiredBreakPeriods"):
+                    breaks = request.constraints.requiredBreakPeriods
+                self._breaks.update(breaks or [])
+
+        # Required (weekday, period) slots of each class
+        self._required: Dict[str, Set[Tuple[int, int]]] = {}
+        for class_obj in request.classes:
+            schedule = getattr(class_obj, "weeklySchedule", None)
+            required = getattr(schedule, "requiredPeriods", None) or []
+            self._required[class_obj.name] = {
+                (slot.dayOfWeek, slot.period) for slot in required
+            }
+
+        # Slots required by exactly one class belong to that class when no two
+        # classes may share a slot
+        self._owner: Dict[Tuple[int, int], str] = {}
+        if (any(isinstance(c, NoOverlapConstraint) for c in enabled)
+                and any(isinstance(c, RequiredPeriodsConstraint) for c in enabled)):
+            owners: Dict[Tuple[int, int], List[str]] = {}
+            for class_obj in request.classes:
+                conflicts = {
+                    (slot.dayOfWeek, slot.period)
+                    for slot in class_obj.weeklySchedule.conflicts
+                }
+                for slot in self._required[class_obj.name] - conflicts:
+                    owners.setdefault(slot, []).append(class_obj.name)
+            self._owner = {
+                slot: names[0] for slot, names in owners.items() if len(names) == 1
+            }
+
+        self.stats = PruningStats()
+        self._break_slots: Set[Tuple[date_type, int]] = set()
+        self._kept_slots: Set[Tuple[date_type, int]] = set()
+
+    def slot_reason(self, day: date_type, period: int) -> Optional[str]:
+        """Get why a slot is statically zero for every class, or None"""
+        if period in self._unavailable.get(day.isoformat(), ()):
+            return "instructor_unavailable"
+        if period in self._breaks:
+            return "required_break"
+        return None
+
+    def reason(self, class_name: str, day: date_type, period: int) -> Optional[str]:
+        """Get why a slot is statically zero for a class, or None if it must be kept"""
+        weekday = day.weekday() + 1
+        if (weekday, period) in self._required.get(class_name, ()):
+            return None
+        reason = self.slot_reason(day, period)
+        if reason is not None:
+            return reason
+        owner = self._owner.get((weekday, period))
+        if owner is not None and owner != class_name:
+            return "required_elsewhere"
+        return None
+
+    def is_pruned(self, class_name: str, day: date_type, period: int) -> bool:
+        """
+        Check whether the variable for a slot should be skipped.
+
+        Args:
+            class_name: Class the variable would belong to
+            day: Calendar date of the slot
+            period: Period of the slot (1-8)
+
+        Returns:
+            True if no variable should be created for the slot
+        """
+        slot = (day, period)
+        if period in self._breaks:
+            self._break_slots.add(slot)
+
+        reason = self.reason(class_name, day, period)
+        if reason is None:
+            self._kept_slots.add(slot)
+            return False
+
+        self.stats.variables_eliminated += 1
+        self.stats.by_reason[reason] = self.stats.by_reason.get(reason, 0) + 1
+        if reason == "instructor_unavailable":
+            # InstructorAvailabilityConstraint adds one constraint per variable
+            self.stats.constraints_eliminated += 1
+        return True
+
+    def finish(self) -> PruningStats:
+        """
+        Finalize the statistics once all variables have been created.
+
+        Returns:
+            Pruning statistics for the request
+        """
+        # TeacherBreakConstraint adds one constraint per non-empty break slot
+        self.stats.constraints_eliminated += len(self._break_slots - self._kept_slots)
+        return self.stats
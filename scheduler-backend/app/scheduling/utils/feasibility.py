@@ -0,0 +1,471 @@
+"""Fast feasibility pre-check run before the CP-SAT model is built."""
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date as date_type, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from dateutil.tz import UTC
+
+from ..core import SchedulerContext
+from ..constraints.assignment import NoOverlapConstraint, SingleAssignmentConstraint
+from ..constraints.limits import (
+    DailyLimitConstraint,
+    WeeklyLimitConstraint,
+    MinimumPeriodsConstraint
+)
+from ..constraints.periods import RequiredPeriodsConstraint
+from ..constraints.relaxable_limits import (
+    RelaxableDailyLimitConstraint,
+    RelaxableWeeklyLimitConstraint
+)
+from ..constraints.relaxation import RelaxationLevel
+from .domain_pruning import DomainPruner
+
+Slot = Tuple[date_type, int]
+
+
+@dataclass
+class FeasibilityIssue:
+    """A single reason why a request cannot be scheduled"""
+    code: str
+    message: str
+    relaxable: bool = False
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for responses and logging"""
+        return {
+            "code": self.code,
+            "message": self.message,
+            "relaxable": self.relaxable,
+            "details": dict(self.details)
+        }
+
+
+@dataclass
+class FeasibilityReport:
+    """Result of the feasibility pre-check"""
+    issues: List[FeasibilityIssue] = field(default_factory=list)
+    suggested_level: Optional[RelaxationLevel] = None
+    duration_ms: float = 0.0
+
+    @property
+    def feasible(self) -> bool:
+        """Whether no necessary condition for a schedule is violated"""
+        return not self.issues
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for responses and logging"""
+        return {
+            "feasible": self.feasible,
+            "issues": [issue.to_dict() for issue in self.issues],
+            "suggested_relaxation_level": (
+                self.suggested_level.name if self.suggested_level is not None else None
+            ),
+            "duration_ms": round(self.duration_ms, 3)
+        }
+
+
+class FeasibilityChecker:
+    """
+    Checks necessary conditions for a schedule by counting free slots,
+    without building or solving a CP-SAT model.
+
+    Only conditions implied by the enabled constraints are checked:
+    - required periods that collide with each other, with a required break
+      or with instructor unavailability
+    - classes with no free slot at all, and whether every class can get its
+      own slot (bipartite matching of classes to slots)
+    - required periods exceeding the daily or weekly limit
+    - weekly minimum periods and total classes exceeding the slot capacity
+      left under the daily and weekly limits
+
+    Passing the check does not guarantee a solution; failing it guarantees
+    there is none. Limit shortfalls are matched against the extra classes the
+    relaxable limit constraints allow at each RelaxationLevel, so the report
+    can name the lowest level that could succeed.
+    """
+
+    def __init__(self, request: Any, constraints: List[Any]):
+        """
+        Initialize the checker.
+
+        Args:
+            request: Schedule request to check
+            constraints: Constraints that will be applied to the model
+        """
+        self.request = request
+        self.constraints = [c for c in constraints if getattr(c, "enabled", True)]
+
+        start_date = datetime.fromisoformat(request.startDate)
+        end_date = datetime.fromisoformat(request.endDate)
+        if start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=UTC)
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+
+        # Weekdays in range with their week offsets, as in BaseSolver._create_variables
+        self.days: List[date_type] = []
+        self.week_of: Dict[date_type, int] = {}
+        current_date = start_date
+        day_index = 0
+        while current_date <= end_date:
+            if current_date.weekday() < 5:
+                self.days.append(current_date.date())
+                self.week_of[current_date.date()] = day_index // 7
+            current_date = current_date + timedelta(days=1)
+            day_index += 1
+
+        context = SchedulerContext(
+            model=None,
+            solver=None,
+            request=request,
+            start_date=start_date,
+            end_date=end_date
+        )
+        self._pruner = DomainPruner(context, self.constraints)
+
+    def _find(self, *types: type) -> Optional[Any]:
+        """Get the first enabled constraint of one of the given types"""
+        for constraint in self.constraints:
+            if isinstance(constraint, types):
+                return constraint
+        return None
+
+    def _free_slots(self) -> Dict[str, Set[Slot]]:
+        """Get the slots each class could be assigned to"""
+        free = {}
+        for class_obj in self.request.classes:
+            conflicts = {
+                (slot.dayOfWeek, slot.period)
+                for slot in class_obj.weeklySchedule.conflicts
+            }
+            free[class_obj.name] = {
+                (day, period)
+                for day in self.days
+                for period in range(1, 9)
+                if (day.weekday() + 1, period) not in conflicts
+                and self._pruner.reason(class_obj.name, day, period) is None
+            }
+        return free
+
+    def _required_slots(self) -> Dict[str, Set[Slot]]:
+        """Get the dated slots RequiredPeriodsConstraint forces for each class"""
+        required = {}
+        for class_obj in self.request.classes:
+            schedule = class_obj.weeklySchedule
+            conflicts = {(slot.dayOfWeek, slot.period) for slot in schedule.conflicts}
+            weekly = {
+                (slot.dayOfWeek, slot.period)
+                for slot in schedule.requiredPeriods
+            } - conflicts
+            required[class_obj.name] = {
+                (day, period)
+                for day in self.days
+                for weekday, period in weekly
+                if day.weekday() + 1 == weekday
+            }
+        return required
+
+    def _required_issues(self, required: Dict[str, Set[Slot]]) -> List[FeasibilityIssue]:
+        """Check required periods against breaks, unavailability and each other"""
+        issues = []
+        blocked = defaultdict(list)
+        for class_name, slots in required.items():
+            for day, period in sorted(slots):
+                reason = self._pruner.slot_reason(day, period)
+                if reason is not None:
+                    blocked[(class_name, reason)].append(f"{day.isoformat()} period {period}")
+        for (class_name, reason), slots in blocked.items():
+            what = "a required break" if reason == "required_break" else "instructor unavailability"
+            issues.append(FeasibilityIssue(
+                code=reason,
+                message=f"Required periods of class {class_name} fall on {what}",
+                details={"className": class_name, "slots": slots}
+            ))
+
+        if self._find(NoOverlapConstraint):
+            owners = defaultdict(list)
+            for class_name, slots in required.items():
+                for slot in slots:
+                    owners[slot].append(class_name)
+            collisions = defaultdict(list)
+            for (day, period), names in sorted(owners.items()):
+                if len(names) > 1:
+                    collisions[tuple(sorted(names))].append(f"{day.isoformat()} period {period}")
+            for names, slots in collisions.items():
+                issues.append(FeasibilityIssue(
+                    code="required_collision",
+                    message=f"Classes {', '.join(names)} require the same periods",
+                    details={"classNames": list(names), "slots": slots}
+                ))
+        return issues
+
+    def _assignment_issues(self, free: Dict[str, Set[Slot]]) -> List[FeasibilityIssue]:
+        """Check that every class can get a slot, and its own one if overlap is forbidden"""
+        issues = []
+        if not self._find(SingleAssignmentConstraint):
+            return issues
+
+        empty = sorted(name for name, slots in free.items() if not slots)
+        if empty:
+            issues.append(FeasibilityIssue(
+                code="no_free_slots",
+                message=(
+                    f"{len(empty)} classes have no free slot after conflicts, "
+                    f"instructor unavailability and breaks"
+                ),
+                details={"classNames": empty}
+            ))
+            return issues
+
+        if self._find(NoOverlapConstraint):
+            matched = _max_matching(free)
+            if matched < len(free):
+                issues.append(FeasibilityIssue(
+                    code="slot_capacity",
+                    message=(
+                        f"Only {matched} of {len(free)} classes can be given "
+                        f"their own slot"
+                    ),
+                    details={"classes": len(free), "assignable": matched}
+                ))
+        return issues
+
+    def _limit_levels(self) -> List[Tuple[Optional[RelaxationLevel], int, int]]:
+        """
+        Get the extra daily and weekly classes allowed at the current
+        relaxation state and at each RelaxationLevel above it.
+
+        Returns:
+            List of (level, extra per day, extra per week), starting with the
+            current state (level None)
+        """
+        daily = self._find(RelaxableDailyLimitConstraint)
+        weekly = self._find(RelaxableWeeklyLimitConstraint)
+
+        def current(constraint):
+            if constraint is None:
+                return 0
+            return constraint.relaxation_params.get("extra_classes_allowed", 0)
+
+        def extra_at(constraint, level):
+            base = current(constraint)
+            if constraint is None or not constraint.can_relax or constraint.never_relax:
+                return base
+            return max(base, constraint.extra_classes_by_level.get(level, 0))
+
+        levels = [(None, current(daily), current(weekly))]
+        for level in RelaxationLevel:
+            if level == RelaxationLevel.NONE:
+                continue
+            levels.append((level, extra_at(daily, level), extra_at(weekly, level)))
+        return levels
+
+    def _limit_issues(
+        self,
+        free: Dict[str, Set[Slot]],
+        required: Dict[str, Set[Slot]],
+        extra_daily: int,
+        extra_weekly: int
+    ) -> List[FeasibilityIssue]:
+        """Check required, minimum and total class counts against the limits"""
+        issues = []
+        limits = self.request.constraints
+        has_daily = self._find(DailyLimitConstraint, RelaxableDailyLimitConstraint) is not None
+        has_weekly = self._find(WeeklyLimitConstraint, RelaxableWeeklyLimitConstraint) is not None
+        max_daily = limits.maxClassesPerDay + extra_daily if has_daily else None
+        max_weekly = limits.maxClassesPerWeek + extra_weekly if has_weekly else None
+
+        # Classes forced by required periods
+        if self._find(RequiredPeriodsConstraint):
+            forced_by_day = defaultdict(int)
+            for slots in required.values():
+                for day, _ in slots:
+                    forced_by_day[day] += 1
+            forced_by_week = defaultdict(int)
+            for day, count in forced_by_day.items():
+                forced_by_week[self.week_of[day]] += count
+            if max_daily is not None:
+                over = {day: n for day, n in forced_by_day.items() if n > max_daily}
+                if over:
+                    issues.append(FeasibilityIssue(
+                        code="required_exceeds_daily_limit",
+                        message=(
+                            f"Required periods need up to {max(over.values())} classes "
+                            f"per day, maximum is {max_daily}"
+                        ),
+                        details={
+                            "maximum": max_daily,
+                            "days": {day.isoformat(): n for day, n in sorted(over.items())}
+                        }
+                    ))
+            if max_weekly is not None:
+                over = {week: n for week, n in forced_by_week.items() if n > max_weekly}
+                if over:
+                    issues.append(FeasibilityIssue(
+                        code="required_exceeds_weekly_limit",
+                        message=(
+                            f"Required periods need up to {max(over.values())} classes "
+                            f"per week, maximum is {max_weekly}"
+                        ),
+                        details={
+                            "maximum": max_weekly,
+                            "weeks": {week + 1: n for week, n in sorted(over.items())}
+                        }
+                    ))
+
+        # Slots usable per day: distinct periods when classes cannot share one
+        no_overlap = self._find(NoOverlapConstraint) is not None
+        usable = defaultdict(set) if no_overlap else defaultdict(int)
+        for slots in free.values():
+            for day, period in slots:
+                if no_overlap:
+                    usable[day].add(period)
+                else:
+                    usable[day] += 1
+
+        week_capacity = defaultdict(int)
+        weekdays = defaultdict(int)
+        for day in self.days:
+            count = len(usable[day]) if no_overlap else usable[day]
+            if count:
+                weekdays[self.week_of[day]] += 1
+            if max_daily is not None:
+                count = min(count, max_daily)
+            week_capacity[self.week_of[day]] += count
+        if max_weekly is not None:
+            for week in week_capacity:
+                week_capacity[week] = min(week_capacity[week], max_weekly)
+
+        # Pro-rated weekly minimum, as in MinimumPeriodsConstraint
+        if self._find(MinimumPeriodsConstraint):
+            base_min = limits.minPeriodsPerWeek
+            short = {}
+            for week, days in weekdays.items():
+                prorated = (base_min * days + 4) // 5
+                min_periods = max(2 if base_min >= 5 else 1, prorated)
+                if min_periods > week_capacity[week]:
+                    short[week + 1] = {"minimum": min_periods, "capacity": week_capacity[week]}
+            if short:
+                issues.append(FeasibilityIssue(
+                    code="minimum_periods_capacity",
+                    message=(
+                        f"Minimum periods per week cannot be met in {len(short)} weeks "
+                        f"with the available slots and limits"
+                    ),
+                    details={"weeks": short}
+                ))
+
+        if self._find(SingleAssignmentConstraint):
+            capacity = sum(week_capacity.values())
+            if len(free) > capacity:
+                issues.append(FeasibilityIssue(
+                    code="total_capacity",
+                    message=(
+                        f"{len(free)} classes need a slot but the limits leave "
+                        f"room for only {capacity}"
+                    ),
+                    details={"classes": len(free), "capacity": capacity}
+                ))
+        return issues
+
+    def check(self) -> FeasibilityReport:
+        """
+        Run the pre-check against the current relaxation state.
+
+        Returns:
+            Report of the issues found and the lowest relaxation level that
+            resolves them, if relaxing the limits can resolve them at all
+        """
+        start_time = time.time()
+        free = self._free_slots()
+        required = self._required_slots() if self._find(RequiredPeriodsConstraint) else {}
+
+        hard = self._required_issues(required) + self._assignment_issues(free)
+
+        levels = self._limit_levels()
+        _, extra_daily, extra_weekly = levels[0]
+        limit_issues = self._limit_issues(free, required, extra_daily, extra_weekly)
+
+        suggested = None
+        if limit_issues:
+            for level, extra_daily, extra_weekly in levels[1:]:
+                if not self._limit_issues(free, required, extra_daily, extra_weekly):
+                    suggested = level
+                    break
+            for issue in limit_issues:
+                issue.relaxable = suggested is not None
+
+        return FeasibilityReport(
+            issues=hard + limit_issues,
+            suggested_level=suggested if not hard else None,
+            duration_ms=(time.time() - start_time) * 1000
+        )
+
+
+def _max_matching(free: Dict[str, Set[Slot]]) -> int:
+    """
+    Size of a maximum matching of classes to distinct slots.
+
+    Uses augmenting paths with an explicit stack, so large requests do not
+    hit the recursion limit.
+    """
+    adjacency = {name: sorted(slots) for name, slots in free.items()}
+    slot_owner: Dict[Slot, str] = {}
+    class_slot: Dict[str, Slot] = {}
+    matched = 0
+
+    for root in adjacency:
+        # Depth-first search for an augmenting path from this class
+        parent: Dict[Slot, str] = {}
+        visited: Set[Slot] = set()
+        stack = [(root, iter(adjacency[root]))]
+        end_slot = None
+        while stack and end_slot is None:
+            name, slots = stack[-1]
+            for slot in slots:
+                if slot in visited:
+                    continue
+                visited.add(slot)
+                parent[slot] = name
+                owner = slot_owner.get(slot)
+                if owner is None:
+                    end_slot = slot
+                else:
+                    stack.append((owner, iter(adjacency[owner])))
+                break
+            else:
+                stack.pop()
+
+        if end_slot is None:
+            continue
+
+        # Flip the path: each class on it takes the slot it reached
+        slot = end_slot
+        while True:
+            name = parent[slot]
+            previous = class_slot.get(name)
+            slot_owner[slot] = name
+            class_slot[name] = slot
+            if name == root:
+                break
+            slot = previous
+        matched += 1
+
+    return matched
+
+
+def check_feasibility(request: Any, constraints: List[Any]) -> FeasibilityReport:
+    """
+    Run the feasibility pre-check for a request.
+
+    Args:
+        request: Schedule request to check
+        constraints: Constraints that will be applied to the model
+
+    Returns:
+        Feasibility report with a structured diagnosis
+    """
+    return FeasibilityChecker(request, constraints).check()
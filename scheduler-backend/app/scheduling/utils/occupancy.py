@@ -0,0 +1,159 @@
+"""Shared slot and day occupancy expressions for CP-SAT constraints and objectives."""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from ortools.sat.python import cp_model
+
+from .variable_index import VariableIndex
+
+
+class SlotOccupancy:
+    """
+    Aggregated occupancy of the schedule for one request.
+
+    The teacher can only hold one class per (date, period), so with the
+    no-overlap constraint in place the load of a slot is itself a 0/1
+    expression. Slot loads, day loads and "day used" indicators are built the
+    first time a component asks for them and are then shared by every
+    constraint and objective working on the same context, instead of each
+    component re-summing the class variables of a slot or creating its own
+    indicator Booleans.
+    """
+
+    def __init__(
+        self,
+        model: cp_model.CpModel,
+        index: VariableIndex,
+        grade_groups: Optional[Dict[str, Any]] = None,
+        shared: bool = True
+    ):
+        """
+        Initialize the occupancy layer.
+
+        Args:
+            model: CP-SAT model that owns the indicator variables
+            index: Variable index of the request
+            grade_groups: Grade group for each class name
+            shared: Reuse expressions and indicators across calls. Disabling
+                this rebuilds them on every call, as components did before the
+                occupancy layer existed (used for benchmarking).
+        """
+        self.model = model
+        self.index = index
+        self._grade_groups = grade_groups or {}
+        self.shared = shared
+        self._slot_loads: Dict[Any, Dict[int, Any]] = {}
+        self._day_loads: Dict[Any, Any] = {}
+        self._day_used: Dict[Any, Any] = {}
+        self._grade_loads: Dict[Any, Dict[int, Dict[Any, Any]]] = {}
+        self.stats = {
+            "slot_loads": 0,
+            "day_loads": 0,
+            "day_indicators": 0,
+            "grade_loads": 0,
+            "reused": 0
+        }
+
+    @staticmethod
+    def _sum(variables: List[Any]) -> Any:
+        """Sum variables, returning a lone variable unchanged."""
+        if len(variables) == 1:
+            return variables[0]
+        return cp_model.LinearExpr.Sum(variables)
+
+    def dates(self) -> List[Any]:
+        """Dates that have at least one variable, in chronological order."""
+        return sorted(self.index.by_date_period.keys())
+
+    def periods(self, date: Any) -> List[int]:
+        """Periods with at least one variable on a date, in order."""
+        return sorted(self.index.by_date_period.get(date, {}).keys())
+
+    def slot_load(self, date: Any, period: int) -> Optional[Any]:
+        """
+        Number of classes scheduled in a slot.
+
+        Returns:
+            Linear expression over the slot's variables, or None if no class
+            can be scheduled in the slot
+        """
+        loads = self._slot_loads.setdefault(date, {})
+        if self.shared and period in loads:
+            self.stats["reused"] += 1
+            return loads[period]
+
+        slot_vars = self.index.by_date_period.get(date, {}).get(period)
+        load = None
+        if slot_vars:
+            load = self._sum([var["variable"] for var in slot_vars])
+            self.stats["slot_loads"] += 1
+        loads[period] = load
+        return load
+
+    def day_load(self, date: Any) -> Optional[Any]:
+        """
+        Number of classes scheduled on a date.
+
+        Returns:
+            Linear expression over the day's variables, or None if no class
+            can be scheduled on the date
+        """
+        if self.shared and date in self._day_loads:
+            self.stats["reused"] += 1
+            return self._day_loads[date]
+
+        day_vars = self.index.by_date.get(date)
+        load = None
+        if day_vars:
+            load = self._sum([var["variable"] for var in day_vars])
+            self.stats["day_loads"] += 1
+        self._day_loads[date] = load
+        return load
+
+    def day_used(self, date: Any) -> Optional[Any]:
+        """
+        Boolean that is true exactly when at least one class is on a date.
+
+        Returns:
+            Indicator variable, or None if no class can be scheduled on the date
+        """
+        if self.shared and date in self._day_used:
+            self.stats["reused"] += 1
+            return self._day_used[date]
+
+        day_vars = self.index.by_date.get(date)
+        used = None
+        if day_vars and len(day_vars) == 1:
+            used = day_vars[0]["variable"]
+        elif day_vars:
+            day_sum = self.day_load(date)
+            used = self.model.NewBoolVar(f"day_used_{date}")
+            self.model.Add(day_sum > 0).OnlyEnforceIf(used)
+            self.model.Add(day_sum == 0).OnlyEnforceIf(used.Not())
+            self.stats["day_indicators"] += 1
+        self._day_used[date] = used
+        return used
+
+    def grade_loads(self, date: Any, period: int) -> Dict[Any, Any]:
+        """
+        Slot load split by grade group.
+
+        Returns:
+            Mapping of grade group to the number of classes of that group
+            scheduled in the slot (only groups with variables in the slot)
+        """
+        loads = self._grade_loads.setdefault(date, {})
+        if self.shared and period in loads:
+            self.stats["reused"] += 1
+            return loads[period]
+
+        by_group = defaultdict(list)
+        for var in self.index.by_date_period.get(date, {}).get(period, []):
+            by_group[self._grade_groups.get(var.get("name"))].append(var["variable"])
+
+        group_loads = {
+            group: self._sum(group_vars) for group, group_vars in by_group.items()
+        }
+        self.stats["grade_loads"] += len(group_loads)
+        loads[period] = group_loads
+        return group_loads
@@ -0,0 +1,72 @@
+"""Detection of the compute resources available to the scheduler process."""
+import math
+import os
+from typing import Optional
+
+# cgroup v2 exposes "<quota> <period>" in cpu.max, v1 uses two separate files
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read(path: str) -> Optional[str]:
+    """Read a small control file, or None if it does not exist"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def cgroup_cpu_limit() -> Optional[float]:
+    """
+    Get the CPU quota of the container in cores.
+
+    Returns:
+        Number of cores allowed by the cgroup quota, or None if unlimited or
+        not running under a cgroup CPU limit
+    """
+    cpu_max = _read(CGROUP_V2_CPU_MAX)
+    if cpu_max:
+        parts = cpu_max.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                quota, period = int(parts[0]), int(parts[1])
+            except ValueError:
+                return None
+            if quota > 0 and period > 0:
+                return quota / period
+        return None
+
+    quota, period = _read(CGROUP_V1_QUOTA), _read(CGROUP_V1_PERIOD)
+    if quota and period:
+        try:
+            quota_us, period_us = int(quota), int(period)
+        except ValueError:
+            return None
+        if quota_us > 0 and period_us > 0:
+            return quota_us / period_us
+    return None
+
+
+def available_cpu_count() -> int:
+    """
+    Get the number of CPUs this process can actually use.
+
+    Takes the smallest of the machine CPU count, the scheduler affinity mask
+    and the cgroup CPU quota (rounded up), so containers limited to a few
+    cores are not oversubscribed.
+
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    count = os.cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            count = min(count, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        count = min(count, math.ceil(limit))
+    return max(1, count)
@@ -0,0 +1,185 @@
+"""Indexed views over the CP-SAT schedule variables of a request."""
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+# Periods are numbered 1-8 throughout the scheduler
+PERIODS_PER_DAY = 8
+
+
+class VariableIndex:
+    """
+    Dense index over the schedule variables created for one request.
+
+    Variables are addressable as (class index, day index, period) and are
+    grouped into the views that constraints and objectives need: by class,
+    by date, by week, by week and weekday, and by date and period. Each view
+    is built in a single pass over the variables the first time it is used
+    and is then shared by every component working on the same context.
+    """
+
+    def __init__(
+        self,
+        variables: List[Dict[str, Any]],
+        start_date: datetime,
+        class_names: Optional[Sequence[str]] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            variables: Variable dictionaries as stored in SchedulerContext.variables
+            start_date: First date of the schedule, used for week numbers
+            class_names: Class names in request order (defines class indices)
+        """
+        self.variables = variables
+        self.size = len(variables)
+        self.start_date = start_date
+        self._class_names = list(class_names or [])
+        self._views: Dict[str, Any] = {}
+
+    def week_of(self, var: Dict[str, Any]) -> int:
+        """Get the week number (relative to start date) of a variable."""
+        week = var.get("week")
+        if week is None:
+            week = (var["date"] - self.start_date).days // 7
+        return week
+
+    def day_index_of(self, var: Dict[str, Any]) -> int:
+        """Get the day offset (relative to start date) of a variable."""
+        day_index = var.get("day_index")
+        if day_index is None:
+            day_index = (var["date"].date() - self.start_date.date()).days
+        return day_index
+
+    @property
+    def by_class(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Variables grouped by class name."""
+        if "by_class" not in self._views:
+            by_class = defaultdict(list)
+            for var in self.variables:
+                by_class[var.get("name")].append(var)
+            self._views["by_class"] = dict(by_class)
+        return self._views["by_class"]
+
+    @property
+    def by_date(self) -> Dict[Any, List[Dict[str, Any]]]:
+        """Variables grouped by calendar date."""
+        if "by_date" not in self._views:
+            by_date = defaultdict(list)
+            for var in self.variables:
+                by_date[var["date"].date()].append(var)
+            self._views["by_date"] = dict(by_date)
+        return self._views["by_date"]
+
+    @property
+    def by_week(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Variables grouped by week number."""
+        if "by_week" not in self._views:
+            by_week = defaultdict(list)
+            for var in self.variables:
+                by_week[self.week_of(var)].append(var)
+            self._views["by_week"] = dict(by_week)
+        return self._views["by_week"]
+
+    @property
+    def by_week_day(self) -> Dict[int, Dict[int, List[Dict[str, Any]]]]:
+        """Variables grouped by week number, then weekday (Monday = 0)."""
+        if "by_week_day" not in self._views:
+            by_week_day = defaultdict(lambda: defaultdict(list))
+            for var in self.variables:
+                by_week_day[self.week_of(var)][var["date"].weekday()].append(var)
+            self._views["by_week_day"] = {
+                week: dict(days) for week, days in by_week_day.items()
+            }
+        return self._views["by_week_day"]
+
+    @property
+    def by_date_period(self) -> Dict[Any, Dict[int, List[Dict[str, Any]]]]:
+        """Variables grouped by calendar date, then period."""
+        if "by_date_period" not in self._views:
+            by_date_period = defaultdict(lambda: defaultdict(list))
+            for var in self.variables:
+                by_date_period[var["date"].date()][var["period"]].append(var)
+            self._views["by_date_period"] = {
+                date: dict(periods) for date, periods in by_date_period.items()
+            }
+        return self._views["by_date_period"]
+
+    @property
+    def by_class_date(self) -> Dict[str, Dict[Any, List[Dict[str, Any]]]]:
+        """Variables grouped by class name, then calendar date."""
+        if "by_class_date" not in self._views:
+            by_class_date = defaultdict(lambda: defaultdict(list))
+            for var in self.variables:
+                by_class_date[var.get("name")][var["date"].date()].append(var)
+            self._views["by_class_date"] = {
+                name: dict(dates) for name, dates in by_class_date.items()
+            }
+        return self._views["by_class_date"]
+
+    @property
+    def weekdays_by_week(self) -> Dict[int, int]:
+        """Number of distinct weekdays (Mon-Fri) with variables in each week."""
+        if "weekdays_by_week" not in self._views:
+            dates_by_week = defaultdict(set)
+            for week, days in self.by_week_day.items():
+                for weekday, day_vars in days.items():
+                    if weekday < 5:
+                        dates_by_week[week].update(var["date"].date() for var in day_vars)
+            self._views["weekdays_by_week"] = {
+                week: len(dates) for week, dates in dates_by_week.items()
+            }
+        return self._views["weekdays_by_week"]
+
+    @property
+    def total_weeks(self) -> int:
+        """Number of weeks spanned by the variables."""
+        return max(self.by_week.keys()) + 1 if self.by_week else 0
+
+    @property
+    def class_index(self) -> Dict[str, int]:
+        """Dense index for each class name (request order first)."""
+        if "class_index" not in self._views:
+            class_index = {name: i for i, name in enumerate(self._class_names)}
+            for var in self.variables:
+                name = var.get("name")
+                if name not in class_index:
+                    class_index[name] = len(class_index)
+            self._views["class_index"] = class_index
+        return self._views["class_index"]
+
+    @property
+    def grid(self) -> List[List[List[Optional[Dict[str, Any]]]]]:
+        """
+        Dense class x day x period tensor of variables.
+
+        Slots without a variable (weekends, conflicts, pruned slots) are None.
+        Periods are stored at index period - 1.
+        """
+        if "grid" not in self._views:
+            class_index = self.class_index
+            num_days = 1 + max((self.day_index_of(var) for var in self.variables), default=-1)
+            grid = [
+                [[None] * PERIODS_PER_DAY for _ in range(num_days)]
+                for _ in range(len(class_index))
+            ]
+            for var in self.variables:
+                grid[class_index[var.get("name")]][self.day_index_of(var)][var["period"] - 1] = var
+            self._views["grid"] = grid
+        return self._views["grid"]
+
+    def get(self, class_name: str, day_index: int, period: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up the variable for a class, day offset and period.
+
+        Returns:
+            The variable dictionary, or None if no variable exists for the slot
+        """
+        c = self.class_index.get(class_name)
+        if c is None or day_index < 0 or not 1 <= period <= PERIODS_PER_DAY:
+            return None
+        days = self.grid[c]
+        if day_index >= len(days):
+            return None
+        return days[day_index][period - 1]
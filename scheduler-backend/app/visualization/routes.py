@@ -7,6 +7,7 @@ from pydantic import ValidationError
 
 from ..models import ScheduleRequest, ScheduleResponse
 from ..scheduling.solvers.solver import UnifiedSolver
+from ..scheduling.solvers.executor import SolverBusyError, get_solve_executor
 from .dashboard import (
     create_dashboard_data,
     compare_schedules
@@ -32,10 +33,6 @@ router = APIRouter(
     }
 )
 
-# Create solver instances
-stable_solver = UnifiedSolver(use_genetic=False)  # Stable uses only OR-Tools
-dev_solver = UnifiedSolver(use_genetic=True)      # Dev uses genetic algorithm
-
 # Store recent schedules for history
 schedule_history: Dict[str, Dict[str, Any]] = {}
 
@@ -61,8 +58,9 @@ async def analyze_schedule(
         Dashboard data with visualizations and metrics
     """
     try:
-        # Choose solver based on type
-        solver = stable_solver if solver_type == "stable" else dev_solver
+        # Choose solver based on type; solvers keep per-run state, so each
+        # request gets its own (stable uses only OR-Tools)
+        solver = UnifiedSolver(use_genetic=solver_type != "stable")
         
         # Debugging: Print request details
         logger.info(f"Analyzing schedule with {len(request.classes)} classes from {request.startDate} to {request.endDate}")
@@ -71,7 +69,10 @@ async def analyze_schedule(
         try:
             # Create schedule
             logger.info("About to call solver.solve()")
-            schedule = solver.solve(request)
+            # Re-analysis of an unchanged request reuses the earlier schedule
+            schedule = solver.get_cached_response(request, count_miss=False)
+            if schedule is None:
+                schedule = await get_solve_executor().solve(solver, request)
             logger.info("Solver.solve() completed successfully")
             
             # Debugging: Print schedule metadata
@@ -115,6 +116,11 @@ async def analyze_schedule(
             
             return dashboard_data
                 
+        except SolverBusyError as e:
+            raise HTTPException(
+                status_code=503,
+                detail={"message": str(e)}
+            )
         except Exception as e:
             logger.error(f"Error solving schedule: {str(e)}")
             logger.error(f"Schedule: {schedule}")
@@ -133,6 +139,8 @@ async def analyze_schedule(
                 "errors": [{"msg": err["msg"], "loc": err["loc"]} for err in e.errors()]
             }
         )
+    except HTTPException:
+        raise
     except Exception as e:
         # Print metadata for debugging
         import inspect
@@ -6,13 +6,28 @@ This script runs comprehensive benchmarks for the genetic algorithm components
 of the Gym Class Rotation Scheduler and generates visualizations and reports.
 
 Usage:
-    python run_ga_benchmarks.py [--dataset] [--parameters] [--parallel] [--quick]
+    python run_ga_benchmarks.py [--dataset] [--parameters] [--parallel] [--fitness]
+                                [--cache] [--pool] [--islands] [--diversity]
+                                [--initialization] [--repair] [--mutation]
+                                [--order-crossover] [--local-search] [--checkpoint]
+                                [--quick]
 
 Options:
-    --dataset       Run dataset scaling benchmarks
-    --parameters    Run parameter sensitivity benchmarks
-    --parallel      Run parallel scaling benchmarks
-    --quick         Run quick versions of benchmarks (fewer iterations)
+    --dataset           Run dataset scaling benchmarks
+    --parameters        Run parameter sensitivity benchmarks
+    --parallel          Run parallel scaling benchmarks
+    --fitness           Run fitness evaluation benchmarks
+    --cache             Run fitness cache benchmarks
+    --pool              Run fitness worker pool benchmarks
+    --islands           Run island model scaling benchmarks
+    --diversity         Run diversity metric benchmarks
+    --initialization    Run population initialization benchmarks
+    --repair            Run offspring repair benchmarks
+    --mutation          Run mutation operator benchmarks
+    --order-crossover   Run order crossover microbenchmarks
+    --local-search      Run local search benchmarks
+    --checkpoint        Run checkpoint benchmarks
+    --quick             Run quick versions of benchmarks (fewer iterations)
     
 If no options are specified, all benchmarks will be run.
 """
@@ -31,7 +46,18 @@ sys.path.insert(0, str(script_dir))
 from tests.performance.ga_benchmarks import (
     benchmark_dataset_scaling,
     benchmark_parameter_sensitivity,
-    benchmark_parallel_scaling
+    benchmark_parallel_scaling,
+    benchmark_fitness_evaluation,
+    benchmark_fitness_cache,
+    benchmark_worker_pool,
+    benchmark_island_scaling,
+    benchmark_diversity_metrics,
+    benchmark_initialization,
+    benchmark_repair,
+    benchmark_mutation,
+    benchmark_order_crossover,
+    benchmark_local_search,
+    benchmark_checkpoint
 )
 from tests.performance.perf_utils import (
     analyze_performance_results,
@@ -45,6 +71,17 @@ def parse_args():
     parser.add_argument("--dataset", action="store_true", help="Run dataset scaling benchmarks")
     parser.add_argument("--parameters", action="store_true", help="Run parameter sensitivity benchmarks")
     parser.add_argument("--parallel", action="store_true", help="Run parallel scaling benchmarks")
+    parser.add_argument("--fitness", action="store_true", help="Run fitness evaluation benchmarks")
+    parser.add_argument("--cache", action="store_true", help="Run fitness cache benchmarks")
+    parser.add_argument("--pool", action="store_true", help="Run fitness worker pool benchmarks")
+    parser.add_argument("--islands", action="store_true", help="Run island model scaling benchmarks")
+    parser.add_argument("--diversity", action="store_true", help="Run diversity metric benchmarks")
+    parser.add_argument("--initialization", action="store_true", help="Run population initialization benchmarks")
+    parser.add_argument("--repair", action="store_true", help="Run offspring repair benchmarks")
+    parser.add_argument("--mutation", action="store_true", help="Run mutation operator benchmarks")
+    parser.add_argument("--order-crossover", action="store_true", help="Run order crossover microbenchmarks")
+    parser.add_argument("--local-search", action="store_true", help="Run local search benchmarks")
+    parser.add_argument("--checkpoint", action="store_true", help="Run checkpoint benchmarks")
     parser.add_argument("--quick", action="store_true", help="Run quick versions of benchmarks")
     return parser.parse_args()
 
@@ -223,7 +260,7 @@ def main():
     args = parse_args()
     
     # Determine which benchmarks to run
-    run_all = not (args.dataset or args.parameters or args.parallel)
+    run_all = not (args.dataset or args.parameters or args.parallel or args.fitness or args.cache or args.pool or args.islands or args.diversity or args.initialization or args.repair or args.mutation or args.order_crossover or args.local_search or args.checkpoint)
     
     if run_all or args.dataset:
         print("\n=== Running Dataset Scaling Benchmark ===\n")
@@ -237,6 +274,50 @@ def main():
         print("\n=== Running Parallel Scaling Benchmark ===\n")
         benchmark_parallel_scaling()
     
+    if run_all or args.fitness:
+        print("\n=== Running Fitness Evaluation Benchmark ===\n")
+        benchmark_fitness_evaluation(generations=5 if args.quick else 20)
+    
+    if run_all or args.cache:
+        print("\n=== Running Fitness Cache Benchmark ===\n")
+        benchmark_fitness_cache(generations=5 if args.quick else 20)
+    
+    if run_all or args.pool:
+        print("\n=== Running Worker Pool Benchmark ===\n")
+        benchmark_worker_pool(generations=3 if args.quick else 10)
+    
+    if run_all or args.islands:
+        print("\n=== Running Island Scaling Benchmark ===\n")
+        benchmark_island_scaling(generations=10 if args.quick else 20)
+    
+    if run_all or args.diversity:
+        print("\n=== Running Diversity Metric Benchmark ===\n")
+        benchmark_diversity_metrics(repeats=1 if args.quick else 3)
+    
+    if run_all or args.initialization:
+        print("\n=== Running Initialization Benchmark ===\n")
+        benchmark_initialization(generations=15 if args.quick else 40)
+    
+    if run_all or args.repair:
+        print("\n=== Running Repair Benchmark ===\n")
+        benchmark_repair(generations=3 if args.quick else 10)
+    
+    if run_all or args.mutation:
+        print("\n=== Running Mutation Operator Benchmark ===\n")
+        benchmark_mutation(time_budget=3.0 if args.quick else 10.0)
+    
+    if run_all or args.order_crossover:
+        print("\n=== Running Order Crossover Benchmark ===\n")
+        benchmark_order_crossover(repeats=50 if args.quick else 200)
+    
+    if run_all or args.local_search:
+        print("\n=== Running Local Search Benchmark ===\n")
+        benchmark_local_search(generations=15 if args.quick else 40)
+    
+    if run_all or args.checkpoint:
+        print("\n=== Running Checkpoint Benchmark ===\n")
+        benchmark_checkpoint(repeats=2 if args.quick else 5)
+    
     # Generate visualizations from results
     print("\n=== Generating Visualizations ===\n")
     generate_visualizations()
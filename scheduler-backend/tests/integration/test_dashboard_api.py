@@ -13,13 +13,24 @@ from tests.utils.generators import (
 
 client = TestClient(app)
 
+def create_request(num_classes: int) -> ScheduleRequest:
+    """
+    Create a one-week request for the dashboard.
+    
+    The latency profile stops at a 5% gap; the default quality profile
+    searches for the optimum until its 300s time limit.
+    """
+    request = ScheduleRequestGenerator.create_request(
+        num_classes=num_classes,
+        num_weeks=1
+    )
+    request.solverProfile = "latency"
+    return request
+
 @pytest.fixture
 def test_schedule_request():
     """Create a simple schedule request for testing."""
-    return ScheduleRequestGenerator.create_request(
-        num_classes=2,
-        num_weeks=1
-    )
+    return create_request(2)
 
 def test_analyze_schedule(test_schedule_request):
     """Test analyzing a schedule and generating dashboard data."""
@@ -63,10 +74,7 @@ def test_analyze_schedule(test_schedule_request):
 def test_get_schedule_history():
     """Test retrieving schedule history."""
     # First analyze a schedule to have something in history
-    request = ScheduleRequestGenerator.create_request(
-        num_classes=1,
-        num_weeks=1
-    )
+    request = create_request(1)
     client.post(
         "/dashboard/analyze",
         json=request.model_dump(),
@@ -94,10 +102,7 @@ def test_get_schedule_history():
 def test_get_chart_data():
     """Test retrieving chart data for a specific schedule."""
     # First analyze a schedule to have something in history
-    request = ScheduleRequestGenerator.create_request(
-        num_classes=1,
-        num_weeks=1
-    )
+    request = create_request(1)
     analyze_response = client.post(
         "/dashboard/analyze",
         json=request.model_dump(),
@@ -141,10 +146,7 @@ def test_get_chart_data():
 def test_get_schedule_metrics():
     """Test retrieving metrics for a specific schedule."""
     # First analyze a schedule to have something in history
-    request = ScheduleRequestGenerator.create_request(
-        num_classes=1,
-        num_weeks=1
-    )
+    request = create_request(1)
     analyze_response = client.post(
         "/dashboard/analyze",
         json=request.model_dump(),
@@ -180,10 +182,7 @@ def test_compare_schedules():
     print("\n----- test_compare_schedules: Starting test -----")
     
     try:
-        request1 = ScheduleRequestGenerator.create_request(
-            num_classes=2,
-            num_weeks=1
-        )
+        request1 = create_request(2)
         print(f"Created request1 with {len(request1.classes)} classes")
         print(f"Request1 classes: {[c.name for c in request1.classes]}")
         print(f"Request1 date range: {request1.startDate} to {request1.endDate}")
@@ -214,10 +213,7 @@ def test_compare_schedules():
     time.sleep(1)
     
     # Create a slightly different request
-    request2 = ScheduleRequestGenerator.create_request(
-        num_classes=2,  # Different number of classes
-        num_weeks=1
-    )
+    request2 = create_request(2)  # Different number of classes
     analyze_response2 = client.post(
         "/dashboard/analyze",
         json=request2.model_dump(),
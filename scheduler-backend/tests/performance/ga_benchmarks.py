@@ -3,13 +3,17 @@
 This module contains benchmarks specifically for the genetic algorithm components,
 measuring performance across various dataset sizes and parameter combinations.
 """
+import math
 import pytest
+import random
 import time
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple, Optional
 import itertools
+import numpy as np
+import multiprocessing
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -18,9 +22,19 @@ from app.models import (
     ScheduleResponse,
     WeightConfig,
     ScheduleMetadata,
-    ScheduleConstraints
+    ScheduleConstraints,
+    TimeSlot
 )
 from app.scheduling.solvers.genetic.optimizer import GeneticOptimizer
+from app.scheduling.solvers.genetic.population import PopulationManager
+from app.scheduling.solvers.genetic.checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from app.scheduling.solvers.genetic.chromosome import MUTATION_METHODS, ScheduleChromosome
+from app.scheduling.solvers.genetic.fitness import FitnessCalculator
+from app.scheduling.solvers.genetic.fitness_cache import FitnessCache
+from app.scheduling.solvers.genetic.fitness_pool import FitnessWorkerPool
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.islands import IslandModel, IslandSettings
+from app.scheduling.solvers.genetic.local_search import local_search
 from tests.utils.generators import ScheduleRequestGenerator
 from tests.utils.assertions import assert_valid_schedule
 
@@ -72,14 +86,13 @@ def create_test_request(
 def get_default_weight_config() -> WeightConfig:
     """Get default weight configuration for testing."""
     return WeightConfig(
-        required_periods=1.0,
-        preferred_periods=0.7,
-        consecutive_periods=0.5,
-        daily_balance=0.3,
-        weekly_balance=0.3,
-        equipment_matching=0.8,
-        instructor_availability=1.0,
-        grade_mixing=0.4
+        final_week_compression=3000,
+        day_usage=2000,
+        daily_balance=1500,
+        preferred_periods=1000,
+        distribution=1000,
+        avoid_periods=-500,
+        earlier_dates=10
     )
 
 
@@ -308,6 +321,932 @@ def benchmark_parallel_scaling(save_results: bool = True) -> Dict[str, Any]:
     return {"worker_counts": worker_counts, "results": results}
 
 
+def benchmark_fitness_evaluation(
+    save_results: bool = True,
+    generations: int = 20,
+    population_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Benchmark generations per second with per-chromosome, batch and incremental fitness.
+    
+    Every generation is scored all three ways before the population evolves,
+    so every mode sees the same chromosomes. Batch scores must match the
+    per-chromosome ones exactly, incremental ones up to rounding. The
+    incremental mode also reports the full evaluations it avoided per
+    generation by reusing or updating parent fitness states.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations to evolve per dataset
+        population_size: Size of the population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("fitness_evaluation", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    class_counts = [5, 10, 20]
+    results = []
+    
+    for num_classes in class_counts:
+        print(f"\nBenchmarking fitness evaluation with {num_classes} classes...")
+        request = create_test_request(num_classes, num_weeks=4)
+        request.constraints.maxClassesPerWeek = num_classes * 5
+        random.seed(0)
+        manager = PopulationManager(
+            size=population_size,
+            request=request,
+            crossover_methods=["single_point", "two_point", "uniform", "order"]
+        )
+        calculator = FitnessCalculator(request, weights)
+        incremental = FitnessCalculator(request, weights, compiled=manager.compiled)
+        
+        scalar_seconds = batch_seconds = incremental_seconds = evolve_seconds = 0.0
+        avoided = []
+        for _ in range(generations):
+            start = time.perf_counter()
+            scalar_scores = [calculator.calculate_fitness(c) for c in manager.population]
+            scalar_seconds += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            batch_scores = calculator.calculate_population_fitness(manager.population)
+            batch_seconds += time.perf_counter() - start
+            
+            if batch_scores != scalar_scores:
+                raise AssertionError("Batch fitness differs from per-chromosome fitness")
+            
+            before = dict(incremental.incremental_stats)
+            start = time.perf_counter()
+            incremental_scores = incremental.calculate_incremental_fitness(manager.population)
+            incremental_seconds += time.perf_counter() - start
+            
+            if not all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+                       for a, b in zip(incremental_scores, scalar_scores)):
+                raise AssertionError("Incremental fitness differs from per-chromosome fitness")
+            stats = incremental.incremental_stats
+            avoided.append(
+                stats["reused"] - before["reused"] + stats["incremental"] - before["incremental"]
+            )
+            for chromosome, fitness in zip(manager.population, batch_scores):
+                chromosome.fitness = fitness
+            
+            start = time.perf_counter()
+            manager.evolve()
+            evolve_seconds += time.perf_counter() - start
+        
+        result = {
+            "num_classes": num_classes,
+            "genes": len(manager.population[0].gene_array),
+            "population_size": population_size,
+            "scalar_generations_per_second": generations / (scalar_seconds + evolve_seconds),
+            "batch_generations_per_second": generations / (batch_seconds + evolve_seconds),
+            "incremental_generations_per_second": generations / (incremental_seconds + evolve_seconds),
+            "fitness_speedup": scalar_seconds / batch_seconds if batch_seconds else 0.0,
+            "evaluations_avoided_per_generation": avoided,
+            "avg_evaluations_avoided": sum(avoided) / len(avoided) if avoided else 0.0,
+            "incremental_stats": dict(incremental.incremental_stats)
+        }
+        print(
+            f"  {result['genes']} genes: {result['scalar_generations_per_second']:.1f} -> "
+            f"{result['batch_generations_per_second']:.1f} (batch) / "
+            f"{result['incremental_generations_per_second']:.1f} (incremental) generations/s "
+            f"(fitness {result['fitness_speedup']:.1f}x faster)"
+        )
+        print(
+            f"  Full evaluations avoided per generation: {result['avg_evaluations_avoided']:.1f} "
+            f"of {population_size} ({result['incremental_stats']})"
+        )
+        results.append(result)
+        tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"class_counts": class_counts, "results": results}
+
+
+def benchmark_fitness_cache(
+    save_results: bool = True,
+    generations: int = 20,
+    population_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Benchmark batch fitness with and without the fitness cache.
+    
+    Populations evolve at the default rates ("exploring") and at the low
+    rates the adaptive controller settles on once a population has
+    converged ("converged"), where elites, clones and repeated individuals
+    make up more of each generation. Cached scores must match the batch
+    scores exactly.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations to evolve per regime
+        population_size: Size of the population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("fitness_cache", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    regimes = [("exploring", 0.1, 0.8), ("converged", 0.01, 0.3)]
+    results = []
+    
+    for regime, mutation_rate, crossover_rate in regimes:
+        print(f"\nBenchmarking fitness cache while {regime}...")
+        request = create_test_request(10, num_weeks=4)
+        request.constraints.maxClassesPerWeek = 50
+        random.seed(0)
+        manager = PopulationManager(
+            size=population_size,
+            request=request,
+            mutation_rate=mutation_rate,
+            crossover_rate=crossover_rate,
+            crossover_methods=["single_point", "two_point", "uniform", "order"]
+        )
+        calculator = FitnessCalculator(request, weights, compiled=manager.compiled)
+        cache = FitnessCache(max_entries=4096)
+        
+        batch_seconds = cached_seconds = 0.0
+        for _ in range(generations):
+            population = manager.population
+            start = time.perf_counter()
+            batch_scores = calculator.calculate_population_fitness(population)
+            batch_seconds += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            keys, scores = cache.lookup(population)
+            missed = [i for i, fitness in enumerate(scores) if fitness is None]
+            if missed:
+                missed_scores = calculator.calculate_population_fitness(
+                    [population[i] for i in missed]
+                )
+                cache.store([keys[i] for i in missed], missed_scores)
+                for i, fitness in zip(missed, missed_scores):
+                    scores[i] = fitness
+            cached_seconds += time.perf_counter() - start
+            
+            if scores != batch_scores:
+                raise AssertionError("Cached fitness differs from batch fitness")
+            for chromosome, fitness in zip(population, batch_scores):
+                chromosome.fitness = fitness
+            manager.evolve()
+        
+        stats = cache.get_stats()
+        result = {
+            "regime": regime,
+            "mutation_rate": mutation_rate,
+            "crossover_rate": crossover_rate,
+            "population_size": population_size,
+            "hit_rate": stats["hit_rate"],
+            "batch_ms_per_generation": batch_seconds * 1000 / generations,
+            "cached_ms_per_generation": cached_seconds * 1000 / generations,
+            "fitness_speedup": batch_seconds / cached_seconds if cached_seconds else 0.0
+        }
+        print(
+            f"  Hit rate {result['hit_rate']:.1%}: {result['batch_ms_per_generation']:.2f} ms -> "
+            f"{result['cached_ms_per_generation']:.2f} ms per generation "
+            f"({result['fitness_speedup']:.2f}x)"
+        )
+        results.append(result)
+        tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"results": results}
+
+
+def benchmark_worker_pool(
+    save_results: bool = True,
+    generations: int = 10,
+    population_size: int = 400
+) -> Dict[str, Any]:
+    """
+    Benchmark fitness scoring in the worker pool with 1, 2, 4 and N workers.
+    
+    The same evolved generations are scored in this process and by pools
+    of each size, with workers scoring their batches per chromosome or in
+    one vectorized pass, and receiving gene arrays pickled or through
+    shared memory. Pool start-up is excluded, since a pool lives for a
+    whole run. N is the number of CPUs.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations to score per configuration
+        population_size: Size of the population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("worker_pool", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    request = create_test_request(20, num_weeks=4)
+    request.constraints.maxClassesPerWeek = 100
+    random.seed(0)
+    manager = PopulationManager(
+        size=population_size,
+        request=request,
+        crossover_methods=["single_point", "two_point", "uniform", "order"]
+    )
+    calculator = FitnessCalculator(request, weights, compiled=manager.compiled)
+    populations = []
+    for _ in range(generations):
+        populations.append(list(manager.population))
+        for chromosome, fitness in zip(manager.population, calculator.calculate_population_fitness(manager.population)):
+            chromosome.fitness = fitness
+        manager.evolve()
+    
+    worker_counts = sorted({1, 2, 4, multiprocessing.cpu_count()})
+    results = []
+    
+    for vectorized, shared in itertools.product((False, True), (False, True)):
+        mode = "vectorized" if vectorized else "per chromosome"
+        transport = "shared memory" if shared else "pickled"
+        print(f"\nBenchmarking worker pool scoring {mode}, {transport}...")
+        score = calculator.calculate_population_fitness if vectorized else (
+            lambda population: [calculator.calculate_fitness(c) for c in population]
+        )
+        start = time.perf_counter()
+        expected = [score(population) for population in populations]
+        local_seconds = time.perf_counter() - start
+        
+        for workers in worker_counts:
+            with FitnessWorkerPool(
+                manager.compiled, weights, max_workers=workers, vectorized=vectorized, shared_memory=shared
+            ) as pool:
+                pool.score(populations[0])  # Start the workers
+                start = time.perf_counter()
+                scores = [pool.score(population) for population in populations]
+                pool_seconds = time.perf_counter() - start
+            
+            if scores != expected:
+                raise AssertionError("Worker pool fitness differs from in-process fitness")
+            result = {
+                "mode": mode,
+                "transport": transport,
+                "workers": workers,
+                "population_size": population_size,
+                "local_ms_per_generation": local_seconds * 1000 / generations,
+                "pool_ms_per_generation": pool_seconds * 1000 / generations,
+                "speedup": local_seconds / pool_seconds if pool_seconds else 0.0
+            }
+            print(
+                f"  {workers} workers: {result['local_ms_per_generation']:.2f} ms -> "
+                f"{result['pool_ms_per_generation']:.2f} ms per generation ({result['speedup']:.2f}x)"
+            )
+            results.append(result)
+            tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"worker_counts": worker_counts, "results": results}
+
+
+def benchmark_island_scaling(
+    save_results: bool = True,
+    generations: int = 20,
+    population_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Benchmark island model throughput with 1, 2, 4 and N island processes.
+    
+    Every island evolves a full population, so N islands do N times the
+    work of one; with a core per island the time per generation should
+    stay flat. Throughput is island generations per second, compared with
+    a single island evolving in this process. N is the number of CPUs.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations each island evolves
+        population_size: Size of each island's population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("island_scaling", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    request = create_test_request(10, num_weeks=4)
+    request.constraints.maxClassesPerWeek = 50
+    compiled = CompiledRequest(request)
+    
+    def run(islands: int, use_processes: bool) -> Tuple[float, float]:
+        settings = [
+            IslandSettings(
+                population_size=population_size,
+                crossover_methods=["single_point", "two_point", "uniform", "order"],
+                seed=index
+            )
+            for index in range(islands)
+        ]
+        with IslandModel(compiled, weights, settings, use_processes=use_processes) as model:
+            start = time.perf_counter()
+            reports = []
+            for _ in range(0, generations, 10):
+                reports = model.run_epoch(10)
+            seconds = time.perf_counter() - start
+        return seconds, max(report.best_fitness for report in reports)
+    
+    baseline_seconds, _ = run(1, use_processes=False)
+    baseline_rate = generations / baseline_seconds
+    print(f"\nSingle island in this process: {baseline_rate:.1f} generations/s")
+    
+    island_counts = sorted({1, 2, 4, multiprocessing.cpu_count()})
+    results = []
+    for islands in island_counts:
+        print(f"\nBenchmarking {islands} island processes...")
+        seconds, best_fitness = run(islands, use_processes=True)
+        rate = islands * generations / seconds
+        result = {
+            "islands": islands,
+            "population_size": population_size,
+            "generations": generations,
+            "island_generations_per_second": rate,
+            "speedup": rate / baseline_rate,
+            "best_fitness": best_fitness
+        }
+        print(f"  {rate:.1f} island generations/s ({result['speedup']:.2f}x), best fitness {best_fitness:.1f}")
+        results.append(result)
+        tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"island_counts": island_counts, "baseline_generations_per_second": baseline_rate, "results": results}
+
+
+def benchmark_diversity_metrics(
+    save_results: bool = True,
+    repeats: int = 3,
+    samples: int = 1000
+) -> Dict[str, Any]:
+    """
+    Benchmark the population diversity metrics against the exact pairwise one.
+    
+    Times each metric on random populations of growing size and gene count,
+    reporting the speedup over the pairwise metric and the difference from
+    its value.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        repeats: Calls timed per metric and population
+        samples: Pairs compared by the sampled metric
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("diversity_metrics", save_results)
+    tracker.start()
+    
+    configurations = [(50, 20), (100, 40), (200, 100)]  # (population, classes)
+    results = []
+    
+    for population_size, num_classes in configurations:
+        request = create_test_request(num_classes, num_weeks=4)
+        request.constraints.maxClassesPerWeek = num_classes * 5
+        random.seed(0)
+        manager = PopulationManager(size=population_size, request=request, diversity_samples=samples)
+        genes = len(manager.population[0].gene_array)
+        print(f"\nBenchmarking diversity of {population_size} chromosomes x {genes} genes...")
+        
+        timings = {}
+        values = {}
+        for metric in ("pairwise", "frequency", "sampled"):
+            manager.diversity_metric = metric
+            start = time.perf_counter()
+            for _ in range(repeats):
+                values[metric] = manager.get_diversity()
+            timings[metric] = (time.perf_counter() - start) * 1000 / repeats
+        
+        for metric in ("frequency", "sampled"):
+            result = {
+                "metric": metric,
+                "population_size": population_size,
+                "genes": genes,
+                "pairwise_ms": timings["pairwise"],
+                "metric_ms": timings[metric],
+                "speedup": timings["pairwise"] / timings[metric] if timings[metric] else 0.0,
+                "abs_error": abs(values[metric] - values["pairwise"])
+            }
+            print(
+                f"  {metric}: {result['pairwise_ms']:.1f} ms -> {result['metric_ms']:.2f} ms "
+                f"({result['speedup']:.0f}x), error {result['abs_error']:.2e}"
+            )
+            results.append(result)
+            tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"configurations": configurations, "results": results}
+
+
+def benchmark_initialization(
+    save_results: bool = True,
+    generations: int = 40,
+    population_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Benchmark random against constraint-aware initial populations.
+    
+    Populations start random, half greedy or fully greedy (see
+    greedy_gene_array). For each, reports the share of valid initial
+    chromosomes, the time to build them, the best initial fitness, and the
+    generations evolution takes to reach the best fitness the random
+    population reaches in ``generations`` generations. A population
+    without a valid chromosome cannot evolve (PopulationManager.evolve
+    keeps only valid children), so it is not evolved.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations each population evolves
+        population_size: Size of each population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("initialization", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    strategies = [("random", 0.0), ("mixed", 0.5), ("greedy", 1.0)]
+    results = []
+    
+    for num_classes, max_per_day in ((10, 4), (20, 6)):
+        request = create_test_request(num_classes, num_weeks=4)
+        request.constraints.maxClassesPerDay = max_per_day
+        request.constraints.maxClassesPerWeek = num_classes + 5
+        compiled = CompiledRequest(request)
+        calculator = FitnessCalculator(request, weights, compiled=compiled)
+        print(f"\nBenchmarking initialization of {num_classes} classes...")
+        
+        def score(manager: PopulationManager) -> List[float]:
+            scores = calculator.calculate_population_fitness(manager.population)
+            for chromosome, fitness in zip(manager.population, scores):
+                chromosome.fitness = fitness
+            return scores
+        
+        runs = {}
+        for strategy, greedy_fraction in strategies:
+            random.seed(0)
+            start = time.perf_counter()
+            manager = PopulationManager(
+                size=population_size,
+                request=request,
+                crossover_methods=["single_point", "two_point", "uniform", "order"],
+                compiled=compiled,
+                greedy_fraction=greedy_fraction
+            )
+            init_ms = (time.perf_counter() - start) * 1000
+            scores = score(manager)
+            valid_fraction = sum(fitness > float('-inf') for fitness in scores) / len(scores)
+            history = [max(scores)]
+            if valid_fraction:
+                for _ in range(generations):
+                    manager.evolve()
+                    history.append(max(score(manager)))
+            runs[strategy] = (init_ms, valid_fraction, history)
+        
+        # Without a valid random chromosome there is no target to reach
+        target = runs["random"][2][-1]
+        for strategy, _ in strategies:
+            init_ms, valid_fraction, history = runs[strategy]
+            reached = None
+            if target > float('-inf'):
+                reached = next((generation for generation, best in enumerate(history) if best >= target), None)
+            result = {
+                "num_classes": num_classes,
+                "strategy": strategy,
+                "init_ms": init_ms,
+                "valid_fraction": valid_fraction,
+                "initial_best": history[0],
+                "final_best": history[-1],
+                "target_fitness": target,
+                "generations_to_target": reached
+            }
+            print(
+                f"  {strategy}: {valid_fraction:.0%} valid, init {init_ms:.1f} ms, "
+                f"best {history[0]:.1f} -> {history[-1]:.1f}, "
+                f"random's final best {target:.1f} reached at generation {reached}"
+            )
+            results.append(result)
+            tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"strategies": [strategy for strategy, _ in strategies], "results": results}
+
+
+def benchmark_repair(
+    save_results: bool = True,
+    generations: int = 10,
+    population_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Benchmark generation time with and without repair of invalid children.
+    
+    Without repair, invalid children are drawn again until the attempt
+    budget runs out and the rest of the population is filled with invalid
+    children. With repair, invalid children have their offending genes
+    moved to the nearest slots that fit. Constraints tighten through
+    lower maxClassesPerDay; populations start random.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations evolved per configuration
+        population_size: Size of the population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("repair", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    num_classes = 20
+    results = []
+    
+    for max_per_day in (8, 6, 5):
+        request = create_test_request(num_classes, num_weeks=4)
+        request.constraints.maxClassesPerDay = max_per_day
+        request.constraints.maxClassesPerWeek = num_classes + 5
+        compiled = CompiledRequest(request)
+        calculator = FitnessCalculator(request, weights, compiled=compiled)
+        print(f"\nBenchmarking repair at maxClassesPerDay={max_per_day}...")
+        
+        for repair_moves in (0, 50):
+            random.seed(0)
+            manager = PopulationManager(
+                size=population_size,
+                request=request,
+                crossover_methods=["single_point", "two_point", "uniform", "order"],
+                compiled=compiled,
+                repair_moves=repair_moves
+            )
+            scores = calculator.calculate_population_fitness(manager.population)
+            generation_times = []
+            for _ in range(generations):
+                for chromosome, fitness in zip(manager.population, scores):
+                    chromosome.fitness = fitness
+                start = time.perf_counter()
+                manager.evolve()
+                generation_times.append((time.perf_counter() - start) * 1000)
+                scores = calculator.calculate_population_fitness(manager.population)
+            
+            stats = manager.get_repair_stats()
+            result = {
+                "max_classes_per_day": max_per_day,
+                "repair": bool(repair_moves),
+                "ms_per_generation": sum(generation_times) / generations,
+                "max_ms_per_generation": max(generation_times),
+                "valid_fraction": sum(fitness > float('-inf') for fitness in scores) / len(scores),
+                "best_fitness": max(scores),
+                "invalid_children": stats["invalid"],
+                "admitted_invalid": stats["admitted_invalid"],
+                "repair_rate": stats["repair_rate"]
+            }
+            print(
+                f"  repair={result['repair']}: {result['ms_per_generation']:.0f} ms/generation "
+                f"(max {result['max_ms_per_generation']:.0f}), {result['valid_fraction']:.0%} valid, "
+                f"best {result['best_fitness']:.1f}, {stats['invalid']} invalid children, "
+                f"{stats['admitted_invalid']} kept invalid"
+            )
+            results.append(result)
+            tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"num_classes": num_classes, "results": results}
+
+
+def benchmark_mutation(
+    save_results: bool = True,
+    time_budget: float = 10.0,
+    population_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Benchmark the structured mutation operators against random mutation.
+    
+    For each operator, mutates copies of valid greedy chromosomes and
+    reports the share of mutants still valid before repair and the time
+    per mutation. Then evolves a random population with each operator
+    alone, and with all of them weighted adaptively, for the same wall-clock
+    budget, reporting the generations reached and the best fitness.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        time_budget: Seconds each population evolves
+        population_size: Size of each population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("mutation", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    num_classes = 20
+    request = create_test_request(num_classes, num_weeks=4)
+    request.constraints.maxClassesPerDay = 6
+    request.constraints.maxClassesPerWeek = num_classes + 5
+    compiled = CompiledRequest(request)
+    calculator = FitnessCalculator(request, weights, compiled=compiled)
+    configurations = [["random"], ["free_slot"], ["swap"], ["shift"], list(MUTATION_METHODS)]
+    
+    print(f"\nBenchmarking mutation operators on {num_classes} classes...")
+    random.seed(0)
+    parents = []
+    for _ in range(population_size):
+        chromosome = ScheduleChromosome(compiled=compiled)
+        chromosome.initialize_greedy()
+        parents.append(chromosome)
+    
+    results = []
+    for methods in configurations:
+        name = "adaptive" if len(methods) > 1 else methods[0]
+        feasible_fraction = mutation_us = None
+        if len(methods) == 1:
+            mutants = [parent.copy() for parent in parents]
+            start = time.perf_counter()
+            for mutant in mutants:
+                mutant.mutate(0.1, methods[0])
+            mutation_us = (time.perf_counter() - start) / len(mutants) * 1e6
+            feasible_fraction = sum(mutant.validate() for mutant in mutants) / len(mutants)
+        
+        random.seed(0)
+        manager = PopulationManager(
+            size=population_size,
+            request=request,
+            crossover_methods=["single_point", "two_point", "uniform", "order"],
+            compiled=compiled,
+            mutation_methods=methods
+        )
+        scores = calculator.calculate_population_fitness(manager.population)
+        start = time.perf_counter()
+        while time.perf_counter() - start < time_budget:
+            for chromosome, fitness in zip(manager.population, scores):
+                chromosome.fitness = fitness
+            manager.evolve()
+            scores = calculator.calculate_population_fitness(manager.population)
+        elapsed = time.perf_counter() - start
+        
+        result = {
+            "operator": name,
+            "feasible_fraction": feasible_fraction,
+            "mutation_us": mutation_us,
+            "generations": manager.generation,
+            "generations_per_second": manager.generation / elapsed,
+            "best_fitness": max(scores),
+            "repair_rate": manager.get_repair_stats()["repair_rate"],
+            "weights": dict(manager.mutation_method_weights)
+        }
+        feasible = f"{feasible_fraction:.0%} feasible mutants, {mutation_us:.0f} us/mutation, " if mutation_us else ""
+        print(
+            f"  {name}: {feasible}{result['generations']} generations in {elapsed:.1f} s, "
+            f"best {result['best_fitness']:.1f}"
+        )
+        results.append(result)
+        tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"num_classes": num_classes, "time_budget": time_budget, "results": results}
+
+
+def benchmark_order_crossover(
+    save_results: bool = True,
+    repeats: int = 200
+) -> Dict[str, Any]:
+    """
+    Microbenchmark order crossover against the position-based crossovers.
+    
+    Times each crossover method on random chromosomes of growing size and
+    reports the time per gene, which stays flat for linear-time methods,
+    and the share of children keeping every class's number of sessions.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        repeats: Crossovers timed per method and size
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("order_crossover", save_results)
+    tracker.start()
+    
+    methods = ["order", "two_point", "uniform"]
+    results = []
+    for num_classes in (10, 50, 100, 200):
+        request = create_test_request(num_classes, num_weeks=4)
+        compiled = CompiledRequest(request)
+        random.seed(0)
+        parents = []
+        for _ in range(2):
+            chromosome = ScheduleChromosome(compiled=compiled)
+            chromosome.initialize_random()
+            parents.append(chromosome)
+        genes = len(parents[0].gene_array)
+        sessions = np.bincount(parents[0].gene_array[:, 0])
+        print(f"\nBenchmarking crossover of {genes} genes...")
+        
+        for method in methods:
+            children = []
+            start = time.perf_counter()
+            for _ in range(repeats):
+                children.extend(parents[0].crossover(parents[1], method=method))
+            crossover_us = (time.perf_counter() - start) / repeats * 1e6
+            kept = sum(
+                (np.bincount(child.gene_array[:, 0], minlength=len(sessions)) == sessions).all()
+                for child in children
+            ) / len(children)
+            result = {
+                "num_classes": num_classes,
+                "genes": genes,
+                "method": method,
+                "crossover_us": crossover_us,
+                "ns_per_gene": crossover_us * 1000 / genes,
+                "sessions_kept": kept
+            }
+            print(
+                f"  {method}: {crossover_us:.1f} us/crossover ({result['ns_per_gene']:.0f} ns/gene), "
+                f"{kept:.0%} of children keep every class's sessions"
+            )
+            results.append(result)
+            tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"methods": methods, "results": results}
+
+
+def benchmark_local_search(
+    save_results: bool = True,
+    generations: int = 40,
+    population_size: int = 50
+) -> Dict[str, Any]:
+    """
+    Benchmark evolution with and without local search on the best chromosomes.
+    
+    Classes get random preferred, avoided and conflicting periods, so
+    single-gene moves have something to improve. Each configuration
+    evolves the same half greedy population, hill-climbing its top
+    chromosomes every ``interval`` generations (see local_search), and
+    reports the generations and seconds taken to reach the best fitness
+    evolution without local search ends with.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        generations: Generations each population evolves
+        population_size: Size of each population
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("local_search", save_results)
+    tracker.start()
+    
+    weights = get_default_weight_config()
+    num_classes = 20
+    request = create_test_request(num_classes, num_weeks=4)
+    request.constraints.maxClassesPerDay = 6
+    request.constraints.maxClassesPerWeek = num_classes + 5
+    rng = random.Random(0)
+    slots = [(day, period) for day in range(1, 6) for period in range(1, 9)]
+    for class_obj in request.classes:
+        picked = rng.sample(slots, 8)
+        class_obj.weeklySchedule.preferredPeriods = [TimeSlot(dayOfWeek=d, period=p) for d, p in picked[:3]]
+        class_obj.weeklySchedule.avoidPeriods = [TimeSlot(dayOfWeek=d, period=p) for d, p in picked[3:6]]
+        class_obj.weeklySchedule.conflicts = [TimeSlot(dayOfWeek=d, period=p) for d, p in picked[6:]]
+    compiled = CompiledRequest(request)
+    calculator = FitnessCalculator(request, weights, compiled=compiled)
+    # (name, interval, top K, neighbours per hill climb)
+    configurations = [("none", 0, 0, 0), ("every 5, top 2", 5, 2, 200), ("every 2, top 4", 2, 4, 200)]
+    print(f"\nBenchmarking local search on {num_classes} classes...")
+    
+    runs = {}
+    for name, interval, top_k, evaluations in configurations:
+        random.seed(0)
+        manager = PopulationManager(
+            size=population_size,
+            request=request,
+            compiled=compiled,
+            greedy_fraction=0.5
+        )
+        search_rng = np.random.default_rng(0)
+        start = time.perf_counter()
+        scores = calculator.calculate_population_fitness(manager.population)
+        for chromosome, fitness in zip(manager.population, scores):
+            chromosome.fitness = fitness
+        history = [(max(scores), 0.0)]
+        for generation in range(1, generations + 1):
+            manager.evolve()
+            scores = calculator.calculate_population_fitness(manager.population)
+            for chromosome, fitness in zip(manager.population, scores):
+                chromosome.fitness = fitness
+            if interval and generation % interval == 0:
+                ranked = sorted(manager.population, key=lambda c: c.fitness, reverse=True)
+                for chromosome in ranked[:top_k]:
+                    if chromosome.fitness > float('-inf'):
+                        local_search(calculator, chromosome, search_rng, evaluations)
+            history.append((max(c.fitness for c in manager.population), time.perf_counter() - start))
+        runs[name] = history
+    
+    target = runs["none"][-1][0]
+    results = []
+    for name, interval, top_k, evaluations in configurations:
+        history = runs[name]
+        reached = next((generation for generation, (best, _) in enumerate(history) if best >= target), None)
+        result = {
+            "configuration": name,
+            "interval": interval,
+            "top_k": top_k,
+            "evaluations": evaluations,
+            "final_best": history[-1][0],
+            "seconds": history[-1][1],
+            "target_fitness": target,
+            "generations_to_target": reached,
+            "seconds_to_target": history[reached][1] if reached is not None else None
+        }
+        print(
+            f"  {name}: best {history[0][0]:.1f} -> {result['final_best']:.1f} in {result['seconds']:.1f} s, "
+            f"target {target:.1f} reached at generation {reached}"
+            + (f" ({result['seconds_to_target']:.1f} s)" if reached is not None else "")
+        )
+        results.append(result)
+        tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"num_classes": num_classes, "results": results}
+
+
+def benchmark_checkpoint(
+    save_results: bool = True,
+    population_sizes: Tuple[int, ...] = (100, 500),
+    repeats: int = 5
+) -> Dict[str, Any]:
+    """
+    Benchmark writing and reading optimizer checkpoints.
+    
+    Each population of a 100-class request is captured, saved and loaded
+    ``repeats`` times, and the checkpoint's size is compared with the
+    pickled chromosomes.
+    
+    Args:
+        save_results: Whether to save the results to disk
+        population_sizes: Population sizes to checkpoint
+        repeats: Timed saves and loads per size
+        
+    Returns:
+        Dictionary of benchmark results
+    """
+    import pickle
+    import tempfile
+    
+    tracker = PerformanceTracker("checkpoint", save_results)
+    tracker.start()
+    
+    num_classes = 100
+    request = create_test_request(num_classes, num_weeks=4)
+    compiled = CompiledRequest(request)
+    print(f"\nBenchmarking checkpoints of {num_classes} classes...")
+    
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "checkpoint.npz"
+        for population_size in population_sizes:
+            random.seed(0)
+            manager = PopulationManager(size=population_size, request=request, compiled=compiled, greedy_fraction=0.5)
+            for chromosome in manager.population:
+                chromosome.fitness = random.random()
+            histories = {"best_fitness_history": [0.0] * 100, "avg_fitness_history": [0.0] * 100,
+                         "diversity_history": [0.0] * 100}
+            
+            start = time.perf_counter()
+            for _ in range(repeats):
+                save_checkpoint(path, Checkpoint.capture("key", 100, manager, None, histories, {}))
+            save_ms = (time.perf_counter() - start) * 1000 / repeats
+            start = time.perf_counter()
+            for _ in range(repeats):
+                loaded = load_checkpoint(path)
+            load_ms = (time.perf_counter() - start) * 1000 / repeats
+            
+            genes = sum(len(gene_array) for gene_array in loaded.gene_arrays)
+            result = {
+                "population_size": population_size,
+                "genes": genes,
+                "save_ms": save_ms,
+                "load_ms": load_ms,
+                "checkpoint_kb": path.stat().st_size / 1024,
+                "pickle_kb": len(pickle.dumps(manager.population)) / 1024,
+                "bytes_per_gene": path.stat().st_size / genes
+            }
+            print(
+                f"  {population_size} chromosomes: save {save_ms:.1f} ms, load {load_ms:.1f} ms, "
+                f"{result['checkpoint_kb']:.0f} KB ({result['bytes_per_gene']:.2f} bytes/gene, "
+                f"pickled {result['pickle_kb']:.0f} KB)"
+            )
+            results.append(result)
+            tracker.record_solution_metric(result)
+    
+    tracker.stop()
+    return {"num_classes": num_classes, "results": results}
+
+
 def run_all_benchmarks():
     """Run all benchmarks and generate summary report."""
     print("\n=== Running Genetic Algorithm Performance Benchmarks ===\n")
@@ -321,6 +1260,39 @@ def run_all_benchmarks():
     print("\n--- Parallel Scaling Benchmark ---")
     parallel_results = benchmark_parallel_scaling()
     
+    print("\n--- Fitness Evaluation Benchmark ---")
+    fitness_results = benchmark_fitness_evaluation()
+    
+    print("\n--- Fitness Cache Benchmark ---")
+    cache_results = benchmark_fitness_cache()
+    
+    print("\n--- Worker Pool Benchmark ---")
+    pool_results = benchmark_worker_pool()
+    
+    print("\n--- Island Scaling Benchmark ---")
+    island_results = benchmark_island_scaling()
+    
+    print("\n--- Diversity Metric Benchmark ---")
+    diversity_results = benchmark_diversity_metrics()
+    
+    print("\n--- Initialization Benchmark ---")
+    initialization_results = benchmark_initialization()
+    
+    print("\n--- Repair Benchmark ---")
+    repair_results = benchmark_repair()
+    
+    print("\n--- Mutation Operator Benchmark ---")
+    mutation_results = benchmark_mutation()
+    
+    print("\n--- Order Crossover Benchmark ---")
+    order_crossover_results = benchmark_order_crossover()
+    
+    print("\n--- Local Search Benchmark ---")
+    local_search_results = benchmark_local_search()
+    
+    print("\n--- Checkpoint Benchmark ---")
+    checkpoint_results = benchmark_checkpoint()
+    
     # Generate summary report
     report_path = Path("perf_results/ga_benchmark_summary.md")
     report_path.parent.mkdir(exist_ok=True)
@@ -353,6 +1325,86 @@ def run_all_benchmarks():
         f.write("|---------|--------------|-------|-----------------|------------|\n")
         for result in parallel_results.get("results", []):
             f.write(f"| {result.get('workers')} | {result.get('duration_ms')} | {result.get('score', 0):.2f} | {result.get('peak_memory_mb', 0):.1f} | {result.get('avg_cpu_percent', 0):.1f} |\n")
+        
+        # Fitness evaluation summary
+        f.write("\n## Fitness Evaluation Results\n\n")
+        f.write("| Classes | Genes | Generations/s (per chromosome) | Generations/s (batch) | Generations/s (incremental) | Fitness Speedup | Evaluations Avoided/Generation |\n")
+        f.write("|---------|-------|-------------------------------|----------------------|----------------------------|-----------------|-------------------------------|\n")
+        for result in fitness_results.get("results", []):
+            f.write(f"| {result.get('num_classes')} | {result.get('genes')} | {result.get('scalar_generations_per_second', 0):.1f} | {result.get('batch_generations_per_second', 0):.1f} | {result.get('incremental_generations_per_second', 0):.1f} | {result.get('fitness_speedup', 0):.1f}x | {result.get('avg_evaluations_avoided', 0):.1f} |\n")
+        
+        # Fitness cache summary
+        f.write("\n## Fitness Cache Results\n\n")
+        f.write("| Regime | Mutation | Crossover | Hit Rate | Batch (ms/generation) | Cached (ms/generation) | Speedup |\n")
+        f.write("|--------|----------|-----------|----------|-----------------------|------------------------|---------|\n")
+        for result in cache_results.get("results", []):
+            f.write(f"| {result.get('regime')} | {result.get('mutation_rate')} | {result.get('crossover_rate')} | {result.get('hit_rate', 0):.1%} | {result.get('batch_ms_per_generation', 0):.2f} | {result.get('cached_ms_per_generation', 0):.2f} | {result.get('fitness_speedup', 0):.2f}x |\n")
+        
+        # Worker pool summary
+        f.write("\n## Worker Pool Results\n\n")
+        f.write("| Scoring | Transport | Workers | In-Process (ms/generation) | Pool (ms/generation) | Speedup |\n")
+        f.write("|---------|-----------|---------|----------------------------|----------------------|---------|\n")
+        for result in pool_results.get("results", []):
+            f.write(f"| {result.get('mode')} | {result.get('transport')} | {result.get('workers')} | {result.get('local_ms_per_generation', 0):.2f} | {result.get('pool_ms_per_generation', 0):.2f} | {result.get('speedup', 0):.2f}x |\n")
+        
+        # Island scaling summary
+        f.write("\n## Island Scaling Results\n\n")
+        f.write("| Islands | Island Generations/s | Speedup | Best Fitness |\n")
+        f.write("|---------|---------------------|---------|--------------|\n")
+        for result in island_results.get("results", []):
+            f.write(f"| {result.get('islands')} | {result.get('island_generations_per_second', 0):.1f} | {result.get('speedup', 0):.2f}x | {result.get('best_fitness', 0):.1f} |\n")
+        
+        # Diversity metric summary
+        f.write("\n## Diversity Metric Results\n\n")
+        f.write("| Metric | Population | Genes | Pairwise (ms) | Metric (ms) | Speedup | Absolute Error |\n")
+        f.write("|--------|------------|-------|---------------|-------------|---------|----------------|\n")
+        for result in diversity_results.get("results", []):
+            f.write(f"| {result.get('metric')} | {result.get('population_size')} | {result.get('genes')} | {result.get('pairwise_ms', 0):.1f} | {result.get('metric_ms', 0):.2f} | {result.get('speedup', 0):.0f}x | {result.get('abs_error', 0):.2e} |\n")
+    
+        # Initialization summary
+        f.write("\n## Initialization Results\n\n")
+        f.write("| Classes | Strategy | Valid | Init (ms) | Initial Best | Final Best | Generations to Target |\n")
+        f.write("|---------|----------|-------|-----------|--------------|------------|-----------------------|\n")
+        for result in initialization_results.get("results", []):
+            f.write(f"| {result.get('num_classes')} | {result.get('strategy')} | {result.get('valid_fraction', 0):.0%} | {result.get('init_ms', 0):.1f} | {result.get('initial_best', 0):.1f} | {result.get('final_best', 0):.1f} | {result.get('generations_to_target')} |\n")
+    
+        # Repair summary
+        f.write("\n## Repair Results\n\n")
+        f.write("| Max Classes/Day | Repair | ms/Generation | Max ms/Generation | Valid | Best Fitness | Invalid Children | Kept Invalid |\n")
+        f.write("|-----------------|--------|---------------|-------------------|-------|--------------|------------------|--------------|\n")
+        for result in repair_results.get("results", []):
+            f.write(f"| {result.get('max_classes_per_day')} | {result.get('repair')} | {result.get('ms_per_generation', 0):.0f} | {result.get('max_ms_per_generation', 0):.0f} | {result.get('valid_fraction', 0):.0%} | {result.get('best_fitness', 0):.1f} | {result.get('invalid_children')} | {result.get('admitted_invalid')} |\n")
+    
+        # Mutation operator summary
+        f.write("\n## Mutation Operator Results\n\n")
+        f.write("| Operator | Feasible Mutants | us/Mutation | Generations/s | Best Fitness |\n")
+        f.write("|----------|------------------|-------------|---------------|--------------|\n")
+        for result in mutation_results.get("results", []):
+            feasible = result.get('feasible_fraction')
+            mutation_us = result.get('mutation_us')
+            f.write(f"| {result.get('operator')} | {'-' if feasible is None else f'{feasible:.0%}'} | {'-' if mutation_us is None else f'{mutation_us:.0f}'} | {result.get('generations_per_second', 0):.1f} | {result.get('best_fitness', 0):.1f} |\n")
+    
+        # Order crossover summary
+        f.write("\n## Order Crossover Results\n\n")
+        f.write("| Genes | Method | us/Crossover | ns/Gene | Sessions Kept |\n")
+        f.write("|-------|--------|--------------|---------|---------------|\n")
+        for result in order_crossover_results.get("results", []):
+            f.write(f"| {result.get('genes')} | {result.get('method')} | {result.get('crossover_us', 0):.1f} | {result.get('ns_per_gene', 0):.0f} | {result.get('sessions_kept', 0):.0%} |\n")
+    
+        # Local search summary
+        f.write("\n## Local Search Results\n\n")
+        f.write("| Local Search | Final Best | Seconds | Generations to Target | Seconds to Target |\n")
+        f.write("|--------------|------------|---------|-----------------------|-------------------|\n")
+        for result in local_search_results.get("results", []):
+            seconds_to_target = result.get('seconds_to_target')
+            f.write(f"| {result.get('configuration')} | {result.get('final_best', 0):.1f} | {result.get('seconds', 0):.1f} | {result.get('generations_to_target')} | {'-' if seconds_to_target is None else f'{seconds_to_target:.1f}'} |\n")
+    
+        # Checkpoint summary
+        f.write("\n## Checkpoint Results\n\n")
+        f.write("| Population | Genes | Save (ms) | Load (ms) | Checkpoint (KB) | Pickled (KB) | Bytes/Gene |\n")
+        f.write("|------------|-------|-----------|-----------|-----------------|--------------|------------|\n")
+        for result in checkpoint_results.get("results", []):
+            f.write(f"| {result.get('population_size')} | {result.get('genes')} | {result.get('save_ms', 0):.1f} | {result.get('load_ms', 0):.1f} | {result.get('checkpoint_kb', 0):.0f} | {result.get('pickle_kb', 0):.0f} | {result.get('bytes_per_gene', 0):.2f} |\n")
     
     print(f"\nBenchmark summary report generated at: {report_path}")
 
@@ -0,0 +1,347 @@
+"""CP-SAT Model Size Benchmarks
+
+This module measures the size of the CP-SAT model built for generated
+requests, so changes to how constraints and objectives are formulated can be
+compared by the number of variables and constraints they add, and by how
+quickly the solver finds feasible and good solutions.
+"""
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from ortools.sat.python import cp_model
+from dateutil.tz import UTC
+
+from app.models import ScheduleRequest
+from app.scheduling.core import SchedulerContext
+from app.scheduling.solvers.base import BaseSolver
+from app.scheduling.utils.occupancy import SlotOccupancy
+from app.scheduling.constraints.assignment import SingleAssignmentConstraint, NoOverlapConstraint
+from app.scheduling.constraints.instructor import InstructorAvailabilityConstraint
+from app.scheduling.constraints.periods import RequiredPeriodsConstraint, ConflictPeriodsConstraint
+from app.scheduling.constraints.limits import (
+    DailyLimitConstraint,
+    WeeklyLimitConstraint,
+    MinimumPeriodsConstraint
+)
+from app.scheduling.constraints.teacher_workload import (
+    ConsecutiveClassesConstraint,
+    TeacherBreakConstraint
+)
+from app.scheduling.objectives.required import RequiredPeriodsObjective
+from app.scheduling.objectives.distribution import DistributionObjective
+from app.scheduling.objectives.day_usage import DayUsageObjective
+from app.scheduling.objectives.final_week import FinalWeekCompressionObjective
+from app.scheduling.objectives.daily_balance import DailyBalanceObjective
+from app.scheduling.objectives.grade_grouping import GradeGroupingObjective
+from tests.utils.generators import ScheduleRequestGenerator
+
+from .perf_utils import PerformanceTracker
+
+
+def create_benchmark_solver(formulation: Optional[str] = None) -> BaseSolver:
+    """
+    Create a solver with every constraint and objective that uses the
+    shared occupancy layer enabled, regardless of feature flags.
+
+    Args:
+        formulation: Objective formulation for the distribution and daily
+            balance objectives (defaults to the configured one)
+    """
+    solver = BaseSolver("model_benchmark")
+    for constraint in [
+        SingleAssignmentConstraint(),
+        NoOverlapConstraint(),
+        InstructorAvailabilityConstraint(),
+        RequiredPeriodsConstraint(),
+        ConflictPeriodsConstraint(),
+        DailyLimitConstraint(),
+        WeeklyLimitConstraint(),
+        MinimumPeriodsConstraint(),
+        ConsecutiveClassesConstraint(enabled=True),
+        TeacherBreakConstraint(enabled=True, required_breaks=[4]),
+    ]:
+        solver.add_constraint(constraint)
+    for objective in [
+        RequiredPeriodsObjective(),
+        DayUsageObjective(),
+        FinalWeekCompressionObjective(),
+        DailyBalanceObjective(formulation),
+        DistributionObjective(formulation),
+        GradeGroupingObjective(),
+    ]:
+        solver.add_objective(objective)
+    return solver
+
+
+def build_model(
+    request: ScheduleRequest,
+    solver: BaseSolver,
+    shared_occupancy: bool = True
+) -> Tuple[SchedulerContext, float]:
+    """
+    Build the CP-SAT model for a request without solving it.
+
+    Args:
+        request: Schedule request to build the model for
+        solver: Solver providing variables, constraints and objectives
+        shared_occupancy: Whether slot/day occupancy is shared between components
+
+    Returns:
+        Tuple of (context holding the model, build time in seconds)
+    """
+    start_time = time.time()
+
+    start_date = datetime.fromisoformat(request.startDate).replace(tzinfo=UTC)
+    end_date = datetime.fromisoformat(request.endDate).replace(tzinfo=UTC)
+    context = SchedulerContext(
+        model=cp_model.CpModel(),
+        solver=cp_model.CpSolver(),
+        request=request,
+        start_date=start_date,
+        end_date=end_date
+    )
+    solver._create_variables(context)
+
+    if not shared_occupancy:
+        context._occupancy = SlotOccupancy(
+            context.model,
+            context.variable_index,
+            {c.name: c.gradeGroup for c in request.classes},
+            shared=False
+        )
+
+    for constraint in solver.constraints:
+        constraint.apply(context)
+
+    objective_terms = []
+    for objective in solver.objectives:
+        objective_terms.extend(
+            objective.weight * term for term in objective.create_terms(context)
+        )
+    if objective_terms:
+        context.model.Maximize(sum(objective_terms))
+
+    return context, time.time() - start_time
+
+
+def get_model_size(context: SchedulerContext) -> Dict[str, int]:
+    """
+    Count the variables and constraints in a built model.
+
+    Args:
+        context: Context holding the model
+
+    Returns:
+        Dictionary with schedule, total variable and constraint counts
+    """
+    proto = context.model.Proto()
+    return {
+        "schedule_variables": len(context.variables),
+        "model_variables": len(proto.variables),
+        "model_constraints": len(proto.constraints),
+    }
+
+
+def benchmark_occupancy_sharing(
+    class_counts: List[int] = None,
+    num_weeks: int = 2,
+    save_results: bool = True
+) -> Dict[str, Any]:
+    """
+    Compare model size with shared and per-component occupancy.
+
+    Args:
+        class_counts: Dataset sizes to build models for
+        num_weeks: Number of weeks in each generated request
+        save_results: Whether to save the results to disk
+
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("occupancy_sharing", save_results)
+    tracker.start()
+
+    class_counts = class_counts or [5, 10, 20, 30]
+    solver = create_benchmark_solver()
+    results = []
+
+    for num_classes in class_counts:
+        print(f"\nBuilding models for {num_classes} classes...")
+        request = ScheduleRequestGenerator.create_request(
+            num_classes=num_classes,
+            num_weeks=num_weeks
+        )
+
+        unshared_context, unshared_time = build_model(request, solver, shared_occupancy=False)
+        shared_context, shared_time = build_model(request, solver, shared_occupancy=True)
+        unshared = get_model_size(unshared_context)
+        shared = get_model_size(shared_context)
+
+        result = {
+            "num_classes": num_classes,
+            "num_weeks": num_weeks,
+            "schedule_variables": shared["schedule_variables"],
+            "unshared_variables": unshared["model_variables"],
+            "shared_variables": shared["model_variables"],
+            "unshared_constraints": unshared["model_constraints"],
+            "shared_constraints": shared["model_constraints"],
+            "variable_reduction": 1 - shared["model_variables"] / max(1, unshared["model_variables"]),
+            "constraint_reduction": 1 - shared["model_constraints"] / max(1, unshared["model_constraints"]),
+            "unshared_build_seconds": unshared_time,
+            "shared_build_seconds": shared_time,
+            "occupancy_stats": dict(shared_context.occupancy.stats),
+        }
+        results.append(result)
+        tracker.record_solution_metric(result)
+
+    tracker.stop()
+    return {"class_counts": class_counts, "results": results}
+
+
+class FirstSolutionTimer(cp_model.CpSolverSolutionCallback):
+    """Records when the first feasible solution was found."""
+
+    def __init__(self):
+        super().__init__()
+        self.start_time = time.time()
+        self.first_solution_seconds = None
+        self.solutions_found = 0
+
+    def on_solution_callback(self):
+        if self.first_solution_seconds is None:
+            self.first_solution_seconds = time.time() - self.start_time
+        self.solutions_found += 1
+
+
+def solve_model(
+    context: SchedulerContext,
+    time_limit_seconds: float = 30.0,
+    num_workers: int = 8
+) -> Dict[str, Any]:
+    """
+    Solve a built model and record search metrics.
+
+    Args:
+        context: Context holding the model
+        time_limit_seconds: Solver time limit
+        num_workers: Number of CP-SAT search workers
+
+    Returns:
+        Dictionary with status, time to first solution and final objective
+    """
+    solver = context.solver
+    solver.parameters.max_time_in_seconds = time_limit_seconds
+    solver.parameters.num_search_workers = num_workers
+
+    timer = FirstSolutionTimer()
+    status = solver.Solve(context.model, timer)
+    has_solution = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+    return {
+        "status": solver.StatusName(status),
+        "first_solution_seconds": timer.first_solution_seconds,
+        "solve_seconds": solver.WallTime(),
+        "solutions_found": timer.solutions_found,
+        "objective": solver.ObjectiveValue() if has_solution else None,
+        "best_bound": solver.BestObjectiveBound() if has_solution else None,
+    }
+
+
+def benchmark_objective_formulations(
+    class_counts: List[int] = None,
+    num_weeks: int = 2,
+    time_limit_seconds: float = 30.0,
+    save_results: bool = True
+) -> Dict[str, Any]:
+    """
+    Compare the pairwise and compact objective formulations.
+
+    Both formulations are built for the same generated requests and
+    compared by model size, time to first feasible solution and final
+    objective. Objective values are reported as returned by the solver; the
+    compact daily balance term measures spread rather than every pair, so
+    the values are comparable in trend rather than exactly.
+
+    Args:
+        class_counts: Dataset sizes to benchmark
+        num_weeks: Number of weeks in each generated request
+        time_limit_seconds: Solver time limit per run
+        save_results: Whether to save the results to disk
+
+    Returns:
+        Dictionary of benchmark results
+    """
+    tracker = PerformanceTracker("objective_formulations", save_results)
+    tracker.start()
+
+    class_counts = class_counts or [5, 10, 20, 30]
+    formulations = ["pairwise", "compact"]
+    results = []
+
+    for num_classes in class_counts:
+        request = ScheduleRequestGenerator.create_request(
+            num_classes=num_classes,
+            num_weeks=num_weeks
+        )
+
+        for formulation in formulations:
+            print(f"\nBenchmarking {formulation} formulation with {num_classes} classes...")
+            solver = create_benchmark_solver(formulation)
+
+            try:
+                context, build_time = build_model(request, solver)
+                result = {
+                    "num_classes": num_classes,
+                    "num_weeks": num_weeks,
+                    "formulation": formulation,
+                    "build_seconds": build_time,
+                    **get_model_size(context),
+                    **solve_model(context, time_limit_seconds),
+                }
+                results.append(result)
+                tracker.record_solution_metric(result)
+            except Exception as e:
+                print(f"Error benchmarking {formulation} with {num_classes} classes: {e}")
+
+    tracker.stop()
+    return {"class_counts": class_counts, "results": results}
+
+
+def run_all_benchmarks():
+    """Run all model size benchmarks and generate a summary report."""
+    print("\n=== Running CP-SAT Model Size Benchmarks ===\n")
+
+    print("\n--- Occupancy Sharing Benchmark ---")
+    sharing_results = benchmark_occupancy_sharing()
+
+    print("\n--- Objective Formulation Benchmark ---")
+    formulation_results = benchmark_objective_formulations()
+
+    report_path = Path("perf_results/model_benchmark_summary.md")
+    report_path.parent.mkdir(exist_ok=True)
+
+    with open(report_path, 'w') as f:
+        f.write("# CP-SAT Model Size Benchmark Summary\n\n")
+        f.write(f"Benchmark run on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        f.write("## Shared Occupancy\n\n")
+        f.write("| Classes | Schedule Vars | Vars (unshared) | Vars (shared) | Constraints (unshared) | Constraints (shared) | Var Reduction | Constraint Reduction |\n")
+        f.write("|---------|---------------|-----------------|---------------|------------------------|----------------------|---------------|----------------------|\n")
+        for result in sharing_results["results"]:
+            f.write(f"| {result['num_classes']} | {result['schedule_variables']} | {result['unshared_variables']} | {result['shared_variables']} | {result['unshared_constraints']} | {result['shared_constraints']} | {result['variable_reduction']:.1%} | {result['constraint_reduction']:.1%} |\n")
+
+        f.write("\n## Objective Formulations\n\n")
+        f.write("| Classes | Formulation | Model Vars | Constraints | First Feasible (s) | Status | Objective | Best Bound |\n")
+        f.write("|---------|-------------|------------|-------------|--------------------|--------|-----------|------------|\n")
+        for result in formulation_results["results"]:
+            first = result["first_solution_seconds"]
+            first_str = f"{first:.2f}" if first is not None else "-"
+            f.write(f"| {result['num_classes']} | {result['formulation']} | {result['model_variables']} | {result['model_constraints']} | {first_str} | {result['status']} | {result['objective']} | {result['best_bound']} |\n")
+
+    print(f"\nBenchmark summary report generated at: {report_path}")
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
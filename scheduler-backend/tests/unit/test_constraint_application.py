@@ -0,0 +1,80 @@
+"""Unit tests for applying the UnifiedSolver's managed constraints to the solved model."""
+import pytest
+from datetime import datetime
+from dateutil.tz import UTC
+
+from ortools.sat.python import cp_model
+
+from app.models import InstructorAvailability
+from app.scheduling.core import SchedulerContext
+from app.scheduling.constraints.instructor import InstructorAvailabilityConstraint
+from app.scheduling.solvers import config as config_module
+from app.scheduling.solvers.solver import UnifiedSolver
+from tests.utils.generators import ScheduleRequestGenerator
+
+
+@pytest.fixture
+def solver():
+    """Unified solver without the genetic optimizer."""
+    return UnifiedSolver(use_genetic=False)
+
+
+@pytest.fixture
+def request_with_absence():
+    """Two classes over one week with the instructor away for periods 1-2 on Monday."""
+    request = ScheduleRequestGenerator.create_request(num_classes=2, start_date="2025-03-03")
+    request.instructorAvailability = [
+        InstructorAvailability(date=datetime(2025, 3, 3), periods=[1, 2])
+    ]
+    return request
+
+
+def test_active_constraints_include_manager(solver):
+    """Enabled constraints registered with the manager are part of the model."""
+    active = solver.get_active_constraints()
+    managed = solver._constraint_manager.get_enabled_constraints()
+
+    assert managed
+    assert all(constraint in active for constraint in managed)
+
+
+def test_disabled_constraints_excluded(solver):
+    """Constraints disabled in the manager are not applied."""
+    constraint = next(
+        c for c in solver._constraint_manager.get_enabled_constraints()
+        if isinstance(c, InstructorAvailabilityConstraint)
+    )
+    constraint.enabled = False
+
+    assert constraint not in solver.get_active_constraints()
+
+
+def test_managed_constraints_bind_solution(solver, request_with_absence, monkeypatch):
+    """Solutions of the built model respect the managed hard constraints."""
+    # Keep every variable so the constraints, not pruning, exclude the slots
+    monkeypatch.setattr(config_module, "ENABLE_DOMAIN_PRUNING", False)
+    context = SchedulerContext(
+        model=cp_model.CpModel(),
+        solver=cp_model.CpSolver(),
+        request=request_with_absence,
+        start_date=datetime.fromisoformat(request_with_absence.startDate).replace(tzinfo=UTC),
+        end_date=datetime.fromisoformat(request_with_absence.endDate).replace(tzinfo=UTC)
+    )
+    solver._create_variables(context)
+    for constraint in solver.get_active_constraints():
+        constraint.apply(context)
+
+    context.solver.parameters.max_time_in_seconds = 10
+    status = context.solver.Solve(context.model)
+    assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+    monday = datetime(2025, 3, 3).date()
+    assigned = [
+        var for var in context.variables
+        if context.solver.Value(var["variable"]) == 1
+    ]
+    assert assigned
+    assert not any(
+        var["date"].date() == monday and var["period"] in (1, 2)
+        for var in assigned
+    )
@@ -0,0 +1,148 @@
+"""Unit tests for domain pruning before variable creation."""
+import pytest
+from datetime import datetime
+from dateutil.tz import UTC
+
+from ortools.sat.python import cp_model
+
+from app.models import InstructorAvailability, TimeSlot
+from app.scheduling.core import SchedulerContext
+from app.scheduling.solvers.base import BaseSolver
+from app.scheduling.constraints.assignment import NoOverlapConstraint
+from app.scheduling.constraints.instructor import InstructorAvailabilityConstraint
+from app.scheduling.constraints.limits import MinimumPeriodsConstraint
+from app.scheduling.constraints.periods import RequiredPeriodsConstraint
+from app.scheduling.constraints.teacher_workload import TeacherBreakConstraint
+from app.scheduling.solvers import config as config_module
+from tests.utils.generators import ScheduleRequestGenerator
+
+
+def create_variables(request, constraints):
+    """Create variables for a request with the given constraints registered."""
+    solver = BaseSolver("pruning_test")
+    for constraint in constraints:
+        solver.add_constraint(constraint)
+    context = SchedulerContext(
+        model=cp_model.CpModel(),
+        solver=cp_model.CpSolver(),
+        request=request,
+        start_date=datetime.fromisoformat(request.startDate).replace(tzinfo=UTC),
+        end_date=datetime.fromisoformat(request.endDate).replace(tzinfo=UTC)
+    )
+    solver._create_variables(context)
+    return context
+
+
+@pytest.fixture
+def request_with_absence():
+    """Two classes over one week with the instructor away for periods 1-2 on Monday."""
+    request = ScheduleRequestGenerator.create_request(num_classes=2, start_date="2025-03-03")
+    request.instructorAvailability = [
+        InstructorAvailability(date=datetime(2025, 3, 3), periods=[1, 2])
+    ]
+    request.constraints.requiredBreakPeriods = [4]
+    return request
+
+
+def test_no_pruning_without_constraints(request_with_absence):
+    """Nothing is pruned when no constraint forces slots to zero."""
+    context = create_variables(request_with_absence, [])
+    assert context.debug_info["domain_pruning"]["variables_eliminated"] == 0
+
+
+def test_instructor_unavailability_pruned(request_with_absence):
+    """Unavailable periods get no variables and are reported."""
+    context = create_variables(request_with_absence, [InstructorAvailabilityConstraint()])
+
+    monday = datetime(2025, 3, 3).date()
+    periods = context.variable_index.by_date_period[monday]
+    assert 1 not in periods and 2 not in periods
+    assert len(periods[3]) == 2
+
+    stats = context.debug_info["domain_pruning"]
+    assert stats["by_reason"] == {"instructor_unavailable": 4}
+    assert stats["constraints_eliminated"] == 4
+
+
+def test_required_breaks_pruned(request_with_absence):
+    """Required break periods get no variables on any day."""
+    context = create_variables(request_with_absence, [TeacherBreakConstraint(enabled=True)])
+
+    assert all(var["period"] != 4 for var in context.variables)
+    stats = context.debug_info["domain_pruning"]
+    # 6 weekdays (start date through end date inclusive) x 2 classes
+    assert stats["by_reason"]["required_break"] == 2 * len(context.variable_index.by_date)
+    assert stats["constraints_eliminated"] == len(context.variable_index.by_date)
+
+
+def test_required_slot_owned_by_one_class(request_with_absence):
+    """A slot required by one class is pruned for the other classes only."""
+    owner, other = request_with_absence.classes
+    owner.weeklySchedule.requiredPeriods = [TimeSlot(dayOfWeek=2, period=5)]
+    context = create_variables(
+        request_with_absence,
+        [NoOverlapConstraint(), RequiredPeriodsConstraint()]
+    )
+
+    tuesday = datetime(2025, 3, 4).date()
+    slot_vars = context.variable_index.by_date_period[tuesday][5]
+    assert [var["name"] for var in slot_vars] == [owner.name]
+
+
+def test_own_required_slot_kept(request_with_absence):
+    """A class keeps its required slot even if the instructor is away."""
+    owner = request_with_absence.classes[0]
+    owner.weeklySchedule.requiredPeriods = [TimeSlot(dayOfWeek=1, period=1)]
+    context = create_variables(request_with_absence, [InstructorAvailabilityConstraint()])
+
+    monday = datetime(2025, 3, 3).date()
+    slot_vars = context.variable_index.by_date_period[monday][1]
+    assert [var["name"] for var in slot_vars] == [owner.name]
+
+
+
+def apply_minimum_periods(request, pruning, monkeypatch):
+    """
+    Build the model with or without pruning.
+
+    Returns the context and the constraints added for the weekly minimums.
+    """
+    monkeypatch.setattr(config_module, "ENABLE_DOMAIN_PRUNING", pruning)
+    availability = InstructorAvailabilityConstraint()
+    context = create_variables(request, [availability])
+    availability.apply(context)
+    first = len(context.model.Proto().constraints)
+    MinimumPeriodsConstraint().apply(context)
+    return context, list(context.model.Proto().constraints)[first:]
+
+
+def away_request(days):
+    """Two classes over two weeks with the instructor away all day on the given March days."""
+    request = ScheduleRequestGenerator.create_request(num_classes=2, num_weeks=2, start_date="2025-03-03")
+    request.constraints.minPeriodsPerWeek = 5
+    request.instructorAvailability = [
+        InstructorAvailability(date=datetime(2025, 3, day), periods=list(range(1, 9))) for day in days
+    ]
+    return request
+
+
+def test_minimum_periods_unchanged_by_pruning(monkeypatch):
+    """A day pruned entirely still counts towards its week's prorated minimum."""
+    request = away_request([3])
+    minimums = {}
+    for pruning in (True, False):
+        context, constraints = apply_minimum_periods(request, pruning, monkeypatch)
+        minimums[pruning] = [constraint.linear.domain[0] for constraint in constraints]
+        if pruning:
+            assert datetime(2025, 3, 3).date() not in context.variable_index.by_date
+
+    assert minimums[True] == minimums[False] == [5, 5, 2]
+
+
+def test_pruned_week_keeps_minimum(monkeypatch):
+    """A week left without variables by pruning is as infeasible as without pruning."""
+    request = away_request(range(10, 15))
+    for pruning in (True, False):
+        context, _ = apply_minimum_periods(request, pruning, monkeypatch)
+        assert (1 in context.variable_index.by_week) is not pruning
+        assert context.solver.Solve(context.model) == cp_model.INFEASIBLE
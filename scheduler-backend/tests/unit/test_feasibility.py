@@ -0,0 +1,151 @@
+"""Unit tests for the feasibility pre-check."""
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from app.models import InstructorAvailability, TimeSlot
+from app.scheduling.constraints.assignment import SingleAssignmentConstraint, NoOverlapConstraint
+from app.scheduling.constraints.instructor import InstructorAvailabilityConstraint
+from app.scheduling.constraints.periods import RequiredPeriodsConstraint
+from app.scheduling.constraints.limits import MinimumPeriodsConstraint
+from app.scheduling.constraints.relaxable_limits import (
+    RelaxableDailyLimitConstraint,
+    RelaxableWeeklyLimitConstraint
+)
+from app.scheduling.constraints.relaxation import RelaxationLevel
+from app.scheduling.utils.feasibility import check_feasibility, _max_matching
+from tests.utils.generators import ScheduleRequestGenerator
+
+
+def base_constraints():
+    """Constraints matching the production configuration with relaxation enabled."""
+    return [
+        SingleAssignmentConstraint(),
+        NoOverlapConstraint(),
+        InstructorAvailabilityConstraint(),
+        RequiredPeriodsConstraint(),
+        RelaxableDailyLimitConstraint(),
+        RelaxableWeeklyLimitConstraint(),
+        MinimumPeriodsConstraint(),
+    ]
+
+
+def issue_codes(report):
+    return [issue.code for issue in report.issues]
+
+
+def test_generated_request_is_feasible():
+    """A generated request with default limits passes the check."""
+    request = ScheduleRequestGenerator.create_request(num_classes=10, num_weeks=2)
+    report = check_feasibility(request, base_constraints())
+    assert report.feasible
+    assert report.suggested_level is None
+
+
+def test_required_collision_is_not_relaxable():
+    """Two classes requiring the same period cannot be fixed by relaxation."""
+    request = ScheduleRequestGenerator.create_request(num_classes=2, start_date="2025-03-03")
+    for class_obj in request.classes:
+        class_obj.weeklySchedule.requiredPeriods = [TimeSlot(dayOfWeek=1, period=1)]
+
+    report = check_feasibility(request, base_constraints())
+    assert "required_collision" in issue_codes(report)
+    assert report.suggested_level is None
+
+
+def test_required_slot_on_unavailable_period():
+    """A required period the instructor is away for is reported."""
+    request = ScheduleRequestGenerator.create_request(num_classes=2, start_date="2025-03-03")
+    request.classes[0].weeklySchedule.requiredPeriods = [TimeSlot(dayOfWeek=1, period=2)]
+    request.instructorAvailability = [
+        InstructorAvailability(date=datetime(2025, 3, 3), periods=[2])
+    ]
+
+    report = check_feasibility(request, base_constraints())
+    assert issue_codes(report) == ["instructor_unavailable"]
+
+
+def test_too_many_classes_for_slots():
+    """More classes than distinct free slots fails the matching check."""
+    request = ScheduleRequestGenerator.create_request(num_classes=3, start_date="2025-03-03")
+    request.endDate = "2025-03-03"
+    all_but_one = [
+        TimeSlot(dayOfWeek=1, period=period) for period in range(2, 9)
+    ]
+    for class_obj in request.classes:
+        class_obj.weeklySchedule.conflicts = list(all_but_one)
+
+    report = check_feasibility(request, base_constraints())
+    assert "slot_capacity" in issue_codes(report)
+    assert report.suggested_level is None
+
+
+def test_limit_shortfall_suggests_lowest_level():
+    """A weekly minimum above the daily limit capacity names the level that fixes it."""
+    request = ScheduleRequestGenerator.create_request(num_classes=5, start_date="2025-03-03")
+    request.constraints.maxClassesPerDay = 1
+    request.constraints.maxClassesPerWeek = 20
+    request.constraints.minPeriodsPerWeek = 12
+
+    report = check_feasibility(request, base_constraints())
+    assert issue_codes(report) == ["minimum_periods_capacity"]
+    # Five days need 3 classes each: the daily limit must allow 2 extra
+    assert report.suggested_level == RelaxationLevel.MODERATE
+    assert report.issues[0].relaxable
+
+
+def test_current_relaxation_is_respected():
+    """Limits already relaxed by the controller count towards capacity."""
+    request = ScheduleRequestGenerator.create_request(num_classes=5, start_date="2025-03-03")
+    request.constraints.maxClassesPerDay = 1
+    request.constraints.maxClassesPerWeek = 20
+    request.constraints.minPeriodsPerWeek = 12
+
+    constraints = base_constraints()
+    for constraint in constraints:
+        if hasattr(constraint, "extra_classes_by_level"):
+            constraint.relaxation_params["extra_classes_allowed"] = \
+                constraint.extra_classes_by_level[RelaxationLevel.MODERATE]
+
+    assert check_feasibility(request, constraints).feasible
+
+
+def test_report_to_dict():
+    """The report serializes the diagnosis and hint."""
+    request = ScheduleRequestGenerator.create_request(num_classes=5, start_date="2025-03-03")
+    request.constraints.maxClassesPerDay = 1
+    request.constraints.minPeriodsPerWeek = 12
+
+    data = check_feasibility(request, base_constraints()).to_dict()
+    assert data["feasible"] is False
+    assert data["suggested_relaxation_level"] == "MODERATE"
+    assert data["issues"][0]["code"] == "minimum_periods_capacity"
+
+
+@pytest.mark.parametrize("free, expected", [
+    ({"a": {1}, "b": {1}}, 1),
+    ({"a": {1, 2}, "b": {1}}, 2),
+    ({"a": {1, 2}, "b": {2, 3}, "c": {1}}, 3),
+    ({"a": {1}, "b": {1}, "c": {1, 2}}, 2),
+])
+def test_max_matching(free, expected):
+    """Augmenting paths reassign slots to fit as many classes as possible."""
+    assert _max_matching(free) == expected
+
+
+def test_solver_rejects_infeasible_request_without_solving():
+    """UnifiedSolver.solve returns the diagnosis instead of building a model."""
+    from app.scheduling.solvers.solver import UnifiedSolver
+
+    request = ScheduleRequestGenerator.create_request(num_classes=2, start_date="2025-03-03")
+    for class_obj in request.classes:
+        class_obj.weeklySchedule.requiredPeriods = [TimeSlot(dayOfWeek=1, period=1)]
+
+    solver = UnifiedSolver(request=request, use_genetic=False, enable_relaxation=True)
+    with patch.object(UnifiedSolver, "create_schedule") as create_schedule:
+        response = solver.solve(with_relaxation=True)
+
+    create_schedule.assert_not_called()
+    assert response.assignments == []
+    assert response.metadata.status == "INFEASIBLE"
+    assert response.metadata.feasibility["issues"][0]["code"] == "required_collision"
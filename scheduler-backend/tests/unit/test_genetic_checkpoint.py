@@ -0,0 +1,167 @@
+"""Unit tests for checkpointing and resuming genetic algorithm runs."""
+import random
+
+import numpy as np
+import pytest
+
+from app.scheduling.solvers.genetic.checkpoint import (
+    Checkpoint,
+    checkpoint_path,
+    load_checkpoint,
+    request_key,
+    save_checkpoint
+)
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.optimizer import GeneticOptimizer
+from app.scheduling.solvers.genetic.population import PopulationManager
+from tests.unit.test_genetic_fitness import create_test_request, create_test_weights
+
+
+def create_optimizer(max_generations, **kwargs):
+    """A sequential optimizer that runs every generation it is given."""
+    return GeneticOptimizer(population_size=8, max_generations=max_generations, parallel_fitness=False,
+                            greedy_init_fraction=0.5, convergence_threshold=float('-inf'), **kwargs)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    """A saved checkpoint loads with the same genes, scores and state."""
+    random.seed(12)
+    request = create_test_request(days=20)
+    manager = PopulationManager(size=4, request=request, greedy_fraction=1.0)
+    for index, chromosome in enumerate(manager.population):
+        chromosome.fitness = float(index) if index else float('-inf')
+    key = request_key(request, create_test_weights())
+    checkpoint = Checkpoint.capture(key, 7, manager, None, {"best_fitness_history": [1.0, 2.0]}, {"solutions_found": 3})
+    path = checkpoint_path(tmp_path, key)
+
+    save_checkpoint(path, checkpoint)
+    loaded = load_checkpoint(path)
+
+    assert path == tmp_path / f"{key}.npz"
+    assert loaded.key == key and loaded.generation == 7
+    assert len(loaded.gene_arrays) == 4
+    for gene_array, original in zip(loaded.gene_arrays, manager.population):
+        assert (gene_array == original.gene_array).all()
+    assert loaded.fitness.tolist() == [float('-inf'), 1.0, 2.0, 3.0]
+    assert loaded.class_ids == list(manager.compiled.classes.ids)
+    assert loaded.best_fitness_history == [1.0, 2.0]
+    assert loaded.state == checkpoint.state | {"random": loaded.state["random"]}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_restore_translates_class_indices():
+    """Genes refer to the same classes in a class table interned in another order."""
+    random.seed(13)
+    request = create_test_request(days=20)
+    manager = PopulationManager(size=2, request=request, greedy_fraction=1.0)
+    checkpoint = Checkpoint.capture("key", 1, manager, None, {}, {})
+    # Classes in reverse order get a class table in reverse order
+    reordered = request.model_copy(update={"classes": list(reversed(request.classes))})
+    compiled = CompiledRequest(reordered)
+    other = PopulationManager(size=2, request=reordered, compiled=compiled)
+    assert compiled.classes.ids != manager.compiled.classes.ids
+
+    checkpoint.restore(other, None)
+
+    for restored, original in zip(other.population, manager.population):
+        assert ([compiled.classes.ids[index] for index in restored.gene_array[:, 0]]
+                == [manager.compiled.classes.ids[index] for index in original.gene_array[:, 0]])
+        assert (restored.gene_array[:, 1:] == original.gene_array[:, 1:]).all()
+
+
+def test_resumed_run_continues_where_it_stopped(tmp_path):
+    """A run resumed from its checkpoint matches one that never stopped."""
+    request = create_test_request(days=20)
+    weights = create_test_weights()
+    random.seed(14)
+    uninterrupted = create_optimizer(6)
+    uninterrupted.optimize(request, weights, time_limit_seconds=60)
+
+    random.seed(14)
+    create_optimizer(3, checkpoint_dir=str(tmp_path), checkpoint_interval=2).optimize(
+        request, weights, time_limit_seconds=60
+    )
+    assert load_checkpoint(checkpoint_path(tmp_path, request_key(request, weights))).generation == 3
+    random.seed(99)
+    resumed = create_optimizer(6, resume_from=str(tmp_path))
+    resumed.optimize(request, weights, time_limit_seconds=60)
+
+    stats = resumed.get_statistics()
+    assert stats["resumed_generation"] == 3
+    assert resumed.generations_run == uninterrupted.generations_run == 6
+    assert stats["best_fitness_history"] == pytest.approx(uninterrupted.best_fitness_history)
+    assert stats["avg_fitness_history"] == pytest.approx(uninterrupted.avg_fitness_history)
+    assert stats["final_mutation_rate"] == uninterrupted.get_statistics()["final_mutation_rate"]
+
+
+def test_resumed_run_skips_seeding_and_initialization(tmp_path, monkeypatch):
+    """A resumed run takes its population from the checkpoint without building one."""
+    request = create_test_request(days=20)
+    weights = create_test_weights()
+    seeded = []
+
+    def seed_solver(seed_request, time_limit):
+        seeded.append(seed_request)
+        raise RuntimeError("no solution")
+
+    random.seed(17)
+    create_optimizer(2, checkpoint_dir=str(tmp_path), cp_sat_seeds=1, seed_solver=seed_solver).optimize(
+        request, weights, time_limit_seconds=60
+    )
+    assert len(seeded) == 1
+
+    initialized = []
+    initialize = PopulationManager._initialize_population
+    monkeypatch.setattr(PopulationManager, "_initialize_population",
+                        lambda manager: initialized.append(manager) or initialize(manager))
+    resumed = create_optimizer(4, resume_from=str(tmp_path), cp_sat_seeds=1, seed_solver=seed_solver)
+    resumed.optimize(request, weights, time_limit_seconds=60)
+
+    assert resumed.get_statistics()["resumed_generation"] == 2
+    assert len(seeded) == 1
+    assert not initialized
+    assert len(resumed.population_manager.population) == 8
+
+
+def test_reused_optimizer_checkpoints_each_request(tmp_path):
+    """An optimizer run on several requests saves and resumes each one's own data."""
+    weights = create_test_weights()
+    first = create_test_request(days=20)
+    second = create_test_request(days=20)
+    for class_obj in second.classes:
+        class_obj.id = class_obj.id.replace("class", "other")
+    second_ids = {class_obj.id for class_obj in second.classes}
+    random.seed(16)
+    optimizer = create_optimizer(2, checkpoint_dir=str(tmp_path), use_adaptive_control=True)
+    for request in (first, second):
+        optimizer.optimize(request, weights, time_limit_seconds=60)
+
+    saved = load_checkpoint(checkpoint_path(tmp_path, request_key(second, weights)))
+    assert set(saved.class_ids) == second_ids
+    assert len(saved.state["controller"]["fitness_history"]) <= saved.generation
+
+    resumed = create_optimizer(4, resume_from=str(tmp_path))
+    for request in (first, second):
+        resumed.optimize(request, weights, time_limit_seconds=60)
+    assert resumed.get_statistics()["resumed_generation"] == 2
+    assert resumed.population_manager.request is second
+    assert set(resumed.population_manager.compiled.classes.ids) == second_ids
+
+
+def test_mismatched_checkpoint_starts_afresh(tmp_path):
+    """A checkpoint of other weights is ignored rather than resumed."""
+    request = create_test_request(days=20)
+    weights = create_test_weights()
+    random.seed(15)
+    create_optimizer(2, checkpoint_dir=str(tmp_path)).optimize(request, weights, time_limit_seconds=60)
+    path = checkpoint_path(tmp_path, request_key(request, weights))
+
+    other_weights = weights.model_copy(update={"final_week_compression": weights.final_week_compression + 1})
+    optimizer = create_optimizer(2, resume_from=str(path))
+    optimizer.optimize(request, other_weights, time_limit_seconds=60)
+
+    assert optimizer.get_statistics()["resumed_generation"] is None
+    assert len(optimizer.best_fitness_history) == 3
+    with pytest.raises(ValueError):
+        np.savez(tmp_path / "other.npz", values=np.zeros(3))
+        load_checkpoint(tmp_path / "other.npz")
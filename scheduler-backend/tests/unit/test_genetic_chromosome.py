@@ -271,6 +271,34 @@ class TestScheduleChromosome:
             # Auto selection might not be supported
             print("Auto selection not supported")
         
+    def test_order_crossover_keeps_sessions(self):
+        """Order crossover keeps each class's sessions, the segment and the donor's order."""
+        random.seed(7)
+        request = create_test_request()
+        parent1 = ScheduleChromosome(request)
+        parent1.initialize_random()
+        parent2 = ScheduleChromosome(request)
+        parent2.initialize_random()
+        genes1 = parent1.gene_array
+        genes2 = parent2.gene_array
+        sessions = sorted(genes1[:, 0].tolist())
+
+        for _ in range(20):
+            child1, child2 = parent1.crossover(parent2, method="order")
+            for child, own, donor in ((child1, genes1, genes2), (child2, genes2, genes1)):
+                child_genes = child.gene_array
+                assert sorted(child_genes[:, 0].tolist()) == sessions
+                kept = (child_genes == own).all(axis=1)
+                assert kept.any()
+                # The other genes are the donor's, in the donor's order
+                donor_rows = [tuple(row) for row in donor.tolist()]
+                positions = [donor_rows.index(tuple(row)) for row in child_genes[~kept].tolist()]
+                assert positions == sorted(positions)
+
+        # Auto picks order crossover for these requests
+        child1, child2 = parent1.crossover(parent2, method="auto")
+        assert sorted(child1.gene_array[:, 0].tolist()) == sessions
+
     def test_validate_method(self):
         """Test the validate method."""
         request = create_test_request()
@@ -311,3 +339,83 @@ class TestScheduleChromosome:
             # Extract day and period from the timeSlot object
             assert assignment.timeSlot.period == period
             assert assignment.timeSlot.dayOfWeek == day
+
+    def test_gene_list_writes_back_to_array(self):
+        """Changes made through the gene list reach the gene array."""
+        request = create_test_request()
+        chromosome = ScheduleChromosome(request)
+        chromosome.genes = [Gene(class_id="class_0", day_of_week=1, period=2, week=0)]
+        chromosome.genes.append(Gene(class_id="class_2", day_of_week=3, period=4, week=1))
+
+        assert chromosome.gene_array.tolist() == [
+            [chromosome.classes.index["class_0"], 0, 1, 2],
+            [chromosome.classes.index["class_2"], 1, 3, 4],
+        ]
+
+        chromosome.genes[0] = Gene(class_id="class_1", day_of_week=5, period=8, week=1)
+        assert chromosome.gene_array[0].tolist() == [chromosome.classes.index["class_1"], 1, 5, 8]
+
+        # A new array replaces the gene list
+        chromosome.mutate(mutation_rate=1.0)
+        assert [gene.class_id for gene in chromosome.genes] == ["class_1", "class_2"]
+        assert [(g.week, g.day_of_week, g.period) for g in chromosome.genes] == \
+            [tuple(row) for row in chromosome.gene_array[:, 1:].tolist()]
+
+    def test_random_operations_follow_random_seed(self):
+        """Mutation and uniform crossover are reproducible with random.seed."""
+        def run():
+            random.seed(7)
+            request = create_test_request()
+            parent1 = ScheduleChromosome(request)
+            parent1.initialize_random()
+            parent2 = ScheduleChromosome(request)
+            parent2.initialize_random()
+            child1, child2 = parent1._uniform_crossover(parent2)
+            child1.mutate(0.3)
+            return child1.gene_array.tolist(), child2.gene_array.tolist()
+
+        assert run() == run()
+
+    def test_crossover_between_class_tables(self):
+        """Parents built without a shared class table still recombine by class ID."""
+        request = create_test_request()
+        parent1 = ScheduleChromosome(request)
+        parent1.genes = [Gene(class_id="class_0", day_of_week=1, period=1, week=0)] * 4
+        parent2 = ScheduleChromosome()
+        parent2.request = request
+        parent2.genes = [Gene(class_id="new_class", day_of_week=2, period=2, week=0)] * 4
+
+        child1, child2 = parent1._two_point_crossover(parent2)
+        class_ids = {gene.class_id for gene in child1.genes + child2.genes}
+        assert class_ids == {"class_0", "new_class"}
+        assert parent1.hamming_distance(parent2) == 4
+        assert parent1.hamming_distance(parent1.copy()) == 0
+
+    def test_validate_rules(self):
+        """Validation enforces daily and weekly limits and consecutive periods."""
+        request = create_test_request()
+        chromosome = ScheduleChromosome(request)
+
+        def valid(*slots):
+            chromosome.genes = [
+                Gene(class_id="class_0", week=week, day_of_week=day, period=period)
+                for week, day, period in slots
+            ]
+            return chromosome.validate()
+
+        assert valid((0, 1, 1), (0, 1, 2), (0, 2, 1))
+        # Three classes on one day
+        assert not valid((0, 1, 1), (0, 1, 3), (0, 1, 5))
+        # Periods 8 and 1 of neighbouring days are not consecutive
+        assert valid((0, 1, 7), (0, 1, 8), (0, 2, 1))
+        # More classes in a week than allowed
+        assert not valid(*[(0, day, 1) for day in range(1, 6)], (0, 1, 3), (0, 2, 3))
+
+        request.constraints.maxClassesPerDay = 3
+        assert not valid((0, 1, 1), (0, 1, 2), (0, 1, 3))
+        # A class taking the same period twice breaks the run of periods
+        assert valid((0, 1, 1), (0, 1, 2), (0, 1, 2))
+
+        request.constraints.allowConsecutiveClasses = False
+        assert not valid((0, 1, 1), (0, 1, 2))
+        assert valid((1, 1, 1), (0, 1, 2))
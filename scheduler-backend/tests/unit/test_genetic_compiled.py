@@ -0,0 +1,106 @@
+"""Unit tests for the compiled request lookup tables of the genetic algorithm."""
+from datetime import datetime
+
+import numpy as np
+
+from app.models import (
+    ScheduleRequest,
+    Class,
+    WeeklySchedule,
+    TimeSlot,
+    ScheduleConstraints,
+    InstructorAvailability,
+)
+from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome
+from app.scheduling.solvers.genetic.compiled import CompiledRequest, ConstraintLimits
+
+
+def create_request(**constraint_overrides) -> ScheduleRequest:
+    """Create a request from Monday 2025-02-10 to Wednesday 2025-02-19."""
+    classes = [
+        Class(id="c0", name="Class 0", grade="1", weeklySchedule=WeeklySchedule(
+            conflicts=[TimeSlot(dayOfWeek=1, period=1)],
+            preferredPeriods=[TimeSlot(dayOfWeek=2, period=3)]
+        )),
+        Class(id="c1", name="Class 1", grade="1", weeklySchedule=WeeklySchedule(
+            avoidPeriods=[TimeSlot(dayOfWeek=5, period=8)]
+        )),
+    ]
+    constraints = dict(
+        maxClassesPerDay=2,
+        maxClassesPerWeek=6,
+        minPeriodsPerWeek=1,
+        maxConsecutiveClasses=2,
+        consecutiveClassesRule="soft",
+        startDate="2025-02-10",
+        endDate="2025-02-19"
+    )
+    constraints.update(constraint_overrides)
+    return ScheduleRequest(
+        classes=classes,
+        instructorAvailability=[
+            InstructorAvailability(date=datetime(2025, 2, 12), periods=[2, 3]),
+            InstructorAvailability(date=datetime(2025, 2, 15), periods=[1]),  # Saturday
+        ],
+        startDate="2025-02-10",
+        endDate="2025-02-19",
+        constraints=ScheduleConstraints(**constraints)
+    )
+
+
+def test_class_indices_follow_request_order():
+    """Request classes are interned first, in request order."""
+    compiled = CompiledRequest(create_request())
+    assert compiled.class_indices.tolist() == [0, 1]
+    assert compiled.classes.ids[:2] == ["c0", "c1"]
+    assert compiled.total_weeks == 2
+    assert compiled.class_rows(np.array([0, 1, 5])).tolist() == [0, 1, 2]
+
+
+def test_calendar_and_allowed_slots():
+    """Allowed slots exclude dates past the end, unavailability and conflicts."""
+    compiled = CompiledRequest(create_request())
+    assert compiled.calendar[0, 1:6].all()
+    assert compiled.calendar[1].tolist() == [False, True, True, True, False, False, False, False]
+
+    # Wednesday of week 0, periods 2 and 3; the Saturday entry is ignored
+    assert compiled.unavailable[0, 3, 2:4].all()
+    assert np.count_nonzero(compiled.unavailable) == 2
+
+    allowed = compiled.allowed
+    assert allowed.shape == (3, 2, 8, 16)
+    assert not allowed[0, :, 1, 1].any()          # Class conflict every week
+    assert allowed[1, :, 1, 1].all()
+    assert not allowed[:, 0, 3, 2].any()          # Instructor unavailable
+    assert allowed[:, 1, 3, 2].all()
+    assert not allowed[:, 1, 4].any()             # Past the end date
+    assert not allowed[:, :, :, 9:].any()         # Only periods 1-8
+    assert not allowed[:, :, 6:].any()            # Only Monday-Friday
+
+    assert compiled.preferred[0, 2, 3] and np.count_nonzero(compiled.preferred) == 1
+    assert compiled.avoided[1, 5, 8] and np.count_nonzero(compiled.avoided) == 1
+
+
+def test_limits_and_chromosomes_use_compiled_request():
+    """Chromosomes built from a compiled request use its limits and tables."""
+    request = create_request(allowConsecutiveClasses=False)
+    compiled = CompiledRequest(request)
+    assert compiled.limits == ConstraintLimits(
+        max_classes_per_day=2,
+        max_classes_per_week=6,
+        min_periods_per_week=1,
+        max_consecutive_classes=2,
+        allow_consecutive_pairs=False
+    )
+
+    chromosome = ScheduleChromosome(compiled=compiled)
+    assert chromosome.request is request
+    assert chromosome.classes is compiled.classes
+    chromosome.initialize_random()
+    assert sorted(chromosome.gene_array[:, 0].tolist()) == [0, 0, 1, 1]
+
+    chromosome.gene_array = [(0, 0, 1, 2), (1, 0, 1, 3)]
+    assert not chromosome.validate()
+    child = chromosome.copy()
+    assert child.compiled is compiled
+    assert not child.validate()
@@ -295,3 +295,70 @@ class TestFitnessCalculator:
         
         # Earlier scheduling should score better
         assert early_score > late_score
+
+    def test_population_fitness_matches_single(self):
+        """Batch scores equal the per-chromosome scores exactly."""
+        random.seed(7)
+        request = create_test_request(days=20)
+        request.constraints.maxClassesPerDay = 4
+        request.constraints.maxClassesPerWeek = 20
+        request.classes[1].weeklySchedule.avoidPeriods = [TimeSlot(dayOfWeek=3, period=2)]
+        weights = create_test_weights()
+        weights.distribution = 7
+        weights.earlier_dates = 3
+        calculator = FitnessCalculator(request, weights)
+
+        population = []
+        for i in range(40):
+            chromosome = ScheduleChromosome(request)
+            chromosome.initialize_random()
+            if i % 4 == 0:
+                # Fewer genes, some of a class the request does not have
+                chromosome.genes = chromosome.genes[:-3] + [
+                    Gene(class_id="unknown", day_of_week=3, period=2, week=1)
+                ]
+            population.append(chromosome)
+
+        single = [calculator.calculate_fitness(chromosome) for chromosome in population]
+        batch = calculator.calculate_population_fitness(population)
+
+        assert batch == single
+        assert any(score == float('-inf') for score in single)
+        assert sum(score != float('-inf') for score in single) > 5
+
+    def test_incremental_fitness_matches_full(self):
+        """Children scored from their parents' states match a full evaluation."""
+        random.seed(11)
+        request = create_test_request(days=20)
+        request.constraints.maxClassesPerDay = 4
+        request.constraints.maxClassesPerWeek = 20
+        request.constraints.maxConsecutiveClasses = 1
+        weights = create_test_weights()
+        weights.distribution = 7
+        weights.earlier_dates = 3
+        calculator = FitnessCalculator(request, weights, verify_incremental=True)
+
+        population = []
+        for _ in range(20):
+            chromosome = ScheduleChromosome(request)
+            chromosome.initialize_random()
+            population.append(chromosome)
+        calculator.calculate_incremental_fitness(population)
+        assert calculator.incremental_stats == {"reused": 0, "incremental": 0, "full": 20}
+
+        for _ in range(5):
+            children = population[:2]
+            for parent, other in zip(population[2::2], population[3::2]):
+                clone = parent.copy()
+                clone.mutate(0.1)
+                children.append(clone)
+                children.extend(parent.crossover(other, method="uniform"))
+            population = children[:20]
+            # verify_incremental raises if any score differs from calculate_fitness
+            scores = calculator.calculate_incremental_fitness(population)
+            assert len(scores) == 20
+
+        stats = calculator.incremental_stats
+        assert stats["reused"] >= 10
+        assert stats["incremental"] > 0
+        assert sum(stats.values()) == 120
@@ -0,0 +1,78 @@
+"""Unit tests for the genetic algorithm fitness cache."""
+import pickle
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome
+from app.scheduling.solvers.genetic.fitness_cache import FitnessCache, gene_hash
+from app.scheduling.solvers.genetic.optimizer import GeneticOptimizer
+
+
+def make_chromosome(*rows):
+    chromosome = ScheduleChromosome()
+    chromosome.gene_array = rows
+    return chromosome
+
+
+def test_gene_hash_depends_on_content_and_shape():
+    """Equal genes hash alike; different genes or shapes do not."""
+    genes = np.array([[0, 0, 1, 2], [1, 0, 3, 4]], dtype=np.int16)
+    assert gene_hash(genes) == gene_hash(genes.copy())
+    assert gene_hash(genes) != gene_hash(genes[::-1])
+    assert gene_hash(genes) != gene_hash(genes.reshape(1, 8))
+
+
+def test_lru_eviction_and_stats():
+    """The least recently used score is evicted first."""
+    cache = FitnessCache(max_entries=2)
+    a, b, c = (make_chromosome((i, 0, 1, 1)) for i in range(3))
+
+    keys, found = cache.lookup([a, b])
+    assert found == [None, None]
+    cache.store(keys, [1.0, 2.0])
+    assert cache.lookup([a])[1] == [1.0]
+    cache.store(cache.lookup([c])[0], [float('-inf')])
+
+    assert cache.lookup([a, b, c])[1] == [1.0, None, float('-inf')]
+    stats = cache.get_stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 4
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+
+
+def test_pickled_cache_keeps_entries():
+    """A pickled copy, as sent to a worker process, keeps its scores."""
+    cache = FitnessCache()
+    chromosome = make_chromosome((0, 0, 1, 1))
+    cache.store(cache.lookup([chromosome])[0], [5.0])
+
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.lookup([chromosome])[1] == [5.0]
+    assert copy.get_stats()["hits"] == 1
+    assert cache.get_stats()["hits"] == 0
+
+
+def test_optimizer_scores_only_cache_misses():
+    """Chromosomes seen before are not evaluated again."""
+    optimizer = GeneticOptimizer(vectorized_fitness=True, fitness_cache_size=16)
+    optimizer.fitness_cache = FitnessCache(16)
+    optimizer.fitness_calculator = MagicMock()
+    optimizer.fitness_calculator.calculate_population_fitness.side_effect = (
+        lambda chromosomes: [float(c.gene_array[0, 0]) for c in chromosomes]
+    )
+
+    population = [make_chromosome((i, 0, 1, 1)) for i in range(3)]
+    optimizer._evaluate_fitness_parallel(population)
+    elite = population[0]
+    elite.fitness = -1.0
+    population = [elite, population[1].copy(), make_chromosome((7, 0, 1, 1))]
+    optimizer._evaluate_fitness_parallel(population)
+
+    calls = optimizer.fitness_calculator.calculate_population_fitness.call_args_list
+    assert [len(call.args[0]) for call in calls] == [3, 1]
+    assert [c.fitness for c in population] == [0.0, 1.0, 7.0]
+    stats = optimizer.get_statistics()["fitness_cache"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 4
@@ -0,0 +1,68 @@
+"""Unit tests for the genetic algorithm fitness worker pool."""
+import random
+
+from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.fitness import FitnessCalculator
+from app.scheduling.solvers.genetic.fitness_pool import FitnessWorkerPool
+
+from tests.unit.test_genetic_fitness import create_test_request, create_test_weights
+
+
+def test_batches_cover_every_chromosome():
+    """Batches are contiguous, one per worker at most, and never below the minimum size."""
+    pool = FitnessWorkerPool.__new__(FitnessWorkerPool)
+    pool.max_workers, pool.min_batch_size = 4, 10
+
+    assert pool.batches(0) == []
+    assert pool.batches(15) == [slice(0, 15)]
+    assert pool.batches(25) == [slice(0, 13), slice(13, 26)]
+    assert pool.batches(100) == [slice(0, 25), slice(25, 50), slice(50, 75), slice(75, 100)]
+
+
+def test_pool_scores_match_this_process():
+    """Workers built from the request score gene arrays like the parent's calculator."""
+    random.seed(5)
+    request = create_test_request(days=20)
+    weights = create_test_weights()
+    compiled = CompiledRequest(request)
+    calculator = FitnessCalculator(request, weights, compiled=compiled)
+    population = []
+    for _ in range(12):
+        chromosome = ScheduleChromosome(compiled=compiled)
+        chromosome.initialize_random()
+        population.append(chromosome)
+    # A chromosome of another length is scored too
+    population[3].gene_array = population[3].gene_array[:-1]
+
+    for vectorized in (True, False):
+        with FitnessWorkerPool(compiled, weights, max_workers=2, vectorized=vectorized) as pool:
+            assert pool.score(population) == [calculator.calculate_fitness(c) for c in population]
+
+
+def test_shared_memory_scores_match_this_process():
+    """Workers score a shared population in place, replacing the block when it no longer fits."""
+    random.seed(6)
+    request = create_test_request(days=20)
+    weights = create_test_weights()
+    compiled = CompiledRequest(request)
+    calculator = FitnessCalculator(request, weights, compiled=compiled)
+    population = []
+    for _ in range(12):
+        chromosome = ScheduleChromosome(compiled=compiled)
+        chromosome.initialize_random()
+        chromosome.gene_array = chromosome.gene_array[:6]
+        population.append(chromosome)
+    expected = [calculator.calculate_fitness(c) for c in population]
+
+    with FitnessWorkerPool(compiled, weights, max_workers=2, shared_memory=True) as pool:
+        assert pool.score(population[:8]) == expected[:8]
+        first_block = pool._shared.block
+        assert pool.score(population) == expected
+        assert pool._shared.block.capacity == 12
+        assert pool._shared.block.name != first_block.name
+
+        # Mixed lengths are pickled; the block is kept for the next generation
+        population[0].gene_array = population[0].gene_array[:-1]
+        assert pool.score(population) == [calculator.calculate_fitness(c) for c in population]
+        assert pool._shared is not None
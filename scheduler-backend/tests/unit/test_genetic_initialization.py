@@ -0,0 +1,161 @@
+"""Unit tests for constraint-aware initialization of genetic algorithm populations."""
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.models import InstructorAvailability, ScheduleAssignment, ScheduleResponse, TimeSlot
+from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome, validate_gene_arrays
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.initialization import greedy_gene_array, response_gene_array
+from app.scheduling.solvers.genetic.optimizer import GeneticOptimizer
+from app.scheduling.solvers.genetic.population import PopulationManager
+from tests.unit.test_genetic_fitness import create_test_request, create_test_weights
+
+
+def constrained_request():
+    """A request whose instructor is away two weekdays of every week."""
+    request = create_test_request(days=20)
+    start = datetime.strptime(request.startDate, "%Y-%m-%d")
+    request.instructorAvailability = [
+        InstructorAvailability(date=start + timedelta(days=offset), periods=list(range(1, 9)))
+        for offset in range(21)
+        if (start + timedelta(days=offset)).weekday() in (0, 1)
+    ]
+    return request
+
+
+def test_greedy_chromosomes_are_valid_and_avoid_blocked_slots():
+    """Greedy schedules keep every limit and take only allowed slots."""
+    random.seed(1)
+    compiled = CompiledRequest(constrained_request())
+    chromosomes = []
+    for _ in range(20):
+        chromosome = ScheduleChromosome(compiled=compiled)
+        chromosome.initialize_greedy()
+        chromosomes.append(chromosome)
+    gene_arrays = np.stack([chromosome.gene_array for chromosome in chromosomes])
+
+    assert validate_gene_arrays(gene_arrays, compiled.limits).all()
+    rows = compiled.class_rows(gene_arrays[..., 0])
+    assert compiled.allowed[rows, gene_arrays[..., 1], gene_arrays[..., 2], gene_arrays[..., 3]].all()
+
+    sessions = compiled.limits.min_periods_per_week * compiled.total_weeks
+    random_chromosome = ScheduleChromosome(compiled=compiled)
+    random_chromosome.initialize_random()
+    assert gene_arrays.shape[1] == len(random_chromosome.gene_array) == 3 * sessions
+    for gene_array in gene_arrays:
+        assert (gene_array[:, 0] == np.repeat(compiled.class_indices, sessions)).all()
+        # Two sessions of each class in every week
+        assert (np.bincount(gene_array[:, 1], minlength=compiled.total_weeks) == 6).all()
+
+
+def test_fixed_genes_are_kept_and_completed():
+    """Fixed genes stay in place; missing sessions are filled and extra ones dropped."""
+    compiled = CompiledRequest(create_test_request(days=20))
+    fixed = np.array([
+        (0, 0, 2, 4),
+        (1, 1, 3, 5),
+        (1, 1, 4, 5),
+        (1, 1, 5, 5),
+        (1, 2, 2, 2),
+        (1, 0, 2, 2),
+        (1, 0, 3, 2),  # Class 1 has six sessions; this one is dropped
+        (9, 0, 1, 1),  # Not a class of the request
+    ])
+    gene_array = greedy_gene_array(compiled, np.random.default_rng(0), fixed)
+
+    assert len(gene_array) == 18
+    rows = {tuple(row) for row in gene_array.tolist()}
+    assert {tuple(row) for row in fixed[:6].tolist()} <= rows
+    assert (0, 0, 3, 2) not in rows
+    assert np.bincount(gene_array[:, 0]).tolist() == [6, 6, 6]
+    assert validate_gene_arrays(gene_array[np.newaxis], compiled.limits).all()
+
+
+def test_response_genes_match_classes_by_id_or_name():
+    """CP-SAT assignments name their class; genetic ones carry its ID."""
+    compiled = CompiledRequest(create_test_request(days=20))
+    start = compiled.start_date
+
+    def assignment(name, class_id, days, day, period):
+        date = (start + timedelta(days=days)).isoformat()
+        return ScheduleAssignment(name=name, classId=class_id, date=date,
+                                  timeSlot=TimeSlot(dayOfWeek=day, period=period))
+
+    response = ScheduleResponse(assignments=[
+        assignment("Class 1-x", "Class 1", 8, 3, 2),
+        assignment("class_2-x", "class_2", 0, 1, 4),
+        assignment("Unknown", None, 0, 1, 5),
+        assignment("class_0", None, 70, 2, 2),
+    ], metadata={"duration_ms": 0, "solutions_found": 1, "score": 0.0, "gap": 0.0})
+
+    assert response_gene_array(compiled, response).tolist() == [[1, 1, 3, 2], [2, 0, 1, 4]]
+
+
+def test_population_mixes_seeded_greedy_and_random_chromosomes():
+    """Seeds come first, then the greedy share, then random chromosomes."""
+    random.seed(2)
+    request = create_test_request(days=20)
+    seed = np.array([(0, 0, 2, 4), (1, 1, 3, 5)])
+    manager = PopulationManager(size=10, request=request, greedy_fraction=0.5, seed_gene_arrays=[seed])
+
+    gene_arrays = np.stack([chromosome.gene_array for chromosome in manager.population])
+    valid = validate_gene_arrays(gene_arrays, manager.compiled.limits)
+    assert valid[:6].all()
+    assert valid[6:].sum() < 4
+    first = {tuple(row) for row in gene_arrays[0].tolist()}
+    assert {(0, 0, 2, 4), (1, 1, 3, 5)} <= first
+
+
+def test_optimizer_seeds_population_from_seed_solver():
+    """A CP-SAT schedule seeds chromosomes; a failing solver seeds none."""
+    request = create_test_request(days=20)
+    compiled = CompiledRequest(request)
+    seed = ScheduleChromosome(compiled=compiled)
+    seed.initialize_greedy()
+    time_limits = []
+
+    def seed_solver(seed_request, time_limit):
+        time_limits.append(time_limit)
+        return seed.decode()
+
+    optimizer = GeneticOptimizer(population_size=6, cp_sat_seeds=2, seed_time_limit=5.0,
+                                 seed_solver=seed_solver, parallel_fitness=False)
+    seed_genes = optimizer._solve_seed_genes(compiled, time_limit_seconds=8)
+    assert time_limits == [2.0]
+    assert len(seed_genes) == 2
+    assert (seed_genes[0] == seed.gene_array).all()
+
+    manager = optimizer._create_population_manager(request, compiled, seed_genes)
+    assert (manager.population[0].gene_array == seed.gene_array).all()
+
+    def failing_solver(seed_request, time_limit):
+        raise RuntimeError("no solution")
+
+    optimizer.seed_solver = failing_solver
+    assert optimizer._solve_seed_genes(compiled, time_limit_seconds=8) == []
+
+
+def test_reused_optimizer_seeds_each_request():
+    """Every run seeds and builds its population from that run's request."""
+    first = create_test_request(days=20)
+    second = create_test_request(days=20)
+    for class_obj in second.classes:
+        class_obj.id = class_obj.id.replace("class", "other")
+    seeded = []
+
+    def seed_solver(seed_request, time_limit):
+        seeded.append(seed_request)
+        raise RuntimeError("no solution")
+
+    optimizer = GeneticOptimizer(population_size=6, max_generations=2, cp_sat_seeds=1,
+                                 seed_solver=seed_solver, greedy_init_fraction=1.0,
+                                 parallel_fitness=False)
+    for request in (first, second):
+        optimizer.optimize(request, create_test_weights(), time_limit_seconds=30)
+
+    assert seeded == [first, second]
+    assert optimizer.fitness_calculator.request is second
+    assert optimizer.population_manager.request is second
+    assert set(optimizer.population_manager.compiled.classes.ids) == {c.id for c in second.classes}
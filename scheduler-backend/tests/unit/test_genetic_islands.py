@@ -0,0 +1,113 @@
+"""Unit tests for the island model of the genetic algorithm."""
+import random
+
+import pytest
+
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.islands import EpochReport, IslandModel, IslandSettings
+from app.scheduling.solvers.genetic.optimizer import GeneticOptimizer
+from tests.unit.test_genetic_fitness import create_test_request, create_test_weights
+
+CROSSOVER_METHODS = ["single_point", "two_point", "uniform", "order"]
+
+
+def island_settings(count, **overrides):
+    """Small islands with distinct seeds."""
+    settings = dict(population_size=8, migration_size=2, crossover_methods=CROSSOVER_METHODS)
+    settings.update(overrides)
+    return [IslandSettings(seed=index, **settings) for index in range(count)]
+
+
+def test_ring_migration_replaces_worst_chromosomes():
+    """Each island's elites replace the worst chromosomes of the next island."""
+    random.seed(3)
+    compiled = CompiledRequest(create_test_request(days=20))
+    model = IslandModel(compiled, create_test_weights(), island_settings(3), use_processes=False)
+
+    reports = model.run_epoch(2)
+    assert [report.island for report in reports] == [0, 1, 2]
+    assert all(len(report.history) == 2 and report.generation == 2 for report in reports)
+    assert all(report.best_fitness == report.emigrants[0][1] for report in reports)
+
+    model.run_epoch(0)
+    for report, island in zip(reports, model._islands[1:] + model._islands[:1]):
+        population = island.manager.population
+        arrivals = population[-2:]
+        assert [c.fitness for c in arrivals] == [fitness for _, fitness in report.emigrants]
+        assert all((c.gene_array == genes).all() for c, (genes, _) in zip(arrivals, report.emigrants))
+
+
+def test_random_migration_never_sends_to_itself():
+    """Random migration picks another island for every emigrant group."""
+    model = IslandModel.__new__(IslandModel)
+    model.size, model.topology = 3, "random"
+    for _ in range(20):
+        model._immigrants = [[] for _ in range(3)]
+        model._migrate([
+            EpochReport(island=i, generation=1, history=[], best_genes=None, best_fitness=0.0,
+                        emigrants=[(None, float(i))])
+            for i in range(3)
+        ])
+        for destination, arrivals in enumerate(model._immigrants):
+            assert all(fitness != destination for _, fitness in arrivals)
+        assert sum(len(arrivals) for arrivals in model._immigrants) == 3
+
+
+def test_unknown_topology_is_rejected():
+    with pytest.raises(ValueError):
+        IslandModel(None, None, [], topology="star")
+
+
+def test_islands_draw_from_their_own_random_streams():
+    """Islands are reproducible from their seeds and leave the random module alone."""
+    compiled = CompiledRequest(create_test_request(days=20))
+    random.seed(6)
+    state = random.getstate()
+    first = IslandModel(compiled, create_test_weights(), island_settings(2), use_processes=False)
+    first.run_epoch(2)
+    assert random.getstate() == state
+
+    random.seed(7)
+    second = IslandModel(compiled, create_test_weights(), island_settings(2), use_processes=False)
+    second.run_epoch(2)
+    for island, other in zip(first._islands, second._islands):
+        assert all(
+            (c.gene_array == o.gene_array).all()
+            for c, o in zip(island.manager.population, other.manager.population)
+        )
+
+
+def test_islands_in_processes_match_contract():
+    """Island processes report like islands in this process."""
+    random.seed(4)
+    compiled = CompiledRequest(create_test_request(days=20))
+    with IslandModel(compiled, create_test_weights(), island_settings(2), use_processes=True) as model:
+        assert len(model._processes) == 2
+        first = model.run_epoch(1)
+        second = model.run_epoch(1)
+    assert [report.generation for report in first + second] == [1, 1, 2, 2]
+    assert not model._processes
+
+
+def test_optimizer_island_mode():
+    """The optimizer returns the best chromosome found on any island."""
+    random.seed(5)
+    optimizer = GeneticOptimizer(
+        population_size=8,
+        max_generations=5,
+        convergence_threshold=-1.0,  # Run every generation
+        num_islands=3,
+        migration_interval=2,
+        parallel_fitness=False,
+        vectorized_fitness=True,
+        island_crossover_weights=[{"order": 0.0}, {"order": 0.0, "uniform": 0.0}]
+    )
+    stats = []
+    optimizer.set_stats_callback(lambda generation, best, *rest: stats.append((generation, best)))
+    response = optimizer.optimize(create_test_request(days=20), create_test_weights(), time_limit_seconds=60)
+
+    assert optimizer.generations_run == 5
+    assert [generation for generation, _ in stats] == list(range(6))
+    assert response.metadata.score == max(best for _, best in stats)
+    assert optimizer.get_best_solution().fitness == response.metadata.score
+    assert optimizer.population_manager is None
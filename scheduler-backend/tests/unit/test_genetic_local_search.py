@@ -0,0 +1,101 @@
+"""Unit tests for local search over genetic algorithm chromosomes."""
+import math
+import random
+
+import numpy as np
+import pytest
+
+from app.scheduling.solvers.genetic import fitness_pool
+from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.fitness import FitnessCalculator
+from app.scheduling.solvers.genetic.local_search import local_search
+from app.scheduling.solvers.genetic.optimizer import GeneticOptimizer
+from tests.unit.test_genetic_fitness import create_test_request, create_test_weights
+
+
+def scored_chromosome(calculator):
+    """A random valid chromosome with a fitness state."""
+    while True:
+        chromosome = ScheduleChromosome(compiled=calculator.compiled)
+        chromosome.initialize_greedy()
+        chromosome.mutate(0.3, "free_slot")
+        chromosome.fitness = calculator.calculate_incremental_fitness([chromosome])[0]
+        if chromosome.fitness > float('-inf'):
+            return chromosome
+
+
+def test_neighbour_scores_match_full_evaluation():
+    """Neighbours scored from the chromosome's state score as if evaluated in full."""
+    random.seed(8)
+    request = create_test_request(days=20)
+    calculator = FitnessCalculator(request, create_test_weights(), compiled=CompiledRequest(request))
+    chromosome = scored_chromosome(calculator)
+    neighbours = []
+    for _ in range(10):
+        neighbour = chromosome.copy()
+        neighbour.mutate(0.2, random.choice(["random", "swap", "shift"]))
+        neighbours.append(neighbour)
+
+    states, scores = calculator.score_neighbours(
+        chromosome, np.stack([neighbour.gene_array for neighbour in neighbours])
+    )
+
+    expected = calculator.calculate_population_fitness(neighbours)
+    for state, score, expected_score, neighbour in zip(states, scores.tolist(), expected, neighbours):
+        assert score == expected_score or math.isclose(score, expected_score, rel_tol=1e-9)
+        assert (state.gene_array == neighbour.gene_array).all()
+    with pytest.raises(ValueError):
+        calculator.score_neighbours(ScheduleChromosome(compiled=calculator.compiled), np.stack([chromosome.gene_array]))
+
+
+def test_local_search_only_keeps_improvements():
+    """Hill climbing never lowers fitness, and its fitness is the chromosome's true score."""
+    random.seed(9)
+    request = create_test_request(days=20)
+    calculator = FitnessCalculator(request, create_test_weights(), compiled=CompiledRequest(request))
+    for seed in range(5):
+        chromosome = scored_chromosome(calculator)
+        before = chromosome.fitness
+
+        moves = local_search(calculator, chromosome, np.random.default_rng(seed), max_evaluations=64)
+
+        assert chromosome.fitness >= before
+        assert (chromosome.fitness > before) == (moves > 0)
+        assert math.isclose(chromosome.fitness, calculator.calculate_fitness(chromosome), rel_tol=1e-9)
+
+
+def test_worker_local_search_returns_improved_genes(monkeypatch):
+    """The worker pool task hill-climbs with the worker's own calculator."""
+    random.seed(10)
+    request = create_test_request(days=20)
+    compiled = CompiledRequest(request)
+    calculator = FitnessCalculator(request, create_test_weights(), compiled=compiled)
+    chromosome = scored_chromosome(calculator)
+    # Restore the worker globals this process sets up after the test
+    for name in ("_worker_compiled", "_worker_calculator", "_worker_vectorized"):
+        monkeypatch.setattr(fitness_pool, name, getattr(fitness_pool, name))
+    fitness_pool._init_worker(request, create_test_weights(), list(compiled.classes.ids), True)
+
+    gene_array, fitness, moves = fitness_pool._local_search(chromosome.gene_array, 64, seed=0)
+
+    improved = ScheduleChromosome(compiled=compiled)
+    improved.gene_array = gene_array
+    assert fitness >= chromosome.fitness
+    assert math.isclose(fitness, calculator.calculate_fitness(improved), rel_tol=1e-9)
+
+
+def test_optimizer_runs_local_search_on_elites():
+    """Local search runs every interval on the best chromosomes and is reported."""
+    random.seed(11)
+    optimizer = GeneticOptimizer(population_size=10, max_generations=4, parallel_fitness=False,
+                                 use_adaptive_control=False, greedy_init_fraction=1.0,
+                                 local_search_interval=2, local_search_top_k=3, local_search_evaluations=32)
+
+    optimizer.optimize(create_test_request(days=20), create_test_weights(), time_limit_seconds=30)
+
+    stats = optimizer.get_statistics()["local_search"]
+    assert optimizer.generations_run >= 2
+    assert stats["runs"] == 3 * (optimizer.generations_run // 2)
+    assert stats["moves"] >= stats["improved"]
+    assert stats["fitness_gain"] >= 0
@@ -0,0 +1,87 @@
+"""Unit tests for the structured mutation operators of the genetic algorithm."""
+import random
+
+import numpy as np
+import pytest
+
+from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome, validate_gene_arrays
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.population import PopulationManager
+from tests.unit.test_genetic_fitness import create_test_request
+
+CROSSOVER_METHODS = ["single_point", "two_point", "uniform", "order"]
+
+
+def greedy_chromosome(compiled):
+    """A valid chromosome to mutate."""
+    chromosome = ScheduleChromosome(compiled=compiled)
+    chromosome.initialize_greedy()
+    return chromosome
+
+
+def test_free_slot_and_shift_keep_valid_schedules_valid():
+    """Genes move within their week to free slots their class may take."""
+    random.seed(3)
+    compiled = CompiledRequest(create_test_request(days=20))
+    for method in ("free_slot", "shift"):
+        chromosome = greedy_chromosome(compiled)
+        original = chromosome.gene_array
+
+        chromosome.mutate(0.5, method)
+
+        gene_array = chromosome.gene_array
+        assert gene_array is not original
+        assert (gene_array != original).any()
+        assert (gene_array[:, :2] == original[:, :2]).all()
+        assert validate_gene_arrays(gene_array[np.newaxis], compiled.limits).all()
+        rows = compiled.class_rows(gene_array[:, 0])
+        assert compiled.allowed[rows, gene_array[:, 1], gene_array[:, 2], gene_array[:, 3]].all()
+        if method == "shift":
+            steps = np.abs(gene_array[:, 2:].astype(int) - original[:, 2:]).sum(axis=1)
+            assert (steps <= 1).all()
+
+
+def test_swap_exchanges_slots_between_classes():
+    """Swapping keeps every slot taken and every class's session count."""
+    random.seed(3)
+    compiled = CompiledRequest(create_test_request(days=20))
+    chromosome = greedy_chromosome(compiled)
+    original = chromosome.gene_array
+
+    chromosome.mutate(0.3, "swap")
+
+    gene_array = chromosome.gene_array
+    assert (gene_array[:, 0] == original[:, 0]).all()
+    assert sorted(map(tuple, gene_array[:, 1:].tolist())) == sorted(map(tuple, original[:, 1:].tolist()))
+    assert (gene_array != original).any()
+    assert validate_gene_arrays(gene_array[np.newaxis], compiled.limits).all()
+
+
+def test_unknown_mutation_method_is_rejected():
+    """Unknown methods raise for chromosomes and population managers alike."""
+    compiled = CompiledRequest(create_test_request(days=20))
+    with pytest.raises(ValueError):
+        greedy_chromosome(compiled).mutate(0.1, "teleport")
+    with pytest.raises(ValueError):
+        PopulationManager(size=4, request=compiled.request, compiled=compiled, mutation_methods=["teleport"])
+
+
+def test_mutation_weights_follow_scored_improvements():
+    """Mutants beating their parents' average are credited, then reweighted."""
+    random.seed(5)
+    manager = PopulationManager(size=10, request=create_test_request(days=20), greedy_fraction=1.0,
+                                crossover_methods=CROSSOVER_METHODS, mutation_methods=["free_slot", "swap"])
+    for chromosome in manager.population:
+        chromosome.fitness = 0.0
+    manager.evolve()
+
+    # Score only the swap mutants above the previous generation
+    for method, child in manager._mutants:
+        child.fitness = 1.0 if method == "swap" else -1.0
+    uses = {method: stats["uses"] for method, stats in manager.mutation_stats.items()}
+    manager.generation = 10
+    manager.evolve()
+
+    assert manager.mutation_method_weights["swap"] > 1.0
+    assert manager.mutation_method_weights["free_slot"] == 0.1
+    assert uses["swap"] > 0 and uses["free_slot"] > 0
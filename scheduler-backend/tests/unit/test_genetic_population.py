@@ -12,6 +12,7 @@ from app.models import (
 )
 from app.scheduling.solvers.genetic.population import PopulationManager
 from app.scheduling.solvers.genetic.chromosome import ScheduleChromosome
+from app.scheduling.solvers.genetic.adaptation import AdaptiveController
 
 
 def create_test_request(days=14) -> ScheduleRequest:
@@ -200,6 +201,25 @@ class TestPopulationManager:
         assert population.crossover_stats["single_point"]["uses"] == 0
         assert population.crossover_stats["single_point"]["improvements"] == 0
         
+    def test_fixed_crossover_weights(self):
+        """Test that fixed crossover weights apply from the start and do not adapt."""
+        random.seed(42)
+        request = create_test_request()
+        
+        population = PopulationManager(
+            size=10,
+            request=request,
+            crossover_methods=["single_point", "two_point"],
+            crossover_weights={"single_point": 1.0, "two_point": 0.0, "unknown": 3.0}
+        )
+        assert population.crossover_method_weights == {"single_point": 1.0, "two_point": 0.0}
+        assert all(population._select_crossover_method() == "single_point" for _ in range(50))
+        
+        population.generation = 10
+        population.crossover_stats["two_point"] = {"uses": 100, "improvements": 100}
+        population._update_crossover_weights()
+        assert population.crossover_method_weights == {"single_point": 1.0, "two_point": 0.0}
+
     def test_evolution(self):
         """Test population evolution."""
         random.seed(42)  # Set seed for reproducibility
@@ -305,3 +325,57 @@ class TestPopulationManager:
         assert abs(avg - expected_avg) < 0.0001  # Average of 0, 10, 20, ..., 90
         assert abs(best - 90.0) < 0.0001  # Highest fitness
         assert 0.0 <= diversity <= 1.0
+
+    def test_diversity_metrics_agree(self):
+        """Test that the frequency metric is exact and the sampled one close."""
+        random.seed(7)
+        request = create_test_request()
+        population = PopulationManager(
+            size=30,
+            request=request,
+            crossover_methods=["single_point", "two_point", "uniform", "order"],
+            diversity_samples=2000
+        )
+        # Clones and a shorter chromosome exercise matching and unequal lengths
+        population.population[1] = population.population[0].copy()
+        population.population[2] = population.population[0].copy()
+        population.population[2].mutate(0.5)
+        population.population[3].gene_array = population.population[3].gene_array[:-1]
+        
+        population.diversity_metric = "pairwise"
+        exact = population.get_diversity()
+        population.diversity_metric = "frequency"
+        assert population.get_diversity() == pytest.approx(exact, rel=1e-12)
+        population.diversity_metric = "sampled"
+        assert population.get_diversity() == pytest.approx(exact, abs=0.05)
+        
+        with pytest.raises(ValueError):
+            PopulationManager(size=2, request=request, diversity_metric="entropy")
+
+    def test_adaptation_matches_exact_diversity(self):
+        """Test that adaptive control follows the same rates with each diversity metric."""
+        random.seed(8)
+        request = create_test_request()
+        population = PopulationManager(
+            size=20,
+            request=request,
+            crossover_methods=["single_point", "two_point", "uniform", "order"],
+            diversity_samples=500
+        )
+        controllers = {
+            metric: AdaptiveController(adaptation_interval=2, diversity_threshold=0.5)
+            for metric in ("pairwise", "frequency", "sampled")
+        }
+        rates = {metric: [] for metric in controllers}
+        for generation in range(16):
+            for chromosome in population.population:
+                chromosome.fitness = random.random() + generation
+            for metric, controller in controllers.items():
+                population.diversity_metric = metric
+                best, avg, diversity = population.get_population_stats()
+                rates[metric].extend(controller.adapt_parameters(generation, best, avg, diversity))
+            population.evolve()
+        
+        assert rates["frequency"] == pytest.approx(rates["pairwise"], rel=1e-9)
+        for sampled, exact in zip(rates["sampled"], rates["pairwise"]):
+            assert sampled == pytest.approx(exact, abs=0.02)
@@ -0,0 +1,80 @@
+"""Unit tests for the repair of invalid genetic algorithm offspring."""
+import random
+
+import numpy as np
+
+from app.scheduling.solvers.genetic.chromosome import validate_gene_arrays
+from app.scheduling.solvers.genetic.compiled import CompiledRequest
+from app.scheduling.solvers.genetic.population import PopulationManager
+from app.scheduling.solvers.genetic.repair import repair_gene_array
+from tests.unit.test_genetic_fitness import create_test_request
+
+CROSSOVER_METHODS = ["single_point", "two_point", "uniform", "order"]
+
+
+def test_repair_moves_offending_gene_to_nearest_slot():
+    """Three classes in a row on a two-class day: one moves to the next school day."""
+    compiled = CompiledRequest(create_test_request(days=20))
+    gene_array = np.array([
+        (0, 0, 2, 3),
+        (1, 0, 2, 4),
+        (2, 0, 2, 5),
+        (0, 1, 3, 1),
+    ], dtype=np.int16)
+    original = gene_array.copy()
+
+    repaired, moves = repair_gene_array(compiled, gene_array, np.random.default_rng(0), max_moves=5)
+
+    assert moves == 1
+    assert (gene_array == original).all()
+    assert validate_gene_arrays(repaired[np.newaxis], compiled.limits).all()
+    moved = np.flatnonzero((repaired != original).any(axis=1))
+    assert len(moved) == 1
+    week, day, period = repaired[moved[0], 1:].tolist()
+    assert week == 0 and day in (1, 3) and period == original[moved[0], 3]
+
+
+def test_repair_respects_budget_and_leaves_valid_genes():
+    """No gene moves past the budget, and valid gene arrays come back as they are."""
+    compiled = CompiledRequest(create_test_request(days=20))
+    invalid = np.array([(0, 0, 2, 3), (1, 0, 2, 4), (2, 0, 2, 5)], dtype=np.int16)
+    valid = np.array([(0, 0, 2, 3), (1, 0, 3, 4), (2, 1, 2, 5)], dtype=np.int16)
+    rng = np.random.default_rng(0)
+
+    assert repair_gene_array(compiled, invalid, rng, max_moves=0) == (invalid, 0)
+    repaired, moves = repair_gene_array(compiled, valid, rng, max_moves=5)
+    assert repaired is valid and moves == 0
+
+
+def test_evolve_repairs_invalid_children():
+    """Invalid children are repaired into the next generation and counted."""
+    random.seed(4)
+    manager = PopulationManager(size=10, request=create_test_request(days=20),
+                                crossover_methods=CROSSOVER_METHODS)
+    for chromosome in manager.population:
+        chromosome.fitness = 0.0
+
+    manager.evolve()
+
+    gene_arrays = np.stack([chromosome.gene_array for chromosome in manager.population[manager.elite_size:]])
+    assert validate_gene_arrays(gene_arrays, manager.compiled.limits).all()
+    stats = manager.get_repair_stats()
+    assert stats["invalid"] > 0
+    assert stats["repaired"] == stats["invalid"]
+    assert stats["repair_rate"] == 1.0
+
+
+def test_evolve_ends_when_attempts_run_out():
+    """Without repair, invalid children fill the population once the attempt budget is spent."""
+    random.seed(4)
+    manager = PopulationManager(size=10, request=create_test_request(days=20),
+                                crossover_methods=CROSSOVER_METHODS, repair_moves=0, offspring_attempts=1)
+    for chromosome in manager.population:
+        chromosome.fitness = 0.0
+
+    manager.evolve()
+
+    assert len(manager.population) == 10
+    stats = manager.get_repair_stats()
+    assert stats["repaired"] == 0
+    assert stats["admitted_invalid"] > 0
@@ -0,0 +1,238 @@
+"""Unit tests for the background job store and worker."""
+import time
+
+import pytest
+
+from app.jobs import worker
+from app.jobs.models import JobMode, JobStatus
+from app.jobs.store import JobStore
+from app.models import ScheduleMetadata, ScheduleResponse
+from tests.utils.generators import ScheduleRequestGenerator
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.sqlite3"), lease_seconds=60, max_attempts=2)
+
+
+@pytest.fixture
+def request_json():
+    return ScheduleRequestGenerator.create_request(num_classes=2).model_dump_json()
+
+
+def expire_lease(store, job_id):
+    """Make a running job look like its worker died."""
+    with store._connect() as conn:
+        conn.execute("UPDATE jobs SET heartbeat_at = 0 WHERE id = ?", (job_id,))
+
+
+def test_create_and_claim_in_order(store, request_json):
+    """Jobs are claimed oldest first, each by exactly one worker."""
+    first = store.create(JobMode.STABLE, request_json, {"profile": "latency"})
+    second = store.create(JobMode.ADAPTIVE, request_json)
+    assert store.get(first.id).status == JobStatus.QUEUED
+
+    # A second store on the same file stands in for another API process
+    other = JobStore(store.path)
+    claimed = [store.claim("w1"), other.claim("w2")]
+    assert [job.id for job in claimed] == [first.id, second.id]
+    assert claimed[0].status == JobStatus.RUNNING
+    assert claimed[0].options == {"profile": "latency"}
+    assert claimed[0].attempts == 1
+    assert store.claim("w3") is None
+
+
+def test_progress_and_finish(store, request_json):
+    """Progress and results are stored for the worker holding the job."""
+    job = store.create(JobMode.DEV, request_json)
+    store.claim("w1")
+
+    assert not store.heartbeat(job.id, "w1", {"generation": 3, "best_fitness": -10.0})
+    assert store.get(job.id).progress == {"generation": 3, "best_fitness": -10.0}
+
+    # Another worker cannot write to the job
+    assert store.heartbeat(job.id, "w2", {"generation": 99})
+    assert not store.finish(job.id, "w2", JobStatus.SUCCEEDED, result="{}")
+
+    assert store.finish(job.id, "w1", JobStatus.SUCCEEDED, result='{"assignments": []}')
+    finished = store.get(job.id)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == '{"assignments": []}'
+    assert finished.finished_at is not None
+
+
+def test_cancel(store, request_json):
+    """Queued jobs cancel at once, running jobs are flagged for their worker."""
+    queued = store.create(JobMode.STABLE, request_json)
+    running = store.create(JobMode.STABLE, request_json)
+    store.cancel(queued.id)
+    assert store.get(queued.id).status == JobStatus.CANCELLED
+
+    assert store.claim("w1").id == running.id
+    assert store.cancel(running.id).status == JobStatus.RUNNING
+    assert store.heartbeat(running.id, "w1")
+
+    store.finish(running.id, "w1", JobStatus.CANCELLED)
+    assert store.cancel(running.id).status == JobStatus.CANCELLED
+    assert store.cancel("missing") is None
+
+
+def test_expired_lease_is_retried(store, request_json):
+    """A job whose worker stopped heartbeating is claimed again, up to max_attempts."""
+    job = store.create(JobMode.OPTIMIZED, request_json)
+    store.claim("w1")
+    expire_lease(store, job.id)
+
+    retried = store.claim("w2")
+    assert retried.id == job.id
+    assert retried.worker == "w2"
+    assert retried.attempts == 2
+    # The old worker lost the job
+    assert store.heartbeat(job.id, "w1")
+
+    expire_lease(store, job.id)
+    assert store.claim("w3") is None
+    assert store.get(job.id).status == JobStatus.FAILED
+
+
+def test_stats(store, request_json):
+    """Jobs are counted by status."""
+    store.create(JobMode.STABLE, request_json)
+    store.create(JobMode.STABLE, request_json)
+    store.claim("w1")
+    stats = store.get_stats()
+    assert stats["queued"] == 1
+    assert stats["running"] == 1
+    assert stats["succeeded"] == 0
+
+
+class ProgressSolver:
+    """Stand-in solver that reports progress until asked to stop."""
+
+    def __init__(self, steps=5):
+        self.steps = steps
+        self.callback = None
+        self.solve_kwargs = None
+
+    def set_progress_callback(self, callback):
+        self.callback = callback
+
+    def solve(self, request, **kwargs):
+        self.solve_kwargs = kwargs
+        for generation in range(self.steps):
+            if self.callback({"solver": "genetic", "generation": generation, "best_fitness": -generation}):
+                break
+        return ScheduleResponse(
+            assignments=[],
+            metadata=ScheduleMetadata(duration_ms=1, solutions_found=1, score=0, gap=0)
+        )
+
+
+def test_run_job_records_result(store, request_json, monkeypatch):
+    """A successful run stores progress and the schedule response."""
+    solver = ProgressSolver()
+    monkeypatch.setattr(worker, "build_solver", lambda mode, request: solver)
+    job = store.create(JobMode.ADAPTIVE, request_json, {"time_limit_seconds": 5, "profile": None})
+    claimed = store.claim("w1")
+
+    assert worker.run_job(store, claimed, "w1", progress_seconds=0) == JobStatus.SUCCEEDED
+    assert solver.solve_kwargs["with_relaxation"] is True
+    assert solver.solve_kwargs["time_limit_seconds"] == 5
+
+    finished = store.get(job.id)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.progress["phase"] == "solving"
+    assert finished.progress["generation"] == solver.steps - 1
+    assert ScheduleResponse.model_validate_json(finished.result).assignments == []
+
+
+def test_run_job_stops_on_cancel(store, request_json, monkeypatch):
+    """Cancelling a running job stops the solver at its next progress report."""
+    job = store.create(JobMode.DEV, request_json)
+
+    class CancelledSolver(ProgressSolver):
+        def set_progress_callback(self, callback):
+            def report(progress):
+                # The job is cancelled through the API while the solver runs
+                if progress["generation"] == 3:
+                    store.cancel(job.id)
+                return callback(progress)
+            self.callback = report
+
+    solver = CancelledSolver(steps=1000)
+    monkeypatch.setattr(worker, "build_solver", lambda mode, request: solver)
+
+    assert worker.run_job(store, store.claim("w1"), "w1", progress_seconds=0) == JobStatus.CANCELLED
+    cancelled = store.get(job.id)
+    assert cancelled.status == JobStatus.CANCELLED
+    assert cancelled.progress["generation"] == 3
+    assert cancelled.result is None
+
+
+def test_run_job_cancelled_while_tuning(store, request_json, monkeypatch):
+    """Cancelling an optimized job stops weight tuning and skips the solve."""
+    job = store.create(JobMode.OPTIMIZED, request_json)
+
+    class TuningSolver(ProgressSolver):
+        def tune_weights(self, request, progress_callback=None):
+            for evaluated in range(1000):
+                if evaluated == 2:
+                    store.cancel(job.id)
+                if progress_callback({"solver": "meta", "evaluated": evaluated}):
+                    break
+            self.tuned = evaluated
+
+    solver = TuningSolver()
+    monkeypatch.setattr(worker, "build_solver", lambda mode, request: solver)
+
+    assert worker.run_job(store, store.claim("w1"), "w1", progress_seconds=0) == JobStatus.CANCELLED
+    assert solver.tuned == 2
+    assert solver.solve_kwargs is None
+    cancelled = store.get(job.id)
+    assert cancelled.status == JobStatus.CANCELLED
+    assert cancelled.progress["phase"] == "tuning"
+    assert cancelled.progress["evaluated"] == 2
+
+
+def test_run_job_failure(store, request_json, monkeypatch):
+    """Errors fail the job with their message."""
+    def build(mode, request):
+        raise ValueError("Weight tuning is disabled")
+
+    monkeypatch.setattr(worker, "build_solver", build)
+    job = store.create(JobMode.OPTIMIZED, request_json)
+    assert worker.run_job(store, store.claim("w1"), "w1") == JobStatus.FAILED
+    failed = store.get(job.id)
+    assert failed.status == JobStatus.FAILED
+    assert "Weight tuning is disabled" in failed.error
+
+
+def test_worker_process_tunes_weights_in_parallel(store, request_json, monkeypatch):
+    """A spawned job worker can evaluate weight configurations in processes of its own."""
+    # The worker reads its configuration from the environment it is spawned with
+    monkeypatch.delenv("PYTEST_CURRENT_TEST")
+    for name, value in {
+        "ENABLE_GENETIC_OPTIMIZATION": "1", "ENABLE_WEIGHT_TUNING": "1",
+        "META_POPULATION_SIZE": "2", "META_GENERATIONS": "1", "META_EVAL_TIME_LIMIT": "2",
+        "META_PARALLEL_EVALUATION": "1", "GA_POPULATION_SIZE": "10", "GA_MAX_GENERATIONS": "5"
+    }.items():
+        monkeypatch.setenv(name, value)
+    job = store.create(JobMode.OPTIMIZED, request_json, {"time_limit_seconds": 5})
+
+    pool = worker.JobWorkerPool(store.path, 1, poll_seconds=0.1)
+    pool.start()
+    evaluated = 0
+    try:
+        deadline = time.time() + 120
+        while time.time() < deadline:
+            current = store.get(job.id)
+            if current.progress and current.progress.get("phase") == "tuning":
+                evaluated = max(evaluated, current.progress.get("evaluated") or 0)
+            if current.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+                break
+            time.sleep(0.05)
+    finally:
+        pool.stop()
+
+    assert evaluated >= 1
+    assert store.get(job.id).status == JobStatus.SUCCEEDED
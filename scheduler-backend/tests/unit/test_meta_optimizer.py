@@ -365,6 +365,46 @@ class TestMetaOptimizer:
         # tested implicitly by the test_optimize function when run with
         # parallel=True.
 
+    def test_optimize_stops_on_request(self, schedule_request, solver_config, monkeypatch):
+        """Returning True from the progress callback stops tuning early."""
+        evaluated = []
+        
+        class CountingMetaObjectiveCalculator:
+            def __init__(self, request, base_config):
+                pass
+                
+            def evaluate_weight_config(self, chromosome, time_limit=60, progress_callback=None):
+                # Inner runs forward their progress to the meta-optimizer
+                stop = progress_callback({"solver": "genetic", "generation": 0, "assignments": []})
+                evaluated.append(stop)
+                return float(len(evaluated)), []
+        
+        monkeypatch.setattr(
+            "app.scheduling.solvers.genetic.meta_optimizer.MetaObjectiveCalculator",
+            CountingMetaObjectiveCalculator
+        )
+        optimizer = MetaOptimizer(
+            request=schedule_request,
+            base_config=solver_config,
+            population_size=5,
+            generations=3
+        )
+        
+        reports = []
+        def callback(progress):
+            reports.append(progress)
+            return progress["evaluated"] >= 2
+        
+        best_config, _ = optimizer.optimize(parallel=False, progress_callback=callback)
+        
+        assert optimizer.stopped
+        assert evaluated == [False, False]
+        assert optimizer.best_chromosome.fitness == 2.0
+        assert isinstance(best_config, WeightConfig)
+        assert reports[0]["evaluation"] == {"solver": "genetic", "generation": 0}
+        assert reports[-1]["evaluated"] == 2
+        assert reports[-1]["generation"] == 0
+
     def test_evaluate_population_parallel_with_error(self, schedule_request, solver_config, monkeypatch):
         """Test error handling in parallel evaluation of population."""
         optimizer = MetaOptimizer(
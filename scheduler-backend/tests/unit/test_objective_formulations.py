@@ -0,0 +1,79 @@
+"""Unit tests for the pairwise and compact objective formulations."""
+import pytest
+from datetime import datetime, timedelta
+
+from ortools.sat.python import cp_model
+
+from app.scheduling.core import SchedulerContext
+from app.scheduling.objectives.distribution import DistributionObjective
+from app.scheduling.objectives.daily_balance import DailyBalanceObjective
+from tests.utils.generators import ScheduleRequestGenerator
+
+
+def create_context(scheduled_periods):
+    """
+    Context with one class that can use periods 1-8 on one day, with the
+    given periods fixed to scheduled and all others fixed to free.
+    """
+    request = ScheduleRequestGenerator.create_request(num_classes=1, start_date="2025-03-03")
+    model = cp_model.CpModel()
+    date = datetime(2025, 3, 3)
+    context = SchedulerContext(
+        model=model,
+        solver=cp_model.CpSolver(),
+        request=request,
+        start_date=date,
+        end_date=date + timedelta(days=6)
+    )
+    for period in range(1, 9):
+        var = model.NewBoolVar(f"p{period}")
+        model.Add(var == int(period in scheduled_periods))
+        context.variables.append({
+            "variable": var,
+            "name": request.classes[0].name,
+            "date": date,
+            "period": period,
+        })
+    return context
+
+
+def period_balance_penalty(formulation, scheduled_periods):
+    """Optimal value of the daily period-balance terms alone."""
+    context = create_context(scheduled_periods)
+    objective = DistributionObjective(formulation)
+    date = datetime(2025, 3, 3).date()
+    if formulation == "compact":
+        terms = objective._compact_period_terms(context, date)
+    else:
+        terms = objective._pairwise_period_terms(context, date)
+    context.model.Maximize(sum(terms))
+    status = context.solver.Solve(context.model)
+    assert status == cp_model.OPTIMAL
+    return context.solver.ObjectiveValue()
+
+
+@pytest.mark.parametrize("scheduled_periods", [[], [1], [1, 2], [2, 5, 7], [1, 2, 3, 4, 5, 6, 7, 8]])
+def test_compact_period_terms_match_pairwise(scheduled_periods):
+    """Both formulations give the same penalty for 0/1 slot loads."""
+    assert period_balance_penalty("compact", scheduled_periods) == \
+        period_balance_penalty("pairwise", scheduled_periods)
+
+
+def test_compact_period_terms_are_linear():
+    """Compact terms add one variable per period rather than two per pair."""
+    pairwise = create_context([1])
+    DistributionObjective("pairwise")._pairwise_period_terms(pairwise, datetime(2025, 3, 3).date())
+    compact = create_context([1])
+    DistributionObjective("compact")._compact_period_terms(compact, datetime(2025, 3, 3).date())
+
+    base_vars = 8
+    assert len(pairwise.model.Proto().variables) - base_vars == 2 * 28
+    assert len(compact.model.Proto().variables) - base_vars == 8
+
+
+def test_unknown_formulation_rejected():
+    """Unknown formulation names raise a ValueError."""
+    with pytest.raises(ValueError):
+        DistributionObjective("quadratic")
+    with pytest.raises(ValueError):
+        DailyBalanceObjective("quadratic")
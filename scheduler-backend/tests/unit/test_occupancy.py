@@ -0,0 +1,75 @@
+"""Unit tests for the shared slot occupancy layer."""
+import pytest
+from datetime import datetime
+
+from ortools.sat.python import cp_model
+
+from app.models import Class
+from app.scheduling.core import SchedulerContext
+from app.scheduling.constraints.assignment import NoOverlapConstraint
+from app.scheduling.constraints.teacher_workload import ConsecutiveClassesConstraint
+from tests.utils.generators import ScheduleRequestGenerator
+
+
+@pytest.fixture
+def context():
+    """Context with three classes that can each take periods 1-3 on one day."""
+    request = ScheduleRequestGenerator.create_request(num_classes=0, start_date="2025-03-03")
+    request.classes = [
+        Class(id=f"C{i}", name=f"C{i}", grade=grade)
+        for i, grade in enumerate(["K", "1", "5"])
+    ]
+    model = cp_model.CpModel()
+    context = SchedulerContext(
+        model=model,
+        solver=cp_model.CpSolver(),
+        request=request,
+        start_date=datetime(2025, 3, 3),
+        end_date=datetime(2025, 3, 9)
+    )
+    date = datetime(2025, 3, 3)
+    context.variables = [
+        {
+            "variable": model.NewBoolVar(f"{class_obj.name}_{period}"),
+            "name": class_obj.name,
+            "date": date,
+            "period": period,
+        }
+        for class_obj in request.classes
+        for period in range(1, 4)
+    ]
+    return context
+
+
+def test_slot_load_is_shared(context):
+    """The same slot load and day indicator are returned on every call."""
+    occupancy = context.occupancy
+    date = datetime(2025, 3, 3).date()
+
+    assert occupancy.slot_load(date, 1) is occupancy.slot_load(date, 1)
+    assert occupancy.day_used(date) is occupancy.day_used(date)
+    assert occupancy.slot_load(date, 8) is None
+    assert occupancy.stats["slot_loads"] == 1
+    assert occupancy.stats["day_indicators"] == 1
+    assert occupancy.stats["reused"] == 2
+
+
+def test_grade_loads_split_slot(context):
+    """Grade loads cover every grade group with a variable in the slot."""
+    loads = context.occupancy.grade_loads(datetime(2025, 3, 3).date(), 2)
+    assert sorted(loads) == [1, 2, 6]
+
+
+def test_consecutive_limit_spans_classes(context):
+    """Three different classes cannot fill three consecutive periods."""
+    NoOverlapConstraint().apply(context)
+    ConsecutiveClassesConstraint(enabled=True).apply(context)
+
+    # Require every period to be filled by some class
+    for period in range(1, 4):
+        context.model.Add(
+            sum(var["variable"] for var in context.variables if var["period"] == period) == 1
+        )
+
+    status = context.solver.Solve(context.model)
+    assert status == cp_model.INFEASIBLE
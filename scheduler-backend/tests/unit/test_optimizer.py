@@ -224,6 +224,58 @@ class TestGeneticOptimizer:
         # Verify fitness calculator was not called
         optimizer.fitness_calculator.calculate_fitness.assert_not_called()
 
+    def test_evaluate_fitness_vectorized(self):
+        """Test that vectorized fitness scores the batch in one call."""
+        optimizer = GeneticOptimizer(parallel_fitness=True, max_workers=2, vectorized_fitness=True)
+        optimizer.fitness_calculator = MagicMock()
+        optimizer.fitness_calculator.calculate_population_fitness.return_value = [10, 20, 30, 40, 50]
+        
+        chromosomes = [MagicMock(fitness=0) for _ in range(5)]
+        optimizer._evaluate_fitness_parallel(chromosomes)
+        
+        optimizer.fitness_calculator.calculate_population_fitness.assert_called_once_with(chromosomes)
+        optimizer.fitness_calculator.calculate_fitness.assert_not_called()
+        assert [c.fitness for c in chromosomes] == [10, 20, 30, 40, 50]
+
+    def test_evaluate_fitness_worker_pool(self):
+        """Test that a running worker pool scores batches it can split."""
+        optimizer = GeneticOptimizer(parallel_fitness=True, max_workers=2, vectorized_fitness=True)
+        optimizer.fitness_calculator = MagicMock()
+        optimizer.fitness_calculator.calculate_population_fitness.return_value = [7]
+        optimizer.worker_pool = MagicMock()
+        optimizer.worker_pool.batches.side_effect = lambda count: [slice(0, 2), slice(2, 4)] if count > 1 else [slice(0, 1)]
+        optimizer.worker_pool.score.side_effect = [[1, 2, 3, 4], RuntimeError("worker died")]
+        
+        chromosomes = [MagicMock(fitness=0) for _ in range(4)]
+        optimizer._evaluate_fitness_parallel(chromosomes)
+        assert [c.fitness for c in chromosomes] == [1, 2, 3, 4]
+        
+        # A single batch is scored in this process
+        single = [MagicMock(fitness=0)]
+        optimizer._evaluate_fitness_parallel(single)
+        assert single[0].fitness == 7
+        
+        # A failing pool is shut down and the batch scored in this process
+        pool = optimizer.worker_pool
+        optimizer.fitness_calculator.calculate_population_fitness.return_value = [5, 6, 7, 8]
+        optimizer._evaluate_fitness_parallel(chromosomes)
+        pool.close.assert_called_once()
+        assert optimizer.worker_pool is None
+        assert [c.fitness for c in chromosomes] == [5, 6, 7, 8]
+
+    def test_evaluate_fitness_incremental(self):
+        """Test that incremental fitness takes precedence over the batch path."""
+        optimizer = GeneticOptimizer(vectorized_fitness=True, incremental_fitness=True)
+        optimizer.fitness_calculator = MagicMock()
+        optimizer.fitness_calculator.calculate_incremental_fitness.return_value = [1, 2, 3]
+        
+        chromosomes = [MagicMock(fitness=0) for _ in range(3)]
+        optimizer._evaluate_fitness_parallel(chromosomes)
+        
+        optimizer.fitness_calculator.calculate_incremental_fitness.assert_called_once_with(chromosomes)
+        optimizer.fitness_calculator.calculate_population_fitness.assert_not_called()
+        assert [c.fitness for c in chromosomes] == [1, 2, 3]
+
     def test_optimize_with_mocks(self, schedule_request, weight_config, mock_chromosome):
         """Test optimize using comprehensive mocking approach."""
         # Create optimizer instance
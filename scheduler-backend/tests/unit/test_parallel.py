@@ -3,6 +3,7 @@ import os
 import pytest
 import unittest
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock, call, ANY
 
 from app.scheduling.solvers.genetic import parallel
@@ -612,7 +613,7 @@ class TestParallelProcessBatched:
     def test_parallel_process_batched_large(self, mock_parallel_map):
         """Test batched processing with large list that creates multiple batches."""
         # Set up mock to return processed batches
-        mock_parallel_map.side_effect = lambda func, batches, max_workers: [
+        mock_parallel_map.side_effect = lambda func, batches, max_workers, executor=None: [
             [x * 2 for x in batch] for batch in batches
         ]
         
@@ -641,6 +642,20 @@ class TestParallelProcessBatched:
         assert batches[1] == list(range(10, 20))
         assert batches[2] == list(range(20, 25))
 
+    def test_parallel_process_batched_with_executor(self):
+        """Test that batches go to a running executor, even in a test environment."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with patch.object(executor, 'submit', wraps=executor.submit) as submit:
+                result = parallel_process_batched(
+                    lambda batch: [x * 2 for x in batch],
+                    list(range(7)),
+                    batch_size=3,
+                    executor=executor
+                )
+        
+        assert result == [x * 2 for x in range(7)]
+        assert submit.call_count == 3
+
     def test_parallel_process_batched_flattening(self):
         """Test correct flattening of batch results in parallel_process_batched."""
         from app.scheduling.solvers.genetic.parallel import parallel_process_batched, set_test_mode
@@ -0,0 +1,111 @@
+"""Unit tests for the content-addressed result cache."""
+import pytest
+
+from app.models import ScheduleAssignment, ScheduleMetadata, ScheduleResponse, TimeSlot
+from app.scheduling.solvers import cache as cache_module
+from app.scheduling.solvers.cache import ResultCache, request_hash
+from tests.utils.generators import ScheduleRequestGenerator
+
+SIGNATURE = {"solver": "cp-sat-unified", "weights": {"distribution": 1000}, "relaxation_level": "NONE"}
+
+
+def make_response(name="c1"):
+    return ScheduleResponse(
+        assignments=[
+            ScheduleAssignment(
+                name=name,
+                classId=name,
+                date="2025-02-12",
+                timeSlot=TimeSlot(dayOfWeek=3, period=1)
+            )
+        ],
+        metadata=ScheduleMetadata(duration_ms=10, solutions_found=1, score=1.0, gap=0.0)
+    )
+
+
+@pytest.fixture
+def request_pair():
+    """A request and a copy with reordered classes and a different date spelling."""
+    request = ScheduleRequestGenerator.create_request(num_classes=3, start_date="2025-02-10")
+    reordered = request.model_copy(deep=True)
+    reordered.classes = list(reversed(reordered.classes))
+    reordered.startDate = "2025-02-10T00:00:00"
+    return request, reordered
+
+
+def test_hash_is_canonical(request_pair):
+    """Equivalent requests hash alike, different solver settings do not."""
+    request, reordered = request_pair
+    assert request_hash(request, SIGNATURE) == request_hash(reordered, SIGNATURE)
+
+    other_weights = dict(SIGNATURE, weights={"distribution": 500})
+    assert request_hash(request, SIGNATURE) != request_hash(request, other_weights)
+    relaxed = dict(SIGNATURE, relaxation_level="MODERATE")
+    assert request_hash(request, SIGNATURE) != request_hash(request, relaxed)
+
+    changed = request.model_copy(deep=True)
+    changed.constraints.maxClassesPerDay += 1
+    assert request_hash(request, SIGNATURE) != request_hash(changed, SIGNATURE)
+
+
+def test_memory_lru_eviction():
+    """The least recently used entry is evicted first."""
+    cache = ResultCache(max_entries=2, ttl_seconds=0)
+    cache.put("a", make_response("a"))
+    cache.put("b", make_response("b"))
+    assert cache.get("a") is not None
+    cache.put("c", make_response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").assignments[0].name == "a"
+    assert cache.get("c").assignments[0].name == "c"
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["memory_hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.75
+
+
+def test_hits_are_copies():
+    """Modifying a returned response does not change the cached one."""
+    cache = ResultCache()
+    cache.put("a", make_response())
+    cache.get("a").assignments[0].date = "2025-02-12T00:00:00Z"
+    assert cache.get("a").assignments[0].date == "2025-02-12"
+
+
+def test_ttl_expiry(monkeypatch):
+    """Entries expire after the TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResultCache(ttl_seconds=60)
+    cache.put("a", make_response())
+    now[0] += 30
+    assert cache.get("a") is not None
+    now[0] += 31
+    assert cache.get("a") is None
+    assert cache.get_stats()["expired"] == 1
+
+
+def test_disk_tier(tmp_path, monkeypatch):
+    """The disk tier survives a new cache instance and honours the TTL."""
+    path = str(tmp_path / "results.sqlite3")
+    ResultCache(ttl_seconds=60, db_path=path).put("a", make_response())
+
+    cache = ResultCache(ttl_seconds=60, db_path=path)
+    assert cache.get("a").assignments[0].name == "c1"
+    assert cache.get("a") is not None
+    stats = cache.get_stats()
+    assert stats["disk_hits"] == 1
+    assert stats["memory_hits"] == 1
+
+    later = cache_module.time.time() + 120
+    monkeypatch.setattr(cache_module.time, "time", lambda: later)
+    assert ResultCache(ttl_seconds=60, db_path=path).get("a") is None
+
+
+def test_uncounted_miss():
+    """Lookups that will be repeated before solving can skip the miss count."""
+    cache = ResultCache()
+    assert cache.get("a", count_miss=False) is None
+    assert cache.get_stats()["misses"] == 0
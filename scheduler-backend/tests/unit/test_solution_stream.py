@@ -0,0 +1,109 @@
+"""Unit tests for streaming intermediate solutions."""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.scheduling.solvers.executor import SolveExecutor
+from app.scheduling.solvers.streaming import SolutionStream, format_sse
+
+
+class ReportingSolver:
+    """Stand-in solver that reports improving solutions until stopped."""
+
+    use_genetic = False
+
+    def __init__(self, reports=3, wait_for_stop=False):
+        self.reports = reports
+        self.wait_for_stop = wait_for_stop
+        self.callback = None
+        self.stopped = threading.Event()
+
+    def set_progress_callback(self, callback):
+        self.callback = callback
+
+    def solve(self, request, **kwargs):
+        step = 0
+        while step < self.reports or self.wait_for_stop:
+            progress = {"solver": "cp-sat", "objective": step, "improved": step % 2 == 0}
+            if progress["improved"]:
+                progress["assignments"] = [{"classId": "c1", "date": "2025-01-06T00:00:00"}]
+            if self.callback(progress):
+                self.stopped.set()
+                break
+            step += 1
+            if self.wait_for_stop and step > 10000:
+                pytest.fail("Solver was never stopped")
+        return f"solved {request}"
+
+
+@pytest.fixture
+def executor():
+    executor = SolveExecutor(max_concurrent=1, max_queued=0, genetic_in_process=False)
+    yield executor
+    executor.shutdown()
+
+
+def test_format_sse():
+    """Messages carry the id, event name and JSON data."""
+    message = format_sse("solution", {"objective": 3}, event_id=7)
+    assert message == 'id: 7\nevent: solution\ndata: {"objective": 3}\n\n'
+    assert json.loads(format_sse("result", [1]).split("data: ")[1]) == [1]
+
+
+def test_stream_yields_solutions_then_result(executor):
+    """Improving solutions and the final result reach the consumer in order."""
+    solver = ReportingSolver(reports=5)
+
+    async def scenario():
+        stream = SolutionStream(solver)
+        stream.start(executor, "r1")
+        return [event async for event in stream.events()]
+
+    events = asyncio.run(scenario())
+    names = [name for name, _ in events]
+    assert names[-1] == "result"
+    assert events[-1][1] == "solved r1"
+    assert "solution" in names
+    objectives = [data["objective"] for name, data in events if name in ("solution", "progress")]
+    assert objectives == sorted(objectives)
+    assert objectives[-1] == 4
+    for name, data in events:
+        if name == "progress":
+            assert "assignments" not in data
+
+
+def test_closing_stream_stops_solver(executor):
+    """Leaving the stream early stops the solver so its slot is freed."""
+    solver = ReportingSolver(wait_for_stop=True)
+
+    async def scenario():
+        stream = SolutionStream(solver)
+        stream.start(executor, "r1")
+        events = stream.events()
+        name, data = await events.__anext__()
+        assert name == "solution"
+        await events.aclose()
+
+    asyncio.run(scenario())
+    assert solver.stopped.wait(timeout=10)
+
+
+def test_stream_reports_solver_errors(executor):
+    """Errors raised by the solve surface after the events before them."""
+    class FailingSolver(ReportingSolver):
+        def solve(self, request, **kwargs):
+            self.callback({"solver": "cp-sat", "objective": 1, "improved": False})
+            raise ValueError("bad request")
+
+    async def scenario():
+        stream = SolutionStream(FailingSolver())
+        stream.start(executor, "r1")
+        seen = []
+        with pytest.raises(ValueError):
+            async for name, _ in stream.events():
+                seen.append(name)
+        return seen
+
+    assert asyncio.run(scenario()) == ["progress"]
@@ -0,0 +1,113 @@
+"""Unit tests for the bounded solve executor."""
+import asyncio
+import threading
+
+import pytest
+
+from app.scheduling.solvers.executor import SolveExecutor, SolverBusyError
+
+
+class BlockingSolver:
+    """Stand-in solver whose solve blocks until released."""
+
+    use_genetic = False
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.calls = []
+
+    def solve(self, request, **kwargs):
+        self.calls.append((request, kwargs))
+        self.started.release()
+        self.release.wait(timeout=10)
+        return f"solved {request}"
+
+
+@pytest.fixture
+def executor():
+    executor = SolveExecutor(max_concurrent=2, max_queued=1, genetic_in_process=False)
+    yield executor
+    executor.shutdown()
+
+
+def test_solve_runs_off_event_loop(executor):
+    """The event loop keeps serving other work while a solve blocks."""
+    solver = BlockingSolver()
+
+    async def scenario():
+        task = asyncio.ensure_future(executor.solve(solver, "r1", profile="latency"))
+        # Other coroutines make progress while the solve is running
+        for _ in range(500):
+            if solver.started.acquire(blocking=False):
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("Solve never started")
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        solver.release.set()
+        return await task
+
+    assert asyncio.run(scenario()) == "solved r1"
+    assert solver.calls == [("r1", {"profile": "latency"})]
+
+
+def test_queue_full_rejects(executor):
+    """Solves beyond the concurrency cap plus queue are rejected."""
+    solver = BlockingSolver()
+
+    async def scenario():
+        tasks = [asyncio.ensure_future(executor.solve(solver, f"r{i}")) for i in range(3)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(SolverBusyError):
+            await executor.solve(solver, "r3")
+
+        stats = executor.get_stats()
+        assert stats["running"] == 2
+        assert stats["queued"] == 1
+        assert stats["rejected"] == 1
+
+        solver.release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(scenario()) == ["solved r0", "solved r1", "solved r2"]
+    stats = executor.get_stats()
+    assert stats["completed"] == 3
+    assert stats["running"] == 0 and stats["queued"] == 0
+
+
+def test_errors_propagate(executor):
+    """Exceptions raised by the solver reach the caller and free the slot."""
+    class FailingSolver:
+        use_genetic = False
+
+        def solve(self, request, **kwargs):
+            raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(executor.solve(FailingSolver(), "r"))
+    assert executor.get_stats()["completed"] == 1
+
+
+def test_stateful_solves_stay_in_thread(monkeypatch):
+    """Relaxation and weight tuning never go to a worker's copy of the solver."""
+    from app.scheduling.constraints.relaxation import RelaxationLevel
+    from app.scheduling.solvers import config as config_module
+    monkeypatch.setattr(config_module, "ENABLE_GENETIC_OPTIMIZATION", True)
+
+    class GeneticSolver:
+        use_genetic = True
+        genetic_optimizer = object()
+        current_relaxation_level = RelaxationLevel.NONE
+
+    executor = SolveExecutor(max_concurrent=1, max_queued=0, genetic_in_process=True)
+    solver = GeneticSolver()
+    try:
+        assert executor._uses_process(solver, {})
+        assert not executor._uses_process(solver, {"with_relaxation": True})
+        assert not executor._uses_process(solver, {"tune_weights": True})
+        solver.current_relaxation_level = RelaxationLevel.MODERATE
+        assert not executor._uses_process(solver, {})
+    finally:
+        executor.shutdown()
@@ -0,0 +1,88 @@
+"""Unit tests for CP-SAT parameter profiles and CPU detection."""
+import pytest
+
+from app.scheduling.solvers import config
+from app.scheduling.solvers.config import SolverProfile, get_solver_profile
+from app.scheduling.utils import resources
+
+
+@pytest.fixture
+def cgroup_files(tmp_path, monkeypatch):
+    """Point the cgroup paths at temporary files."""
+    paths = {
+        "v2": tmp_path / "cpu.max",
+        "quota": tmp_path / "cpu.cfs_quota_us",
+        "period": tmp_path / "cpu.cfs_period_us",
+    }
+    monkeypatch.setattr(resources, "CGROUP_V2_CPU_MAX", str(paths["v2"]))
+    monkeypatch.setattr(resources, "CGROUP_V1_QUOTA", str(paths["quota"]))
+    monkeypatch.setattr(resources, "CGROUP_V1_PERIOD", str(paths["period"]))
+    return paths
+
+
+def test_cgroup_v2_quota(cgroup_files):
+    """A cpu.max quota is converted to cores."""
+    cgroup_files["v2"].write_text("150000 100000\n")
+    assert resources.cgroup_cpu_limit() == 1.5
+
+
+def test_cgroup_v2_unlimited(cgroup_files):
+    """An unlimited cpu.max has no limit."""
+    cgroup_files["v2"].write_text("max 100000\n")
+    assert resources.cgroup_cpu_limit() is None
+
+
+def test_cgroup_v1_quota(cgroup_files):
+    """cgroup v1 quota and period files are used when cpu.max is missing."""
+    cgroup_files["quota"].write_text("200000")
+    cgroup_files["period"].write_text("100000")
+    assert resources.cgroup_cpu_limit() == 2.0
+
+    cgroup_files["quota"].write_text("-1")
+    assert resources.cgroup_cpu_limit() is None
+
+
+def test_available_cpus_respect_quota(cgroup_files, monkeypatch):
+    """The CPU count is capped by the quota, rounded up."""
+    monkeypatch.setattr(resources.os, "cpu_count", lambda: 16)
+    cgroup_files["v2"].write_text("150000 100000\n")
+    assert resources.available_cpu_count() <= 2
+    assert resources.available_cpu_count() >= 1
+
+
+def test_profile_workers(monkeypatch):
+    """Profiles use a fixed worker count or the capped detected count."""
+    monkeypatch.setattr(config, "available_cpu_count", lambda: 16)
+    assert SolverProfile("fixed", NUM_WORKERS=3).get_num_workers() == 3
+    assert SolverProfile("capped", MAX_WORKERS=2).get_num_workers() == 2
+    assert SolverProfile("auto").get_num_workers() == 16
+
+
+def test_time_limit_precedence():
+    """The caller's limit wins over the profile's, which wins over the global one."""
+    profile = SolverProfile("test", TIME_LIMIT_SECONDS=30)
+    assert profile.get_time_limit(5) == 5.0
+    assert profile.get_time_limit() == 30.0
+    assert SolverProfile("test").get_time_limit() == float(config.SOLVER_TIME_LIMIT_SECONDS)
+
+
+def test_profile_from_env(monkeypatch):
+    """SOLVER_<NAME>_* variables override profile defaults."""
+    monkeypatch.setenv("SOLVER_CUSTOM_TIME_LIMIT", "12")
+    monkeypatch.setenv("SOLVER_CUSTOM_WORKERS", "4")
+    monkeypatch.setenv("SOLVER_CUSTOM_RELATIVE_GAP", "0.1")
+    monkeypatch.setenv("SOLVER_CUSTOM_LOG", "1")
+    profile = SolverProfile.from_env("custom", TIME_LIMIT_SECONDS=60)
+    assert profile.TIME_LIMIT_SECONDS == 12.0
+    assert profile.NUM_WORKERS == 4
+    assert profile.RELATIVE_GAP == 0.1
+    assert profile.LOG_SEARCH_PROGRESS
+
+
+def test_named_profiles():
+    """The built-in profiles exist and unknown names are rejected."""
+    assert get_solver_profile("latency").RELATIVE_GAP > 0
+    assert get_solver_profile("throughput").MAX_WORKERS <= 2
+    assert get_solver_profile().NAME == config.SOLVER_PROFILE
+    with pytest.raises(ValueError):
+        get_solver_profile("fastest")
@@ -0,0 +1,91 @@
+"""Unit tests for the shared variable index."""
+import pytest
+from datetime import datetime, timedelta
+
+from app.scheduling.utils.variable_index import VariableIndex
+
+
+@pytest.fixture
+def start_date():
+    """First day of the test schedule (a Monday)."""
+    return datetime(2025, 3, 3)
+
+
+@pytest.fixture
+def variables(start_date):
+    """Variables for two classes over two weeks of weekdays, periods 1-3."""
+    variables = []
+    for day_index in range(12):
+        date = start_date + timedelta(days=day_index)
+        if date.weekday() >= 5:
+            continue
+        for name in ["Class A", "Class B"]:
+            for period in range(1, 4):
+                variables.append({
+                    "variable": f"{name}_{date.date()}_{period}",
+                    "name": name,
+                    "date": date,
+                    "period": period,
+                    "day_index": day_index,
+                    "week": day_index // 7
+                })
+    return variables
+
+
+def test_views_partition_variables(variables, start_date):
+    """Each grouping view contains every variable exactly once."""
+    index = VariableIndex(variables, start_date, ["Class A", "Class B"])
+
+    assert sum(len(v) for v in index.by_class.values()) == len(variables)
+    assert sum(len(v) for v in index.by_date.values()) == len(variables)
+    assert sum(len(v) for v in index.by_week.values()) == len(variables)
+    assert sum(
+        len(v) for periods in index.by_date_period.values() for v in periods.values()
+    ) == len(variables)
+    assert sum(
+        len(v) for days in index.by_week_day.values() for v in days.values()
+    ) == len(variables)
+
+
+def test_week_views(variables, start_date):
+    """Week views match the week arithmetic used by the constraints."""
+    index = VariableIndex(variables, start_date)
+
+    assert index.total_weeks == 2
+    assert index.weekdays_by_week == {0: 5, 1: 5}
+    for week, week_vars in index.by_week.items():
+        for var in week_vars:
+            assert (var["date"] - start_date).days // 7 == week
+
+
+def test_week_computed_without_precomputed_fields(variables, start_date):
+    """Variables created without week/day_index fields are still indexed."""
+    for var in variables:
+        del var["week"]
+        del var["day_index"]
+    index = VariableIndex(variables, start_date)
+
+    assert index.total_weeks == 2
+    assert index.get("Class A", 7, 2)["date"] == start_date + timedelta(days=7)
+
+
+def test_grid_lookup(variables, start_date):
+    """Dense grid returns the variable for a slot, None for missing slots."""
+    index = VariableIndex(variables, start_date, ["Class A", "Class B"])
+
+    var = index.get("Class B", 1, 3)
+    assert var["name"] == "Class B"
+    assert var["period"] == 3
+    assert var["date"] == start_date + timedelta(days=1)
+
+    assert index.get("Class B", 5, 1) is None  # Saturday
+    assert index.get("Class B", 1, 8) is None  # Period without a variable
+    assert index.get("Unknown", 1, 1) is None
+    assert index.get("Class A", 100, 1) is None
+
+
+def test_views_are_cached(variables, start_date):
+    """Views are built once and shared."""
+    index = VariableIndex(variables, start_date)
+    assert index.by_date_period is index.by_date_period
+    assert index.by_class is index.by_class
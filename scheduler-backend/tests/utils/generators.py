@@ -124,15 +124,16 @@ class InstructorAvailabilityGenerator:
             while current_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
                 current_date += timedelta(days=1)
             
-            # Default to all periods available (1-8)
-            periods = list(range(1, 9))
+            # InstructorAvailability lists the periods the instructor is
+            # unavailable, so default to none (all periods available)
+            periods = []
             
-            # Remove unavailable periods for this day if specified
+            # Add unavailable periods for this day if specified
             if unavailable_pattern:
                 for slot in unavailable_pattern:
                     if slot.dayOfWeek == current_date.weekday() + 1:
-                        if slot.period in periods:
-                            periods.remove(slot.period)
+                        if slot.period not in periods:
+                            periods.append(slot.period)
             
             availabilities.append(
                 InstructorAvailability(